@@ -0,0 +1,83 @@
+import os
+import sys
+import time
+import asyncio
+import argparse
+import contextlib
+import io
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from iso3166_updates import Updates, AsyncUpdates
+
+async def _measure_loop_lag(stop: asyncio.Event, interval: float, lags: list) -> None:
+    """ Repeatedly sleep for the interval, recording how late the event loop woke up each time. """
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, loop.time() - expected))
+
+async def bench_loop_lag(mode: str="thread", queries: int=8, likeness_score: int=60, interval: float=0.005) -> dict:
+    """
+    Measure the event loop lag whilst a number of concurrent fuzzy searches are awaited. In the
+    "inline" mode the synchronous Updates.search is called directly on the event loop, as per the
+    synchronous AsyncUpdates.search, otherwise the searches are awaited via AsyncUpdates.asearch,
+    offloaded to its thread or process executor.
+
+    Parameters
+    ==========
+    :mode: str (default="thread")
+        "inline", "thread" or "process".
+    :queries: int (default=8)
+        number of concurrent search queries.
+    :likeness_score: int (default=60)
+        likeness score of the fuzzy searches, lower scores are more expensive.
+    :interval: float (default=0.005)
+        sleep interval of the loop lag probe, in seconds.
+
+    Returns
+    =======
+    :results: dict
+        total elapsed time, max and p99 loop lag, in milliseconds.
+    """
+    search_terms = ["canton", "province", "region", "municipality", "district", "parish", "county", "department"]
+    if (mode == "inline"):
+        iso = Updates()
+        iso.all
+        async def search(term):
+            return iso.search(term, likeness_score=likeness_score)
+    else:
+        iso = AsyncUpdates(executor=mode)
+        iso.all
+        search = lambda term: iso.asearch(term, likeness_score=likeness_score)
+        #warm up executor, starting any worker processes
+        await iso.astats()
+
+    stop, lags = asyncio.Event(), []
+    probe = asyncio.create_task(_measure_loop_lag(stop, interval, lags))
+    start = time.perf_counter()
+    await asyncio.gather(*(search(search_terms[i % len(search_terms)]) for i in range(queries)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await probe
+    if (mode != "inline"):
+        iso.close()
+
+    lags = sorted(lags) or [0.0]
+    return {"elapsed_ms": round(elapsed * 1000, 1), "max_lag_ms": round(lags[-1] * 1000, 2),
+            "p99_lag_ms": round(lags[min(len(lags) - 1, int(len(lags) * 0.99))] * 1000, 2)}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark event loop lag during concurrent AsyncUpdates searches.')
+    parser.add_argument('-queries', '--queries', type=int, required=False, default=8, 
+        help='Number of concurrent search queries.')
+    parser.add_argument('-likeness_score', '--likeness_score', type=int, required=False, default=60, 
+        help='Likeness score of the fuzzy searches.')
+
+    #parse input args
+    args = parser.parse_args()
+
+    for mode in ("inline", "thread", "process"):
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = asyncio.run(bench_loop_lag(mode, args.queries, args.likeness_score))
+        print(f"{mode:>8}: {args.queries} searches in {results['elapsed_ms']} ms, "
+              f"loop lag max {results['max_lag_ms']} ms, p99 {results['p99_lag_ms']} ms.")
@@ -0,0 +1,86 @@
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import threading
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from iso3166_updates import Updates
+
+def bench_concurrent_reads(readers: int=4, duration: float=5.0, with_writer: bool=True) -> dict:
+    """
+    Measure the throughput of Updates queries from multiple reader threads whilst a writer
+    thread continuously adds and deletes a custom update. Readers never take a lock, each
+    query runs against a snapshot of the current dataset generation.
+
+    Parameters
+    ==========
+    :readers: int (default=4)
+        number of concurrent reader threads.
+    :duration: float (default=5.0)
+        number of seconds to run the benchmark for.
+    :with_writer: bool (default=True)
+        whether to run the writer thread alongside the readers.
+
+    Returns
+    =======
+    :results: dict
+        total reads, reads/sec and total writes completed during the benchmark.
+    """
+    temp_dir = tempfile.mkdtemp()
+    try:
+        updates_filepath = os.path.join(temp_dir, "iso3166-updates.json")
+        shutil.copyfile(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "iso3166_updates", "iso3166-updates.json"), updates_filepath)
+        iso = Updates(custom_updates_filepath=updates_filepath)
+        iso.all
+
+        stop = threading.Event()
+        read_counts = [0] * readers
+        write_count = [0]
+
+        #each reader cycles through a mix of country, year and search queries
+        def reader(index: int) -> None:
+            queries = (lambda: iso["FR,DE,JP"], lambda: iso.year("2020-2023"), lambda: iso.search("addition", include_match_score=False))
+            while not stop.is_set():
+                queries[read_counts[index] % len(queries)]()
+                read_counts[index] += 1
+
+        #writer repeatedly adds then deletes a custom update, persisting each change to a copy of the dataset
+        def writer() -> None:
+            save_new_filename = os.path.join(temp_dir, "iso3166-updates-copy.json")
+            while not stop.is_set():
+                iso.custom_update("JP", change="Benchmark change", date_issued="2025-01-01", save_new=True, save_new_filename=save_new_filename)
+                iso.custom_update("JP", change="Benchmark change", date_issued="2025-01-01", delete=True, save_new=True, save_new_filename=save_new_filename)
+                write_count[0] += 2
+
+        threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+        if (with_writer):
+            threads.append(threading.Thread(target=writer))
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        time.sleep(duration)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+    finally:
+        shutil.rmtree(temp_dir)
+
+    return {"reads": sum(read_counts), "reads_per_sec": round(sum(read_counts) / elapsed, 1), "writes": write_count[0]}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark Updates read throughput under concurrent custom updates.')
+    parser.add_argument('-readers', '--readers', type=int, required=False, default=4, 
+        help='Number of concurrent reader threads.')
+    parser.add_argument('-duration', '--duration', type=float, required=False, default=5.0, 
+        help='Duration of each benchmark run, in seconds.')
+
+    #parse input args
+    args = parser.parse_args()
+
+    for with_writer in (False, True):
+        results = bench_concurrent_reads(args.readers, args.duration, with_writer)
+        print(f"{args.readers} reader(s), {'with' if with_writer else 'without'} concurrent writer: "
+              f"{results['reads']} reads ({results['reads_per_sec']} reads/sec), {results['writes']} writes.")
@@ -0,0 +1,56 @@
+import os
+import sys
+import json
+import argparse
+import timeit
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from iso3166_updates import Updates
+
+def bench_json_bytes(number: int=50) -> dict:
+    """
+    Measure the mean time per call of serializing country and year lookups to UTF-8 JSON 
+    via json.dumps of the lookup output, against to_json_bytes(), which joins the cached 
+    pre-serialized fragments of each country's updates.
+
+    Parameters
+    ==========
+    :number: int (default=50)
+        number of calls of each lookup to time.
+
+    Returns
+    =======
+    :results: dict
+        mean milliseconds per call of each lookup, via json.dumps and to_json_bytes().
+    """
+    iso = Updates(response_cache=True)
+    iso.all
+
+    lookups = {
+        "alpha FR": ({"alpha_code": "FR"}, lambda: iso["FR"]),
+        "alpha FR,DE,JP,CN,IN": ({"alpha_code": "FR,DE,JP,CN,IN"}, lambda: iso["FR,DE,JP,CN,IN"]),
+        "year 2023": ({"year": "2023"}, lambda: iso.year("2023")),
+        "year 2014,2016": ({"year": "2014,2016"}, lambda: iso.year("2014,2016")),
+        "year >2015": ({"year": ">2015"}, lambda: iso.year(">2015")),
+        "all": ({}, lambda: iso.all),
+    }
+
+    results = {}
+    for name, (kwargs, lookup) in lookups.items():
+        results[name] = {
+            "json.dumps": round(timeit.timeit(lambda: json.dumps(lookup()).encode("utf-8"), number=number) / number * 1000, 3),
+            "to_json_bytes": round(timeit.timeit(lambda: iso.to_json_bytes(**kwargs), number=number) / number * 1000, 3),
+        }
+
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark serializing Updates lookups to JSON bytes.')
+    parser.add_argument('-number', '--number', type=int, required=False, default=50,
+        help='Number of calls of each lookup to time.')
+
+    #parse input args
+    args = parser.parse_args()
+
+    for name, timings in bench_json_bytes(args.number).items():
+        print(f"{name}: {timings['json.dumps']} ms/call json.dumps, {timings['to_json_bytes']} ms/call to_json_bytes "
+              f"({round(timings['json.dumps'] / timings['to_json_bytes'], 1)}x).")
@@ -0,0 +1,51 @@
+import os
+import sys
+import argparse
+import timeit
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from iso3166_updates import Updates
+
+def bench_raw_output(number: int=20) -> dict:
+    """
+    Measure the mean time per call of the Updates query methods in their default mode,
+    which wraps the output in the Map class and copies each update where attributes are
+    added, against the raw mode, which returns shared references to the dataset.
+
+    Parameters
+    ==========
+    :number: int (default=20)
+        number of calls of each query to time.
+
+    Returns
+    =======
+    :results: dict
+        mean milliseconds per call of each query, in default and raw modes.
+    """
+    iso = Updates()
+    iso.all
+
+    queries = {
+        "alpha": lambda raw: iso.alpha("FR,GB,DE,JP,CN,IN,ID,ES,IT,NG", raw=raw),
+        "year": lambda raw: iso.year(">2000", raw=raw),
+        "date_range (sorted)": lambda raw: iso.date_range("2000-01-01", sort_by_date="dateDesc", raw=raw),
+        "search": lambda raw: iso.search("addition, deletion", raw=raw),
+    }
+
+    results = {}
+    for name, query in queries.items():
+        results[name] = {mode: round(timeit.timeit(lambda: query(raw), number=number) / number * 1000, 3)
+                         for mode, raw in (("default", False), ("raw", True))}
+
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark Updates query methods in default and raw output modes.')
+    parser.add_argument('-number', '--number', type=int, required=False, default=20,
+        help='Number of calls of each query to time.')
+
+    #parse input args
+    args = parser.parse_args()
+
+    for name, timings in bench_raw_output(args.number).items():
+        print(f"{name}: {timings['default']} ms/call default, {timings['raw']} ms/call raw "
+              f"({round(timings['default'] / timings['raw'], 1)}x).")
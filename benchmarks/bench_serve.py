@@ -0,0 +1,142 @@
+import os
+import sys
+import time
+import socket
+import argparse
+import threading
+import subprocess
+import http.client
+from urllib.parse import urlsplit
+
+DEFAULT_TARGETS = ["/api/alpha/FR", "/api/alpha/DE,JP,CN", "/api/year/2023", "/api/year/2014,2016", "/api/all",
+                   "/api/search/parishes", "/api/date_range/2019-01-01,2023-12-31?sortBy=dateDesc"]
+
+def bench_serve(url: str, targets: list, concurrency: int=8, duration: float=10.0, accept_gzip: bool=True, conditional: bool=False) -> dict:
+    """
+    Load test a running iso3166-updates API server, with a number of concurrent clients each
+    sending requests for the targets in turn over a persistent HTTP/1.1 connection.
+
+    Parameters
+    ==========
+    :url: str
+        base URL of the server, e.g. http://127.0.0.1:8000.
+    :targets: list
+        request targets to cycle through, e.g. /api/alpha/FR.
+    :concurrency: int (default=8)
+        number of concurrent client threads.
+    :duration: float (default=10.0)
+        number of seconds to run the load test for.
+    :accept_gzip: bool (default=True)
+        whether clients accept gzip encoded responses.
+    :conditional: bool (default=False)
+        whether clients send the ETag of their previous response for a target in the 
+        If-None-Match header, so unchanged responses are answered with a 304.
+
+    Returns
+    =======
+    :results: dict
+        total requests, requests/sec, p50/p99/max latency in milliseconds and count of each status code.
+    """
+    split_url = urlsplit(url)
+    stop = threading.Event()
+    latencies = [[] for _ in range(concurrency)]
+    statuses = [{} for _ in range(concurrency)]
+    errors = [0] * concurrency
+
+    def client(index: int) -> None:
+        connection = http.client.HTTPConnection(split_url.hostname, split_url.port or 80, timeout=30)
+        etags = {}
+        i = index
+        while not stop.is_set():
+            target = targets[i % len(targets)]
+            i += 1
+            headers = {"Accept-Encoding": "gzip"} if accept_gzip else {}
+            if conditional and target in etags:
+                headers["If-None-Match"] = etags[target]
+            start = time.perf_counter()
+            try:
+                connection.request("GET", target, headers=headers)
+                response = connection.getresponse()
+                response.read()
+            except (OSError, http.client.HTTPException):
+                errors[index] += 1
+                connection.close()
+                connection = http.client.HTTPConnection(split_url.hostname, split_url.port or 80, timeout=30)
+                continue
+            latencies[index].append(time.perf_counter() - start)
+            statuses[index][response.status] = statuses[index].get(response.status, 0) + 1
+            if response.getheader("ETag"):
+                etags[target] = response.getheader("ETag")
+        connection.close()
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    all_latencies = sorted(latency for client_latencies in latencies for latency in client_latencies)
+    all_statuses = {}
+    for client_statuses in statuses:
+        for status, count in client_statuses.items():
+            all_statuses[status] = all_statuses.get(status, 0) + count
+
+    def percentile(p: float) -> float:
+        return round(all_latencies[min(len(all_latencies) - 1, int(len(all_latencies) * p))] * 1000, 3) if all_latencies else 0.0
+
+    return {"requests": len(all_latencies), "requests_per_sec": round(len(all_latencies) / elapsed, 1), "p50_ms": percentile(0.50), 
+            "p99_ms": percentile(0.99), "max_ms": percentile(1.0), "statuses": all_statuses, "errors": sum(errors)}
+
+def start_server(workers: int) -> tuple:
+    """ Start an API server on a free port in a subprocess, returning the process and its base URL. """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    process = subprocess.Popen([sys.executable, "-m", "iso3166_updates.serve", "--port", str(port), "--workers", str(workers)],
+                               cwd=os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."), stdout=subprocess.DEVNULL)
+
+    #wait until the server accepts connections
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            break
+        except OSError:
+            time.sleep(0.2)
+
+    return process, f"http://127.0.0.1:{port}"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Load test the iso3166-updates API server, reporting requests/sec and p99 latency.')
+    parser.add_argument('-url', '--url', type=str, required=False, default="",
+        help='Base URL of a running server, by default a server is started for the load test.')
+    parser.add_argument('-workers', '--workers', type=int, required=False, default=os.cpu_count() or 1,
+        help='Number of worker processes of the started server.')
+    parser.add_argument('-concurrency', '--concurrency', type=int, required=False, default=8,
+        help='Number of concurrent clients.')
+    parser.add_argument('-duration', '--duration', type=float, required=False, default=10.0,
+        help='Duration of each load test, in seconds.')
+    parser.add_argument('-targets', '--targets', type=str, nargs='+', required=False, default=DEFAULT_TARGETS,
+        help='Space separated request targets, e.g. /api/alpha/FR /api/year/2023.')
+
+    #parse input args
+    args = parser.parse_args()
+
+    process = None
+    url = args.url
+    if not (url):
+        process, url = start_server(args.workers)
+    try:
+        for conditional in (False, True):
+            results = bench_serve(url, args.targets, args.concurrency, args.duration, conditional=conditional)
+            print(f"{args.concurrency} client(s), {'conditional' if conditional else 'unconditional'} requests: {results['requests']} requests "
+                  f"({results['requests_per_sec']} requests/sec), p50 {results['p50_ms']} ms, p99 {results['p99_ms']} ms, "
+                  f"max {results['max_ms']} ms, statuses {results['statuses']}, {results['errors']} errors.")
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
@@ -27,10 +27,12 @@ import xml.etree.ElementTree as ET
 from xml.dom import minidom
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
+from contextlib import contextmanager
 
 def get_iso3166_updates(alpha_codes: str="", year: str="", export_filename: str="iso3166-updates", export_folder: str="iso3166-updates-output",
         alpha_codes_range: str="", concat_updates: bool=True, export_json: bool=True, export_csv: bool=True, export_xml: bool=False, verbose: bool=True, 
-        use_selenium: bool=True, use_wiki: bool=True, include_remarks_data: bool=True, save_each_iteration=False, use_proxy: bool=True) -> Dict[str, Union[List[Dict], pd.DataFrame]]:
+        use_selenium: bool=True, use_wiki: bool=True, include_remarks_data: bool=True, save_each_iteration=False, use_proxy: bool=True,
+        max_drivers: int=4, max_driver_pages: int=50, max_driver_memory_mb: int=1024) -> Dict[str, Union[List[Dict], pd.DataFrame]]:
     """
     Get all listed changes/updates to a country's ISO 3166-2 subdivision codes/names. The two data
     sources for the updates data are via the "Changes" section on its wiki page as well as any listed
@@ -120,6 +122,14 @@ def get_iso3166_updates(alpha_codes: str="", year: str="", export_filename: str=
         if set to True then use a proxy IP when creating the Chromedriver via the create_driver
         module/function. This was implemented to help the Chromedriver stop getting blocked via 
         429 errors.
+    :max_drivers: int (default=4)
+        maximum number of Chromedriver instances in the pool used to load the countries' ISO 
+        pages concurrently, started lazily by the workers.
+    :max_driver_pages: int (default=50)
+        number of ISO pages a Chromedriver instance loads before it's recycled, 0 to not recycle.
+    :max_driver_memory_mb: int (default=1024)
+        memory usage in megabytes of a Chromedriver instance's page above which it's recycled, 0 to
+        not recycle.
 
     Returns
     =======
@@ -167,18 +177,15 @@ def get_iso3166_updates(alpha_codes: str="", year: str="", export_filename: str=
         #create instance of Free Proxy class & get random proxy
         proxy = FreeProxy().get()
 
-    #create webdriver instance if using Selenium, pass in proxy IP, if applicable
+    #create pool of webdriver instances if using Selenium, pass in proxy IP, if applicable, the first driver is started upfront
     if (use_selenium):
-        driver = create_driver(proxy)
+        driver_pool = DriverPool(max_drivers, proxy, max_driver_pages, max_driver_memory_mb)
     else:
-        driver = None
+        driver_pool = None
 
     #start elapsed time counter
     start = time.time()
     
-    #create a lock for thread-safe driver access if using Selenium
-    driver_lock = threading.Lock() if use_selenium else None
-    
     #helper function to process a single country's updates
     def process_country(alpha2: str) -> Tuple[str, List[Dict]]:
         """
@@ -192,8 +199,8 @@ def get_iso3166_updates(alpha_codes: str="", year: str="", export_filename: str=
                 iso3166_df_wiki = get_updates_df_wiki(alpha2)
 
                 #use Selenium Chromedriver to parse country's updates data from official ISO website
-                # Thread-safe access to driver
-                with driver_lock:
+                #each worker loads the page on its own driver from the pool
+                with driver_pool.driver() as driver:
                     iso_website_df, remarks_data = get_updates_df_selenium(alpha2, driver, include_remarks_data)
 
                 #concatenate two updates dataframes
@@ -208,8 +215,8 @@ def get_iso3166_updates(alpha_codes: str="", year: str="", export_filename: str=
             #pull just ISO page data 
             elif (use_selenium):
                 #use Selenium Chromedriver to parse country's updates data from official ISO website
-                # Thread-safe access to driver
-                with driver_lock:
+                #each worker loads the page on its own driver from the pool
+                with driver_pool.driver() as driver:
                     iso3166_df, remarks_data = get_updates_df_selenium(alpha2, driver, include_remarks_data)
             
             #raise error if both bools are set to False, no data being exported
@@ -263,45 +270,48 @@ def get_iso3166_updates(alpha_codes: str="", year: str="", export_filename: str=
     max_workers = min(15, len(alpha_codes_list))  # Use 15 workers or number of countries, whichever is smaller
     max_workers = max(1, max_workers)  # Ensure at least 1 worker
     
-    #initalise tqdm progress bar, if less than 5 alpha-2 codes input then don't display progress bar
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        #submit all tasks to executor
-        futures = {executor.submit(process_country, alpha2): alpha2 for alpha2 in alpha_codes_list}
+    try:
+        #start the pool's first driver, the pool is closed even if starting it or fetching the updates fails
+        if (driver_pool is not None):
+            driver_pool.start()
+
+        #initalise tqdm progress bar, if less than 5 alpha-2 codes input then don't display progress bar
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            #submit all tasks to executor
+            futures = {executor.submit(process_country, alpha2): alpha2 for alpha2 in alpha_codes_list}
         
-        #process completed futures with progress bar
-        progress_bar = tqdm(as_completed(futures), total=len(futures), ncols=80, disable=(len(alpha_codes_list) < 5))
+            #process completed futures with progress bar
+            progress_bar = tqdm(as_completed(futures), total=len(futures), ncols=80, disable=(len(alpha_codes_list) < 5))
         
-        for future in progress_bar:
-            alpha2 = futures[future]
-            try:
-                result_alpha2, updates = future.result()
-                all_iso3166_updates[result_alpha2] = updates
+            for future in progress_bar:
+                alpha2 = futures[future]
+                try:
+                    result_alpha2, updates = future.result()
+                    all_iso3166_updates[result_alpha2] = updates
                 
-                #update progress bar description with country info
-                flag_icon = flag.flag(result_alpha2) if result_alpha2 != "XK" else ""
-                country_name = iso3166.countries_by_alpha2.get(result_alpha2)
-                if country_name:
-                    progress_bar.set_description(f"{country_name.name.title()} ({result_alpha2}) {flag_icon}")
+                    #update progress bar description with country info
+                    flag_icon = flag.flag(result_alpha2) if result_alpha2 != "XK" else ""
+                    country_name = iso3166.countries_by_alpha2.get(result_alpha2)
+                    if country_name:
+                        progress_bar.set_description(f"{country_name.name.title()} ({result_alpha2}) {flag_icon}")
                 
-                #save the updates data export at current iteration if requested
-                if (save_each_iteration):
-                    export_updates(all_iso3166_updates, export_folder, export_filename, export_json, export_csv, export_xml, 
-                                   concat_updates, result_alpha2, alpha_codes_range, year, year_range, year_greater_than, 
-                                   year_less_than, year_not_equal)
+                    #save the updates data export at current iteration if requested
+                    if (save_each_iteration):
+                        export_updates(all_iso3166_updates, export_folder, export_filename, export_json, export_csv, export_xml, 
+                                       concat_updates, result_alpha2, alpha_codes_range, year, year_range, year_greater_than, 
+                                       year_less_than, year_not_equal)
                     
-            except Exception as e:
-                if (verbose):
-                    print(f"Error retrieving result for {alpha2}: {str(e)}")
+                except Exception as e:
+                    if (verbose):
+                        print(f"Error retrieving result for {alpha2}: {str(e)}")
         
-        progress_bar.close()
-    
-    #close Selenium webdriver if it was created
-    if (use_selenium and driver is not None):
-        try:
-            driver.quit()
-        except Exception as e:
+            progress_bar.close()
+    finally:
+        #close all Selenium webdrivers in the pool if it was created
+        if (driver_pool is not None):
+            driver_pool.close()
             if (verbose):
-                print(f"Warning: Error closing Selenium driver: {str(e)}")    
+                print(f"Selenium drivers created: {driver_pool.created}, recycled: {driver_pool.recycled}, replaced: {driver_pool.replaced}")
 
     #end elapsed time counter and calculate
     end = time.time()
@@ -477,6 +487,195 @@ def create_driver(proxy: str=None) -> webdriver.Chrome:
 
     return driver
 
+#copy of iso3166_updates_export.driver.DriverPool, as this Cloud Run scraper is deployed standalone without the export
+#package, any changes to the pool must be kept in sync with iso3166_updates_export/driver.py
+class DriverPool:
+    """
+    Thread-safe pool of Selenium Chromedriver instances, created via create_driver, so multiple
+    workers can load the countries' ISO pages concurrently, each on its own driver, rather than
+    sharing a single driver behind a lock. Drivers are started lazily, up to the pool's size, 
+    when a worker first needs one. Each driver is checked to be alive before it's handed out and
+    after any error, with crashed or unresponsive drivers quit and replaced by a new driver. 
+    Drivers are also recycled after loading a maximum number of pages or when the browser's 
+    memory usage grows too large, as long-running Chrome sessions leak memory.
+
+    Parameters
+    ==========
+    :size: int (default=1)
+        maximum number of drivers running concurrently.
+    :proxy: str (default=None)
+        proxy IP to use when creating the drivers.
+    :max_pages: int (default=50)
+        number of pages a driver loads before it's recycled, 0 to not recycle by number of pages.
+    :max_memory_mb: int (default=1024)
+        used JS heap size in megabytes of a driver's page above which it's recycled, 0 to not 
+        recycle by memory usage.
+    :driver_factory: callable (default=None)
+        function called with the proxy to create each driver, by default create_driver.
+
+    Usage
+    =====
+    with DriverPool(size=4) as pool:
+        with pool.driver() as driver:
+            get_updates_df_selenium("AD", driver)
+
+    Raises
+    ======
+    ValueError:
+        Invalid pool size or recycling thresholds.
+    """
+    def __init__(self, size: int=1, proxy: str=None, max_pages: int=50, max_memory_mb: int=1024, driver_factory=None) -> None:
+        #raise error if invalid pool size or recycling thresholds input
+        if (size < 1):
+            raise ValueError(f"Expected a driver pool size of at least 1, got {size}.")
+        if (max_pages < 0 or max_memory_mb < 0):
+            raise ValueError(f"Expected non-negative recycling thresholds, got {max_pages} pages and {max_memory_mb} MB.")
+        self.size = size
+        self.proxy = proxy
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self.driver_factory = driver_factory or create_driver
+
+        #idle drivers and their number of loaded pages, number of drivers running or being started 
+        self._idle = []
+        self._pages = {}
+        self._running = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+        #number of drivers created, recycled and replaced after crashing
+        self.created = 0
+        self.recycled = 0
+        self.replaced = 0
+
+    def acquire(self, timeout: float=None) -> webdriver.Chrome:
+        """
+        Get an idle, live driver from the pool, starting a new driver if none are idle and the
+        pool isn't full, otherwise waiting for a driver to be released. Raises a RuntimeError if
+        the pool is closed and a TimeoutError if no driver is available within the timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._condition:
+                while not (self._closed or self._idle or self._running < self.size):
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if (remaining is not None and remaining <= 0):
+                        raise TimeoutError(f"No driver available in the pool within {timeout} seconds.")
+                    self._condition.wait(remaining)
+                if (self._closed):
+                    raise RuntimeError("Driver pool is closed.")
+                driver = self._idle.pop() if self._idle else None
+                if (driver is None):
+                    self._running += 1
+
+            #start a new driver outside the lock, releasing its slot if it fails to start
+            if (driver is None):
+                try:
+                    driver = self.driver_factory(self.proxy)
+                except Exception:
+                    with self._condition:
+                        self._running -= 1
+                        self._condition.notify()
+                    raise
+                with self._condition:
+                    self.created += 1
+                    self._pages[driver] = 0
+                return driver
+
+            #replace idle drivers that have crashed since they were released
+            if (self.is_alive(driver)):
+                return driver
+            self._discard(driver)
+            with self._condition:
+                self.replaced += 1
+
+    def start(self, count: int=1) -> None:
+        """ Eagerly start drivers, up to the pool's size, e.g. to check drivers can be created before using the pool. """
+        drivers = [self.acquire() for _ in range(min(count, self.size))]
+        with self._condition:
+            self._idle.extend(drivers)
+            self._condition.notify_all()
+
+    def release(self, driver: webdriver.Chrome, failed: bool=False) -> None:
+        """
+        Return a driver to the pool after loading a page. The driver is quit rather than reused if
+        the pool is closed, if it has crashed after a failed page load, or if it has reached the 
+        maximum number of pages or memory usage, its replacement being started lazily.
+        """
+        with self._condition:
+            self._pages[driver] = self._pages.get(driver, 0) + 1
+            pages = self._pages[driver]
+            closed = self._closed
+
+        if (closed):
+            self._discard(driver)
+        elif (failed and not self.is_alive(driver)):
+            self._discard(driver)
+            with self._condition:
+                self.replaced += 1
+        elif ((self.max_pages and pages >= self.max_pages) or 
+              (self.max_memory_mb and self.memory_usage(driver) > self.max_memory_mb)):
+            self._discard(driver)
+            with self._condition:
+                self.recycled += 1
+        else:
+            with self._condition:
+                self._idle.append(driver)
+                self._condition.notify()
+
+    @contextmanager
+    def driver(self, timeout: float=None):
+        """ Context manager acquiring a driver from the pool and releasing it on exit. """
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        except BaseException:
+            self.release(driver, failed=True)
+            raise
+        self.release(driver)
+
+    @staticmethod
+    def is_alive(driver: webdriver.Chrome) -> bool:
+        """ Liveness check of a driver, whether its browser session responds to a script. """
+        try:
+            return driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    @staticmethod
+    def memory_usage(driver: webdriver.Chrome) -> float:
+        """ Used JS heap size in megabytes of a driver's current page, 0 if unavailable. """
+        try:
+            return float(driver.execute_script("return window.performance.memory ? window.performance.memory.usedJSHeapSize : 0") or 0) / 1048576
+        except Exception:
+            return 0
+
+    def _discard(self, driver: webdriver.Chrome) -> None:
+        """ Quit a driver and free its slot in the pool. """
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        with self._condition:
+            self._pages.pop(driver, None)
+            self._running -= 1
+            self._condition.notify()
+
+    def close(self) -> None:
+        """ Quit all idle drivers, drivers in use are quit when they're released. """
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for driver in idle:
+            self._discard(driver)
+
+    def __enter__(self) -> "DriverPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
 def get_updates_df_wiki(alpha_code: str, proxy: str=None) -> pd.DataFrame:
     """
     Pull all related ISO 3166 updates/changes for a given input country from the country's
@@ -1,22 +1,1208 @@
 from __future__ import annotations
 import os
 import sys
+import io
+import csv
 import json
-import re
 import copy
+import gzip
+import zlib
+import struct
+import re
+import unicodedata
+import hashlib
+import tempfile
+import shutil
+import atexit
+import weakref
 import asyncio
-from functools import lru_cache
+import ssl
+import urllib.parse
+import threading
+import bisect
+from functools import lru_cache, partial
+from contextlib import contextmanager
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Iterable
 from datetime import datetime
 from importlib.metadata import version as _pkg_version
 from pycountry import countries
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util import Retry
 from thefuzz import fuzz
+if (os.name == "nt"):
+    import msvcrt
+else:
+    import fcntl
+
+def _open_updates_file(filepath: str):
+    """Open an updates JSON file for reading as text, decompressing gzip compressed (.gz) files."""
+    if filepath.endswith(".gz"):
+        return gzip.open(filepath, "rt", encoding="utf-8")
+    return open(filepath, "r", encoding="utf-8")
 
-@lru_cache(maxsize=None)
 def _load_updates_json(filepath: str) -> dict:
-    """Load and cache the ISO 3166 updates JSON, keyed by filepath to avoid repeated disk I/O."""
-    with open(filepath, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """
+    Load the ISO 3166 updates JSON, cached by its filepath, size and modification time to avoid
+    repeated disk I/O, so a file rewritten by another process, e.g. compacted, is reloaded.
+    """
+    file_stat = os.stat(filepath)
+    return _read_updates_json(filepath, file_stat.st_size, file_stat.st_mtime_ns)
+
+@lru_cache(maxsize=32)
+def _read_updates_json(filepath: str, size: int, mtime_ns: int) -> dict:
+    """Load and cache the ISO 3166 updates JSON, keyed by its filepath, size and modification time."""
+    with _open_updates_file(filepath) as f:
+        return {alpha_code: _read_only_updates(country_updates) for alpha_code, country_updates in json.load(f).items()}
+
+def _country_index_path(filepath: str) -> str:
+    """Return the filepath of the per-country offset index sidecar for an updates JSON file."""
+    return os.path.splitext(filepath)[0] + ".index.json"
+
+def _build_country_index(filepath: str) -> dict:
+    """
+    Scan an updates JSON file and return the byte offset and length of each country's
+    array of updates, keyed by alpha-2 code. The offsets allow an individual country's
+    updates to be read and parsed without loading the rest of the file. Compressed files can't
+    be read by offset so aren't indexed.
+    """
+    if filepath.endswith(".gz"):
+        raise ValueError(f"Compressed updates file can't be indexed: {filepath}.")
+    with open(filepath, "rb") as f:
+        raw = f.read()
+    text = raw.decode("utf-8")
+    decoder = json.JSONDecoder()
+    whitespace = re.compile(r"\s*")
+
+    #track the last converted char/byte position so char offsets can be converted into byte offsets incrementally
+    last_char, last_byte = 0, 0
+    def to_byte_offset(char_pos: int) -> int:
+        nonlocal last_char, last_byte
+        last_byte += len(text[last_char:char_pos].encode("utf-8"))
+        last_char = char_pos
+        return last_byte
+
+    country_index = {}
+    pos = whitespace.match(text, 0).end()
+    if text[pos:pos + 1] != "{":
+        raise ValueError(f"Expected updates JSON to be an object keyed by country code: {filepath}.")
+    pos = whitespace.match(text, pos + 1).end()
+
+    #iterate over each "alpha-2": [...] pair in the top-level object, recording the span of each array
+    while text[pos:pos + 1] != "}":
+        alpha_code, pos = decoder.raw_decode(text, pos)
+        pos = whitespace.match(text, pos).end()
+        if text[pos:pos + 1] != ":":
+            raise ValueError(f"Invalid JSON found whilst indexing updates file: {filepath}.")
+        start = whitespace.match(text, pos + 1).end()
+        _, end = decoder.raw_decode(text, start)
+        start_byte = to_byte_offset(start)
+        country_index[alpha_code] = [start_byte, to_byte_offset(end) - start_byte]
+        pos = whitespace.match(text, end).end()
+        if text[pos:pos + 1] == ",":
+            pos = whitespace.match(text, pos + 1).end()
+
+    return {"size": len(raw), "countries": country_index}
+
+def _write_country_index(filepath: str, country_index: dict) -> None:
+    """Atomically write the per-country offset index sidecar, silently skipping read-only install dirs."""
+    index_path = _country_index_path(filepath)
+    temp_path = f"{index_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(country_index, f, separators=(",", ":"))
+        os.replace(temp_path, index_path)
+    except OSError:
+        if os.path.isfile(temp_path):
+            os.remove(temp_path)
+
+@lru_cache(maxsize=None)
+def _load_country_index(filepath: str, size: int, mtime_ns: int) -> dict:
+    """
+    Load and cache the per-country offset index for an updates JSON file, keyed by its
+    filepath, size and modification time. The sidecar index is used if its recorded size
+    matches the file, otherwise the index is rebuilt from the file and the sidecar rewritten.
+    """
+    try:
+        with open(_country_index_path(filepath), "r", encoding="utf-8") as f:
+            country_index = json.load(f)
+        if country_index.get("size") == size:
+            return country_index["countries"]
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    country_index = _build_country_index(filepath)
+    _write_country_index(filepath, country_index)
+    return country_index["countries"]
+
+def _read_country_updates(filepath: str, offset: int, length: int) -> list:
+    """Read and parse a single country's array of updates from its byte span in the updates JSON file."""
+    with open(filepath, "rb") as f:
+        f.seek(offset)
+        raw = f.read(length)
+
+    #validate the span still delimits a JSON array, the file may have changed since it was indexed
+    if not (raw[:1] == b"[" and raw[-1:] == b"]"):
+        raise ValueError(f"Stale country offset index for updates file: {filepath}.")
+    country_updates = json.loads(raw.decode("utf-8"))
+    if not isinstance(country_updates, list):
+        raise ValueError(f"Stale country offset index for updates file: {filepath}.")
+    return _read_only_updates(country_updates)
+
+#header of a gzip member, without a filename or modification time, and the empty final deflate block ending its deflate stream
+_GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x02\xff"
+_DEFLATE_END = b"\x03\x00"
+
+def _deflate(data: bytes, level: int=9) -> bytes:
+    """
+    Raw deflate compress a fragment of a gzip member's data. The fragment is compressed on its
+    own and sync flushed, so it ends on a byte boundary without ending the deflate stream and 
+    can be joined with other fragments into a single gzip member via _gzip_join().
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+def _gzip_join(fragments: Iterable) -> bytes:
+    """
+    Join (data, deflated) pairs of data and its _deflate() fragment into a single gzip member, 
+    ending the deflate stream with an empty final block followed by the trailer of the CRC32 
+    and size of the fragments' joined data.
+    """
+    crc, size, gzip_parts = 0, 0, [_GZIP_HEADER]
+    for data, deflated in fragments:
+        crc = zlib.crc32(data, crc)
+        size += len(data)
+        gzip_parts.append(deflated)
+    gzip_parts.append(_DEFLATE_END + struct.pack("<II", crc, size & 0xffffffff))
+    return b"".join(gzip_parts)
+
+def _journal_path(filepath: str) -> str:
+    """Return the filepath of the append-only custom updates journal for an updates JSON file."""
+    return os.path.splitext(filepath)[0] + ".journal.ndjson"
+
+def _overlay_journal_path(filepath: str, overlay: str, overlay_dir: str="") -> str:
+    """
+    Return the filepath of the append-only journal of a named overlay of custom updates for an 
+    updates JSON file, stored in the overlay directory or otherwise alongside the updates file.
+    """
+    if not (isinstance(overlay, str) and re.fullmatch(r"[A-Za-z0-9_\-]+", overlay)):
+        raise ValueError(f"Overlay name should only contain letters, digits, underscores or hyphens, got {overlay!r}.")
+    filename = os.path.splitext(os.path.basename(filepath))[0] + f".{overlay}.overlay.ndjson"
+    return os.path.join(overlay_dir or os.path.dirname(filepath), filename)
+
+def _fsync_dir(dirpath: str) -> None:
+    """Flush a directory's entries to disk so created, renamed or removed files survive a crash, where supported."""
+    try:
+        dir_fd = os.open(dirpath or ".", os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+@contextmanager
+def _journal_lock(journal_path: str):
+    """
+    Hold an exclusive inter-process lock on a custom updates journal, via its sidecar lock file, 
+    so operations appended by another process can't be lost whilst the journal is read and
+    atomically replaced during compaction.
+    """
+    lock_fd = os.open(f"{journal_path}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if (os.name == "nt"):
+            #msvcrt only retries a blocking lock for 10 seconds before raising
+            while True:
+                try:
+                    msvcrt.locking(lock_fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        else:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if (os.name == "nt"):
+                os.lseek(lock_fd, 0, os.SEEK_SET)
+                msvcrt.locking(lock_fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(lock_fd, fcntl.LOCK_UN)
+    finally:
+        os.close(lock_fd)
+
+def _append_journal(journal_path: str, operations: list) -> None:
+    """
+    Durably append custom update operations to a custom updates journal, as NDJSON lines written 
+    with O_APPEND writes and fsynced before returning. A torn final line, left by a crash 
+    mid-append, is truncated first so the operations start on their own line. The journal's lock
+    is held whilst appending, so an append can't land in a journal being replaced by compaction.
+    """
+    lines = "".join(json.dumps(operation, ensure_ascii=False) + "\n" for operation in operations).encode("utf-8")
+    with _journal_lock(journal_path):
+        created = not os.path.isfile(journal_path)
+        journal_fd = os.open(journal_path, os.O_RDWR | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            size = os.fstat(journal_fd).st_size
+            if (size):
+                os.lseek(journal_fd, size - 1, os.SEEK_SET)
+                if os.read(journal_fd, 1) != b"\n":
+                    os.lseek(journal_fd, 0, os.SEEK_SET)
+                    os.ftruncate(journal_fd, os.read(journal_fd, size).rfind(b"\n") + 1)
+            while (lines):
+                lines = lines[os.write(journal_fd, lines):]
+            os.fsync(journal_fd)
+        finally:
+            os.close(journal_fd)
+    if (created):
+        _fsync_dir(os.path.dirname(journal_path))
+
+def _parse_journal(journal_bytes: bytes, journal_path: str) -> dict:
+    """
+    Parse the operations of a custom updates journal, grouped by alpha-2 code in the order they 
+    were appended. Only newline terminated lines are complete, a torn final line left by a crash
+    mid-append is ignored.
+    """
+    journal_operations = {}
+    for line in journal_bytes.split(b"\n")[:-1]:
+        if not (line.strip()):
+            continue
+        try:
+            operation = json.loads(line)
+            journal_operations.setdefault(operation["alpha_code"], []).append((operation["op"], operation["update"]))
+        except (ValueError, KeyError, TypeError):
+            raise ValueError(f"Invalid operation found in custom updates journal: {journal_path}.")
+    return journal_operations
+
+@lru_cache(maxsize=8)
+def _load_journal(journal_path: str, size: int, mtime_ns: int) -> dict:
+    """Load and cache the operations of a custom updates journal, keyed by its filepath, size and modification time."""
+    with open(journal_path, "rb") as f:
+        return _parse_journal(f.read(), journal_path)
+
+def _get_journal_operations(journal_path: str) -> dict:
+    """Get the custom update operations of a custom updates journal, grouped by alpha-2 code."""
+    try:
+        journal_stat = os.stat(journal_path)
+    except FileNotFoundError:
+        return {}
+    return _load_journal(journal_path, journal_stat.st_size, journal_stat.st_mtime_ns)
+
+def _rewrite_journal(journal_path: str, compacted_bytes: bytes, journal_bytes: bytes=b"") -> None:
+    """
+    Atomically replace the compacted leading bytes of a custom updates journal with the input
+    journal bytes, keeping any operations appended since the compacted bytes were read. The 
+    journal is removed if it would be empty. The caller must hold the journal's lock.
+    """
+    with open(journal_path, "rb") as f:
+        journal_bytes += f.read()[len(compacted_bytes):]
+    if (journal_bytes):
+        temp_path = f"{journal_path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(journal_bytes)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, journal_path)
+    else:
+        os.remove(journal_path)
+    _fsync_dir(os.path.dirname(os.path.abspath(journal_path)))
+
+def _update_key(update: dict) -> tuple:
+    """Return the identity of an update used for duplicate and delete checks: its case-insensitive Change and Date Issued."""
+    return (update["Change"].strip().lower(), update["Date Issued"].strip())
+
+def _replay_journal(country_updates: list, operations: list) -> list:
+    """
+    Replay journaled operations onto a copy of a country's updates. Adds of an existing update
+    and deletes of a missing update are skipped, so replaying a journal onto a base file it has
+    already been compacted into leaves the updates unchanged.
+    """
+    country_updates = list(country_updates)
+
+    #index the position of each update by its key, deleted updates are removed once all operations are replayed
+    update_positions = {}
+    for i, update in enumerate(country_updates):
+        update_positions.setdefault(_update_key(update), []).append(i)
+    deleted_positions = set()
+
+    for op, update in operations:
+        positions = update_positions.setdefault(_update_key(update), [])
+        if op == "add" and not positions:
+            positions.append(len(country_updates))
+            country_updates.append(update)
+        elif op == "delete" and positions:
+            deleted_positions.add(positions.pop(0))
+
+    if (deleted_positions):
+        return _read_only_updates([update for i, update in enumerate(country_updates) if i not in deleted_positions])
+    return _read_only_updates(country_updates)
+
+def _apply_journal(journal_path: str, all_updates: dict) -> dict:
+    """Apply the operations of a custom updates journal to the updates it journals, copying only the changed countries."""
+    journal_operations = _get_journal_operations(journal_path)
+    if not (journal_operations):
+        return all_updates
+    return {**all_updates, **{alpha_code: _replay_journal(all_updates.get(alpha_code, []), operations) 
+                              for alpha_code, operations in journal_operations.items()}}
+
+class _ReadOnlyUpdate(dict):
+    """
+    Read-only update object. The updates data loaded from an updates file is cached and shared
+    by all of its instances and overlays, so it can't be modified in place, modifying it through
+    one instance would otherwise affect every other instance. Copies, e.g. via dict() or 
+    copy.deepcopy(), are plain, modifiable dicts.
+    """
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("ISO 3166 updates data is read-only as it's shared between instances, copy it to modify it e.g. dict(update).")
+
+    __setitem__ = __delitem__ = __ior__ = update = pop = popitem = clear = setdefault = _read_only
+
+    def __reduce__(self):
+        return (_ReadOnlyUpdate, (dict(self),))
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+class _ReadOnlyUpdates(list):
+    """
+    Read-only list of a country's updates, shared by all instances and overlays of an updates
+    file until a custom update or overlay changes the country, which replaces it with a new list.
+    Copies, e.g. via list() or copy.deepcopy(), are plain, modifiable lists.
+    """
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("ISO 3166 updates data is read-only as it's shared between instances, copy it to modify it e.g. list(updates).")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __reduce__(self):
+        return (_ReadOnlyUpdates, (list(self),))
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict) -> list:
+        return [copy.deepcopy(update, memo) for update in self]
+
+def _read_only_updates(country_updates: list) -> _ReadOnlyUpdates:
+    """Get a read-only list of a country's updates, reusing the list and update objects that are already read-only."""
+    if type(country_updates) is _ReadOnlyUpdates:
+        return country_updates
+    return _ReadOnlyUpdates(update if type(update) is _ReadOnlyUpdate else _ReadOnlyUpdate(update) for update in country_updates)
+
+def _get_base_updates(filepath: str) -> dict:
+    """
+    Get the base updates of an updates JSON file with its journaled custom updates applied. The
+    object is cached and shared by all instances, and overlays, of the file.
+    """
+    try:
+        journal_stat = os.stat(_journal_path(filepath))
+    except FileNotFoundError:
+        return _load_updates_json(filepath)
+    file_stat = os.stat(filepath)
+    return _load_base_updates(filepath, file_stat.st_size, file_stat.st_mtime_ns, journal_stat.st_size, journal_stat.st_mtime_ns)
+
+@lru_cache(maxsize=8)
+def _load_base_updates(filepath: str, size: int, mtime_ns: int, journal_size: int, journal_mtime_ns: int) -> dict:
+    """Load and cache the journaled base updates of an updates JSON file, keyed by the file's and its journal's size and modification time."""
+    return _apply_journal(_journal_path(filepath), _read_updates_json(filepath, size, mtime_ns))
+
+def _overlay_operations(base_updates: list, country_updates: list) -> list:
+    """
+    Return the minimal custom update operations that replay a country's base updates into its 
+    overlaid updates: deletes of the base updates not in the overlaid updates, then adds of the
+    overlaid updates not in the base.
+    """
+    return [("delete", update) for update in base_updates if update not in country_updates] + \
+        [("add", update) for update in country_updates if update not in base_updates]
+
+def _update_fingerprint(update: dict) -> bytes:
+    """
+    Return the stable fingerprint of an update: a hash of its attributes, sorted by name, with 
+    their whitespace normalised, so updates only differing by whitespace have the same fingerprint.
+    """
+    return hashlib.blake2b("\x1e".join(f"{key}\x1f{' '.join(str(value).split())}" for key, value in sorted(update.items())).encode("utf-8"), 
+                           digest_size=16).digest()
+
+#format identifier of the delta patches created by Updates.create_delta() and applied by Updates.apply_delta()
+_DELTA_FORMAT = "iso3166-updates-delta"
+
+def _diff_country_updates(previous_updates: list, current_updates: list) -> tuple:
+    """
+    Diff a country's previous and current lists of updates in linear time, returning the lists
+    of added and removed updates, and of (previous, current) pairs of modified updates, in order.
+    Updates are matched by their fingerprints, then the unmatched updates are paired as modified 
+    by their Date Issued. Identical updates are matched first via the hash of their attributes,
+    so only the remaining updates are fingerprinted.
+    """
+    #unmatched previous updates by their attributes, consumed by the identical current updates
+    previous_attributes = {}
+    for update in previous_updates:
+        previous_attributes.setdefault(tuple(update.items()), []).append(update)
+    unmatched_updates = []
+    for update in current_updates:
+        matches = previous_attributes.get(tuple(update.items()))
+        if (matches):
+            matches.pop()
+        else:
+            unmatched_updates.append(update)
+
+    #unmatched previous updates by fingerprint, consumed by the remaining current updates with the same fingerprint
+    previous_fingerprints = {}
+    for matches in previous_attributes.values():
+        for update in matches:
+            previous_fingerprints.setdefault(_update_fingerprint(update), []).append(update)
+    current_unmatched_updates, unmatched_updates = unmatched_updates, []
+    for update in current_unmatched_updates:
+        matches = previous_fingerprints.get(_update_fingerprint(update))
+        if (matches):
+            matches.pop()
+        else:
+            unmatched_updates.append(update)
+    if not (unmatched_updates or any(previous_fingerprints.values())):
+        return [], [], []
+
+    #pair the remaining previous and current updates with the same Date Issued as modified
+    removed_positions = {}
+    unmatched_ids = {id(update) for matches in previous_fingerprints.values() for update in matches}
+    removed_updates = [update for update in previous_updates if id(update) in unmatched_ids]
+    for i, update in enumerate(removed_updates):
+        removed_positions.setdefault(str(update.get("Date Issued", "")).strip(), []).append(i)
+    added_updates, modified_updates, modified_positions = [], [], set()
+    for update in unmatched_updates:
+        positions = removed_positions.get(str(update.get("Date Issued", "")).strip())
+        if (positions):
+            modified_positions.add(positions[0])
+            modified_updates.append((removed_updates[positions.pop(0)], update))
+        else:
+            added_updates.append(update)
+    return added_updates, [update for i, update in enumerate(removed_updates) if i not in modified_positions], modified_updates
+
+#common names and abbreviations of countries that aren't listed in pycountry, mapped to their alpha-2 code
+_COUNTRY_NAME_ALIASES = {
+    "UK": "GB", "Britain": "GB", "Great Britain": "GB", "USA": "US", "US": "US", "America": "US", "UAE": "AE",
+    "Russia": "RU", "Ivory Coast": "CI", "Vatican": "VA", "Vatican City": "VA", "Czech Republic": "CZ", "Turkey": "TR", 
+    "Swaziland": "SZ", "Macedonia": "MK", "Burma": "MM", "Cape Verde": "CV", "East Timor": "TL", "Brunei": "BN", 
+    "Palestine": "PS", "DRC": "CD", "DR Congo": "CD", "Democratic Republic of the Congo": "CD", "Congo-Kinshasa": "CD",
+    "Republic of the Congo": "CG", "Congo-Brazzaville": "CG", "Micronesia": "FM", "Holland": "NL", "Falkland Islands": "FK"
+}
+
+def _fold_country_name(name: str) -> str:
+    """
+    Fold a country name for matching: accents and punctuation are removed, the name is lowercased,
+    a leading "the" is dropped and whitespace is collapsed, e.g. "Côte d'Ivoire" -> "cote d ivoire".
+    Dotted abbreviations are joined, e.g. "U.K." -> "uk".
+    """
+    name = unicodedata.normalize("NFKD", name.replace("&", " and "))
+    name = "".join(char for char in name if not unicodedata.combining(char)).casefold()
+    name = re.sub(r"\b(\w)\.(?=\w\b)", r"\1", name)
+    words = re.sub(r"[\W_]+", " ", name).split()
+    return " ".join(words[1:] if words[:1] == ["the"] and len(words) > 1 else words)
+
+class _CountryNameIndex:
+    """
+    Index of the accent-folded ISO 3166-1 country names, official names, common names and aliases
+    of each alpha-2 code, including variants of qualified names such as "Korea, Republic of" ->
+    "Republic of Korea" and, where unambiguous, "Iran". Folded names are matched exactly via a
+    dict, otherwise fuzzy matching is pruned to the names sharing the most character trigrams 
+    with the input, ranked by their Dice coefficient, rather than scoring every name.
+    """
+    __slots__ = ("names", "alpha_codes", "exact", "ngrams", "ngram_counts")
+
+    #maximum number of trigram candidates that are fuzzy scored
+    MAX_CANDIDATES = 12
+
+    def __init__(self) -> None:
+        self.names, self.alpha_codes, self.exact, self.ngrams, self.ngram_counts = [], [], {}, {}, []
+
+        country_names, qualified_bases = [], {}
+        for country in countries:
+            for name in (country.name, getattr(country, "official_name", None), getattr(country, "common_name", None)):
+                if not (name):
+                    continue
+                country_names.append((name, country.alpha_2))
+                #add variants of qualified names, e.g. "Falkland Islands (Malvinas)" & "Korea, Republic of"
+                if "(" in name:
+                    country_names.append((re.sub(r"\s*\(.*?\)", "", name), country.alpha_2))
+                if ", " in name:
+                    base, qualifier = name.split(", ", 1)
+                    country_names.append((qualifier + " " + base, country.alpha_2))
+                    qualified_bases.setdefault(base, set()).add(country.alpha_2)
+        country_names.extend((base, alpha_codes.pop()) for base, alpha_codes in qualified_bases.items() if len(alpha_codes) == 1)
+        country_names.extend(_COUNTRY_NAME_ALIASES.items())
+
+        for name, alpha_code in country_names:
+            folded_name = _fold_country_name(name)
+            if not (folded_name) or folded_name in self.exact:
+                continue
+            self.exact[folded_name] = alpha_code
+            ngrams = self.get_ngrams(folded_name)
+            for ngram in ngrams:
+                self.ngrams.setdefault(ngram, []).append(len(self.names))
+            self.names.append(folded_name)
+            self.alpha_codes.append(alpha_code)
+            self.ngram_counts.append(len(ngrams))
+
+    @staticmethod
+    def get_ngrams(folded_name: str) -> set:
+        """ Get the set of character trigrams of a folded name, padded to include its start and end. """
+        padded_name = "  " + folded_name + " "
+        return {padded_name[i:i + 3] for i in range(len(padded_name) - 2)}
+
+    def match(self, folded_name: str, likeness_score: int) -> str|None:
+        """ Get the alpha-2 code of the best matching name for a folded name, if its score meets the likeness score. """
+        alpha_code = self.exact.get(folded_name)
+        if alpha_code is not None or likeness_score >= 100:
+            return alpha_code
+
+        #count the trigrams shared with each name, only scoring the names with the highest Dice coefficient
+        ngrams = self.get_ngrams(folded_name)
+        shared_ngrams = {}
+        for ngram in ngrams:
+            for index in self.ngrams.get(ngram, ()):
+                shared_ngrams[index] = shared_ngrams.get(index, 0) + 1
+        candidates = sorted(shared_ngrams, key=lambda index: (-shared_ngrams[index] / (len(ngrams) + self.ngram_counts[index]), index))
+
+        best_score, best_alpha_code = 0, None
+        for index in candidates[:self.MAX_CANDIDATES]:
+            score = fuzz.token_sort_ratio(folded_name, self.names[index])
+            if score > best_score:
+                best_score, best_alpha_code = score, self.alpha_codes[index]
+
+        return best_alpha_code if best_score >= likeness_score else None
+
+@lru_cache(maxsize=None)
+def _get_country_name_index() -> _CountryNameIndex:
+    """Build and cache the country name index, shared by all instances."""
+    return _CountryNameIndex()
+
+@lru_cache(maxsize=2048)
+def _match_country_name(folded_name: str, likeness_score: int) -> str|None:
+    """Match a folded country name to its alpha-2 code, caching the most recent results."""
+    return _get_country_name_index().match(folded_name, likeness_score)
+
+#export formats of Updates.export() by file extension, and the columns of CSV exports, as per iso3166_updates_export.utils.export_updates
+_EXPORT_FORMATS = {".json": "json", ".ndjson": "ndjson", ".jsonl": "ndjson", ".csv": "csv", ".xml": "xml"}
+_CSV_EXPORT_COLUMNS = ("Change", "Description of Change", "Date Issued", "Source")
+
+def _escape_xml(value: str) -> str:
+    """Escape XML text and attribute values, normalising line endings, as per the minidom pretty-printed XML exports."""
+    return value.replace("\r\n", "\n").replace("\r", "\n").replace("&", "&amp;").replace("<", "&lt;").replace("\"", "&quot;").replace(">", "&gt;")
+
+#URL of the updates JSON in the GitHub repo, at a branch or version tag ref
+_REMOTE_UPDATES_URL = "https://raw.githubusercontent.com/amckenna41/iso3166-updates/{ref}/iso3166_updates/iso3166-updates.json"
+
+#hash algorithm of the per-country content digests of a dataset manifest
+_MANIFEST_DIGEST_ALGORITHM = "blake2b-128"
+
+def _remote_manifest_url(updates_url: str) -> str:
+    """Return the URL of the manifest published alongside a remote updates JSON, e.g. iso3166-updates.manifest.json."""
+    return (updates_url[:-len(".json")] if updates_url.endswith(".json") else updates_url) + ".manifest.json"
+
+def _country_digest(alpha_code: str, updates: list) -> str:
+    """
+    Return the hex content digest of a country's updates as published in a dataset manifest: the
+    hash of the country's "code": [...] JSON object member, equal to the digest of its pre-serialized
+    JSON fragments, so is independent of the indentation of the published JSON.
+    """
+    return hashlib.blake2b(json.dumps({alpha_code: updates})[1:-1].encode("utf-8"), digest_size=16).hexdigest()
+
+def _validate_manifest(manifest: dict) -> dict:
+    """ Validate a fetched dataset manifest, returning its entry of each country's digest, record count and byte span. """
+    countries = manifest.get("countries") if isinstance(manifest, dict) else None
+    if not (isinstance(countries, dict) and manifest.get("algorithm") == _MANIFEST_DIGEST_ALGORITHM):
+        raise ValueError("Invalid updates dataset manifest, expected an object of each country's digest, count, offset and length.")
+    for alpha_code, entry in countries.items():
+        if not (isinstance(entry, dict) and isinstance(entry.get("digest"), str) and 
+                all(isinstance(entry.get(key), int) for key in ("count", "offset", "length"))):
+            raise ValueError(f"Invalid updates dataset manifest entry for country: {alpha_code}.")
+    return countries
+
+def _default_remote_cache_dir() -> str:
+    """Return the default directory of the cache of fetched remote updates datasets, in the user's cache directory."""
+    return os.environ.get("ISO3166_UPDATES_CACHE_DIR") or \
+        os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "iso3166-updates")
+
+class _AsyncHTTPResponse:
+    """ Response of an HTTP GET request sent via asyncio streams, with the attributes of a requests.Response used by the remote dataset caches. """
+    __slots__ = ("url", "status_code", "headers", "content")
+
+    def __init__(self, url: str, status_code: int, headers: CaseInsensitiveDict, content: bytes) -> None:
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    def raise_for_status(self) -> None:
+        """ Raise a requests HTTPError if the response has an error status, as per requests.Response.raise_for_status(). """
+        if (self.status_code >= 400):
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error for url: {self.url}", response=None)
+
+async def _async_http_request(url: str, headers: dict) -> _AsyncHTTPResponse:
+    """ Send a single HTTP/1.1 GET request via asyncio streams, reading the response body in chunks as it's streamed. """
+    parsed_url = urllib.parse.urlsplit(url)
+    port = parsed_url.port or (443 if parsed_url.scheme == "https" else 80)
+    reader, writer = await asyncio.open_connection(parsed_url.hostname, port, 
+                                                   ssl=ssl.create_default_context() if parsed_url.scheme == "https" else None)
+    try:
+        target = (parsed_url.path or "/") + (f"?{parsed_url.query}" if parsed_url.query else "")
+        host = parsed_url.hostname if parsed_url.port is None else f"{parsed_url.hostname}:{parsed_url.port}"
+        request_headers = {"Host": host, "Accept-Encoding": "identity", "Connection": "close", **(headers or {})}
+        writer.write((f"GET {target} HTTP/1.1\r\n" + "".join(f"{key}: {value}\r\n" for key, value in request_headers.items()) + "\r\n").encode("latin-1"))
+        await writer.drain()
+
+        #parse the status line and headers of the response
+        status_line = (await reader.readuntil(b"\r\n")).decode("latin-1").split(" ", 2)
+        if not (len(status_line) >= 2 and status_line[0].startswith("HTTP/") and status_line[1].isdigit()):
+            raise requests.exceptions.ConnectionError(f"Invalid HTTP response status line from url: {url}.")
+        status_code, response_headers = int(status_line[1]), CaseInsensitiveDict()
+        while (line := await reader.readuntil(b"\r\n")) != b"\r\n":
+            key, _, value = line.decode("latin-1").partition(":")
+            response_headers[key.strip()] = value.strip()
+
+        #read the body by its content length, chunked transfer encoding or until the connection is closed
+        chunks = []
+        if (status_code in (204, 304)):
+            pass
+        elif ("chunked" in response_headers.get("Transfer-Encoding", "").lower()):
+            while (chunk_size := int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)):
+                chunks.append(await reader.readexactly(chunk_size))
+                await reader.readexactly(2)
+        elif ("Content-Length" in response_headers):
+            remaining = int(response_headers["Content-Length"])
+            while (remaining > 0):
+                chunk = await reader.readexactly(min(remaining, 65536))
+                chunks.append(chunk)
+                remaining -= len(chunk)
+        else:
+            while (chunk := await reader.read(65536)):
+                chunks.append(chunk)
+        return _AsyncHTTPResponse(url, status_code, response_headers, b"".join(chunks))
+    finally:
+        writer.close()
+
+async def _async_http_get(url: str, headers: dict|None=None, timeout: float=15, retries: int=3, max_redirects: int=5) -> _AsyncHTTPResponse:
+    """
+    Send an HTTP GET request via asyncio streams, without a thread per request, retrying on connection 
+    errors and transient error statuses with exponential backoff and following redirects, as per the 
+    pooled session of the remote dataset cache. Timeouts and connection errors are raised as the 
+    corresponding requests exceptions, so callers handle both the sync and async paths alike.
+    """
+    for attempt in range(retries + 1):
+        try:
+            for _ in range(max_redirects + 1):
+                parsed_url = urllib.parse.urlsplit(url)
+                if (parsed_url.scheme not in ("http", "https") or not parsed_url.hostname):
+                    raise requests.exceptions.InvalidURL(f"Invalid URL, expected an http or https URL: {url}.")
+                response = await asyncio.wait_for(_async_http_request(url, headers), timeout)
+                if not (response.status_code in (301, 302, 303, 307, 308) and response.headers.get("Location")):
+                    break
+                url = urllib.parse.urljoin(url, response.headers["Location"])
+            else:
+                raise requests.exceptions.TooManyRedirects(f"Exceeded {max_redirects} redirects for url: {url}.")
+        #requests exceptions subclass OSError, so are raised before the connection errors are retried
+        except requests.exceptions.RequestException:
+            raise
+        except asyncio.TimeoutError as e:
+            if (attempt == retries):
+                raise requests.exceptions.Timeout(f"Request timed out for url: {url}.") from e
+        except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError) as e:
+            if (attempt == retries):
+                raise requests.exceptions.ConnectionError(f"Error connecting to url: {url}, {e}.") from e
+        else:
+            if (response.status_code not in (429, 500, 502, 503, 504) or attempt == retries):
+                return response
+        await asyncio.sleep(0.5 * 2 ** attempt)
+
+class _RemoteDatasetCache:
+    """
+    On-disk cache of fetched remote updates datasets, keyed by URL. Each dataset is stored with
+    the ETag and Last-Modified headers of its response, which are sent as If-None-Match and
+    If-Modified-Since headers when the URL is next fetched, so an unchanged dataset costs a single
+    304 round trip. Requests are sent through a pooled session that retries on connection errors
+    and transient error statuses. Parsed datasets are kept in memory, keyed by the digest of their
+    content, so a 304 response doesn't reparse the dataset. Immutable URLs, e.g. of version tags,
+    are served from the cache without a request.
+    """
+    def __init__(self, cache_dir: str, retries: int=3) -> None:
+        self.cache_dir = cache_dir
+        self.session = requests.Session()
+        adapter = HTTPAdapter(max_retries=Retry(total=retries, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504), 
+                                                allowed_methods=frozenset(["GET"])))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._parsed = {}
+        self._countries = {}
+        self._lock = threading.Lock()
+
+    def _cache_paths(self, url: str) -> tuple:
+        """ Get the filepaths of the cached dataset of a URL and its response metadata. """
+        cache_key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.cache_dir, cache_key + ".json"), os.path.join(self.cache_dir, cache_key + ".meta.json")
+
+    def fetch(self, url: str, immutable: bool=False, timeout: float=15) -> dict:
+        """
+        Get the parsed dataset of a URL, revalidating a cached copy via a conditional request. 
+        Errors writing to the cache directory are ignored, the dataset is still returned.
+        """
+        meta, data, headers = self._prepare(url, immutable)
+        if data is not None:
+            return data
+        response = self.session.get(url, headers=headers, timeout=timeout)
+        if (response.status_code == 304 and headers):
+            data = self._load(self._cache_paths(url)[0], meta)
+            if data is not None:
+                return data
+            #cached copy is unreadable, refetch it unconditionally
+            response = self.session.get(url, timeout=timeout)
+        response.raise_for_status()
+        return self._store(url, response.headers, response.content)
+
+    async def fetch_async(self, url: str, immutable: bool=False, timeout: float=15) -> dict:
+        """
+        Awaitable version of fetch(), sending the requests via asyncio streams rather than the 
+        session; reading and parsing the cached or fetched dataset is offloaded to a thread.
+        """
+        meta, data, headers = await asyncio.to_thread(self._prepare, url, immutable)
+        if data is not None:
+            return data
+        response = await _async_http_get(url, headers, timeout)
+        if (response.status_code == 304 and headers):
+            data = await asyncio.to_thread(self._load, self._cache_paths(url)[0], meta)
+            if data is not None:
+                return data
+            response = await _async_http_get(url, timeout=timeout)
+        response.raise_for_status()
+        return await asyncio.to_thread(self._store, url, response.headers, response.content)
+
+    def _prepare(self, url: str, immutable: bool=False) -> tuple:
+        """
+        Get the cached metadata of a URL's dataset and the conditional request headers to revalidate
+        it with, and the cached dataset of an immutable URL, which is used without revalidating it.
+        """
+        data_path, meta_path = self._cache_paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if not (os.path.isfile(data_path) and meta.get("url") == url):
+                meta = {}
+        except (OSError, ValueError):
+            meta = {}
+
+        #cached copies of immutable URLs are used without revalidating them
+        if (meta and immutable):
+            data = self._load(data_path, meta)
+            if data is not None:
+                return meta, data, {}
+
+        headers = {}
+        if (meta.get("etag")):
+            headers["If-None-Match"] = meta["etag"]
+        if (meta.get("last_modified")):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return meta, None, headers
+
+    def _store(self, url: str, response_headers: dict, content: bytes) -> dict:
+        """ Parse the fetched dataset of a URL, caching it in memory and on disk with the ETag and Last-Modified headers of its response. """
+        data_path, meta_path = self._cache_paths(url)
+        data = json.loads(content)
+        meta = {"url": url, "etag": response_headers.get("ETag", ""), "last_modified": response_headers.get("Last-Modified", ""), 
+                "digest": hashlib.blake2b(content, digest_size=16).hexdigest()}
+        with self._lock:
+            self._parsed[url] = (meta["digest"], data)
+
+        #store the dataset before its metadata, so the metadata never refers to a partially written dataset
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for path, path_content in ((data_path, content), (meta_path, json.dumps(meta).encode("utf-8"))):
+                temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(temp_path, "wb") as f:
+                    f.write(path_content)
+                os.replace(temp_path, path)
+        except OSError:
+            pass
+        return data
+
+    def _load(self, data_path: str, meta: dict) -> dict|None:
+        """ Get a cached dataset, parsing it only if it isn't already parsed in memory. None is returned if it's unreadable. """
+        with self._lock:
+            parsed = self._parsed.get(meta["url"])
+        if parsed is not None and parsed[0] == meta.get("digest"):
+            return parsed[1]
+        try:
+            with open(data_path, "rb") as f:
+                content = f.read()
+            data = json.loads(content)
+        except (OSError, ValueError):
+            return None
+        with self._lock:
+            self._parsed[meta["url"]] = (hashlib.blake2b(content, digest_size=16).hexdigest(), data)
+        return data
+
+    def fetch_countries(self, url: str, entries: dict, timeout: float=15) -> dict:
+        """
+        Get the parsed updates of countries from a remote dataset, requesting only each country's 
+        byte span of the dataset via an HTTP Range request, as per the offsets of its manifest
+        entry. Each fetched country's updates are verified against the digest of its entry and
+        cached on disk and in memory keyed by the digest, so are never refetched. If the server
+        ignores Range requests, the countries are taken from the full dataset.
+        """
+        countries_updates, missing_entries = self._get_countries(entries)
+        if not (missing_entries):
+            return countries_updates
+
+        def fetch_span(alpha_code: str, entry: dict) -> requests.Response:
+            response = self.session.get(url, headers=self._range_headers(entry), timeout=timeout)
+            response.raise_for_status()
+            return response
+
+        #the first response shows if the server supports Range requests, otherwise the rest are taken from its full dataset
+        first_response = fetch_span(*missing_entries[0])
+        if (first_response.status_code != 206):
+            return self._store_countries(countries_updates, missing_entries, [first_response])
+        responses = [first_response]
+        if (len(missing_entries) > 1):
+            with ThreadPoolExecutor(max_workers=min(8, len(missing_entries) - 1)) as executor:
+                responses.extend(executor.map(lambda item: fetch_span(*item), missing_entries[1:]))
+        return self._store_countries(countries_updates, missing_entries, responses)
+
+    async def fetch_countries_async(self, url: str, entries: dict, timeout: float=15) -> dict:
+        """
+        Awaitable version of fetch_countries(), requesting the countries' spans concurrently via 
+        asyncio streams, up to 8 at a time; verifying and caching them is offloaded to a thread.
+        """
+        countries_updates, missing_entries = await asyncio.to_thread(self._get_countries, entries)
+        if not (missing_entries):
+            return countries_updates
+        semaphore = asyncio.Semaphore(8)
+
+        async def fetch_span(alpha_code: str, entry: dict) -> _AsyncHTTPResponse:
+            async with semaphore:
+                response = await _async_http_get(url, self._range_headers(entry), timeout)
+            response.raise_for_status()
+            return response
+
+        first_response = await fetch_span(*missing_entries[0])
+        responses = [first_response]
+        if (first_response.status_code == 206 and len(missing_entries) > 1):
+            responses.extend(await asyncio.gather(*(fetch_span(*item) for item in missing_entries[1:])))
+        return await asyncio.to_thread(self._store_countries, countries_updates, missing_entries, responses)
+
+    def _get_countries(self, entries: dict) -> tuple:
+        """ Get the cached updates of countries by the digests of their manifest entries, and the list of (alpha_code, entry) of uncached countries. """
+        countries_updates, missing_entries = {}, []
+        for alpha_code, entry in entries.items():
+            updates = self._load_country(alpha_code, entry["digest"])
+            if updates is None:
+                missing_entries.append((alpha_code, entry))
+            else:
+                countries_updates[alpha_code] = updates
+        return countries_updates, missing_entries
+
+    @staticmethod
+    def _range_headers(entry: dict) -> dict:
+        """ Get the Range request header of the byte span of a country's manifest entry. """
+        return {"Range": f"bytes={entry['offset']}-{entry['offset'] + entry['length'] - 1}"}
+
+    def _store_countries(self, countries_updates: dict, missing_entries: list, responses: list) -> dict:
+        """
+        Verify and cache the fetched updates of the uncached countries from their span responses,
+        or from the full dataset of the first response if the server ignored the Range request.
+        """
+        if (responses[0].status_code != 206):
+            dataset = json.loads(responses[0].content)
+            for alpha_code, entry in missing_entries:
+                countries_updates[alpha_code] = self._store_country(alpha_code, entry["digest"], dataset.get(alpha_code))
+            return countries_updates
+        for (alpha_code, entry), response in zip(missing_entries, responses):
+            if (response.status_code != 206):
+                raise ValueError(f"Expected partial content response for the updates of country: {alpha_code}.")
+            countries_updates[alpha_code] = self._store_country(alpha_code, entry["digest"], json.loads(response.content))
+        return countries_updates
+
+    def _country_path(self, digest: str) -> str:
+        """ Get the filepath of the cached updates of a country by their digest. """
+        return os.path.join(self.cache_dir, "countries", digest + ".json")
+
+    def _load_country(self, alpha_code: str, digest: str) -> list|None:
+        """ Get the cached updates of a country by their digest, verifying a copy read from disk. None is returned if they aren't cached. """
+        with self._lock:
+            updates = self._countries.get(digest)
+        if updates is not None:
+            return updates
+        try:
+            with open(self._country_path(digest), "rb") as f:
+                updates = json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+        if not (isinstance(updates, list) and _country_digest(alpha_code, updates) == digest):
+            return None
+        with self._lock:
+            self._countries[digest] = updates
+        return updates
+
+    def _store_country(self, alpha_code: str, digest: str, updates: list) -> list:
+        """ Verify the fetched updates of a country against the digest of its manifest entry, caching them by the digest. """
+        if not (isinstance(updates, list) and _country_digest(alpha_code, updates) == digest):
+            raise ValueError(f"Fetched updates of country {alpha_code} don't match the digest of its manifest entry.")
+        with self._lock:
+            self._countries[digest] = updates
+        country_path = self._country_path(digest)
+        try:
+            os.makedirs(os.path.dirname(country_path), exist_ok=True)
+            temp_path = f"{country_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(json.dumps(updates).encode("utf-8"))
+            os.replace(temp_path, country_path)
+        except OSError:
+            pass
+        return updates
+
+@lru_cache(maxsize=None)
+def _get_remote_dataset_cache(cache_dir: str) -> _RemoteDatasetCache:
+    """Get the remote dataset cache of a cache directory, shared by all instances in the process."""
+    return _RemoteDatasetCache(cache_dir)
+
+class _VersionStore:
+    """
+    On-disk store of the fetched datasets of tagged versions, content-addressed by the digest
+    of their JSON: each distinct dataset is stored once, optionally gzip compressed, in the
+    objects directory, and an index maps each version to its dataset's digest. As tagged versions
+    are immutable, stored versions are never refetched, and missing versions are fetched
+    concurrently. Parsed datasets, and the manifest digests of their countries, are kept in memory.
+    """
+    def __init__(self, store_dir: str, session: requests.Session) -> None:
+        self.store_dir = store_dir
+        self.session = session
+        self._datasets = {}
+        self._country_digests = {}
+        self._lock = threading.Lock()
+
+    def _index_path(self) -> str:
+        """ Get the filepath of the index of stored versions' digests. """
+        return os.path.join(self.store_dir, "versions.json")
+
+    def _load_index(self) -> dict:
+        """ Get the index of stored versions' digests, empty if it doesn't exist or is unreadable. """
+        try:
+            with open(self._index_path(), "r", encoding="utf-8") as f:
+                index = json.load(f)
+            return index if isinstance(index, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def path(self, version: str) -> str|None:
+        """ Get the filepath of the stored dataset of a version, None if it isn't stored. """
+        digest = self._load_index().get(version)
+        if not (isinstance(digest, str)):
+            return None
+        for extension in (".json.gz", ".json"):
+            object_path = os.path.join(self.store_dir, "objects", digest + extension)
+            if os.path.isfile(object_path):
+                return object_path
+        return None
+
+    def get(self, version: str) -> tuple|None:
+        """ Get the digest and parsed dataset of a stored version, None if it isn't stored or is unreadable. """
+        object_path = self.path(version)
+        if object_path is None:
+            return None
+        digest = os.path.basename(object_path).split(".")[0]
+        with self._lock:
+            dataset = self._datasets.get(digest)
+        if dataset is not None:
+            return digest, dataset
+        try:
+            with open(object_path, "rb") as f:
+                content = f.read()
+            if object_path.endswith(".gz"):
+                content = gzip.decompress(content)
+            if hashlib.blake2b(content, digest_size=16).hexdigest() != digest:
+                return None
+            dataset = json.loads(content)
+        except (OSError, ValueError, EOFError):
+            return None
+        with self._lock:
+            self._datasets[digest] = dataset
+        return digest, dataset
+
+    def fetch(self, versions: Iterable, url_template: str, compress: bool=True, timeout: float=15) -> dict:
+        """
+        Get the parsed datasets of versions, keyed by version, fetching the versions that aren't 
+        stored concurrently from the URL template, with a {ref} placeholder for the version tag,
+        and storing them. Errors writing to the store directory are ignored, the datasets are 
+        still returned.
+        """
+        datasets, missing_versions = self._get_versions(versions)
+        if not (missing_versions):
+            return datasets
+
+        def fetch_version(version: str) -> bytes:
+            response = self.session.get(url_template.format(ref=f"v{version}"), timeout=timeout)
+            response.raise_for_status()
+            return response.content
+
+        with ThreadPoolExecutor(max_workers=min(8, len(missing_versions))) as executor:
+            contents = list(executor.map(fetch_version, missing_versions))
+        return self._store(datasets, dict(zip(missing_versions, contents)), compress)
+
+    async def fetch_async(self, versions: Iterable, url_template: str, compress: bool=True, timeout: float=15) -> dict:
+        """
+        Awaitable version of fetch(), fetching the missing versions concurrently via asyncio streams;
+        reading, parsing and storing the datasets is offloaded to a thread.
+        """
+        datasets, missing_versions = await asyncio.to_thread(self._get_versions, versions)
+        if not (missing_versions):
+            return datasets
+
+        async def fetch_version(version: str) -> bytes:
+            response = await _async_http_get(url_template.format(ref=f"v{version}"), timeout=timeout)
+            response.raise_for_status()
+            return response.content
+
+        contents = await asyncio.gather(*(fetch_version(version) for version in missing_versions))
+        return await asyncio.to_thread(self._store, datasets, dict(zip(missing_versions, contents)), compress)
+
+    def _get_versions(self, versions: Iterable) -> tuple:
+        """ Get the parsed datasets of the stored versions, keyed by version, and the list of versions that aren't stored. """
+        datasets, missing_versions = {}, []
+        for version in dict.fromkeys(versions):
+            stored = self.get(version)
+            if stored is None:
+                missing_versions.append(version)
+            else:
+                datasets[version] = stored[1]
+        return datasets, missing_versions
+
+    def _store(self, datasets: dict, contents: dict, compress: bool=True) -> dict:
+        """ Parse and store the fetched JSON of each version, adding the parsed datasets to the input datasets, keyed by version. """
+        fetched_versions = [(version, (hashlib.blake2b(content, digest_size=16).hexdigest(), content, json.loads(content)))
+                            for version, content in contents.items()]
+        with self._lock:
+            for version, (digest, _, dataset) in fetched_versions:
+                datasets[version] = self._datasets.setdefault(digest, dataset)
+
+            #store each distinct dataset before adding its version to the index, so the index never refers to a missing dataset;
+            #concurrent processes may each rewrite the index, in which case a lost version is refetched when next used
+            try:
+                os.makedirs(os.path.join(self.store_dir, "objects"), exist_ok=True)
+                for version, (digest, content, _) in fetched_versions:
+                    object_path = os.path.join(self.store_dir, "objects", digest + (".json.gz" if compress else ".json"))
+                    if not os.path.isfile(object_path):
+                        temp_path = f"{object_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                        with open(temp_path, "wb") as f:
+                            f.write(gzip.compress(content, mtime=0) if compress else content)
+                        os.replace(temp_path, object_path)
+                index = {**self._load_index(), **{version: digest for version, (digest, _, _) in fetched_versions}}
+                temp_path = f"{self._index_path()}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(index, f, indent=4, sort_keys=True)
+                os.replace(temp_path, self._index_path())
+            except OSError:
+                pass
+        return datasets
+
+    def country_digests(self, dataset: dict) -> dict:
+        """ Get the manifest digests of a stored dataset's countries, keyed by alpha-2 code, computed once per dataset. """
+        with self._lock:
+            digests = self._country_digests.get(id(dataset))
+        if digests is None or digests[0] is not dataset:
+            digests = (dataset, {alpha_code: _country_digest(alpha_code, updates) for alpha_code, updates in dataset.items()})
+            with self._lock:
+                self._country_digests[id(dataset)] = digests
+        return digests[1]
+
+@lru_cache(maxsize=None)
+def _get_version_store(cache_dir: str) -> _VersionStore:
+    """Get the store of tagged versions' datasets in a cache directory, shared by all instances in the process."""
+    return _VersionStore(os.path.join(cache_dir, "versions"), _get_remote_dataset_cache(cache_dir).session)
+
+@lru_cache(maxsize=None)
+def _get_versions_temp_dir() -> str:
+    """
+    Get the temporary directory of the tagged versions' datasets that couldn't be written to the
+    store of versions, created once and shared by all instances in the process, and removed when
+    the process exits.
+    """
+    temp_dir = tempfile.mkdtemp(prefix="iso3166-updates-")
+    atexit.register(shutil.rmtree, temp_dir, ignore_errors=True)
+    return temp_dir
+
+class _UpdatesGeneration:
+    """
+    Snapshot of an Updates instance's dataset. A generation's updates object is never modified
+    in place once published; writers build a new generation and publish it via a single reference
+    swap, so readers holding a generation never block and never see a partially applied write.
+    """
+    __slots__ = ("all", "number", "digest", "gzip")
+
+    def __init__(self, all_updates: dict, number: int=0) -> None:
+        self.all = all_updates
+        self.number = number
+        self.digest = None
+        self.gzip = {}
+
+class _CountryJSONFragments:
+    """
+    Pre-serialized UTF-8 JSON fragments of a country's list of updates: the whole "code": [...] 
+    member, each individual update and the member of each year's subset of updates, as well as
+    the content hash of the country's member, used to build ETags of queries. Fragments are
+    built from the json.dumps output of the records, so joining them gives byte-identical output to
+    serializing the equivalent dict. Generations never modify a country's list in place, so the 
+    fragments remain valid for as long as the country's list object is unchanged.
+
+    The raw deflate fragments of the country's member, compressed on first use, are joined into 
+    a single gzip member of a multi-country JSON object: the head fragment opens the object and
+    the tail fragment is preceded by the separator of the previous country's member.
+    """
+    __slots__ = ("updates", "member", "digest", "records", "record_years", "years", "deflate_head", "deflate_tail")
+
+    #(data, deflated) fragments closing a JSON object of countries' members, and of an empty object
+    DEFLATE_CLOSE = (b"}", _deflate(b"}"))
+    DEFLATE_EMPTY = (b"{}", _deflate(b"{}"))
+
+    def __init__(self, alpha_code: str, updates: list) -> None:
+        self.updates = updates
+        self.deflate_head = None
+        self.deflate_tail = None
+        self.records = [json.dumps(update).encode("utf-8") for update in updates]
+        self.member = self.join(alpha_code, self.records)
+        self.digest = hashlib.blake2b(self.member, digest_size=16).digest()
+
+        #group the updates by their year of publication, keeping each update's year for filtering by multiple years
+        self.record_years = []
+        year_records = {}
+        for update, record in zip(updates, self.records):
+            parsed = Updates._parse_date_issued(update["Date Issued"])
+            self.record_years.append(parsed.year if parsed is not None else None)
+            if parsed is not None:
+                year_records.setdefault(parsed.year, []).append(record)
+        self.years = {year: self.join(alpha_code, records) for year, records in year_records.items()}
+
+    @staticmethod
+    def join(alpha_code: str, records: list) -> bytes:
+        """ Join serialized update records into a "code": [...] JSON object member. """
+        return json.dumps(alpha_code).encode("utf-8") + b": [" + b", ".join(records) + b"]"
+
+    def deflate_fragment(self, first: bool) -> tuple:
+        """ Get the (data, deflated) fragment of the country's member, opening the JSON object if first, else preceded by its separator. """
+        if (first):
+            if self.deflate_head is None:
+                self.deflate_head = _deflate(b"{" + self.member)
+            return b"{" + self.member, self.deflate_head
+        if self.deflate_tail is None:
+            self.deflate_tail = _deflate(b", " + self.member)
+        return b", " + self.member, self.deflate_tail
 
 class Updates():
     """
@@ -39,6 +1225,23 @@ class Updates():
     Currently there are 250 country's listed in the updates json with updates dating from 1996 up
     to the present year.
 
+    Instances are safe to query from multiple threads whilst custom updates are being made. Each
+    query runs against a snapshot of the current dataset generation and custom updates publish a
+    new generation via a single reference swap, so readers never block or see a partial update.
+
+    For serving the updates data as JSON, the to_json_bytes() method returns the serialized country
+    and year lookups from a cache of pre-serialized fragments of each country's updates. Setting 
+    the response_cache parameter pre-serializes the fragments whenever a dataset generation is 
+    published, otherwise they're serialized on first use. The to_json_gzip() method returns the 
+    same lookups gzip compressed, from payloads compressed once per dataset generation and deflate
+    fragments compressed once per country.
+
+    Instances with a named overlay layer, set via the overlay parameter, journal their custom
+    updates to the overlay rather than the updates file, e.g. so tenants can each make their
+    own in-house updates over one shared base dataset. Overlays are replayed over the base 
+    updates as each country is loaded, only copying the countries the overlay changes, with 
+    the rest shared with the base and other overlays.
+
     Parameters
     ==========
     :country_code: str (default="")
@@ -48,6 +1251,15 @@ class Updates():
     :custom_updates_filepath: str (default="")
         filepath to updates object that class will import. This is an optional parameter, if its
         empty then the default path will be used.
+    :response_cache: bool (default=False)
+        pre-serialize the JSON fragments used by to_json_bytes() for each country whenever a 
+        dataset generation is published, rather than on first use.
+    :overlay: str (default="")
+        name of an overlay layer of custom updates, e.g. per tenant, that custom_update() writes
+        to rather than the journal of the updates file. The overlay is persisted in its own
+        append-only journal, replayed over the shared, untouched base updates when loaded.
+    :overlay_dir: str (default="")
+        directory of the overlay's journal file, by default the directory of the updates file.
 
     Methods
     =======
@@ -55,21 +1267,52 @@ class Updates():
         get all listed updates/changes in the updates json object for an input country/countries,
         by making the instance object subscriptable and updates accessible via their alpha-2, 
         alpha-3 or numeric country codes.
-    year(input_year):
+    alpha(alpha_code, raw=False):
+        get all listed updates/changes for an input country/countries, the same as __getitem__, 
+        optionally as raw shared references without Map wrapping.
+    country_name(country_name, likeness_score=100, raw=False):
+        get all listed updates/changes for an input country name/names, matched exactly or fuzzy
+        matched against an indexed, accent-folded list of country names and aliases.
+    year(input_year, raw=False):
         get all listed updates/changes in the updates json object for an input year, set of years,
         year range, greater than/less than year or not equal to a year.
-    date_range(input_date_range, sort_by_date=""):
+    date_range(input_date_range, sort_by_date="", raw=False):
         get all listed updates/changes in the updates json that were published within the input date
         range, inclusive. If only one date input then get all updates from this date, inclusive.
-    search(search_term, likeness_score=100, include_match_score=True):
+    search(search_term, likeness_score=100, include_match_score=True, parallel=False, raw=False):
         get all listed updates/changes in the updates JSON object for an input search keyword/item. For
         example searching for a specific subdivision/country name. The function can also accept a list 
         of keywords. A likeness score is used to allow you to ge the percentage of likeness for search 
         results.
+    to_json_bytes(alpha_code=None, year=None):
+        get the UTF-8 encoded JSON of the updates for an input country/countries or year/years,
+        joined from cached pre-serialized fragments of each country's updates.
+    to_json_gzip(alpha_code=None, year=None):
+        get the gzip compressed JSON of to_json_bytes() from cached precompressed payloads and 
+        per-country deflate fragments.
+    etag(alpha_code=None, year=None, date_range=None, sort_by_date=""):
+        get a strong HTTP ETag for the output of a country, year or date range query, combined
+        from the cached content hashes of the countries' updates.
+    export(filepath, data=None, format="", compress=None):
+        export the updates data or the output of a query to a compact JSON, NDJSON, CSV or XML
+        file, optionally gzip compressed, written record by record.
+    diff(other, since_date=""):
+        get the records added, removed and modified between the updates and another dataset,
+        compared by per-record fingerprints.
+    reload():
+        reload the updates file and journal(s), rebuilding only the changed countries and 
+        publishing them as a new dataset generation.
+    watch(interval=1.0, content_hash=False, callback=None):
+        watch the updates file and journal(s) for changes, reloading them in a background thread.
+    unwatch():
+        stop watching the updates file for changes.
     stats():
         return a high-level summary dict of the dataset: total updates, number of countries with
         updates, year range covered, most-updated country, most common change type, and the most
         recent Date Issued.
+    close():
+        stop watching the updates file and shutdown the process pool used by parallel searches, 
+        also called on exiting the instance's context manager.
     check_for_updates():
         pulling the latest updates object from the repo and comparing it with the current version
         of the object, outlining any changes that need to be implemented.
@@ -78,11 +1321,35 @@ class Updates():
         add or delete a custom Update to an existing country on the main iso3166-updates.json 
         object. Custom Updates can be used for in-house/bespoke applications that are using 
         the iso3166-updates software but require additional custom updates to be included.
-        These can be added to the default object that the software imports or on a custom
-        updates object that can be exported.
+        These can be added to the default object that the software imports, persisted in an 
+        append-only journal, or on a custom updates object that can be exported.
+    custom_updates_batch(operations, save_new=False, save_new_filename="iso3166_updates_copy.json"):
+        add and/or delete a batch of custom Updates atomically, with a single persistence step.
+    transaction(save_new=False, save_new_filename="iso3166_updates_copy.json"):
+        context manager buffering the custom_update() calls made within it and applying them 
+        atomically as a single batch on exit.
+    import_custom_updates(filepath, save_new=False, save_new_filename="iso3166_updates_copy.json"):
+        bulk import custom Updates from a CSV or NDJSON file as a single batch.
+    create_delta(other, from_version="", to_version=""):
+        create a compact delta patch of the operations upgrading the updates to another dataset.
+    apply_delta(delta, save_new=False, save_new_filename="iso3166_updates_copy.json"):
+        apply a delta patch to the updates, keeping any custom updates, as a single batch.
+    compact():
+        compact the append-only journal of custom updates into a new updates file snapshot.
+    from_version(version, cache_dir="", remote_updates_url="", compress=True, **kwargs):
+        get an instance of the dataset of a tagged version, fetched once into a local store of versions.
+    from_versions(versions, cache_dir="", remote_updates_url="", compress=True, **kwargs):
+        get instances of the datasets of multiple tagged versions, fetching missing versions concurrently.
+    timeline(alpha_code, raw=False):
+        get the full history of a country, joining the ISO 3166-3 entries of its former codes 
+        with its updates in date order.
+    timelines(alpha_codes="", raw=False):
+        get the timelines of one or more countries, or all countries, keyed by alpha-2 code.
     convert_to_alpha2(alpha_code):
         convert the inputted ISO 3166-1 alpha-3 or numeric country codes into their 2 letter 
         alpha-2 counterpart.
+    country_names_to_alpha2(country_names, likeness_score=100):
+        convert a list of free-text country names into their 2 letter alpha-2 codes.
     convert_date_format(date_str):
         convert the inputted date into the YYYY-MM-DD format. 
     __str__:
@@ -154,17 +1421,24 @@ class Updates():
     #delete above custom updates object
     iso.custom_update("LI", change="Brand new LI subdivision", date_issued="2025-01-01", delete=1)
 
+    #add custom update object to a named overlay over the shared base updates
+    iso_tenant = Updates(overlay="tenant_a")
+    iso_tenant.custom_update("LI", change="Tenant LI subdivision", date_issued="2025-01-01")
+
     #get total number of updates in updates object
     len(iso)
 
     #get total size of updates object in MB
     iso.__sizeof__()
     """
-    def __init__(self, country_code: str="", custom_updates_filepath: str="") -> None:
+    def __init__(self, country_code: str="", custom_updates_filepath: str="", response_cache: bool=False, 
+                 overlay: str="", overlay_dir: str="") -> None:
         
         self.__version__ = _pkg_version("iso3166-updates")
         self.iso3166_updates_json_filename = "iso3166-updates.json"
         self.country_code = country_code
+        self.response_cache = response_cache
+        self.overlay = overlay
 
         #if not using a custom object filepath, use the default object in module directory 
         if custom_updates_filepath:
@@ -176,16 +1450,43 @@ class Updates():
         if not (os.path.isfile(self.iso3166_updates_path)):
             raise OSError(f"Issue finding iso3166-updates.json in dir: {self.iso3166_updates_path}.")
 
-        #load from cache to avoid repeated disk I/O; deepcopy for instance isolation
-        try:
-            self.all = copy.deepcopy(_load_updates_json(self.iso3166_updates_path))
-        except json.JSONDecodeError:
-            raise ValueError("Error ❗: The ISO 3166 updates file contains invalid JSON.")
+        #custom updates are journaled to the named overlay's journal if set, which is replayed over the shared base 
+        #updates and their journal, otherwise to the journal of the updates file itself
+        self._base_journal_path = _journal_path(self.iso3166_updates_path)
+        if (self.overlay):
+            if (overlay_dir and not os.path.isdir(overlay_dir)):
+                raise OSError(f"Overlay directory not found: {overlay_dir}.")
+            self._overlay_journal_path = _overlay_journal_path(self.iso3166_updates_path, self.overlay, overlay_dir)
+        else:
+            self._overlay_journal_path = None
+
+        #updates data is loaded lazily, country by country, using the per-country offset index of the updates file,
+        #until the full dataset is required at which point it's published as the instance's first dataset generation
+        self._generation = None
+        self._lazy_updates = {}
+        self._write_lock = threading.Lock()
+        self._process_pool = None
+        self._json_fragments = {}
+        self._timelines = {}
+        self._update_indexes = {}
+        self._transaction_local = threading.local()
+        self._watcher = None
+
+        #URL template of the remote updates JSON fetched by check_for_updates(), and the directory its fetched copies are cached in;
+        #the URL template of its manifest is derived from the updates JSON's if not set
+        self.remote_updates_url = _REMOTE_UPDATES_URL
+        self.remote_manifest_url = None
+        self.remote_cache_dir = _default_remote_cache_dir()
+        self._country_index = self._get_country_index()
+
+        #if the updates file couldn't be indexed, fall back to loading the full file
+        if self._country_index is None:
+            self.all
 
         #full list of valid alpha-2 codes from pycountry
         self.valid_alpha2_codes = {country.alpha_2 for country in countries}
 
-        #if input country code param set, iterate over data object and get updates data for specified input/inputs
+        #if input country code param set, only read the updates data for the specified input/inputs from the file
         if self.country_code:
             temp_updates_data = {}
             self.country_code = self.country_code.upper().replace(" ", "").split(',')
@@ -201,11 +1502,177 @@ class Updates():
                 self.country_code[i] = converted_alpha_code
 
                 #add country's updates data to temporary object
-                temp_updates_data[converted_alpha_code] = self.all[converted_alpha_code]
+                temp_updates_data[converted_alpha_code] = self._get_country_updates(converted_alpha_code)
 
             #replace 'all' class attribute with filtered country/countries updates data
             self.all = temp_updates_data
-    
+
+    @property
+    def all(self) -> dict:
+        """
+        All of the ISO 3166 updates data for the instance, keyed by alpha-2 code. The returned
+        object is a snapshot of the current dataset generation which is never modified in place.
+        For unscoped instances, the dataset is loaded on first access from the cached updates file,
+        whose lists of updates are shared by all instances and overlays; the lists and updates are
+        read-only, raising a TypeError if modified, so copy them to modify them.
+        """
+        return self._snapshot().all
+
+    @all.setter
+    def all(self, all_updates: dict) -> None:
+        with self._write_lock:
+            self._publish(all_updates)
+
+    def _snapshot(self) -> _UpdatesGeneration:
+        """
+        Get the current dataset generation, loading the full updates file if it hasn't yet been
+        loaded. Readers should take a single snapshot and use it for the duration of a query.
+        """
+        generation = self._generation
+        if generation is None:
+            #load from cache to avoid repeated disk I/O, the cached read-only lists of updates are shared by all instances
+            try:
+                all_updates = _get_base_updates(self.iso3166_updates_path)
+                if (self._overlay_journal_path):
+                    all_updates = _apply_journal(self._overlay_journal_path, all_updates)
+            except json.JSONDecodeError:
+                raise ValueError("Error ❗: The ISO 3166 updates file contains invalid JSON.")
+            all_updates = {alpha_code: _read_only_updates(country_updates) for alpha_code, country_updates in all_updates.items()}
+            with self._write_lock:
+                if self._generation is None:
+                    self._generation = _UpdatesGeneration(all_updates)
+                    self._lazy_updates = {}
+                    if (self.response_cache):
+                        self._build_json_fragments(all_updates)
+                generation = self._generation
+        return generation
+
+    def _pinned(self) -> Updates:
+        """
+        Get a view of the instance pinned to a snapshot of its current dataset generation, sharing
+        its caches, so a series of queries, e.g. the ETag of a response and the response itself,
+        read the same generation even if a new one is published in between. The view should only
+        be used for queries, custom updates should be made via the instance.
+        """
+        view = copy.copy(self)
+        view._generation = self._snapshot()
+        return view
+
+    def _publish(self, all_updates: dict) -> _UpdatesGeneration:
+        """
+        Publish a new dataset generation via a single reference swap, readers holding the
+        previous generation are unaffected. Must be called whilst holding the write lock. The
+        countries' lists of updates are published read-only, reusing those already read-only.
+        """
+        all_updates = {alpha_code: _read_only_updates(country_updates) for alpha_code, country_updates in all_updates.items()}
+        previous_number = self._generation.number if self._generation is not None else 0
+        self._generation = _UpdatesGeneration(all_updates, previous_number + 1)
+        if (self.response_cache):
+            self._build_json_fragments(all_updates)
+        return self._generation
+
+    def _get_json_fragments(self, alpha_code: str, updates: list) -> _CountryJSONFragments:
+        """
+        Get the pre-serialized JSON fragments of a country's list of updates, serializing them if
+        the country isn't cached or its list has been replaced by a newer dataset generation.
+        """
+        fragments = self._json_fragments.get(alpha_code)
+        if fragments is None or fragments.updates is not updates:
+            fragments = _CountryJSONFragments(alpha_code, updates)
+            self._json_fragments[alpha_code] = fragments
+        return fragments
+
+    def _get_generation_gzip(self, generation: _UpdatesGeneration, key: tuple, to_json_bytes) -> bytes:
+        """
+        Get a gzip compressed JSON payload of a dataset generation, compressing the output of
+        to_json_bytes if it isn't yet cached on the generation. Payloads are cached for the lifetime
+        of the generation, up to a limit of 256 payloads per generation.
+        """
+        gzip_bytes = generation.gzip.get(key)
+        if gzip_bytes is None:
+            json_bytes = to_json_bytes()
+            gzip_bytes = _gzip_join([(json_bytes, _deflate(json_bytes))])
+            #the JSON is of the current generation, which may have been replaced whilst compressing
+            if len(generation.gzip) < 256 and self._generation is generation:
+                generation.gzip[key] = gzip_bytes
+        return gzip_bytes
+
+    def _get_generation_digest(self, generation: _UpdatesGeneration) -> bytes:
+        """
+        Get the content hash of a dataset generation, combined from the content hash of each 
+        country's updates. The hash is cached on the generation, only the countries changed since 
+        the previous generation need serialized to compute it.
+        """
+        if generation.digest is None:
+            generation_hash = hashlib.blake2b(digest_size=16)
+            for alpha_code, updates in generation.all.items():
+                generation_hash.update(self._get_json_fragments(alpha_code, updates).digest)
+            generation.digest = generation_hash.digest()
+        return generation.digest
+
+    def _build_json_fragments(self, all_updates: dict) -> None:
+        """ Pre-serialize the JSON fragments of each country, reusing those of unchanged countries. """
+        for alpha_code, updates in all_updates.items():
+            self._get_json_fragments(alpha_code, updates)
+
+    def _get_country_index(self, rebuild: bool=False) -> dict|None:
+        """
+        Get the per-country byte offset index for the updates file, rebuilding it if the
+        existing sidecar index is stale. None is returned if the file can't be indexed,
+        in which case the full file is loaded instead.
+        """
+        try:
+            if (rebuild):
+                _load_country_index.cache_clear()
+                country_index = _build_country_index(self.iso3166_updates_path)
+                _write_country_index(self.iso3166_updates_path, country_index)
+                return country_index["countries"]
+            file_stat = os.stat(self.iso3166_updates_path)
+            return _load_country_index(self.iso3166_updates_path, file_stat.st_size, file_stat.st_mtime_ns)
+        except (ValueError, IndexError):
+            return None
+
+    def _get_country_updates(self, alpha_code: str, generation: _UpdatesGeneration|None=None) -> list:
+        """
+        Get the list of updates for an alpha-2 code from the input or current dataset generation.
+        If the full dataset hasn't yet been loaded, only that country's updates are read from the
+        updates file, with any of its journaled custom updates replayed.
+        """
+        generation = generation or self._generation
+        if generation is not None or self._country_index is None:
+            return (generation or self._snapshot()).all[alpha_code]
+        if alpha_code in self._lazy_updates:
+            return self._lazy_updates[alpha_code]
+        if alpha_code not in self._country_index:
+            raise KeyError(alpha_code)
+
+        country_updates = self._read_journaled_country_updates(alpha_code)
+        if country_updates is None:
+            return self._snapshot().all[alpha_code]
+        self._lazy_updates[alpha_code] = country_updates
+        return country_updates
+
+    def _read_journaled_country_updates(self, alpha_code: str) -> list|None:
+        """
+        Read a country's updates from its span of the updates file, with any of its journaled 
+        custom updates replayed. None is returned if the file can no longer be indexed.
+        """
+        #read country's span of the file, rebuilding the index if the file has changed since it was indexed
+        try:
+            country_updates = _read_country_updates(self.iso3166_updates_path, *self._country_index[alpha_code])
+        except ValueError:
+            self._country_index = self._get_country_index(rebuild=True)
+            if self._country_index is None:
+                return None
+            country_updates = _read_country_updates(self.iso3166_updates_path, *self._country_index[alpha_code])
+
+        #replay any custom updates journaled for the country, followed by those of the overlay
+        for journal_path in (self._base_journal_path, self._overlay_journal_path):
+            journal_operations = _get_journal_operations(journal_path).get(alpha_code) if journal_path else None
+            if (journal_operations):
+                country_updates = _replay_journal(country_updates, journal_operations)
+        return country_updates
+
     def __getitem__(self, alpha_code: str) -> dict:
         """
         Get all listed updates/changes in the updates json object for an input country/countries,
@@ -248,6 +1715,41 @@ class Updates():
         iso["RWA, TUV, UKR, URY"]
         iso["646, 798, 804, 858"]
 
+        Raises
+        ======
+        TypeError:
+            If input alpha code parameter isn't a string.
+        ValueError:
+            Invalid alpha code parameter input after validation/conversion.
+            Valid alpha code input but country data not available as 'country_code' 
+            parameter was input on class instantiation.
+        """
+        return self.alpha(alpha_code)
+
+    def alpha(self, alpha_code: str, raw: bool=False) -> dict:
+        """
+        Get all listed updates/changes in the updates json object for an input country/countries,
+        using their ISO 3166-1 alpha-2, alpha-3 or numeric country codes, the same as subscripting
+        the instance. By default each update is wrapped in the Map class for dot notation access.
+        
+        The 'raw' parameter returns the country updates as they're stored in the current dataset 
+        generation, without any wrapping or copying, which is useful for JSON-serving paths that 
+        don't need dot notation access. The returned lists and updates are shared references that 
+        should be treated as read-only.
+
+        Parameters
+        ==========
+        :alpha_code: str
+            one or more ISO 3166-1 alpha-2, alpha-3 or numeric country codes for sought country/
+            territory updates e.g. AD, DE, EGT, 184. 
+        :raw: bool (default=False)
+            return a plain dict of shared references to the country updates.
+
+        Returns
+        =======
+        :iso3166_updates_dict: dict
+            dict object of country updates info for inputted code/codes.
+
         Raises
         ======
         TypeError:
@@ -267,6 +1769,9 @@ class Updates():
         #object to store country data, it is a dict if more than one country or list if only one country
         iso3166_updates_dict = {}
 
+        #snapshot of current dataset generation, if the full dataset has been loaded
+        generation = self._generation
+
         #iterate over all input alpha codes, appending all updates to country object, pass through Map class to access via dot notation
         for i, code in enumerate(alpha_code):
 
@@ -276,16 +1781,21 @@ class Updates():
             #raise error if invalid alpha-2 code input or country data not imported on object instantiation 
             if not (converted_alpha_code in self.valid_alpha2_codes):
                 raise ValueError(f"Invalid ISO 3166-1 alpha-2 code input: {code}.")
-            if converted_alpha_code not in self.all:
+            if converted_alpha_code not in (generation.all if generation is not None else self):
                 raise ValueError(f"Valid alpha-2 code input {code}, but country data not available as 'country_code' parameter was input on class instantiation,"
                                 " try creating another instance of the class with no initial input parameter value, e.g iso = Updates().")
 
             #set valid converted alpha code to list element
             alpha_code[i] = converted_alpha_code
 
+            #add shared reference to country updates if raw output
+            if (raw):
+                iso3166_updates_dict[converted_alpha_code] = self._get_country_updates(converted_alpha_code, generation)
+                continue
+
             #add each country update to country object, wrapping each update in Map for dot notation access
             iso3166_updates_dict[converted_alpha_code] = []
-            for update in self.all[converted_alpha_code]:
+            for update in self._get_country_updates(converted_alpha_code, generation):
                 map_update = Map(update)
                 #convert nested dicts into Map instances for dot notation access
                 for key in map_update.keys():
@@ -297,28 +1807,252 @@ class Updates():
         iso3166_updates_dict = dict(sorted(iso3166_updates_dict.items()))
 
         #convert into instance of Map class so keys can be accessed via dot notation
-        iso3166_updates_dict = Map(iso3166_updates_dict)
+        if not (raw):
+            iso3166_updates_dict = Map(iso3166_updates_dict)
 
         return iso3166_updates_dict 
     
-    def year(self, input_year: str|list) -> dict:
+    def timeline(self, alpha_code: str, raw: bool=False) -> list:
         """
-        Get all listed updates/changes in the updates json object for an input year, set of years,
-        year range, greater than/less than year or not equal to a year. The json object will be 
-        iterated over and any matching updates from the "Date Issued" column will be appended 
-        to the output dict.
+        Get the full history of a country: the ISO 3166-3 entries of the formerly used codes that 
+        preceded it, e.g. YUCS and CSXX for Serbia (RS), joined with its listed updates/changes, in
+        date order. The country can be input via its ISO 3166-1 alpha-2, alpha-3 or numeric code, or 
+        a former ISO 3166-3 alpha-4, alpha-2 or alpha-3 code succeeded by a single current country,
+        e.g. DDDE or DDR for Germany.
+
+        Each event is a dict of its "Date" (the withdrawal date of a former code or the Date Issued 
+        of an update), its "Type" ("Withdrawal" or "Update"), its "Code" (the alpha-4 code of a
+        former code or the alpha-2 code of an update) and the attributes of the ISO 3166-3 entry or
+        update. The predecessors of each current code are indexed when the ISO 3166-3 dataset is 
+        loaded, and each country's timeline is built once per dataset generation, so repeated 
+        lookups are O(1).
 
         Parameters
         ==========
-        :input_year: str|list
-            single or comma separated str/list of multiple years. Can also accept a year range or a year 
-            to get updates greater than or less than e.g "2015", "2009,2019", ">2022", "<2004", "2005-2012".
+        :alpha_code: str
+            ISO 3166-1 alpha-2, alpha-3 or numeric code, or former ISO 3166-3 alpha-4, alpha-2 or 
+            alpha-3 code, of the country e.g. RS, SRB, 688, DDDE.
+        :raw: bool (default=False)
+            return the shared event dicts rather than wrapping each in Map. The events should be 
+            treated as read-only.
 
         Returns
         =======
-        :country_output_dict: dict
-            output dictionary of sought ISO 3166 updates for input year/years.
-        
+        :timeline: list
+            events of the country's history, in date order.
+
+        Raises
+        ======
+        TypeError:
+            If input alpha code parameter isn't a string.
+        ValueError:
+            Invalid alpha code input, or a former code succeeded by multiple current countries, 
+            whose timelines can be got via timelines().
+            Valid alpha code input but country data not available as 'country_code' 
+            parameter was input on class instantiation.
+
+        Usage
+        =====
+        iso = Updates()
+        iso.timeline("RS")     # YUCS (2003), CSXX (2006) and the updates of Serbia
+        iso.timeline("DDR")    # former alpha-3 code of the German Democratic Republic, resolved to DE
+        """
+        #raise type error if input isn't a string
+        if not (isinstance(alpha_code, str)):
+            raise TypeError(f'Input parameter {alpha_code} is not of correct datatype string, got {type(alpha_code)}.')
+
+        alpha_codes = self._resolve_timeline_codes(alpha_code)
+        if (len(alpha_codes) > 1):
+            raise ValueError(f"Former code {alpha_code.strip().upper()} was succeeded by multiple countries {', '.join(alpha_codes)}, "
+                             "use timelines() to get the timeline of each.")
+        return self.timelines(alpha_codes, raw=raw)[alpha_codes[0]]
+
+    def timelines(self, alpha_codes: str|Iterable="", raw: bool=False) -> dict:
+        """
+        Get the timelines of one or more countries, as per timeline(), keyed by alpha-2 code. Former
+        codes succeeded by multiple current countries are resolved to all of them, e.g. YUCS to ME 
+        and RS. If no codes are input, the timelines of all countries are returned.
+
+        Parameters
+        ==========
+        :alpha_codes: str|Iterable (default="")
+            comma separated string, or iterable, of ISO 3166-1 or former ISO 3166-3 codes.
+        :raw: bool (default=False)
+            return a plain dict of the shared event dicts rather than wrapping them in Map.
+
+        Returns
+        =======
+        :timelines: dict
+            events of each country's history in date order, keyed by alpha-2 code in sorted order.
+
+        Raises
+        ======
+        TypeError:
+            If input alpha codes parameter isn't a string or iterable of strings.
+        ValueError:
+            Invalid alpha code input.
+            Valid alpha code input but country data not available as 'country_code' 
+            parameter was input on class instantiation.
+        """
+        if isinstance(alpha_codes, str):
+            alpha_codes = alpha_codes.split(",")
+        elif not (isinstance(alpha_codes, Iterable)):
+            raise TypeError(f"Input parameter alpha_codes must be a string or iterable of strings, got {type(alpha_codes)}.")
+        input_codes = []
+        for code in alpha_codes:
+            if not (isinstance(code, str)):
+                raise TypeError(f"Input alpha code {code} is not of correct datatype string, got {type(code)}.")
+            if (code.strip()):
+                input_codes.append(code)
+
+        #snapshot of current dataset generation, the timelines of all countries load the full dataset
+        generation = self._generation if input_codes else self._snapshot()
+        if (input_codes):
+            converted_alpha_codes = sorted({converted_code for code in input_codes for converted_code in self._resolve_timeline_codes(code)})
+        else:
+            converted_alpha_codes = sorted(generation.all)
+
+        timelines = {}
+        for converted_alpha_code in converted_alpha_codes:
+            if converted_alpha_code not in (generation.all if generation is not None else self):
+                raise ValueError(f"Valid alpha-2 code input {converted_alpha_code}, but country data not available as 'country_code' parameter was input on class instantiation,"
+                                " try creating another instance of the class with no initial input parameter value, e.g iso = Updates().")
+            events = self._get_timeline(converted_alpha_code, self._get_country_updates(converted_alpha_code, generation))
+            timelines[converted_alpha_code] = list(events) if raw else [Map(event) for event in events]
+
+        return timelines if raw else Map(timelines)
+
+    def _resolve_timeline_codes(self, alpha_code: str) -> list:
+        """
+        Convert an ISO 3166-1 alpha-2, alpha-3 or numeric code into its alpha-2 code, as per 
+        convert_to_alpha2(), or a former ISO 3166-3 alpha-4, alpha-2 or alpha-3 code into the
+        alpha-2 codes of the current countries succeeding it.
+        """
+        alpha_code = alpha_code.strip().upper()
+        try:
+            converted_alpha_code = self.convert_to_alpha2(alpha_code)
+            if converted_alpha_code is not None:
+                return [converted_alpha_code]
+        except ValueError:
+            pass
+        successors = Iso31663()._index.resolve(alpha_code)
+        if not (successors):
+            raise ValueError(f"Invalid ISO 3166-1 or former ISO 3166-3 country code input: {alpha_code}.")
+        return list(successors)
+
+    def _get_timeline(self, alpha_code: str, updates: list) -> tuple:
+        """
+        Get the events of a country's timeline, joining the ISO 3166-3 entries of its predecessors
+        with its list of updates in date order, building it if the country isn't cached or its list 
+        has been replaced by a newer dataset generation. Dates are YYYY or YYYY-MM-DD strings, so sort
+        chronologically as strings; the sort is stable so withdrawals precede updates of the same date.
+        """
+        timeline = self._timelines.get(alpha_code)
+        if timeline is None or timeline[0] is not updates:
+            iso3166_3 = Iso31663()
+            events = [(iso3166_3.all[alpha4_code].get("Withdrawal_Date") or "", 
+                       {"Date": iso3166_3.all[alpha4_code].get("Withdrawal_Date") or "", "Type": "Withdrawal", "Code": alpha4_code, **iso3166_3.all[alpha4_code]}) 
+                      for alpha4_code in iso3166_3._index.predecessors.get(alpha_code, ())]
+            for update in updates:
+                date_issued = update.get("Date Issued", "").strip().split(" ")[0].strip()
+                events.append((date_issued, {"Date": date_issued, "Type": "Update", "Code": alpha_code, **update}))
+            events.sort(key=lambda event: event[0])
+            timeline = (updates, tuple(event for _, event in events))
+            self._timelines[alpha_code] = timeline
+        return timeline[1]
+
+    def country_name(self, country_name: str, likeness_score: int=100, raw: bool=False) -> dict:
+        """
+        Get all listed updates/changes in the updates json object for an input country name or
+        comma separated list of country names, returning the same output as __getitem__ for the 
+        matching countries' alpha-2 codes. Names are matched against an index of the ISO 3166-1 
+        country names, official names, common names and common aliases (e.g. UK, Ivory Coast), 
+        folded to ignore case, accents and punctuation, so "Cote d'Ivoire" matches "Côte d'Ivoire".
+        Names that contain a comma, e.g. "Korea, Republic of", can be input as part of a list.
+
+        By default names must match exactly once folded (likeness_score=100). Setting the likeness
+        score between 1 and 100 fuzzy matches names that don't match exactly to the closest name 
+        with a match score greater than or equal to the likeness score, e.g. "Tajikstan" to 
+        "Tajikistan". Only the names sharing the most character trigrams with an input name are 
+        fuzzy scored, and the results of recent lookups are cached.
+
+        Parameters
+        ==========
+        :country_name: str
+            one or more comma separated country names, e.g. "Tajikistan, Ireland".
+        :likeness_score: int (default=100)
+            likeness score between 1 and 100 that sets the percentage of likeness the input 
+            names must have to a country name to be matched.
+        :raw: bool (default=False)
+            return a plain dict of shared references to the country updates.
+
+        Returns
+        =======
+        :iso3166_updates_dict: dict
+            dict object of country updates info for the matching countries.
+
+        Raises
+        ======
+        TypeError:
+            Input country name parameter isn't a string.
+        ValueError:
+            Empty country name input, invalid likeness score input or no matching country 
+            found for an input name.
+        """
+        #raise type error if input isn't a string
+        if not (isinstance(country_name, str)):
+            raise TypeError(f'Input parameter {country_name} is not of correct datatype string, got {type(country_name)}.')
+
+        #raise error if invalid (1-100) likeness score input
+        if not (1 <= likeness_score <= 100):
+            raise ValueError(f"Likeness score must be between 1 and 100, got {likeness_score}.")
+
+        input_names = [name.strip() for name in country_name.split(",")]
+        if not (any(input_names)):
+            raise ValueError("Input country name cannot be empty.")
+
+        alpha_codes = []
+        i = 0
+        while i < len(input_names):
+            if not (input_names[i]):
+                i += 1
+                continue
+            #match the longest run of up to 3 comma separated parts that's a country name, as some names contain commas
+            for j in range(min(len(input_names), i + 3), i + 1, -1):
+                alpha_code = _match_country_name(_fold_country_name(" ".join(input_names[i:j])), 100)
+                if alpha_code is not None:
+                    break
+            else:
+                j = i + 1
+                alpha_code = _match_country_name(_fold_country_name(input_names[i]), likeness_score)
+            if alpha_code is None:
+                raise ValueError(f"No matching country name found for input: {input_names[i]}.")
+            alpha_codes.append(alpha_code)
+            i = j
+
+        return self.alpha(",".join(alpha_codes), raw=raw)
+
+    def year(self, input_year: str|list, raw: bool=False) -> dict:
+        """
+        Get all listed updates/changes in the updates json object for an input year, set of years,
+        year range, greater than/less than year or not equal to a year. The json object will be 
+        iterated over and any matching updates from the "Date Issued" column will be appended 
+        to the output dict.
+
+        Parameters
+        ==========
+        :input_year: str|list
+            single or comma separated str/list of multiple years. Can also accept a year range or a year 
+            to get updates greater than or less than e.g "2015", "2009,2019", ">2022", "<2004", "2005-2012".
+        :raw: bool (default=False)
+            return a plain dict rather than a Map. The updates are always shared references to the
+            dataset and should be treated as read-only.
+
+        Returns
+        =======
+        :country_output_dict: dict
+            output dictionary of sought ISO 3166 updates for input year/years.
+        
         Raises
         ======
         TypeError:
@@ -346,51 +2080,30 @@ class Updates():
 
         #filter updates by year; int comparisons used to avoid lexicographic issues
         if (input_year != []):
-            for code in self.all:
+            all_updates = self.all
+            for code in all_updates:
                 country_output_dict[code] = []
-                for update in self.all[code]:
+                for update in all_updates[code]:
 
                     #extract integer year from Date Issued, stripping corrected date parenthetical if applicable
                     parsed = Updates._parse_date_issued(update["Date Issued"])
                     if parsed is None:
                         continue
-                    current_updates_year = parsed.year
-
-                    #exclude rows matching the input year/years
-                    if (year_not_equal):
-                        if current_updates_year not in [int(y) for y in input_year]:
-                            country_output_dict[code].append(update)
-
-                    #include rows where year >= input year
-                    elif (year_greater_than):
-                        if current_updates_year >= int(input_year[0]):
-                            country_output_dict[code].append(update)
-
-                    #include rows where year < input year
-                    elif (year_less_than):
-                        if current_updates_year < int(input_year[0]):
-                            country_output_dict[code].append(update)
-
-                    #include rows within year range, inclusive
-                    elif (year_range):
-                        if int(input_year[0]) <= current_updates_year <= int(input_year[1]):
-                            country_output_dict[code].append(update)
 
-                    #include rows matching the year/list of years
-                    else:
-                        for year_ in input_year:
-                            if current_updates_year == int(year_):
-                                country_output_dict[code].append(update)
+                    #add update for each time its year matches the input year/years
+                    for _ in range(self._year_filter_matches(parsed.year, input_year, year_range, year_greater_than, year_less_than, year_not_equal)):
+                        country_output_dict[code].append(update)
 
             #remove any empty objects from dict
             country_output_dict = {i:j for i,j in country_output_dict.items() if j != []}
 
         #make updates object subscriptable using Map class
-        country_output_dict = Map(country_output_dict)
+        if not (raw):
+            country_output_dict = Map(country_output_dict)
 
         return country_output_dict
 
-    def date_range(self, date: str|list, sort_by_date: str="") -> dict|list:
+    def date_range(self, date: str|list, sort_by_date: str="", raw: bool=False) -> dict|list:
         """
         Get all listed updates/changes in the updates json object that have publication dates within
         the inputted date range, inclusive. The function accepts a comma separated list of 2 dates
@@ -406,13 +2119,17 @@ class Updates():
             whether to sort by publication date ascending or descending. Acceptable values are
             "dateAsc" and "dateDesc", representing date ascending or descending, respectively. 
             If data other than these are input then objects not sorted by date.
+        :raw: bool (default=False)
+            when sorting by date, return a list of (alpha-2 code, update) tuples rather than
+            copying each update to add its Country Code attribute. The updates are shared 
+            references to the dataset and should be treated as read-only.
 
         Returns
         =======
         :date_filtered_data: dict|list
             object of all found updates/changes that were published within the input date range. 
             If the sort_by_date parameter is set a list of updates, sorted by date descending
-            or ascending will be returned.
+            or ascending will be returned, or a list of (alpha-2 code, update) tuples if raw.
 
         Raises
         ======
@@ -426,38 +2143,12 @@ class Updates():
         If the class was instantiated with a 'country_code' parameter, results are
         scoped to that country/countries only.
         """
-        #carry out relevant data validation if the input date is a string
-        if isinstance(date, str):
-            date_parts = date.split(",")
-            date_parts = [d.strip() for d in date_parts] 
-        #carry out relevant data validation if the input date is a list
-        elif isinstance(date, list):
-            date_parts = date
-        #raise error if input isn't a string or list
-        else:
-            raise TypeError(f"Input must be a string or a list of two dates , got {date}.")
-        
-        #if only one date input, treat this as the starting date, setting the end date as today
-        if len(date_parts) == 1:
-            date_parts.append(datetime.today().strftime("%Y-%m-%d"))
-        elif len(date_parts) != 2:
-            raise ValueError(f"Date input must contain either one or two dates, got: {date_parts}.")
-
-        #extra start and end date and convert each
-        start_date, end_date = date_parts[0], date_parts[1]
-        start_date = self.convert_date_format(start_date)
-        end_date = self.convert_date_format(end_date)
+        #validate and convert input dates into start and end datetimes
+        start_date, end_date = self._parse_date_range(date)
 
-        #raise error if start or end date couldn't be converted into the YYYY-MM-DD format
-        if (start_date is None or end_date is None):
-            raise ValueError(f"Input dates could not be converted into the YYYY-MM-DD format, got: {start_date, end_date}.")
-
-        #swap dates if start_date is later than end_date
-        if start_date > end_date:
-            start_date, end_date = end_date, start_date
-
-        #object to store date filtered updates data
+        #object to store date filtered updates data, and the flattened updates with their parsed date for sorting
         date_filtered_data = {}
+        dated_updates = []
 
         #iterate over all updates data, adding all data that's within desired date range
         for country_code, updates in self.all.items():
@@ -478,6 +2169,7 @@ class Updates():
                 #check if the original date falls within the input range
                 if (start_date <= original_date <= end_date): 
                     filtered_changes.append(update)
+                    dated_updates.append((original_date, country_code, update))
                     update_added = True
 
                 #check if the corrected date falls within the input range
@@ -485,6 +2177,7 @@ class Updates():
                     if (start_date <= corrected_date <= end_date):
                         if not (update_added):
                             filtered_changes.append(update)
+                            dated_updates.append((original_date, country_code, update))
 
             #add filtered changes to main date filtered object
             if filtered_changes:
@@ -493,42 +2186,55 @@ class Updates():
         #sort the updates output by date descending or ascending, skip if only one data element in output
         if (sort_by_date.lower() in ("dateasc", "datedesc") and len(date_filtered_data) > 1):
             
-            #list of flattened outputs
-            flattened_updates = []
-
-            #iterate over object of updates, create copy, add Country Code attribute to identify each
-            for country_code, updates in date_filtered_data.items():
-                for update in updates:
-                    update_with_code = update.copy()
-
-                    #temp var of updates object, append Country Code
-                    update_with_code = {"Country Code": country_code, **update_with_code}
-
-                    #parse the original publication date from attribute
-                    original_date_str = update["Date Issued"].split(" ")[0]  
-                    original_date = datetime.strptime(original_date_str, "%Y-%m-%d")
-
-                    #create new parsed date attribute for sorting 
-                    update_with_code["sortable_date"] = original_date
-                    
-                    #append object to list
-                    flattened_updates.append(update_with_code)
-
-            #sort list of outputs by Date Issued, descending or ascending depending on input parameter
-            if (sort_by_date.lower() == "datedesc"):
-                flattened_updates.sort(key=lambda x: x["sortable_date"], reverse=True)
-            else:
-                flattened_updates.sort(key=lambda x: x["sortable_date"], reverse=False)
+            #sort flattened updates by original Date Issued, descending or ascending depending on input parameter, 
+            #the sort is stable so updates with the same date keep their dataset order
+            dated_updates.sort(key=lambda x: x[0], reverse=(sort_by_date.lower() == "datedesc"))
 
-            #remove parsed temp date attribute
-            for update in flattened_updates:
-                del update["sortable_date"]
+            #return shared references paired with their country code if raw, else copies with Country Code attribute
+            if (raw):
+                flattened_updates = [(country_code, update) for _, country_code, update in dated_updates]
+            else:
+                flattened_updates = [{"Country Code": country_code, **update} for _, country_code, update in dated_updates]
 
             date_filtered_data = flattened_updates
 
         return date_filtered_data
 
-    def search(self, search_term: str, likeness_score: int=100, include_match_score: bool=True) -> dict|list:
+    def _parse_date_range(self, date: str|list) -> tuple:
+        """ Validate the date_range() input dates, returning the start and end dates as datetimes. """
+        #carry out relevant data validation if the input date is a string
+        if isinstance(date, str):
+            date_parts = date.split(",")
+            date_parts = [d.strip() for d in date_parts] 
+        #carry out relevant data validation if the input date is a list
+        elif isinstance(date, list):
+            date_parts = list(date)
+        #raise error if input isn't a string or list
+        else:
+            raise TypeError(f"Input must be a string or a list of two dates , got {date}.")
+        
+        #if only one date input, treat this as the starting date, setting the end date as today
+        if len(date_parts) == 1:
+            date_parts.append(datetime.today().strftime("%Y-%m-%d"))
+        elif len(date_parts) != 2:
+            raise ValueError(f"Date input must contain either one or two dates, got: {date_parts}.")
+
+        #extra start and end date and convert each
+        start_date, end_date = date_parts[0], date_parts[1]
+        start_date = self.convert_date_format(start_date)
+        end_date = self.convert_date_format(end_date)
+
+        #raise error if start or end date couldn't be converted into the YYYY-MM-DD format
+        if (start_date is None or end_date is None):
+            raise ValueError(f"Input dates could not be converted into the YYYY-MM-DD format, got: {start_date, end_date}.")
+
+        #swap dates if start_date is later than end_date
+        if start_date > end_date:
+            start_date, end_date = end_date, start_date
+
+        return start_date, end_date
+
+    def search(self, search_term: str, likeness_score: int=100, include_match_score: bool=True, parallel: bool|int=False, raw: bool=False) -> dict|list:
         """
         Get all listed updates/changes in the updates json object that have the inputted search
         terms. It can accept 1 or more search terms and return the data for each. The 'likeness_score' 
@@ -546,6 +2252,14 @@ class Updates():
         search terms are to the returned updates objects. Setting include_match_score to False removes
         this attribute, returning a dict of updates sorted alphabetically by country code.
 
+        The fuzzy search is CPU-bound, for large datasets the 'parallel' parameter can be set to shard
+        the countries across a persistent pool of worker processes, each of which loads the dataset
+        once. The shards are searched in parallel and their results merged, giving the same output as
+        the single-process search. The pool is restarted if the dataset changes, e.g. after a custom
+        update, and should be shutdown via the close() method, or by using the instance as a context
+        manager, once no longer needed, otherwise it's only shutdown when the instance is garbage 
+        collected.
+
         Parameters
         ========== 
         :search_term: str
@@ -558,6 +2272,14 @@ class Updates():
             set to False to strip the % match score from the returned update objects. When False,
             a dict sorted alphabetically by country code is returned. When True (the default), a
             list sorted by descending match score is returned.
+        :parallel: bool|int (default=False)
+            set to True to search the dataset in parallel using a pool of worker processes, one per 
+            processor on the machine, or set to an int for a specific number of worker processes.
+        :raw: bool (default=False)
+            return the matching updates as shared references to the dataset rather than copying 
+            each one to add the Country Code and Match Score attributes. A list of (alpha-2 code, 
+            update, match score) tuples is returned, or a dict of updates by country code if 
+            include_match_score=False. The updates should be treated as read-only.
 
         Returns
         =======
@@ -579,6 +2301,53 @@ class Updates():
         If the class was instantiated with a 'country_code' parameter, results are
         scoped to that country/countries only.
         """
+        #validate input parameters and split search terms into comma separated list 
+        search_terms = self._parse_search_terms(search_term, likeness_score)
+
+        #search through main country updates data object, sharded across the process pool if applicable
+        if (parallel):
+            search_results = self._search_updates_parallel(search_terms, likeness_score, None if parallel is True else int(parallel))
+        else:
+            search_results = self._search_updates(self.all.items(), search_terms, likeness_score)
+
+        return self._format_search_results(search_results, search_terms, include_match_score, raw)
+
+    def _search_updates_parallel(self, search_terms: list, likeness_score: int, processes: int=None) -> list:
+        """
+        Search the dataset in shards of countries across the instance's persistent process pool.
+        Shards are contiguous ranges of countries balanced by their number of updates, with the
+        shard results concatenated in order to match the output of _search_updates.
+        """
+        #create or resize the process pool, the pool is kept for subsequent searches
+        processes = processes or os.cpu_count() or 1
+        if processes < 1:
+            raise ValueError(f"Number of search processes must be at least 1, got {processes}.")
+        if self._process_pool is None or self._process_pool.max_workers != processes:
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=False)
+            self._process_pool = _UpdatesProcessPool(self, processes)
+        executor, generation = self._process_pool.get_executor()
+
+        #split countries into shards of roughly equal numbers of updates, several per process to balance the load
+        total_updates = sum(len(updates) for updates in generation.all.values())
+        shard_size = max(1, -(-total_updates // (processes * 4)))
+        shards, current_shard, current_shard_size = [], [], 0
+        for country_code, updates in generation.all.items():
+            current_shard.append(country_code)
+            current_shard_size += len(updates)
+            if current_shard_size >= shard_size:
+                shards.append(current_shard)
+                current_shard, current_shard_size = [], 0
+        if current_shard:
+            shards.append(current_shard)
+
+        #search shards in parallel, merging results in shard order
+        futures = [executor.submit(_search_process_pool_worker, shard, search_terms, likeness_score) for shard in shards]
+        return [result for future in futures for result in future.result()]
+
+    @staticmethod
+    def _parse_search_terms(search_term: str, likeness_score: int) -> list:
+        """ Validate the search() input parameters, returning the list of lowercased search terms. """
         #raise error if search_term parameter isn't a string
         if not (isinstance(search_term, str)):
             raise TypeError(f"Input search term should be of type str, got {type(search_term)}.")
@@ -588,42 +2357,49 @@ class Updates():
             raise ValueError(f"Likeness score must be between 1 and 100, got {likeness_score}.")
 
         #split search terms into comma separated list 
-        search_terms = [term.strip().lower() for term in search_term.split(",")]
+        return [term.strip().lower() for term in search_term.split(",")]
 
+    def _search_updates(self, country_updates: Iterable, search_terms: list, likeness_score: int) -> list:
+        """
+        Get the updates matching the search terms from an iterable of (alpha-2 code, updates) pairs,
+        as a list of (alpha-2 code, update, match score) tuples referencing the original updates. 
+        Results are in the order of the input countries and their updates, so a dataset can be 
+        searched in separate chunks and the chunk results concatenated in order to give the same 
+        result as searching it all at once.
+        """
         #store search results
         search_results = []
 
-        #iterate through main country updates data object 
-        for country_code, updates in self.all.items():
+        #parse each search term once, if input term has a date in it, try to parse into supported YYYY-MM-DD format
+        parsed_terms = []
+        for term in search_terms:
+            input_date_original = self.convert_date_format(term)
+            is_date_term = input_date_original is not None
+            if (is_date_term):
+                term = str(input_date_original).split(" ")[0]
+
+            #create regex pattern for term, 2 regex patterns are supported depending on if non-word characters are in the term e.g "2023-11-23"
+            if re.search(r'\W', term):  # contains non-word characters (like "-", ".", etc.)
+                word_pattern = re.compile(re.escape(term))
+            else:
+                word_pattern = re.compile(r'\b{}\b'.format(re.escape(term)))
+            parsed_terms.append((term, is_date_term, word_pattern))
+
+        #iterate through country updates 
+        for country_code, updates in country_updates:
             for update in updates:
                 #combine main change and description attributes into one search space 
                 combined_text = f"{update['Change']} {update.get('Description of Change', '')}".lower()
 
                 #iterate over all input search terms
-                for term in search_terms:
-                    #if input term has a date in it, try to parse into supported YYYY-MM-DD format, else return None
-                    input_date_original = self.convert_date_format(term)
-
+                for term, is_date_term, word_pattern in parsed_terms:
                     #if valid date found in search term, add Date Issued attribute data to search space
-                    if not (input_date_original is None):
-                        input_date_converted = str(self.convert_date_format(term)).split(" ")[0]
+                    if (is_date_term):
                         combined_text = f"{combined_text}{update.get('Date Issued').strip()}".lower()
-                        term = input_date_converted
-
-                    #temp var of updates object, append Country Code
-                    temp_search_result = {"Country Code": country_code, **update}
 
-                    #create regex pattern for term, 2 regex patterns are supported depending on if non-word characters are in the term e.g "2023-11-23"
-                    if re.search(r'\W', term):  # contains non-word characters (like "-", ".", etc.)
-                        word_pattern = re.escape(term)
-                    else:
-                        word_pattern = r'\b{}\b'.format(re.escape(term))
-
-                    #search for exact match of keyword in combined search text
-                    if re.search(word_pattern, combined_text):
-                        #add Match Score of 100 to object, meaning an exact match
-                        temp_search_result["Match Score"] = 100
-                        search_results.append(temp_search_result)
+                    #search for exact match of keyword in combined search text, a Match Score of 100 meaning an exact match
+                    if word_pattern.search(combined_text):
+                        search_results.append((country_code, update, 100))
                     #search for non-exact match, find best fuzzy search score across all words
                     else:
                         words = re.findall(r'\w+', combined_text)
@@ -632,33 +2408,218 @@ class Updates():
                             score = max(fuzz.ratio(term, word) for word in words)
                             #if score is greater than likeness score threshold, append to object, add score
                             if (score >= likeness_score):
-                                temp_search_result["Match Score"] = score
-                                search_results.append(temp_search_result)
+                                search_results.append((country_code, update, score))
+
+        return search_results
 
+    @staticmethod
+    def _format_search_results(search_results: list, search_terms: list, include_match_score: bool=True, raw: bool=False) -> dict|list:
+        """
+        Format the search results from _search_updates, either sorted by Match Score or with the score
+        stripped and the results grouped by country code. Unless raw, each result is copied with its
+        Country Code and Match Score attributes added.
+        """
         #no matching data found for search terms
         if not search_results:
             print(f"No matching updates found with the given search term(s): {search_terms}")
-            return search_results
+            return []
         
         #if include_match_score=False, strip scores and return dict sorted by country code
         if not (include_match_score):
-            for item in search_results:
-                item.pop("Match Score", None)
-
             #group results by country code, preserving all matches per country
             temp_search_results = {}
-            for update in search_results:
-                code = update["Country Code"]
-                update_copy = {k: v for k, v in update.items() if k != "Country Code"}
-                temp_search_results.setdefault(code, []).append(update_copy)
+            for code, update, _ in search_results:
+                temp_search_results.setdefault(code, []).append(update if raw else dict(update))
 
             #sort dict by country code, alphabetically
-            search_results = dict(sorted(temp_search_results.items()))
+            return dict(sorted(temp_search_results.items()))
+
+        #sort output by matching score, highest match first
+        search_results = sorted(search_results, key=lambda x: x[2], reverse=True)
+        if (raw):
+            return search_results
+
+        return [{"Country Code": code, **update, "Match Score": score} for code, update, score in search_results]
+
+    def to_json_bytes(self, alpha_code: str=None, year: str|list=None) -> bytes:
+        """
+        Get the UTF-8 encoded JSON of the updates for an input country/countries or year/years, 
+        byte-identical to json.dumps of the output of the equivalent __getitem__ or year() lookup, 
+        or of all the updates data if neither is input. Rather than encoding the output objects,
+        the JSON is joined from pre-serialized fragments of each country's updates, which are
+        cached for as long as the country's updates are unchanged. Single year lookups are joined
+        from fragments of each country's updates grouped by year, other year lookups from the
+        fragments of the updates matching the years, without re-parsing their dates.
+
+        Parameters
+        ==========
+        :alpha_code: str (default=None)
+            one or more ISO 3166-1 alpha-2, alpha-3 or numeric country codes, as accepted by 
+            __getitem__.
+        :year: str|list (default=None)
+            one or more years, a year range or a greater than/less than/not equal to year, as 
+            accepted by year().
+
+        Returns
+        =======
+        :json_bytes: bytes
+            UTF-8 encoded JSON object of the sought updates, keyed by alpha-2 code.
+
+        Raises
+        ======
+        ValueError:
+            Both the alpha code and year parameters input, or invalid alpha code or year input.
+        TypeError:
+            Invalid data type for alpha code or year parameters.
+        """
+        #raise error if both alpha code and year parameters input
+        if (alpha_code is not None and year is not None):
+            raise ValueError("Only one of the alpha_code or year parameters can be input.")
+
+        if (alpha_code is not None):
+            members = [self._get_json_fragments(code, updates).member for code, updates in self.alpha(alpha_code, raw=True).items()]
+        elif (year is not None):
+            input_year, year_range, year_greater_than, year_less_than, year_not_equal = self._parse_year_input(year)
+
+            members = []
+            for code, updates in self.all.items():
+                fragments = self._get_json_fragments(code, updates)
+                if (len(input_year) == 1 and not (year_range or year_greater_than or year_less_than or year_not_equal)):
+                    #use the country's pre-serialized updates for the single year
+                    member = fragments.years.get(input_year[0])
+                else:
+                    #join the country's pre-serialized updates that match the years, using each update's pre-parsed year
+                    records = []
+                    for record, record_year in zip(fragments.records, fragments.record_years):
+                        if record_year is not None:
+                            records.extend([record] * self._year_filter_matches(record_year, input_year, year_range, year_greater_than, year_less_than, year_not_equal))
+                    member = _CountryJSONFragments.join(code, records) if records else None
+                if (member is not None):
+                    members.append(member)
         else:
-            #sort output by matching score, highest match first
-            search_results.sort(key=lambda x: x["Match Score"], reverse=True)
+            members = [self._get_json_fragments(code, updates).member for code, updates in self.all.items()]
 
-        return search_results
+        return b"{" + b", ".join(members) + b"}"
+
+    def to_json_gzip(self, alpha_code: str=None, year: str|list=None) -> bytes:
+        """
+        Get the gzip compressed UTF-8 encoded JSON of the updates for an input country/countries
+        or year/years, or of all the updates data if neither is input, which decompresses to the 
+        output of to_json_bytes(). The compressed payloads are cached rather than compressing the 
+        JSON on each call: the payloads of all the updates and of year lookups are cached on the
+        dataset generation and so are only recompressed when a new generation is published, whilst 
+        a country lookup is joined from the cached raw deflate fragments of each country, which are 
+        only recompressed when the country's updates change. The fragments are sync flushed, so 
+        they're joined into a single gzip member, with the CRC32 of the joined JSON in its trailer.
+
+        Parameters
+        ==========
+        :alpha_code: str (default=None)
+            one or more ISO 3166-1 alpha-2, alpha-3 or numeric country codes, as accepted by 
+            __getitem__.
+        :year: str|list (default=None)
+            one or more years, a year range or a greater than/less than/not equal to year, as 
+            accepted by year().
+
+        Returns
+        =======
+        :gzip_bytes: bytes
+            gzip compressed UTF-8 encoded JSON object of the sought updates, keyed by alpha-2 code.
+
+        Raises
+        ======
+        ValueError:
+            Both the alpha code and year parameters input, or invalid alpha code or year input.
+        TypeError:
+            Invalid data type for alpha code or year parameters.
+        """
+        #raise error if both alpha code and year parameters input
+        if (alpha_code is not None and year is not None):
+            raise ValueError("Only one of the alpha_code or year parameters can be input.")
+
+        if (alpha_code is not None):
+            return _gzip_join(self._get_country_deflate_fragments(alpha_code))
+
+        generation = self._snapshot()
+        if (year is not None):
+            return self._get_generation_gzip(generation, ("year", repr(self._parse_year_input(year))), lambda: self.to_json_bytes(year=year))
+        return self._get_generation_gzip(generation, ("all",), self.to_json_bytes)
+
+    def _get_country_deflate_fragments(self, alpha_code: str) -> list:
+        """ Get the (data, deflated) fragments of the JSON object of a country lookup, from the cached fragments of each country. """
+        country_updates = self.alpha(alpha_code, raw=True)
+        if not (country_updates):
+            return [_CountryJSONFragments.DEFLATE_EMPTY]
+        return [self._get_json_fragments(code, updates).deflate_fragment(first=index == 0) 
+                for index, (code, updates) in enumerate(country_updates.items())] + [_CountryJSONFragments.DEFLATE_CLOSE]
+
+    def _json_deflate(self, alpha_code: str=None, year: str|list=None) -> bytes:
+        """
+        Get the raw deflate fragment of the JSON output of to_json_bytes(), from the same cached
+        payloads and fragments as to_json_gzip(), so it can be joined with other fragments into
+        a single gzip member via _gzip_join(), e.g. within the envelope of an API response.
+        """
+        if (alpha_code is not None and year is None):
+            return b"".join(deflated for _, deflated in self._get_country_deflate_fragments(alpha_code))
+        #strip the header, final block and trailer from the cached gzip member's deflate stream
+        return self.to_json_gzip(alpha_code, year)[len(_GZIP_HEADER):-len(_DEFLATE_END) - 8]
+
+    def etag(self, alpha_code: str=None, year: str|list=None, date_range: str|list=None, sort_by_date: str="") -> str:
+        """
+        Get a strong HTTP ETag for the output of a country, year or date range query, or for all
+        of the updates data if no query parameters are input. The ETag is combined from the query 
+        parameters, after validation and normalisation, and the content hashes of the countries' 
+        updates that the query reads, without running the query or serializing its output. The
+        content hash of each country's updates is cached for as long as they're unchanged and the 
+        hash of the dataset generation, used by year and date range queries, is cached on the 
+        generation, so the ETag of a query changes only if the updates data it reads changes.
+
+        Parameters
+        ==========
+        :alpha_code: str (default=None)
+            one or more ISO 3166-1 alpha-2, alpha-3 or numeric country codes, as accepted by 
+            __getitem__.
+        :year: str|list (default=None)
+            one or more years, a year range or a greater than/less than/not equal to year, as 
+            accepted by year().
+        :date_range: str|list (default=None)
+            one or two dates, as accepted by date_range().
+        :sort_by_date: str (default="")
+            sort_by_date parameter of the date range query, as accepted by date_range().
+
+        Returns
+        =======
+        :etag: str
+            double quoted ETag of the query output, for use in the ETag and If-None-Match HTTP headers.
+
+        Raises
+        ======
+        ValueError:
+            More than one of the alpha code, year and date range parameters input, or invalid
+            parameter input.
+        TypeError:
+            Invalid data type for alpha code, year or date range parameters.
+        """
+        #raise error if more than one query parameter input
+        if sum(query is not None for query in (alpha_code, year, date_range)) > 1:
+            raise ValueError("Only one of the alpha_code, year or date_range parameters can be input.")
+
+        if (alpha_code is not None):
+            #a country query only reads the sought countries' updates
+            etag_parts = [b"alpha"]
+            for code, updates in self.alpha(alpha_code, raw=True).items():
+                etag_parts.extend([code.encode("utf-8"), self._get_json_fragments(code, updates).digest])
+        elif (year is not None):
+            etag_parts = [b"year", repr(self._parse_year_input(year)).encode("utf-8"), self._get_generation_digest(self._snapshot())]
+        elif (date_range is not None):
+            start_date, end_date = self._parse_date_range(date_range)
+            sort_by_date = sort_by_date.lower() if sort_by_date.lower() in ("dateasc", "datedesc") else ""
+            etag_parts = [b"date_range", f"{start_date:%Y-%m-%d},{end_date:%Y-%m-%d},{sort_by_date}".encode("utf-8"), 
+                          self._get_generation_digest(self._snapshot())]
+        else:
+            etag_parts = [b"all", self._get_generation_digest(self._snapshot())]
+
+        return '"' + hashlib.blake2b(b"\0".join(etag_parts), digest_size=16).hexdigest() + '"'
 
     def custom_update(self, alpha_code: str, custom_update_object: dict=None, change: str="", date_issued: str="", description_of_change: str="", 
                       source: str="", delete: bool=False, save_new: bool=False, save_new_filename: str="iso3166_updates_copy.json") -> None:
@@ -677,8 +2638,14 @@ class Updates():
         of the added Update, but also setting the 'delete' parameter to 1/True. You can 
         also uninstall and reinstall. 
 
-        To avoid writing over the main existing updates file you can export to a separate object 
-        via the `save_new` and `save_new_filename` parameters.
+        Custom updates aren't written to the updates file itself, each add or delete operation is
+        appended to an append-only journal alongside it (e.g. iso3166-updates.journal.ndjson),
+        fsynced before the update is published, which is replayed onto the updates file whenever 
+        it's loaded. Each custom update therefore writes a single line rather than the whole 
+        dataset; the compact() method merges the journal into a new updates file on demand. 
+        
+        To export the updated dataset to a separate object instead, use the `save_new` and 
+        `save_new_filename` parameters, in which case the operation isn't journaled.
 
         Note that this is a destructive yet temporary functionality. Adding a new custom 
         change/update will make the dataset out of sync with the official ISO 3166 Updates data, 
@@ -706,7 +2673,7 @@ class Updates():
             from json object.      
         :save_new: bool (default=0)
             save a new copy of the iso3166-updates.json object with the new changes applied,
-            such that the original object is not overwritten. 
+            rather than journaling the change for the original object. 
         :save_new_filename: str (default="iso3166_updates_copy.json")
             filename for copied iso3166-updates.json object with the new changes applied.
 
@@ -802,76 +2769,915 @@ class Updates():
             if not ("Source" in custom_update_object):
                 custom_update_object["Source"] = ""
 
-        #raise error if not deleting and neither custom_update_object nor change+date_issued are provided
-        if not delete and not custom_update_object and not (change and date_issued):
-            raise ValueError("When adding a custom update, either 'custom_update_object' or both 'change' and 'date_issued' parameters must be provided.")
+        #raise error if not deleting and neither custom_update_object nor change+date_issued are provided
+        if not delete and not custom_update_object and not (change and date_issued):
+            raise ValueError("When adding a custom update, either 'custom_update_object' or both 'change' and 'date_issued' parameters must be provided.")
+
+        #build the new update record, or the Change and Date Issued of the update to delete
+        if custom_update_object:
+            custom_updates_data = {key: custom_update_object.get(key, "") for key in ['Change', 'Description of Change', 'Date Issued', 'Source']}
+        else:
+            custom_updates_data = {"Change": change, "Date Issued": date_issued, "Description of Change": description_of_change, "Source": source}
+        operation = (alpha_code, "delete" if delete else "add", custom_updates_data)
+
+        #buffer the operation if within a transaction, it's applied when the transaction exits
+        transaction_operations = getattr(self._transaction_local, "operations", None)
+        if transaction_operations is not None:
+            transaction_operations.append(operation)
+            return
+
+        self._apply_custom_updates([operation], save_new, save_new_filename)
+
+    def custom_updates_batch(self, operations: Iterable, save_new: bool=False, save_new_filename: str="iso3166_updates_copy.json") -> int:
+        """
+        Add and/or delete a batch of custom changes/updates, as per custom_update(), atomically:
+        if any operation is invalid, e.g. a duplicate update or a delete of a missing update, an 
+        error is raised and none of the operations are applied. Each operation is validated as 
+        per custom_update(), duplicate and delete checks are lookups in a hash index of each 
+        country's updates keyed by their case-insensitive Change and Date Issued, and the whole
+        batch is persisted in a single journal append (or export if save_new is set) and published
+        as a single new dataset generation.
+
+        Parameters
+        ==========
+        :operations: Iterable
+            custom update operations, each a dict of the alpha_code (or "Country Code") of the
+            country, the update's "Change", "Date Issued" and optional "Description of Change" 
+            and "Source" attributes, and an optional "delete" flag to delete the update.
+        :save_new: bool (default=False)
+            save a new copy of the iso3166-updates.json object with the new changes applied,
+            rather than journaling the changes for the original object.
+        :save_new_filename: str (default="iso3166_updates_copy.json")
+            filename for copied iso3166-updates.json object with the new changes applied.
+
+        Returns
+        =======
+        :applied: int
+            number of custom update operations applied.
+
+        Usage
+        =====
+        iso.custom_updates_batch([
+            {"alpha_code": "UZ", "Change": "Example ISO 3166 update for UZ", "Date Issued": "2025-01-01"},
+            {"alpha_code": "LB", "Change": "Example ISO 3166 update for LB", "Date Issued": "2025-01-01", "Source": "https://..."},
+            {"alpha_code": "FR", "Change": "Existing update for FR", "Date Issued": "2024-01-01", "delete": True}
+        ])
+
+        Raises
+        ======
+        TypeError:
+            Invalid data type for an operation or its attributes.
+        ValueError:
+            Invalid operation, prefixed with its position in the batch.
+        """
+        operations = list(operations)
+        with self.transaction(save_new, save_new_filename):
+            for i, operation in enumerate(operations):
+                try:
+                    if not (isinstance(operation, dict)):
+                        raise TypeError(f"Custom update operation should be a dict, got {type(operation)}.")
+                    alpha_code = operation.get("alpha_code", operation.get("Country Code", ""))
+                    delete = operation.get("delete", False)
+                    if isinstance(delete, str):
+                        delete = delete.strip().lower() in ("1", "true", "yes", "y")
+                    custom_update_object = {key: operation[key] for key in ("Change", "Date Issued", "Description of Change", "Source") if key in operation}
+                    self.custom_update(alpha_code, custom_update_object=custom_update_object, delete=bool(delete))
+                except (TypeError, ValueError) as error:
+                    raise type(error)(f"Invalid custom update operation at index {i}: {error}") from error
+
+        return len(operations)
+
+    @contextmanager
+    def transaction(self, save_new: bool=False, save_new_filename: str="iso3166_updates_copy.json"):
+        """
+        Context manager that applies the custom updates made within it atomically when it exits, 
+        as a single batch: custom_update() calls made by the thread within the context are validated 
+        and buffered, then applied as per custom_updates_batch(). If an error is raised within the 
+        context, or any of the buffered operations are invalid, none of them are applied. Queries 
+        made within the context don't see the buffered updates. Nested transactions are applied 
+        with the outermost transaction, whose save_new parameters are used in place of those of 
+        the custom_update() calls.
+
+        Parameters
+        ==========
+        :save_new: bool (default=False)
+            save a new copy of the iso3166-updates.json object with the new changes applied,
+            rather than journaling the changes for the original object.
+        :save_new_filename: str (default="iso3166_updates_copy.json")
+            filename for copied iso3166-updates.json object with the new changes applied.
+
+        Usage
+        =====
+        with iso.transaction():
+            iso.custom_update("UZ", change="Example ISO 3166 update for UZ", date_issued="2025-01-01")
+            iso.custom_update("LB", change="Example ISO 3166 update for LB", date_issued="2025-01-01")
+        """
+        #nested transactions join the outermost transaction
+        if getattr(self._transaction_local, "operations", None) is not None:
+            yield self
+            return
+
+        self._transaction_local.operations = []
+        try:
+            yield self
+            operations = self._transaction_local.operations
+        finally:
+            self._transaction_local.operations = None
+        self._apply_custom_updates(operations, save_new, save_new_filename, batch=True)
+
+    def import_custom_updates(self, filepath: str, save_new: bool=False, save_new_filename: str="iso3166_updates_copy.json") -> int:
+        """
+        Bulk import custom updates from a CSV or NDJSON file, applied atomically as a single batch
+        as per custom_updates_batch(). CSV files have a header row of the "Country Code" (or 
+        alpha_code), "Change", "Date Issued", "Description of Change", "Source" and optional 
+        "delete" columns, as in the CSV exported by the iso3166_updates_export scripts. NDJSON
+        (.ndjson or .jsonl) files have an operation object per line, in the same format as the
+        operations of custom_updates_batch() or as the lines of a custom updates journal.
+
+        Parameters
+        ==========
+        :filepath: str
+            filepath to the CSV or NDJSON file of custom updates.
+        :save_new: bool (default=False)
+            save a new copy of the iso3166-updates.json object with the new changes applied,
+            rather than journaling the changes for the original object.
+        :save_new_filename: str (default="iso3166_updates_copy.json")
+            filename for copied iso3166-updates.json object with the new changes applied.
+
+        Returns
+        =======
+        :applied: int
+            number of custom update operations applied.
+
+        Raises
+        ======
+        OSError:
+            Import file not found.
+        ValueError:
+            Unsupported file type, invalid JSON line or invalid operation.
+        """
+        if not (os.path.isfile(filepath)):
+            raise OSError(f"Custom updates import file not found: {filepath}.")
+
+        file_extension = os.path.splitext(filepath)[1].lower()
+        if (file_extension == ".csv"):
+            with open(filepath, "r", encoding="utf-8-sig", newline="") as f:
+                operations = list(csv.DictReader(f))
+        elif (file_extension in (".ndjson", ".jsonl")):
+            operations = []
+            with open(filepath, "r", encoding="utf-8") as f:
+                for line_number, line in enumerate(f, 1):
+                    if not (line.strip()):
+                        continue
+                    try:
+                        operation = json.loads(line)
+                    except json.JSONDecodeError:
+                        raise ValueError(f"Invalid JSON on line {line_number} of custom updates import file: {filepath}.")
+                    #convert custom updates journal lines into operations
+                    if isinstance(operation, dict) and "op" in operation and "update" in operation:
+                        operation = {"alpha_code": operation.get("alpha_code", ""), **operation["update"], "delete": operation["op"] == "delete"}
+                    operations.append(operation)
+        else:
+            raise ValueError(f"Custom updates import file should be a CSV or NDJSON file, got: {filepath}.")
+
+        return self.custom_updates_batch(operations, save_new, save_new_filename)
+
+    def create_delta(self, other: Updates|dict, from_version: str="", to_version: str="") -> dict:
+        """
+        Create a compact delta patch that upgrades the instance's updates to those of another
+        Updates instance or updates object, e.g. of a newer version of the dataset, to be applied
+        to a deployed dataset via apply_delta(). The delta lists the operations of each changed 
+        country, as per diff(): the updates to add, the fingerprints of the updates to remove, and 
+        the fingerprints of the modified updates with their replacements. Fingerprints are hashes
+        of an update's whitespace normalised attributes, so identify an update independently of
+        its position.
+
+        Parameters
+        ==========
+        :other: Updates|dict
+            Updates instance, or updates object keyed by alpha-2 code, to upgrade the instance's
+            updates to.
+        :from_version: str (default="")
+            version of the instance's updates, recorded in the delta.
+        :to_version: str (default="")
+            version of the other updates, recorded in the delta.
+
+        Returns
+        =======
+        :delta: dict
+            delta patch, with keys "format", "from_version", "to_version" and "countries", a 
+            mapping of alpha-2 code to a dict of the country's "add" list of updates, "remove" 
+            list of fingerprints and "modify" list of {"fingerprint", "update"} dicts, each only
+            present if non-empty.
+
+        Raises
+        ======
+        TypeError:
+            Invalid data type for other.
+
+        Usage
+        =====
+        delta = Updates(custom_updates_filepath="iso3166-updates-v1.8.0.json").create_delta(
+            Updates(custom_updates_filepath="iso3166-updates-v1.8.7.json"), "1.8.0", "1.8.7")
+        """
+        updates_diff = self.diff(other)
+        delta_countries = {}
+        for alpha_code in sorted({**updates_diff["added"], **updates_diff["removed"], **updates_diff["modified"]}):
+            country_delta = {}
+            if (alpha_code in updates_diff["added"]):
+                country_delta["add"] = updates_diff["added"][alpha_code]
+            if (alpha_code in updates_diff["removed"]):
+                country_delta["remove"] = [_update_fingerprint(update).hex() for update in updates_diff["removed"][alpha_code]]
+            if (alpha_code in updates_diff["modified"]):
+                country_delta["modify"] = [{"fingerprint": _update_fingerprint(modified["previous"]).hex(), "update": modified["current"]} 
+                                           for modified in updates_diff["modified"][alpha_code]]
+            delta_countries[alpha_code] = country_delta
+
+        return {"format": _DELTA_FORMAT, "from_version": from_version, "to_version": to_version, "countries": delta_countries}
+
+    def apply_delta(self, delta: dict, save_new: bool=False, save_new_filename: str="iso3166_updates_copy.json") -> int:
+        """
+        Apply a delta patch, created by create_delta(), to the instance's updates, e.g. to upgrade
+        a deployed dataset with custom updates between versions without downloading either version.
+        Only the countries in the delta are read and copied: each country's updates are matched to
+        the delta's fingerprints, and the removed and modified updates are deleted and the added
+        and modified updates added, as custom update operations applied atomically as a single
+        batch, as per custom_updates_batch(). The instance's custom updates, or those of its 
+        overlay, are kept; operations whose update has already been removed, or whose added update
+        already exists, are skipped, so applying a delta twice leaves the updates unchanged.
+
+        Parameters
+        ==========
+        :delta: dict
+            delta patch, as created by create_delta().
+        :save_new: bool (default=False)
+            save a new copy of the iso3166-updates.json object with the delta applied, rather 
+            than journaling the changes for the original object.
+        :save_new_filename: str (default="iso3166_updates_copy.json")
+            filename for copied iso3166-updates.json object with the delta applied.
+
+        Returns
+        =======
+        :applied: int
+            number of add, remove and modify operations of the delta applied.
+
+        Raises
+        ======
+        TypeError:
+            Invalid data type for delta.
+        ValueError:
+            Invalid delta patch, or a delta of a country not in the instance's updates.
+
+        Usage
+        =====
+        iso = Updates()
+        iso.apply_delta(delta)
+        """
+        if not isinstance(delta, dict):
+            raise TypeError(f"Delta should be a dict, as created by create_delta(), got {type(delta)}.")
+        if not (delta.get("format") == _DELTA_FORMAT and isinstance(delta.get("countries"), dict)):
+            raise ValueError(f"Invalid delta patch, expected a dict of format {_DELTA_FORMAT!r} with a dict of countries.")
+
+        def validate_update(alpha_code: str, update: dict) -> dict:
+            if not (isinstance(update, dict) and isinstance(update.get("Change"), str) and isinstance(update.get("Date Issued"), str)):
+                raise ValueError(f"Invalid update in delta patch of country {alpha_code}, expected a dict with Change and Date Issued attributes: {update}.")
+            return update
+
+        #match each delta country's updates to the delta's fingerprints, simulating its keys to skip duplicate adds
+        all_updates = self._snapshot().all
+        operations, applied = [], 0
+        for alpha_code, country_delta in delta["countries"].items():
+            if not (isinstance(country_delta, dict)):
+                raise ValueError(f"Invalid delta patch of country {alpha_code}, expected a dict of add, remove and modify operations.")
+            if alpha_code not in all_updates:
+                raise ValueError(f"Valid alpha-2 code input {alpha_code}, but country data not available in the updates object.")
+            fingerprint_updates, key_counts = {}, {}
+            for update in all_updates[alpha_code]:
+                fingerprint_updates.setdefault(_update_fingerprint(update).hex(), []).append(update)
+                key_counts[_update_key(update)] = key_counts.get(_update_key(update), 0) + 1
+
+            def delete(fingerprint: str) -> bool:
+                matches = fingerprint_updates.get(fingerprint)
+                if not (matches):
+                    return False
+                update = matches.pop(0)
+                key_counts[_update_key(update)] -= 1
+                operations.append((alpha_code, "delete", update))
+                return True
+
+            def add(update: dict) -> bool:
+                if key_counts.get(_update_key(update)):
+                    return False
+                key_counts[_update_key(update)] = 1
+                operations.append((alpha_code, "add", update))
+                return True
+
+            for fingerprint in country_delta.get("remove", []):
+                applied += delete(fingerprint)
+            for modified in country_delta.get("modify", []):
+                if not (isinstance(modified, dict) and "fingerprint" in modified):
+                    raise ValueError(f"Invalid modify operation in delta patch of country {alpha_code}, expected a dict of fingerprint and update.")
+                update = validate_update(alpha_code, modified.get("update"))
+                if delete(modified["fingerprint"]):
+                    add(update)
+                    applied += 1
+            for update in country_delta.get("add", []):
+                applied += add(validate_update(alpha_code, update))
+
+        self._apply_custom_updates(operations, save_new, save_new_filename)
+        return applied
+
+    def _get_update_index(self, alpha_code: str, updates: list) -> dict:
+        """
+        Get the hash index of a country's list of updates, mapping the key of each update, its 
+        case-insensitive Change and Date Issued, to its positions in the list. The index is 
+        cached for as long as the country's list object is unchanged.
+        """
+        cached_index = self._update_indexes.get(alpha_code)
+        if cached_index is None or cached_index[0] is not updates:
+            update_index = {}
+            for i, update in enumerate(updates):
+                update_index.setdefault(_update_key(update), []).append(i)
+            cached_index = (updates, update_index)
+            self._update_indexes[alpha_code] = cached_index
+        return cached_index[1]
+
+    def _apply_custom_updates(self, operations: list, save_new: bool=False, save_new_filename: str="iso3166_updates_copy.json", batch: bool=False) -> None:
+        """
+        Atomically apply a list of validated (alpha_code, op, update) custom update operations.
+        Duplicate adds and deletes of missing updates are detected via the hash index of each
+        country's updates; if any operation is invalid, none are applied. All of the operations
+        are persisted in a single journal append, or export if save_new is set, and published as
+        a single new dataset generation. Errors of a batch of operations are prefixed with the 
+        position of the invalid operation.
+        """
+        if not (operations):
+            return
+        error_prefix = "Invalid custom update operation at index {}: " if (batch) else ""
+
+        #writers are serialised, the new dataset generation is built from a copy of the current one and published
+        #via a single reference swap so concurrent readers never see a partially applied update
+        self._snapshot()
+        with self._write_lock:
+            all_updates = self._generation.all
+
+            #copy of each changed country's updates, its index and the positions of its deleted updates
+            changed_countries = {}
+            journal_operations = []
+            for i, (alpha_code, op, update) in enumerate(operations):
+                if alpha_code not in all_updates:
+                    raise ValueError(error_prefix.format(i) + f"Valid alpha-2 code input {alpha_code}, but country data not available as 'country_code' parameter was input on class instantiation.")
+                if alpha_code not in changed_countries:
+                    changed_countries[alpha_code] = (list(all_updates[alpha_code]), dict(self._get_update_index(alpha_code, all_updates[alpha_code])), set())
+                country_updates, update_index, deleted_positions = changed_countries[alpha_code]
+
+                key = _update_key(update)
+                positions = update_index.get(key, [])
+                if (op == "add"):
+                    #raise error if existing update found in object
+                    if (positions):
+                        raise ValueError(error_prefix.format(i) + f"Custom updates object should be unique and not already present an existing update: {update}.")
+                    update_index[key] = [len(country_updates)]
+                    country_updates.append(update)
+                else:
+                    #raise error if object to be deleted not found in updates object
+                    if not (positions):
+                        raise ValueError(error_prefix.format(i) + "No matching updates object found to delete.")
+                    update = country_updates[positions[0]]
+                    deleted_positions.add(positions[0])
+                    update_index[key] = positions[1:]
+                journal_operations.append({"op": op, "alpha_code": alpha_code, "update": update})
+
+            #remove the deleted updates from each changed country's copy, caching the index of countries without deletions
+            for alpha_code, (country_updates, update_index, deleted_positions) in changed_countries.items():
+                if (deleted_positions):
+                    country_updates = _read_only_updates([update for i, update in enumerate(country_updates) if i not in deleted_positions])
+                else:
+                    country_updates = _read_only_updates(country_updates)
+                    self._update_indexes[alpha_code] = (country_updates, update_index)
+                changed_countries[alpha_code] = country_updates
+            all_updates = {**all_updates, **changed_countries}
+
+            #durably append the operations to the updates file's journal before publishing them, rather than rewriting the file
+            if not (save_new):
+                _append_journal(self._overlay_journal_path or self._base_journal_path, journal_operations)
+
+            #publish new dataset generation with the updated copies of the countries' updates
+            self._publish(all_updates)
+
+            #export new updates object to custom output if parameter set
+            if (save_new):
+                with open(save_new_filename, 'w', encoding='utf-8') as output_json:
+                    json.dump(all_updates, output_json, ensure_ascii=False, indent=4)
+
+    def compact(self) -> None:
+        """
+        Compact the custom updates journal into the updates file: the journaled operations are 
+        replayed onto the updates file and the result written as its new base snapshot, after
+        which the compacted operations are removed from the journal. The new file is written to 
+        a temporary file, fsynced and atomically renamed over the updates file, so a crash leaves 
+        either the previous or the new file in place. If a crash occurs before the journal is 
+        truncated, replaying it onto the compacted file leaves the updates unchanged. The journal's
+        lock file, <journal>.lock, is held whilst compacting, so appends by other processes wait
+        for the compaction rather than being lost.
+
+        For an overlay instance, the shared updates file is left untouched and the overlay's 
+        journal is instead rewritten as the minimal set of operations that replay the base 
+        updates into the overlaid updates, e.g. dropping updates added and later deleted.
+
+        Returns
+        =======
+        None
+
+        Raises
+        ======
+        ValueError:
+            Invalid JSON in the updates file or an invalid operation in the journal.
+        OSError:
+            The updates file's directory isn't writable.
+        """
+        if (self._overlay_journal_path):
+            return self._compact_overlay()
+
+        journal_path = self._base_journal_path
+        #the journal's lock is held from reading the journal to rewriting it, so concurrent appends by other processes aren't lost
+        with self._write_lock, _journal_lock(journal_path):
+            try:
+                with open(journal_path, "rb") as f:
+                    journal_bytes = f.read()
+            except FileNotFoundError:
+                return
+            #only compact the complete lines of the journal, ignoring any torn final line
+            journal_bytes = journal_bytes[:journal_bytes.rfind(b"\n") + 1]
+            if not (journal_bytes.strip()):
+                return
+
+            #replay the journal onto the updates file and atomically replace it
+            with _open_updates_file(self.iso3166_updates_path) as f:
+                all_updates = json.load(f)
+            for alpha_code, operations in _parse_journal(journal_bytes, journal_path).items():
+                all_updates[alpha_code] = _replay_journal(all_updates.get(alpha_code, []), operations)
+            temp_path = f"{self.iso3166_updates_path}.{os.getpid()}.tmp"
+            try:
+                if self.iso3166_updates_path.endswith(".gz"):
+                    with open(temp_path, "wb") as f:
+                        f.write(gzip.compress(json.dumps(all_updates, ensure_ascii=False, indent=4).encode("utf-8"), mtime=0))
+                        f.flush()
+                        os.fsync(f.fileno())
+                else:
+                    with open(temp_path, "w", encoding="utf-8") as f:
+                        json.dump(all_updates, f, ensure_ascii=False, indent=4)
+                        f.flush()
+                        os.fsync(f.fileno())
+                os.replace(temp_path, self.iso3166_updates_path)
+            finally:
+                if os.path.isfile(temp_path):
+                    os.remove(temp_path)
+            _fsync_dir(os.path.dirname(os.path.abspath(self.iso3166_updates_path)))
+
+            #remove the compacted operations from the journal, keeping any appended whilst compacting
+            _rewrite_journal(journal_path, journal_bytes)
+
+            #invalidate caches and reindex the new updates file
+            _read_updates_json.cache_clear()
+            _load_base_updates.cache_clear()
+            _load_journal.cache_clear()
+            self._country_index = self._get_country_index(rebuild=True)
+
+            #publish the compacted updates, which include any operations journaled by other instances
+            all_updates = _apply_journal(journal_path, all_updates)
+            if self._generation is not None:
+                self._publish({alpha_code: all_updates[alpha_code] for alpha_code in self._generation.all if alpha_code in all_updates})
+            else:
+                self._lazy_updates = {}
+
+    def _compact_overlay(self) -> None:
+        """
+        Compact the overlay's journal into the minimal operations that replay the shared base
+        updates into the overlaid updates of each of its countries, atomically replacing the 
+        compacted lines of the journal and keeping any operations appended whilst compacting.
+        """
+        journal_path = self._overlay_journal_path
+        with self._write_lock, _journal_lock(journal_path):
+            try:
+                with open(journal_path, "rb") as f:
+                    journal_bytes = f.read()
+            except FileNotFoundError:
+                return
+            #only compact the complete lines of the journal, ignoring any torn final line
+            journal_bytes = journal_bytes[:journal_bytes.rfind(b"\n") + 1]
+            if not (journal_bytes.strip()):
+                return
+
+            base_updates = _get_base_updates(self.iso3166_updates_path)
+            compacted_operations = []
+            for alpha_code, operations in _parse_journal(journal_bytes, journal_path).items():
+                base_country_updates = base_updates.get(alpha_code, [])
+                country_updates = _replay_journal(base_country_updates, operations)
+                compacted_operations.extend({"op": op, "alpha_code": alpha_code, "update": update} 
+                                            for op, update in _overlay_operations(base_country_updates, country_updates))
+            _rewrite_journal(journal_path, journal_bytes, 
+                             "".join(json.dumps(operation, ensure_ascii=False) + "\n" for operation in compacted_operations).encode("utf-8"))
+            _load_journal.cache_clear()
+
+    def reload(self) -> list:
+        """
+        Reload the updates file and its custom updates journal(s), e.g. after the file has been
+        updated by a separate process, publishing the changes as a new dataset generation. Each 
+        country's reloaded updates are compared against those of the current generation, with
+        the updates of unchanged countries kept, so only the changed countries' derived data, 
+        e.g. their JSON fragments, content hashes and indexes, is rebuilt. If the dataset is 
+        still being loaded lazily, only the already loaded countries are reread.
+
+        Returns
+        =======
+        :changed_countries: list
+            sorted alpha-2 codes of the countries whose updates were changed, added or removed.
+
+        Raises
+        ======
+        ValueError:
+            Invalid JSON in the updates file or an invalid operation in a journal.
+
+        Usage
+        =====
+        changed_countries = iso.reload()
+        """
+        #writers are serialised, so custom updates made whilst reloading aren't lost from the published generation
+        with self._write_lock:
+            _read_updates_json.cache_clear()
+            _load_base_updates.cache_clear()
+            self._country_index = self._get_country_index()
+            generation = self._generation
+            changed_countries = []
+
+            #reread the lazily loaded countries, keeping those unchanged
+            if generation is None and self._country_index is not None:
+                lazy_updates = {}
+                for alpha_code, previous_updates in self._lazy_updates.items():
+                    country_updates = self._read_journaled_country_updates(alpha_code) if alpha_code in self._country_index else None
+                    if (country_updates == previous_updates):
+                        lazy_updates[alpha_code] = previous_updates
+                    elif self._country_index is None:
+                        break
+                    else:
+                        changed_countries.append(alpha_code)
+                        if country_updates is not None:
+                            lazy_updates[alpha_code] = country_updates
+                else:
+                    self._lazy_updates = lazy_updates
+                    return sorted(changed_countries)
+
+            #reload the full dataset, keeping the updates of unchanged countries of the current generation
+            try:
+                all_updates = _get_base_updates(self.iso3166_updates_path)
+            except json.JSONDecodeError:
+                raise ValueError("Error ❗: The ISO 3166 updates file contains invalid JSON.")
+            if (self._overlay_journal_path):
+                all_updates = _apply_journal(self._overlay_journal_path, all_updates)
+            current_updates = generation.all if generation is not None else self._lazy_updates
+            if (self.country_code):
+                all_updates = {alpha_code: all_updates[alpha_code] for alpha_code in self.country_code if alpha_code in all_updates}
+            
+            reloaded_updates = {}
+            for alpha_code, country_updates in all_updates.items():
+                previous_updates = current_updates.get(alpha_code)
+                if (previous_updates == country_updates):
+                    reloaded_updates[alpha_code] = previous_updates
+                else:
+                    reloaded_updates[alpha_code] = country_updates
+                    if (generation is not None or previous_updates is not None):
+                        changed_countries.append(alpha_code)
+            if generation is not None:
+                changed_countries.extend(alpha_code for alpha_code in generation.all if alpha_code not in reloaded_updates)
+            if (changed_countries or generation is None):
+                self._publish(reloaded_updates)
+                self._lazy_updates = {}
+            return sorted(changed_countries)
+
+    def watch(self, interval: float=1.0, content_hash: bool=False, callback=None) -> None:
+        """
+        Watch the updates file and its custom updates journal(s) for changes, e.g. made by a 
+        separate job, reloading them in a background thread via reload() when they change. The
+        files are polled every interval seconds, comparing either their size and modification
+        time or, if content_hash is set, a hash of their contents. Errors whilst reloading, e.g. 
+        from reading a partially written file, are retried on the next poll. Any existing 
+        watcher of the instance is replaced; the watcher is stopped via unwatch() or close().
+
+        Parameters
+        ==========
+        :interval: float (default=1.0)
+            seconds between polls of the files.
+        :content_hash: bool (default=False)
+            compare a hash of the files' contents between polls, rather than their size and 
+            modification time.
+        :callback: callable (default=None)
+            function called from the watcher thread with the sorted list of changed alpha-2 
+            codes after each reload that changed the updates.
+
+        Returns
+        =======
+        None
+
+        Raises
+        ======
+        ValueError:
+            Non-positive polling interval.
+
+        Usage
+        =====
+        iso.watch(interval=5, callback=lambda changed_countries: print(f"Reloaded {changed_countries}"))
+        """
+        if not (interval > 0):
+            raise ValueError(f"Watch interval should be a positive number of seconds, got {interval}.")
+        self.unwatch()
+        stop_event = threading.Event()
+        signature = self._get_files_signature(content_hash)
+        watcher_thread = threading.Thread(target=self._watch_files, args=(interval, content_hash, callback, stop_event, signature), 
+                                          name="UpdatesWatcher", daemon=True)
+        self._watcher = (watcher_thread, stop_event)
+        watcher_thread.start()
+
+    def unwatch(self) -> None:
+        """ Stop watching the updates file for changes, if a watcher has been started via watch(). """
+        watcher, self._watcher = self._watcher, None
+        if watcher is not None:
+            watcher_thread, stop_event = watcher
+            stop_event.set()
+            if watcher_thread is not threading.current_thread():
+                watcher_thread.join()
+
+    def _watch_files(self, interval: float, content_hash: bool, callback, stop_event: threading.Event, signature: tuple) -> None:
+        """ Poll the updates file and journal(s) for changes until stopped, reloading them when they change. """
+        while not stop_event.wait(interval):
+            try:
+                current_signature = self._get_files_signature(content_hash)
+                if (current_signature == signature):
+                    continue
+                changed_countries = self.reload()
+            except (OSError, ValueError):
+                continue
+            signature = current_signature
+            if (changed_countries and callback is not None and not stop_event.is_set()):
+                callback(changed_countries)
+
+    def _get_files_signature(self, content_hash: bool=False) -> tuple:
+        """
+        Get the signature of the updates file and its journal(s) used to detect changes: their 
+        sizes and modification times, or a hash of their contents.
+        """
+        signature = []
+        for filepath in (self.iso3166_updates_path, self._base_journal_path, self._overlay_journal_path):
+            if not (filepath):
+                continue
+            try:
+                if (content_hash):
+                    with open(filepath, "rb") as f:
+                        signature.append(hashlib.file_digest(f, "blake2b").digest() if hasattr(hashlib, "file_digest") 
+                                         else hashlib.blake2b(f.read()).digest())
+                else:
+                    file_stat = os.stat(filepath)
+                    signature.append((file_stat.st_size, file_stat.st_mtime_ns))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
+    def diff(self, other: Updates|dict, since_date: str="") -> dict:
+        """
+        Get the records added, removed and modified between the instance's updates and those of
+        another Updates instance or updates object, e.g. a newer version of the dataset. Records
+        are compared by stable fingerprints, hashes of their whitespace normalised attributes, in
+        a single pass over each country's updates, with records that aren't in the other dataset 
+        paired as modified by their country and Date Issued. Countries whose lists of updates are 
+        equal are skipped without fingerprinting them.
+
+        Parameters
+        ==========
+        :other: Updates|dict
+            Updates instance, or updates object keyed by alpha-2 code, to compare the instance's
+            updates against.
+        :since_date: str (default="")
+            if set, only records published on or after this date are included in the diff, 
+            by their current Date Issued for added or modified records. Accepts any format 
+            recognised by convert_date_format.
+
+        Returns
+        =======
+        :diff: dict
+            dict with keys:
+            - "added" (dict): mapping of alpha-2 code to list of records only in the other dataset.
+            - "removed" (dict): mapping of alpha-2 code to list of records only in the instance's dataset.
+            - "modified" (dict): mapping of alpha-2 code to list of {"previous": record, "current": record}
+              pairs of records with the same Date Issued whose other attributes changed.
+            - "total_added", "total_removed", "total_modified" (int): total counts of each.
+            - "total_countries" (int): number of countries with any changed records.
+
+        Raises
+        ======
+        TypeError:
+            Invalid data type for other.
+        ValueError:
+            Invalid since_date format.
+
+        Usage
+        =====
+        diff = Updates(custom_updates_filepath="iso3166-updates-v1.json").diff(Updates(custom_updates_filepath="iso3166-updates-v2.json"))
+        """
+        if isinstance(other, Updates):
+            other = other.all
+        if not isinstance(other, dict):
+            raise TypeError(f"Other updates should be an Updates instance or a dict of updates keyed by alpha-2 code, got {type(other)}.")
+        since_date_dt = None
+        if since_date:
+            since_date_dt = self.convert_date_format(since_date)
+            if since_date_dt is None:
+                raise ValueError(f"Invalid since_date format, got: {since_date!r}. Expected YYYY-MM-DD or another recognised date format.")
+        return self._diff_updates(self.all, other, since_date_dt)
+
+    @classmethod
+    def _diff_updates(cls, previous_updates: dict, current_updates: dict, since_date: datetime|None=None) -> dict:
+        """ Diff two updates objects keyed by alpha-2 code, optionally only including the records published on or after a date. """
+        def published_since(update: dict) -> bool:
+            update_date = cls._parse_date_issued(str(update.get("Date Issued", "")).split("(")[0].strip().split(" ")[0].strip())
+            return update_date is not None and update_date >= since_date
+
+        added, removed, modified = {}, {}, {}
+        for alpha_code in {**previous_updates, **current_updates}:
+            previous_country_updates = previous_updates.get(alpha_code) or []
+            current_country_updates = current_updates.get(alpha_code) or []
+            if (previous_country_updates is current_country_updates or previous_country_updates == current_country_updates):
+                continue
+            added_updates, removed_updates, modified_updates = _diff_country_updates(previous_country_updates, current_country_updates)
+            if (since_date is not None):
+                added_updates = [update for update in added_updates if published_since(update)]
+                removed_updates = [update for update in removed_updates if published_since(update)]
+                modified_updates = [(previous, current) for previous, current in modified_updates if published_since(current)]
+            if (added_updates):
+                added[alpha_code] = added_updates
+            if (removed_updates):
+                removed[alpha_code] = removed_updates
+            if (modified_updates):
+                modified[alpha_code] = [{"previous": previous, "current": current} for previous, current in modified_updates]
+
+        return {
+            "added": added,
+            "removed": removed,
+            "modified": modified,
+            "total_added": sum(len(updates) for updates in added.values()),
+            "total_removed": sum(len(updates) for updates in removed.values()),
+            "total_modified": sum(len(updates) for updates in modified.values()),
+            "total_countries": len({**added, **removed, **modified}),
+        }
+
+    @classmethod
+    def from_version(cls, version: str, cache_dir: str="", remote_updates_url: str="", compress: bool=True, **kwargs) -> Updates:
+        """
+        Get an Updates instance of the dataset of a tagged version, e.g. for offline historical
+        queries or comparisons of releases via diff(). Tagged datasets are fetched from the repo 
+        once, into a content-addressed store of versions in the cache directory, so later calls,
+        including from other processes, need no network. Datasets are stored gzip compressed unless
+        compress is False, with identical datasets of different versions stored once. Custom updates
+        made to the instance are journaled alongside the stored dataset, so should use an overlay.
+
+        Parameters
+        ==========
+        :version: str
+            version tag of the dataset, e.g. "1.8.0".
+        :cache_dir: str (default="")
+            cache directory of the store of versions, by default ~/.cache/iso3166-updates or the
+            ISO3166_UPDATES_CACHE_DIR environment variable, as per the remote_cache_dir attribute.
+        :remote_updates_url: str (default="")
+            URL template of the repo's updates JSON, with a {ref} placeholder for the version tag,
+            by default that of the remote_updates_url attribute.
+        :compress: bool (default=True)
+            store fetched datasets gzip compressed.
+        :kwargs: dict
+            keyword arguments of the Updates instance, e.g. country_code or overlay.
+
+        Returns
+        =======
+        :updates: Updates
+            instance of the version's dataset.
+
+        Raises
+        ======
+        ValueError:
+            Invalid version format.
+        RequestException:
+            Error fetching the version's dataset from the repo.
+
+        Usage
+        =====
+        previous = Updates.from_version("1.8.0")
+        previous.diff(Updates.from_version("1.8.7"))
+        """
+        return cls.from_versions([version], cache_dir, remote_updates_url, compress, **kwargs)[version]
+
+    @classmethod
+    def from_versions(cls, versions: Iterable, cache_dir: str="", remote_updates_url: str="", compress: bool=True, **kwargs) -> dict:
+        """
+        Get Updates instances of the datasets of multiple tagged versions, keyed by version, as per 
+        from_version(), fetching the versions that aren't stored concurrently.
+
+        Parameters
+        ==========
+        :versions: Iterable
+            version tags of the datasets, e.g. ["1.8.0", "1.8.5"].
+        :cache_dir: str (default="")
+            cache directory of the store of versions.
+        :remote_updates_url: str (default="")
+            URL template of the repo's updates JSON, with a {ref} placeholder for the version tag.
+        :compress: bool (default=True)
+            store fetched datasets gzip compressed.
+        :kwargs: dict
+            keyword arguments of the Updates instances.
+
+        Returns
+        =======
+        :updates: dict
+            Updates instance of each version's dataset, keyed by version.
 
-        #get all updates data for current country updates
-        all_updates_data = self.all[alpha_code]
+        Raises
+        ======
+        ValueError:
+            Invalid version format.
+        RequestException:
+            Error fetching a version's dataset from the repo.
 
-        #pre-build the new update record and mark as ready-to-add; the loop below will
-        #clear this flag if a duplicate is detected or set delete_object_found on success
-        if not delete:
-            if custom_update_object:
-                custom_updates_data = {key: custom_update_object[key] for key in ['Change', 'Description of Change', 'Date Issued', 'Source']}
-            else:
-                custom_updates_data = {"Change": change, "Date Issued": date_issued, "Description of Change": description_of_change, "Source": source}
-            new_update_object = True
-        else:
-            custom_updates_data = {}
-            new_update_object = False
-
-        delete_object_found = False
-
-        #iterate over all current updates for country code
-        for i, entry_data in enumerate(all_updates_data):
-
-            #delete update if delete parameter set, iterate over each update for country code and delete matching, raise error if no match found
-            if (delete):
-                if (custom_update_object):
-                    #if matching update found, delete from current object
-                    if (entry_data['Change'].strip().lower() == custom_update_object['Change'].strip().lower() and
-                        entry_data['Date Issued'].strip() == custom_update_object['Date Issued'].strip()):
-                        del all_updates_data[i]
-                        delete_object_found = True
-                        break
-                else:
-                    #if matching update found, delete from current object
-                    if (entry_data['Change'].strip().lower() == change.strip().lower() and
-                        entry_data['Date Issued'].strip() == date_issued.strip()):
-                        del all_updates_data[i]
-                        delete_object_found = True
-                        break
-            else:
-                if (custom_update_object):
-                    #if existing update found in object raise error
-                    if (entry_data['Change'].strip().lower() == custom_update_object['Change'].strip().lower() and
-                        entry_data['Date Issued'].strip() == custom_update_object['Date Issued'].strip()):
-                        raise ValueError(f"Custom updates object should be unique and not already present an existing update: {custom_update_object}.")
-                else:
-                    #if existing update found in object raise error
-                    if (entry_data['Change'].strip().lower() == change.strip().lower() and
-                        entry_data['Date Issued'].strip() == date_issued.strip()):
-                        raise ValueError(f"Custom updates object should be unique and not already present an existing code: {change}.")
-
-        #add new object to main class object
-        if (new_update_object):
-            self.all[alpha_code].append(custom_updates_data)
-
-        #raise error if object to be deleted not found in updates object, 
-        elif (delete and not delete_object_found):
-            raise ValueError(f"No matching updates object found to delete.")
-
-        #export new updates object to custom output if parameter set
-        if (save_new):
-            with open(save_new_filename, 'w', encoding='utf-8') as output_json:
-                json.dump(self.all, output_json, ensure_ascii=False, indent=4)  
-        #export new updates object to existing object
+        Usage
+        =====
+        releases = Updates.from_versions(["1.8.0", "1.8.5", "1.8.7"])
+        """
+        versions = [version.strip() for version in ([versions] if isinstance(versions, str) else versions)]
+        for version in versions:
+            if not re.match(r'^\d+\.\d+(\.\d+)?$', version):
+                raise ValueError(f"Invalid version format, expected e.g. '1.8.0', got: {version!r}.")
+        version_store = _get_version_store(cache_dir or _default_remote_cache_dir())
+        datasets = version_store.fetch(versions, remote_updates_url or _REMOTE_UPDATES_URL, compress)
+        version_paths = {version: version_store.path(version) for version in versions}
+
+        #the store directory isn't writable, so the fetched datasets are written once to the process's temporary directory
+        for version in versions:
+            if version_paths[version] is None:
+                version_paths[version] = os.path.join(_get_versions_temp_dir(), f"iso3166-updates-{version}.json")
+                if not (os.path.isfile(version_paths[version])):
+                    temp_path = f"{version_paths[version]}.{threading.get_ident()}.tmp"
+                    with open(temp_path, "w", encoding="utf-8") as f:
+                        json.dump(datasets[version], f, ensure_ascii=False)
+                    os.replace(temp_path, version_paths[version])
+        return {version: cls(custom_updates_filepath=version_paths[version], **kwargs) for version in versions}
+
+    def _fetch_remote_updates(self, remote_cache: _RemoteDatasetCache, since_version: str="") -> tuple:
+        """
+        Get the baseline and latest updates objects to compare: the local updates, or the dataset
+        of the since_version tag from the version store (fetched if it isn't stored), and the latest
+        updates object of the repo. The manifest of the latest object is fetched concurrently with 
+        the baseline, and then only the updates of the countries whose digests differ from the 
+        baseline's are fetched; the updates of unchanged countries are the baseline's lists, so 
+        aren't compared. If the manifest isn't published or is invalid, the full latest object is
+        fetched.
+        """
+        manifest_url = self.remote_manifest_url or _remote_manifest_url(self.remote_updates_url)
+        main_url = self.remote_updates_url.format(ref="main")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            if (since_version):
+                version_store = _get_version_store(self.remote_cache_dir)
+                baseline_future = executor.submit(version_store.fetch, [since_version], self.remote_updates_url)
+            try:
+                main_manifest = _validate_manifest(remote_cache.fetch(manifest_url.format(ref="main")))
+            except (requests.exceptions.RequestException, ValueError):
+                main_manifest = None
+            baseline_updates = baseline_future.result()[since_version] if since_version else self.all
+
+        #instances scoped to specific countries only compare, and fetch, the manifest entries of those countries
+        if (main_manifest is not None):
+            main_manifest = self._scope_countries(main_manifest)
+            changed_entries = self._changed_manifest_entries(main_manifest, baseline_updates, since_version)
+            try:
+                changed_updates = remote_cache.fetch_countries(main_url, changed_entries)
+                return self._scope_countries(baseline_updates), {alpha_code: changed_updates[alpha_code] if alpha_code in changed_entries else baseline_updates[alpha_code] 
+                                                                 for alpha_code in main_manifest}
+            except (requests.exceptions.RequestException, ValueError):
+                pass
+        return self._scope_countries(baseline_updates), self._scope_countries(remote_cache.fetch(main_url))
+
+    def _scope_countries(self, updates: dict) -> dict:
+        """ Filter an object keyed by alpha-2 code to the instance's countries, if it's scoped to specific countries via country_code. """
+        if not (self.country_code):
+            return updates
+        return {alpha_code: country_updates for alpha_code, country_updates in updates.items() if alpha_code in self.country_code}
+
+    def _changed_manifest_entries(self, main_manifest: dict, baseline_updates: dict, since_version: str="") -> dict:
+        """
+        Get the entries of the latest manifest whose digests differ from the baseline's countries: the
+        local updates' fragment digests, or the stored digests of the since_version tag's dataset.
+        """
+        if (since_version):
+            baseline_digest = _get_version_store(self.remote_cache_dir).country_digests(baseline_updates).get
         else:
-            with open(os.path.join(self.iso3166_updates_path), 'w', encoding='utf-8') as output_json:
-                json.dump(self.all, output_json, ensure_ascii=False, indent=4)
-            #invalidate cache so future instantiations reload the updated file
-            _load_updates_json.cache_clear()
+            baseline_digest = lambda alpha_code: self._get_json_fragments(alpha_code, baseline_updates[alpha_code]).digest.hex() \
+                if alpha_code in baseline_updates else None
+        return {alpha_code: entry for alpha_code, entry in main_manifest.items() if baseline_digest(alpha_code) != entry["digest"]}
 
     def check_for_updates(self, since_date: str="", since_version: str="") -> dict:
         """ 
@@ -887,6 +3693,24 @@ class Updates():
         fetches the JSON at that tagged release from GitHub and uses it as the baseline
         instead of the locally-installed copy.
 
+        Fetched JSON objects are cached on disk in the remote_cache_dir directory (by default 
+        ~/.cache/iso3166-updates, or the ISO3166_UPDATES_CACHE_DIR environment variable) with 
+        their ETag and Last-Modified headers. The latest JSON is revalidated via a conditional 
+        request through a pooled session with retries, so an unchanged object costs a single 304
+        round trip. The JSON of a tagged release is fetched, concurrently with the latest JSON's 
+        manifest, into a content-addressed store of versions in the cache directory, as per 
+        from_version(), so is only fetched once. The URL template of the JSON, with a {ref} 
+        placeholder for the branch or tag, is the remote_updates_url attribute.
+
+        A manifest of the per-country content digests, record counts and byte spans of each JSON
+        object (iso3166-updates.manifest.json) is fetched first, via the same cache, and only the
+        updates of the countries whose digests differ are fetched, by HTTP Range requests of their
+        spans of the JSON, and compared. Fetched countries are cached by their digests, so are only
+        fetched once. If a manifest isn't published or is invalid, the full JSON objects are fetched.
+        The URL template of the manifest is the remote_manifest_url attribute, by default derived
+        from remote_updates_url. Instances scoped to specific countries via country_code only compare,
+        and fetch, the updates of those countries.
+
         Parameters
         ==========
         :since_date: str (default="")
@@ -897,14 +3721,22 @@ class Updates():
             A version tag (e.g. ``"1.8.0"``) that is used to fetch the historic JSON
             from GitHub as the baseline for the comparison, instead of the local copy.
 
+        The comparison uses the diff() engine, so as well as the new or modified records, the
+        records removed from the baseline and the previous versions of the modified records are
+        also returned.
+
         Returns
         =======
         :result: dict
             A structured dict with keys:
-            - ``"updates_found"`` (bool): True when at least one new record was found.
-            - ``"total_updates"`` (int): total count of new records across all countries.
-            - ``"total_countries"`` (int): number of countries that have new records.
-            - ``"updates"`` (dict): mapping of alpha-2 code to list of new update dicts.
+            - ``"updates_found"`` (bool): True when at least one new or modified record was found.
+            - ``"total_updates"`` (int): total count of new or modified records across all countries.
+            - ``"total_countries"`` (int): number of countries that have new or modified records.
+            - ``"updates"`` (dict): mapping of alpha-2 code to list of new or modified update dicts.
+            - ``"added"``, ``"removed"``, ``"modified"`` (dict) and ``"total_added"``, ``"total_removed"``,
+              ``"total_modified"`` (int): the diff of the baseline and latest records, as per diff().
+            - ``"diff_total_countries"`` (int): number of countries with any added, removed or modified 
+              records, the ``"total_countries"`` of diff().
 
         Raises
         ====== 
@@ -913,6 +3745,20 @@ class Updates():
         RequestException:
             Error retrieving the updates JSON from main GitHub repo. 
         """
+        since_date_dt = self._parse_check_for_updates_args(since_date, since_version)
+
+        #when since_version is set, compare *latest main* against the *versioned baseline*
+        #when not set, compare *latest main* against the *local installed copy*
+        #only the countries whose manifest digests differ are fetched, unless the manifests aren't published
+        remote_cache = _get_remote_dataset_cache(self.remote_cache_dir)
+        try:
+            baseline_updates, compare_against = self._fetch_remote_updates(remote_cache, since_version.strip())
+        except (requests.exceptions.RequestException, ValueError) as e:
+            return self._check_for_updates_error(e)
+        return self._check_for_updates_result(baseline_updates, compare_against, since_date_dt)
+
+    def _parse_check_for_updates_args(self, since_date: str="", since_version: str="") -> datetime|None:
+        """ Validate the since_date and since_version parameters of check_for_updates(), returning the parsed since_date. """
         #validate and parse since_date if provided
         since_date_dt = None
         if since_date:
@@ -920,72 +3766,28 @@ class Updates():
             if since_date_dt is None:
                 raise ValueError(f"Invalid since_date format, got: {since_date!r}. Expected YYYY-MM-DD or another recognised date format.")
 
-        #determine the baseline JSON URL — either a tagged release or the latest main branch
-        if since_version:
-            #validate version string
-            if not re.match(r'^\d+\.\d+(\.\d+)?$', since_version.strip()):
-                raise ValueError(f"Invalid since_version format, expected e.g. '1.8.0', got: {since_version!r}.")
-            updates_url = f"https://raw.githubusercontent.com/amckenna41/iso3166-updates/v{since_version.strip()}/iso3166_updates/iso3166-updates.json"
-        else:
-            updates_url = "https://raw.githubusercontent.com/amckenna41/iso3166-updates/main/iso3166_updates/iso3166-updates.json"
-
-        #pull latest (or versioned) data object from repo
-        try:
-            response = requests.get(updates_url, timeout=15)
-            response.raise_for_status()
-            latest_iso3166_updates_json = response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Failed to fetch the latest Updates data from repo: {e}.")
-            return {"updates_found": False, "total_updates": 0, "total_countries": 0, "updates": {}}
-
-        #separate object that holds individual data objects that were found on the object in the repo that weren't in the software object
-        new_iso3166_updates = {}
-
-        #bool to track if any new updates found
-        updates_found = False
+        #validate version string
+        if since_version and not re.match(r'^\d+\.\d+(\.\d+)?$', since_version.strip()):
+            raise ValueError(f"Invalid since_version format, expected e.g. '1.8.0', got: {since_version!r}.")
+        return since_date_dt
 
-        #baseline is either the versioned repo JSON (since_version path) or the local installed copy
-        baseline_json = latest_iso3166_updates_json if since_version else self.all
+    def _check_for_updates_error(self, error: Exception) -> dict:
+        """ Output the error fetching the latest updates object, returning the empty result of check_for_updates(). """
+        print(f"Failed to fetch the latest Updates data from repo: {error}.")
+        return {**self._check_for_updates_diff({}, {}), "updates_found": False, "total_updates": 0, "total_countries": 0, "updates": {}}
 
-        #when since_version is set, compare *latest main* against the *versioned baseline*
-        #when not set, compare *latest main* against the *local installed copy*
-        compare_against = self.all if not since_version else {}
-        if since_version:
-            #re-fetch latest main to compare against the versioned baseline
-            try:
-                main_response = requests.get(
-                    "https://raw.githubusercontent.com/amckenna41/iso3166-updates/main/iso3166_updates/iso3166-updates.json",
-                    timeout=15
-                )
-                main_response.raise_for_status()
-                compare_against = main_response.json()
-            except requests.exceptions.RequestException as e:
-                print(f"Failed to fetch the latest Updates data from repo: {e}.")
-                return {"updates_found": False, "total_updates": 0, "total_countries": 0, "updates": {}}
-
-        #iterate over all ISO 3166 updates data in the compare_against object
-        for alpha_code, entries in compare_against.items():
-            baseline_entries = baseline_json.get(alpha_code, [])
-            new_iso3166_updates[alpha_code] = []
-
-            #iterate over individual updates entries, add to object if not in baseline
-            for update in entries:
-                if update not in baseline_entries:
-                    #apply since_date filter if set
-                    if since_date_dt:
-                        raw_date_str = update.get("Date Issued", "").split("(")[0].strip().split(" ")[0].strip()
-                        try:
-                            update_dt = datetime.strptime(raw_date_str, "%Y-%m-%d")
-                        except ValueError:
-                            continue
-                        if update_dt < since_date_dt:
-                            continue
-                    updates_found = True
-                    new_iso3166_updates[alpha_code].append(update)
+    def _check_for_updates_result(self, baseline_updates: dict, compare_against: dict, since_date_dt: datetime|None=None) -> dict:
+        """ Diff the baseline and latest updates objects, outputting and returning the result of check_for_updates(). """
+        updates_diff = self._check_for_updates_diff(baseline_updates, compare_against, since_date_dt)
 
-            #if current alpha-2 code has no new ISO 3166 updates associated with it, remove from temp object
-            if not new_iso3166_updates[alpha_code]:
-                new_iso3166_updates.pop(alpha_code, None)
+        #new and modified records of each country, in the order of the latest object
+        new_iso3166_updates = {}
+        for alpha_code in compare_against:
+            changed_ids = {id(update) for update in updates_diff["added"].get(alpha_code, [])} | \
+                {id(modified["current"]) for modified in updates_diff["modified"].get(alpha_code, [])}
+            if (changed_ids):
+                new_iso3166_updates[alpha_code] = [update for update in compare_against[alpha_code] if id(update) in changed_ids]
+        updates_found = bool(new_iso3166_updates)
 
         #print out any found updates 
         if (updates_found):
@@ -1003,7 +3805,8 @@ class Updates():
             for code in list(new_iso3166_updates.keys()):
                 
                 #output current country name and code
-                print(f"{countries.get(alpha_2=code).name} ({code}):")
+                country = countries.get(alpha_2=code)
+                print(f"{country.name if country else code} ({code}):")
                 
                 #iterate over rows of new data and print each update as formatted JSON
                 for update_row in new_iso3166_updates[code]:
@@ -1014,12 +3817,23 @@ class Updates():
         
         #return structured diff for programmatic use
         return {
+            **updates_diff,
             "updates_found": updates_found,
             "total_updates": sum(len(v) for v in new_iso3166_updates.values()),
             "total_countries": len(new_iso3166_updates),
             "updates": new_iso3166_updates,
         }
 
+    def _check_for_updates_diff(self, baseline_updates: dict, compare_against: dict, since_date_dt: datetime|None=None) -> dict:
+        """
+        Diff the baseline and latest updates objects for the result of check_for_updates(), with the diff's
+        count of countries with any changed records renamed to diff_total_countries, as total_countries is
+        the number of countries with new or modified records.
+        """
+        updates_diff = self._diff_updates(baseline_updates, compare_against, since_date_dt)
+        updates_diff["diff_total_countries"] = updates_diff.pop("total_countries")
+        return updates_diff
+
     @property
     def last_updated(self) -> str:
         """
@@ -1033,8 +3847,13 @@ class Updates():
             Most recent publication date across the entire updates dataset in
             ``YYYY-MM-DD`` format, or an empty string if no parseable dates are found.
         """
+        return self._get_last_updated(self.all)
+
+    @staticmethod
+    def _get_last_updated(all_updates: dict) -> str:
+        """ Get the most recent Date Issued value in the input updates object in YYYY-MM-DD format. """
         latest = None
-        for entries in self.all.values():
+        for entries in all_updates.values():
             for update in entries:
                 raw = update.get("Date Issued", "").split("(")[0].strip().split(" ")[0].strip()
                 try:
@@ -1045,7 +3864,7 @@ class Updates():
                     latest = dt
         return latest.strftime("%Y-%m-%d") if latest else ""
 
-    def change_type(self, change_type: str) -> dict:
+    def change_type(self, change_type: str, raw: bool=False) -> dict:
         """
         Filter the dataset by the structural type of ISO 3166 change using keyword
         matching on the ``Change`` and ``Description of Change`` fields.
@@ -1063,6 +3882,9 @@ class Updates():
         ==========
         :change_type: str
             One or more change types, comma-separated.
+        :raw: bool (default=False)
+            return a plain dict rather than a Map. The updates are always shared
+            references to the dataset and should be treated as read-only.
 
         Returns
         =======
@@ -1113,7 +3935,7 @@ class Updates():
             if matched:
                 result[code] = matched
 
-        return Map(result)
+        return result if raw else Map(result)
 
     def stats(self) -> dict:
         """
@@ -1159,7 +3981,8 @@ class Updates():
             "amendment": re.compile(r"amendment|amended", re.IGNORECASE),
         }
 
-        for code, entries in self.all.items():
+        all_updates = self.all
+        for code, entries in all_updates.items():
             count = len(entries)
             total_updates += count
             updates_per_country[code] = updates_per_country.get(code, 0) + count
@@ -1186,11 +4009,11 @@ class Updates():
 
         return {
             "total_updates": total_updates,
-            "total_countries": len(self.all),
+            "total_countries": len(all_updates),
             "year_range": [min(years), max(years)] if years else [],
             "most_updated_country": most_updated_country,
             "most_common_change_type": most_common,
-            "last_updated": self.last_updated,
+            "last_updated": self._get_last_updated(all_updates),
         }
 
     def save_to_file(self, filepath: str) -> None:
@@ -1236,6 +4059,164 @@ class Updates():
         with open(filepath, "w", encoding="utf-8") as f:
             json.dump(self.all, f, ensure_ascii=False, indent=4)
 
+    def export(self, filepath: str, data: dict|list=None, format: str="", compress: bool=None) -> int:
+        """
+        Export the updates data, or the output of a query, to a compact JSON, NDJSON, CSV or XML 
+        file, optionally gzip compressed. The file is written record by record, so memory use is
+        bounded by the updates being exported rather than their serialized output. 
+
+        The data can be the updates keyed by alpha-2 code, e.g. the output of all, __getitem__, 
+        year(), date_range() or search() with include_match_score=False, or a list of updates, e.g. 
+        the sorted output of date_range() or search(), either as dicts with a "Country Code" or as 
+        raw (alpha_code, update[, match_score]) tuples. The CSV and XML files have the same layout 
+        as those of iso3166_updates_export.utils.export_updates: the CSV has Country Code, Change, 
+        Description of Change, Date Issued and Source columns, with the rows of updates keyed by 
+        alpha-2 code sorted by country and the Country Code column dropped if only one country is 
+        exported; the XML has an Update element per update in a Country element per country. JSON 
+        exports of updates keyed by alpha-2 code are in the format of the updates JSON, whilst
+        lists of updates are exported as an array of objects with a "Country Code", as are each
+        of the lines of NDJSON exports.
+
+        Parameters
+        ==========
+        :filepath: str
+            destination path of the export file, which will be created or overwritten.
+        :data: dict|list (default=None)
+            updates data or query output to export, by default all of the updates data.
+        :format: str (default="")
+            export format, one of json, ndjson, csv or xml; by default inferred from the file 
+            extension (.json, .ndjson/.jsonl, .csv or .xml, optionally followed by .gz).
+        :compress: bool (default=None)
+            gzip compress the export file, by default if the file extension is .gz.
+
+        Returns
+        =======
+        :total_exported: int
+            number of updates exported.
+
+        Raises
+        ======
+        TypeError:
+            Invalid data type for filepath or data.
+        ValueError:
+            Invalid or unknown export format.
+        OSError:
+            The destination directory does not exist or is not writable.
+
+        Usage
+        =====
+        iso.export("iso3166-updates.ndjson.gz")
+        iso.export("iso3166-updates-2020s.csv", iso.year(">2020"))
+        iso.export("iso3166-updates-sorted.xml", iso.date_range("2020-01-01", sort_by_date="dateDesc"))
+        """
+        if not isinstance(filepath, str):
+            raise TypeError(f"filepath must be a string, got {type(filepath)}.")
+        dest_dir = os.path.dirname(os.path.abspath(filepath))
+        if not os.path.isdir(dest_dir):
+            raise OSError(f"Destination directory does not exist: {dest_dir!r}.")
+
+        #infer format and compression from the file extension, if not input
+        root, extension = os.path.splitext(filepath.lower())
+        if (compress is None):
+            compress = extension == ".gz"
+        if (extension == ".gz"):
+            extension = os.path.splitext(root)[1]
+        format = (format or _EXPORT_FORMATS.get(extension, "")).lower()
+        if format not in ("json", "ndjson", "csv", "xml"):
+            raise ValueError(f"Export format should be one of json, ndjson, csv or xml, got {format!r} for filepath: {filepath}.")
+
+        #updates keyed by alpha-2 code are exported by country, lists of updates in their order
+        if (data is None):
+            data = self.all
+        if isinstance(data, dict):
+            by_country = True
+            if (format == "csv"):
+                data = dict(sorted(data.items(), key=lambda item: item[0]))
+            records = ((alpha_code, update) for alpha_code, updates in data.items() for update in updates)
+            total_countries = sum(1 for updates in data.values() if updates)
+        elif isinstance(data, (list, tuple)):
+            by_country = False
+            records = [self._export_record(record) for record in data]
+            total_countries = len({alpha_code for alpha_code, _ in records})
+        else:
+            raise TypeError(f"Export data should be a dict of updates keyed by alpha-2 code or a list of updates, got {type(data)}.")
+
+        if (compress):
+            output = io.TextIOWrapper(gzip.GzipFile(filepath, "wb", mtime=0), encoding="utf-8", newline="")
+        else:
+            output = open(filepath, "w", encoding="utf-8", newline="")
+        total_exported = 0
+        with output:
+            if (format == "json" and by_country):
+                #updates JSON format, written country by country without indentation
+                output.write("{")
+                for i, (alpha_code, updates) in enumerate(data.items()):
+                    output.write(("," if i else "") + json.dumps(alpha_code) + ":[")
+                    for j, update in enumerate(updates):
+                        output.write(("," if j else "") + json.dumps(update, ensure_ascii=False, separators=(",", ":")))
+                        total_exported += 1
+                    output.write("]")
+                output.write("}")
+            elif (format in ("json", "ndjson")):
+                separator, start, end = ("\n", "", "\n") if format == "ndjson" else (",", "[", "]")
+                output.write(start)
+                for alpha_code, update in records:
+                    output.write((separator if total_exported and format == "json" else "") + 
+                                 json.dumps({"Country Code": alpha_code, **update}, ensure_ascii=False, separators=(",", ":")) + 
+                                 (end if format == "ndjson" else ""))
+                    total_exported += 1
+                output.write(end if format == "json" else "")
+            elif (format == "csv"):
+                #Country Code column is dropped if only one country's updates are exported
+                include_country_code = total_countries != 1
+                csv_writer = csv.writer(output, lineterminator=os.linesep)
+                csv_writer.writerow((("Country Code",) if include_country_code else ()) + _CSV_EXPORT_COLUMNS)
+                for alpha_code, update in records:
+                    csv_writer.writerow(([alpha_code] if include_country_code else []) + [update.get(column, "") for column in _CSV_EXPORT_COLUMNS])
+                    total_exported += 1
+            else:
+                #pretty printed XML, with consecutive updates of a country within the same Country element
+                output.write('<?xml version="1.0" ?>\n')
+                if (by_country):
+                    records = ((alpha_code, update) for alpha_code, updates in data.items() for update in (updates or [None]))
+                #the root element is opened on the first record, whilst the current country's element is kept open until the next country's
+                current_country, country_open = None, False
+                for alpha_code, update in records:
+                    if (current_country is None):
+                        output.write("<ISO3166Updates>\n")
+                    if (alpha_code != current_country or update is None):
+                        if (country_open):
+                            output.write("  </Country>\n")
+                        current_country, country_open = alpha_code, update is not None
+                        #countries without updates are empty elements
+                        output.write(f'  <Country code="{_escape_xml(str(alpha_code))}"' + (">\n" if country_open else "/>\n"))
+                        if (update is None):
+                            continue
+                    output.write("    <Update>\n")
+                    for key, value in update.items():
+                        element, text = key.replace(" ", "_"), _escape_xml(str(value))
+                        output.write(f"      <{element}>{text}</{element}>\n" if text else f"      <{element}/>\n")
+                    output.write("    </Update>\n")
+                    total_exported += 1
+                if (current_country is None):
+                    output.write("<ISO3166Updates/>\n")
+                else:
+                    output.write(("  </Country>\n" if country_open else "") + "</ISO3166Updates>\n")
+
+        return total_exported
+
+    @staticmethod
+    def _export_record(record: dict|tuple) -> tuple:
+        """ Convert an update of a list of updates into an (alpha_code, update) export record. """
+        if isinstance(record, (tuple, list)) and len(record) in (2, 3):
+            alpha_code, update = record[0], record[1]
+            if len(record) == 3:
+                update = {**update, "Match Score": record[2]}
+            return alpha_code, update
+        if isinstance(record, dict) and "Country Code" in record:
+            return record["Country Code"], {key: value for key, value in record.items() if key != "Country Code"}
+        raise TypeError(f"Exported updates should be dicts with a Country Code or (alpha_code, update) tuples, got {record!r}.")
+
     @staticmethod
     def _parse_date_issued(date_str: str):
         """
@@ -1252,6 +4233,50 @@ class Updates():
         except ValueError:
             return None
 
+    @staticmethod
+    def _parse_year_input(year: str|list) -> tuple:
+        """
+        Validate a year() input parameter, without modifying it, returning the processed list of
+        integer years and mode flags from _parse_year_filter.
+        """
+        #parse year filter mode flags from a copy of the input, as the year filter parser modifies the list
+        if (isinstance(year, str)):
+            input_year = year.replace(' ', '').split(',')
+        elif (isinstance(year, list)):
+            input_year = list(year)
+        else:
+            raise TypeError(f"Invalid data type for year parameter, expected str or list, got {type(year)}.")
+        input_year, year_range, year_greater_than, year_less_than, year_not_equal = Updates._parse_year_filter(input_year)
+
+        return [int(year_) for year_ in input_year], year_range, year_greater_than, year_less_than, year_not_equal
+
+    @staticmethod
+    def _year_filter_matches(current_updates_year: int, input_year: list, year_range: bool, year_greater_than: bool, 
+                             year_less_than: bool, year_not_equal: bool) -> int:
+        """
+        Get the number of times an update published in the input year matches the processed year 
+        list and mode flags from _parse_year_filter, an update matching each of a list of years
+        once per year it matches.
+        """
+        #exclude rows matching the input year/years
+        if (year_not_equal):
+            return int(current_updates_year not in [int(y) for y in input_year])
+
+        #include rows where year >= input year
+        if (year_greater_than):
+            return int(current_updates_year >= int(input_year[0]))
+
+        #include rows where year < input year
+        if (year_less_than):
+            return int(current_updates_year < int(input_year[0]))
+
+        #include rows within year range, inclusive
+        if (year_range):
+            return int(int(input_year[0]) <= current_updates_year <= int(input_year[1]))
+
+        #include rows matching the year/list of years
+        return sum(current_updates_year == int(year_) for year_ in input_year)
+
     @staticmethod
     def _parse_year_filter(input_year: list) -> tuple:
         """
@@ -1380,6 +4405,57 @@ class Updates():
 
         return None
     
+    @staticmethod
+    def country_names_to_alpha2(country_names: Iterable, likeness_score: int=100) -> list:
+        """
+        Convert a list of free-text country names into their ISO 3166-1 alpha-2 codes, matching 
+        each name as in country_name(), for resolving large lists of names in a single call. Each 
+        element is a single country name, which may contain commas, and unmatched names are 
+        converted to None rather than raising an error. Duplicate names, after folding, are only 
+        matched once.
+
+        Parameters
+        ==========
+        :country_names: Iterable
+            country names to convert, e.g. ["Tajikistan", "Republic of Ireland", "Viet Nam"].
+        :likeness_score: int (default=100)
+            likeness score between 1 and 100 that sets the percentage of likeness the input 
+            names must have to a country name to be matched.
+
+        Returns
+        =======
+        :alpha_codes: list
+            alpha-2 code of each input name, or None if no country name matches.
+
+        Raises
+        ======
+        TypeError:
+            Country names parameter, or any of its elements, isn't of the correct datatype.
+        ValueError:
+            Invalid likeness score input.
+        """
+        #raise type error if input is a string rather than a list of names
+        if isinstance(country_names, str) or not isinstance(country_names, Iterable):
+            raise TypeError(f"Input parameter country_names must be an iterable of strings, got {type(country_names)}.")
+
+        #raise error if invalid (1-100) likeness score input
+        if not (1 <= likeness_score <= 100):
+            raise ValueError(f"Likeness score must be between 1 and 100, got {likeness_score}.")
+
+        #match each distinct name once, bypassing the result cache so it isn't flushed by a large batch
+        country_name_index = _get_country_name_index()
+        matched_names = {}
+        alpha_codes = []
+        for name in country_names:
+            if not (isinstance(name, str)):
+                raise TypeError(f"Input country name {name} is not of correct datatype string, got {type(name)}.")
+            folded_name = _fold_country_name(name)
+            if folded_name not in matched_names:
+                matched_names[folded_name] = country_name_index.match(folded_name, likeness_score) if folded_name else None
+            alpha_codes.append(matched_names[folded_name])
+
+        return alpha_codes
+
     @staticmethod
     def convert_date_format(date: str) -> datetime | None:
         """
@@ -1435,13 +4511,34 @@ class Updates():
         #return None if date cannot be converted into desired format
         return None
 
+    def close(self) -> None:
+        """
+        Stop watching the updates file and shutdown the process pool used by parallel searches, if
+        created. The pool is otherwise only shutdown when the instance is garbage collected or the
+        interpreter exits, so instances used for parallel searches should be closed when no longer
+        needed, or used as a context manager.
+        """
+        self.unwatch()
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
+
+    def __enter__(self) -> Updates:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def __len__(self) -> int:
         """ Get total number of ISO 3166 Updates objects. """
         return sum(len(changes) for changes in self.all.values())
 
     def __contains__(self, country_code: str) -> bool:
         """ Return True/False if the input country code is in updates object. """
-        return country_code in self.all
+        generation = self._generation
+        if generation is not None or self._country_index is None:
+            return country_code in (generation or self._snapshot()).all
+        return country_code in self._country_index
         
     def __str__(self) -> str:
         """ Get string representation of class instance. """
@@ -1449,10 +4546,12 @@ class Updates():
     
     def __repr__(self) -> str:
         """ Object representation of class instance. """
+        all_updates = self.all
         return (f"<Updates(version={self.__version__!r}, "
-        f"countries_loaded={len(self.all)}, "
-        f"total_updates={len(self)}, "
-        f"source_file={os.path.basename(self.iso3166_updates_path)!r})>")
+        f"countries_loaded={len(all_updates)}, "
+        f"total_updates={sum(len(changes) for changes in all_updates.values())}, "
+        f"source_file={os.path.basename(self.iso3166_updates_path)!r}"
+        + (f", overlay={self.overlay!r})>" if self.overlay else ")>"))
 
     def __sizeof__(self) -> float:
         """ Return size of instance of ISO 3166 Updates JSON in MB. """
@@ -1522,17 +4621,91 @@ class Map(dict):
         del self.__dict__[key]
 
 
+#Updates instance held by each worker process of an _UpdatesProcessPool, loaded once per worker by the pool initializer
+_process_pool_updates = None
+
+def _init_process_pool_worker(updates_filepath: str, all_updates: dict) -> None:
+    """ Initialise a process pool worker's Updates instance with the dataset generation of the pool. """
+    global _process_pool_updates
+    _process_pool_updates = Updates(custom_updates_filepath=updates_filepath)
+    _process_pool_updates.all = all_updates
+
+def _call_process_pool_worker(method: str, *args, **kwargs):
+    """ Call a method of the process pool worker's Updates instance. """
+    return getattr(_process_pool_updates, method)(*args, **kwargs)
+
+def _search_process_pool_worker(country_codes: list, search_terms: list, likeness_score: int) -> list:
+    """ Search the updates of the input countries in the process pool worker's dataset. """
+    all_updates = _process_pool_updates.all
+    return _process_pool_updates._search_updates(((code, all_updates[code]) for code in country_codes), search_terms, likeness_score)
+
+class _UpdatesProcessPool:
+    """
+    Persistent pool of worker processes, each holding a copy of an Updates instance's current
+    dataset generation. The dataset is sent to each worker once, by the pool initializer, rather
+    than with each call. If a new dataset generation is published, e.g. via a custom update, the
+    pool is restarted with the new generation on its next use. The pool only holds a weak 
+    reference to the instance and is shutdown when the instance is garbage collected, or the
+    interpreter exits, if it isn't shutdown before then.
+
+    Parameters
+    ==========
+    :updates: Updates
+        instance of Updates class whose dataset is loaded into the worker processes.
+    :max_workers: int (default=None)
+        maximum number of worker processes, defaults to the number of processors on the machine.
+    """
+    def __init__(self, updates: Updates, max_workers: int=None) -> None:
+        self.max_workers = max_workers
+        self._updates = weakref.ref(updates)
+        self._executor = None
+        self._generation = None
+        self._lock = threading.Lock()
+        self._finalizer = weakref.finalize(updates, self.shutdown, False)
+
+    def get_executor(self) -> tuple:
+        """ Get the pool's executor and the dataset generation loaded into its workers. """
+        updates = self._updates()
+        generation = updates._snapshot()
+        with self._lock:
+            if self._executor is None or self._generation is not generation:
+                #outstanding calls on the previous pool still complete against its generation
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False)
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_process_pool_worker,
+                                                     initargs=(updates.iso3166_updates_path, generation.all))
+                self._generation = generation
+            return self._executor, self._generation
+
+    def shutdown(self, wait: bool=True) -> None:
+        """ Shutdown the pool's worker processes. """
+        self._finalizer.detach()
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+            self._executor = None
+            self._generation = None
+
 class AsyncUpdates:
     """
     Async-compatible wrapper around the synchronous :class:`Updates` class.
 
-    All data-access methods (``all``, ``year``, ``date_range``, ``search``,
-    ``change_type``, ``last_updated``) delegate synchronously because
-    they operate entirely in-memory.  The ``check_for_updates`` method is
-    genuinely async — it performs an HTTP fetch using ``asyncio`` with the
-    standard library's ``asyncio.to_thread`` helper so it does not block the
-    calling event loop, making it safe to use inside FastAPI, aiohttp, and
-    similar frameworks.
+    The synchronous methods delegate directly to the underlying :class:`Updates` instance.
+    Their awaitable versions share the same names with an ``a`` prefix: the queries
+    (``ayear``, ``adate_range``, ``asearch``, ``achange_type``, ``astats``, ``acountry_name``,
+    ``acountry_names_to_alpha2``, ``ato_json_bytes`` and ``ato_json_gzip``) are offloaded to
+    a thread or process executor so that they never block the calling event loop, making
+    them safe to use inside FastAPI, aiohttp, and similar frameworks. ``asearch`` scans the dataset in chunks
+    of countries, each chunk being a separate executor job, so a large fuzzy search
+    can't monopolise the executor and the chunks of concurrent queries interleave.
+    The number of executor jobs in flight is bounded by a concurrency limiter, so
+    event-loop latency stays bounded under load. The ``acheck_for_updates`` method
+    fetches the remote objects natively via asyncio streams, without a thread per check.
+
+    With the ``"process"`` executor, the dataset is loaded once into each worker of
+    a persistent process pool, which is restarted if a new dataset generation is
+    published, e.g. via ``custom_update``. Call ``close()``, or use the instance as
+    an async context manager, to shutdown any executor created by the instance.
 
     Parameters
     ==========
@@ -1540,6 +4713,20 @@ class AsyncUpdates:
         Forwarded to the underlying :class:`Updates` constructor.
     :custom_updates_filepath: str (default="")
         Forwarded to the underlying :class:`Updates` constructor.
+    :executor: str|Executor (default="thread")
+        executor to offload queries to, either "thread", "process" or an existing
+        thread-based ``concurrent.futures.Executor`` instance.
+    :max_workers: int (default=None)
+        maximum number of worker threads/processes of the created executor.
+    :max_concurrency: int (default=None)
+        maximum number of executor jobs in flight at once across all queries, defaults
+        to max_workers or the number of processors on the machine.
+    :chunk_size: int (default=25)
+        number of countries scanned per executor job by ``search``.
+    :overlay: str (default="")
+        name of an overlay layer of custom updates over the shared base updates, as per Updates.
+    :overlay_dir: str (default="")
+        directory of the overlay's journal file, by default the directory of the updates file.
 
     Usage
     =====
@@ -1547,15 +4734,46 @@ class AsyncUpdates:
     from iso3166_updates import AsyncUpdates
 
     async def main():
-        iso = AsyncUpdates()
-        diff = await iso.check_for_updates()
+        async with AsyncUpdates(executor="process") as iso:
+            results = await iso.asearch("canton", likeness_score=80)
+            diff = await iso.acheck_for_updates()
         print(diff)
 
     asyncio.run(main())
     """
 
-    def __init__(self, country_code: str = "", custom_updates_filepath: str = "") -> None:
-        self._updates = Updates(country_code=country_code, custom_updates_filepath=custom_updates_filepath)
+    def __init__(self, country_code: str = "", custom_updates_filepath: str = "", executor: str|Executor = "thread",
+                 max_workers: int = None, max_concurrency: int = None, chunk_size: int = 25, overlay: str = "", overlay_dir: str = "") -> None:
+        #raise error if invalid executor, concurrency or chunk size input
+        if isinstance(executor, str) and executor not in ("thread", "process"):
+            raise ValueError(f"Executor must be 'thread', 'process' or an Executor instance, got {executor!r}.")
+        if isinstance(executor, ProcessPoolExecutor):
+            raise TypeError("Existing ProcessPoolExecutor instances aren't supported, use executor='process' instead.")
+        if not isinstance(executor, (str, Executor)):
+            raise TypeError(f"Executor must be 'thread', 'process' or an Executor instance, got {type(executor)}.")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f"Max concurrency must be at least 1, got {max_concurrency}.")
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size must be at least 1, got {chunk_size}.")
+
+        self._updates = Updates(country_code=country_code, custom_updates_filepath=custom_updates_filepath, overlay=overlay, overlay_dir=overlay_dir)
+        self.max_concurrency = max_concurrency or max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+        #executors created by the instance are shutdown on close, existing executors are left to their owner
+        self._process_pool = None
+        self._owns_executor = isinstance(executor, str)
+        if executor == "process":
+            self._executor = None
+            self._process_pool = _UpdatesProcessPool(self._updates, max_workers)
+        elif executor == "thread":
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="AsyncUpdates")
+        else:
+            self._executor = executor
+
+        #concurrency limiter, bound to the event loop it was created in
+        self._semaphore = None
+        self._semaphore_loop = None
 
     # ------------------------------------------------------------------ #
     #  Synchronous pass-throughs (no I/O, safe to call directly)          #
@@ -1589,20 +4807,164 @@ class AsyncUpdates:
     def change_type(self, change_type: str) -> dict:
         return self._updates.change_type(change_type)
 
+    def etag(self, *args, **kwargs) -> str:
+        return self._updates.etag(*args, **kwargs)
+
+    def timeline(self, *args, **kwargs) -> list:
+        return self._updates.timeline(*args, **kwargs)
+
+    def timelines(self, *args, **kwargs) -> dict:
+        return self._updates.timelines(*args, **kwargs)
+
     def custom_update(self, *args, **kwargs) -> None:
         return self._updates.custom_update(*args, **kwargs)
 
+    def compact(self) -> None:
+        return self._updates.compact()
+
+    def custom_updates_batch(self, *args, **kwargs) -> int:
+        return self._updates.custom_updates_batch(*args, **kwargs)
+
+    def transaction(self, *args, **kwargs):
+        return self._updates.transaction(*args, **kwargs)
+
+    def import_custom_updates(self, *args, **kwargs) -> int:
+        return self._updates.import_custom_updates(*args, **kwargs)
+
+    def create_delta(self, *args, **kwargs) -> dict:
+        return self._updates.create_delta(*args, **kwargs)
+
+    def apply_delta(self, *args, **kwargs) -> int:
+        return self._updates.apply_delta(*args, **kwargs)
+
+    def reload(self) -> list:
+        return self._updates.reload()
+
+    def watch(self, *args, **kwargs) -> None:
+        return self._updates.watch(*args, **kwargs)
+
+    def unwatch(self) -> None:
+        return self._updates.unwatch()
+
     def save_to_file(self, filepath: str) -> None:
         return self._updates.save_to_file(filepath)
 
+    def export(self, filepath: str, data: dict|list = None, format: str = "", compress: bool = None) -> int:
+        return self._updates.export(filepath, data, format, compress)
+
+    def country_name(self, country_name: str, likeness_score: int = 100, raw: bool = False) -> dict:
+        return self._updates.country_name(country_name, likeness_score=likeness_score, raw=raw)
+
+    def country_names_to_alpha2(self, country_names: Iterable, likeness_score: int = 100) -> list:
+        return self._updates.country_names_to_alpha2(country_names, likeness_score=likeness_score)
+
+    def to_json_bytes(self, alpha_code: str = None, year: str|list = None) -> bytes:
+        return self._updates.to_json_bytes(alpha_code=alpha_code, year=year)
+
+    def to_json_gzip(self, alpha_code: str = None, year: str|list = None) -> bytes:
+        return self._updates.to_json_gzip(alpha_code=alpha_code, year=year)
+
+    def check_for_updates(self, since_date: str = "", since_version: str = "") -> dict:
+        return self._updates.check_for_updates(since_date=since_date, since_version=since_version)
+
     # ------------------------------------------------------------------ #
     #  Async methods                                                       #
     # ------------------------------------------------------------------ #
 
-    async def check_for_updates(self, since_date: str = "", since_version: str = "") -> dict:
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """ Get the concurrency limiter for the running event loop. """
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    def _get_executor(self) -> Executor:
+        """ Get the executor that queries are offloaded to. """
+        return self._process_pool.get_executor()[0] if self._process_pool is not None else self._executor
+
+    async def _run_in_executor(self, executor: Executor, func, *args, **kwargs):
+        """ Run a function in the executor, waiting for a slot of the concurrency limiter. """
+        async with self._get_semaphore():
+            return await asyncio.get_running_loop().run_in_executor(executor, partial(func, *args, **kwargs))
+
+    async def _run_query(self, method: str, *args, **kwargs):
+        """ Run an Updates query method in the executor. """
+        if self._process_pool is not None:
+            return await self._run_in_executor(self._get_executor(), _call_process_pool_worker, method, *args, **kwargs)
+        return await self._run_in_executor(self._executor, getattr(self._updates, method), *args, **kwargs)
+
+    async def acountry_name(self, country_name: str, likeness_score: int = 100) -> dict:
+        """ Async version of :meth:`Updates.country_name`. """
+        return await self._run_query("country_name", country_name, likeness_score=likeness_score)
+
+    async def acountry_names_to_alpha2(self, country_names: Iterable, likeness_score: int = 100) -> list:
+        """ Async version of :meth:`Updates.country_names_to_alpha2`. """
+        return await self._run_query("country_names_to_alpha2", list(country_names), likeness_score=likeness_score)
+
+    async def ayear(self, input_year: str|list) -> dict:
+        """ Async version of :meth:`Updates.year`. """
+        return await self._run_query("year", input_year)
+
+    async def adate_range(self, date: str|list, sort_by_date: str = "") -> dict|list:
+        """ Async version of :meth:`Updates.date_range`. """
+        return await self._run_query("date_range", date, sort_by_date=sort_by_date)
+
+    async def achange_type(self, change_type: str) -> dict:
+        """ Async version of :meth:`Updates.change_type`. """
+        return await self._run_query("change_type", change_type)
+
+    async def astats(self) -> dict:
+        """ Async version of :meth:`Updates.stats`. """
+        return await self._run_query("stats")
+
+    async def ato_json_bytes(self, alpha_code: str = None, year: str|list = None) -> bytes:
+        """ Async version of :meth:`Updates.to_json_bytes`. """
+        return await self._run_query("to_json_bytes", alpha_code=alpha_code, year=year)
+
+    async def ato_json_gzip(self, alpha_code: str = None, year: str|list = None) -> bytes:
+        """ Async version of :meth:`Updates.to_json_gzip`. """
+        return await self._run_query("to_json_gzip", alpha_code=alpha_code, year=year)
+
+    async def asearch(self, search_term: str, likeness_score: int = 100, include_match_score: bool = True) -> dict|list:
+        """
+        Async version of :meth:`Updates.search`. The dataset is scanned in chunks of
+        ``chunk_size`` countries, each chunk being a separate executor job, with the
+        chunk results concatenated in order to give the same output as the synchronous
+        search.
+        """
+        search_terms = Updates._parse_search_terms(search_term, likeness_score)
+
+        #each chunk is searched against the same dataset generation
+        if self._process_pool is not None:
+            executor, generation = self._process_pool.get_executor()
+            country_codes = list(generation.all)
+            chunks = [(_search_process_pool_worker, country_codes[i:i + self.chunk_size]) 
+                      for i in range(0, len(country_codes), self.chunk_size)]
+        else:
+            executor = self._executor
+            country_updates = list(self._updates.all.items())
+            chunks = [(self._updates._search_updates, country_updates[i:i + self.chunk_size]) 
+                      for i in range(0, len(country_updates), self.chunk_size)]
+
+        chunk_results = await asyncio.gather(*(self._run_in_executor(executor, func, chunk, search_terms, likeness_score) for func, chunk in chunks))
+        search_results = [result for chunk_result in chunk_results for result in chunk_result]
+
+        return Updates._format_search_results(search_results, search_terms, include_match_score)
+
+    async def aexport(self, filepath: str, data: dict|list = None, format: str = "", compress: bool = None) -> int:
+        """ Async version of :meth:`Updates.export`, writing the export file in a thread so it doesn't block the event loop. """
+        return await asyncio.to_thread(self._updates.export, filepath, data, format, compress)
+
+    async def acheck_for_updates(self, since_date: str = "", since_version: str = "") -> dict:
         """
-        Async version of :meth:`Updates.check_for_updates`.  Runs the synchronous
-        implementation in a thread-pool executor so it does not block the event loop.
+        Async version of :meth:`Updates.check_for_updates`. The manifest, the since_version
+        baseline and the changed countries are fetched natively via asyncio streams, rather
+        than in a thread per check, so many concurrent checks don't exhaust the thread pool:
+        the manifest and baseline are fetched concurrently, as are the byte spans of the
+        changed countries. Reading, parsing and diffing the objects is offloaded to a thread,
+        so never blocks the event loop. The same on-disk caches and version store as
+        :meth:`Updates.check_for_updates` are used.
 
         Parameters
         ==========
@@ -1615,10 +4977,63 @@ class AsyncUpdates:
         =======
         :dict
             Structured diff dict — same shape as :meth:`Updates.check_for_updates`.
+
+        Raises
+        ======
+        ValueError:
+            Invalid ``since_date`` or ``since_version`` format.
         """
-        return await asyncio.to_thread(
-            self._updates.check_for_updates, since_date=since_date, since_version=since_version
-        )
+        since_date_dt = self._updates._parse_check_for_updates_args(since_date, since_version)
+        remote_cache = _get_remote_dataset_cache(self._updates.remote_cache_dir)
+        try:
+            baseline_updates, compare_against = await self._fetch_remote_updates(remote_cache, since_version.strip())
+        except (requests.exceptions.RequestException, ValueError) as e:
+            return self._updates._check_for_updates_error(e)
+        return await asyncio.to_thread(self._updates._check_for_updates_result, baseline_updates, compare_against, since_date_dt)
+
+    async def _fetch_remote_updates(self, remote_cache: _RemoteDatasetCache, since_version: str = "") -> tuple:
+        """ Awaitable version of Updates._fetch_remote_updates(), fetching the manifest and baseline concurrently via asyncio streams. """
+        updates = self._updates
+        manifest_url = updates.remote_manifest_url or _remote_manifest_url(updates.remote_updates_url)
+        main_url = updates.remote_updates_url.format(ref="main")
+
+        async def fetch_main_manifest() -> dict|None:
+            try:
+                return _validate_manifest(await remote_cache.fetch_async(manifest_url.format(ref="main")))
+            except (requests.exceptions.RequestException, ValueError):
+                return None
+
+        async def fetch_baseline() -> dict:
+            if (since_version):
+                version_store = _get_version_store(updates.remote_cache_dir)
+                return (await version_store.fetch_async([since_version], updates.remote_updates_url))[since_version]
+            return await asyncio.to_thread(lambda: updates.all)
+
+        main_manifest, baseline_updates = await asyncio.gather(fetch_main_manifest(), fetch_baseline())
+        if (main_manifest is not None):
+            main_manifest = updates._scope_countries(main_manifest)
+            changed_entries = await asyncio.to_thread(updates._changed_manifest_entries, main_manifest, baseline_updates, since_version)
+            try:
+                changed_updates = await remote_cache.fetch_countries_async(main_url, changed_entries)
+                return updates._scope_countries(baseline_updates), {alpha_code: changed_updates[alpha_code] if alpha_code in changed_entries else baseline_updates[alpha_code] 
+                                                                    for alpha_code in main_manifest}
+            except (requests.exceptions.RequestException, ValueError):
+                pass
+        return updates._scope_countries(baseline_updates), updates._scope_countries(await remote_cache.fetch_async(main_url))
+
+    def close(self) -> None:
+        """ Stop watching the updates file and shutdown any thread or process executor created by the instance. """
+        self._updates.unwatch()
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+        elif self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+
+    async def __aenter__(self) -> AsyncUpdates:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await asyncio.to_thread(self.close)
 
     def __len__(self) -> int:
         return len(self._updates)
@@ -1639,6 +5054,80 @@ def _load_iso3166_3_json(filepath: str) -> dict:
     with open(filepath, "r", encoding="utf-8") as f:
         return json.load(f)
 
+class _Iso31663Index:
+    """
+    Reverse and range indexes of the ISO 3166-3 dataset, built once per data file and shared by
+    all Iso31663 instances: the alpha-4 codes of the entries of each current alpha-2 code, former
+    alpha-2 code and former alpha-3 code, in dataset order, and the alpha-4 codes sorted by their
+    withdrawal dates. Withdrawal dates are YYYY or YYYY-MM-DD strings, so sort chronologically as
+    strings, with a year-only date sorted before the dates of its year.
+    """
+    def __init__(self, entries: dict) -> None:
+        self.entries = entries
+        self.current_codes, self.former_alpha2, self.former_alpha3 = {}, {}, {}
+        for alpha4_code, entry in entries.items():
+            for current_code in entry.get("Current_Codes") or []:
+                self.current_codes.setdefault(current_code.upper(), []).append(alpha4_code)
+            if (entry.get("Former_Alpha2")):
+                self.former_alpha2.setdefault(entry["Former_Alpha2"].upper(), []).append(alpha4_code)
+            if (entry.get("Former_Alpha3")):
+                self.former_alpha3.setdefault(entry["Former_Alpha3"].upper(), []).append(alpha4_code)
+        for index in (self.current_codes, self.former_alpha2, self.former_alpha3):
+            for code in index:
+                index[code] = tuple(index[code])
+
+        withdrawals = sorted((entry.get("Withdrawal_Date") or "", alpha4_code) for alpha4_code, entry in entries.items())
+        self.withdrawal_dates = tuple(withdrawal_date for withdrawal_date, _ in withdrawals)
+        self.withdrawal_codes = tuple(alpha4_code for _, alpha4_code in withdrawals)
+
+        #current ISO 3166-1 alpha-2 codes succeeding each entry, following codes that were themselves later withdrawn, 
+        #e.g. YUCS was succeeded by CS, the former alpha-2 code of CSXX, which was succeeded by ME and RS
+        self.successors = {alpha4_code: self._get_successors(alpha4_code, set()) for alpha4_code in entries}
+        self.predecessors = {}
+        for alpha4_code in self.withdrawal_codes:
+            for current_code in self.successors[alpha4_code]:
+                self.predecessors.setdefault(current_code, []).append(alpha4_code)
+        for current_code in self.predecessors:
+            self.predecessors[current_code] = tuple(self.predecessors[current_code])
+
+    def _get_successors(self, alpha4_code: str, visited: set) -> tuple:
+        """
+        Get the current alpha-2 codes succeeding an entry. A current code that isn't an ISO 3166-1 code 
+        refers to the entries using it as their former alpha-2 code that were withdrawn at the same time
+        or later, whose successors are followed in turn.
+        """
+        visited.add(alpha4_code)
+        entry, successors = self.entries[alpha4_code], []
+        for current_code in entry.get("Current_Codes") or []:
+            current_code = current_code.upper()
+            if countries.get(alpha_2=current_code) is not None:
+                successors.append(current_code)
+                continue
+            for later_code in self.former_alpha2.get(current_code, ()):
+                if later_code not in visited and (self.entries[later_code].get("Withdrawal_Date") or "") >= (entry.get("Withdrawal_Date") or ""):
+                    successors.extend(self._get_successors(later_code, visited))
+        return tuple(dict.fromkeys(successors))
+
+    def resolve(self, code: str) -> tuple:
+        """ Get the current alpha-2 codes succeeding a former alpha-4, alpha-3 or alpha-2 code, empty if it isn't a former code. """
+        if len(code) == 4:
+            alpha4_codes = (code,) if code in self.entries else ()
+        else:
+            alpha4_codes = (self.former_alpha2 if len(code) == 2 else self.former_alpha3).get(code, ())
+        return tuple(dict.fromkeys(current_code for alpha4_code in alpha4_codes for current_code in self.successors[alpha4_code]))
+
+    def withdrawn_between(self, start_date: str="", end_date: str="") -> tuple:
+        """ Get the alpha-4 codes withdrawn between the inclusive start and end dates, in order of withdrawal date. """
+        start = bisect.bisect_left(self.withdrawal_dates, start_date) if start_date else 0
+        #any date in the end date's year or day sorts before the end date suffixed by "~"
+        end = bisect.bisect_right(self.withdrawal_dates, end_date + "~") if end_date else len(self.withdrawal_dates)
+        return self.withdrawal_codes[start:end]
+
+@lru_cache(maxsize=None)
+def _get_iso3166_3_index(filepath: str) -> _Iso31663Index:
+    """Build and cache the indexes of the ISO 3166-3 JSON, shared by all instances."""
+    return _Iso31663Index(_load_iso3166_3_json(filepath))
+
 
 class Iso31663:
     """
@@ -1650,7 +5139,9 @@ class Iso31663:
     there are **73** codes defined in the standard.
 
     The dataset is bundled with the package as ``iso3166-3.json`` and is loaded
-    lazily on first access.
+    lazily on first access. It is loaded once, along with reverse indexes of the 
+    entries' current codes, former alpha-2 and alpha-3 codes and a range index of 
+    their withdrawal dates, and shared by all instances without being copied.
 
     Parameters
     ==========
@@ -1661,7 +5152,8 @@ class Iso31663:
     Attributes
     ==========
     :all: dict
-        The full (or filtered) ISO 3166-3 dataset, keyed by alpha-4 code.
+        The full (or filtered) ISO 3166-3 dataset, keyed by alpha-4 code. The entries
+        are shared by all instances and should be treated as read-only.
 
     Usage
     =====
@@ -1679,6 +5171,14 @@ class Iso31663:
     iso3["DDDE"].Name
     iso3["DDDE"].Withdrawal_Date
     iso3["DDDE"].Current_Codes
+
+    # reverse lookups by current codes and former alpha-2/alpha-3 codes
+    iso3.current_code("DJ")
+    iso3.former_alpha2("AI,CS")
+    iso3.former_alpha3(["AFI", "DDR"])
+
+    # codes withdrawn between 1990 and 2000, in order of withdrawal date
+    iso3.withdrawal_date_range("1990", "2000")
     """
 
     def __init__(self, alpha4_code: str = "") -> None:
@@ -1691,10 +5191,12 @@ class Iso31663:
         if not os.path.isfile(self.iso3166_3_path):
             raise OSError(f"ISO 3166-3 data file not found: {self.iso3166_3_path!r}.")
 
+        #the dataset and its indexes are loaded once and shared by all instances, so aren't copied
         try:
-            self.all = copy.deepcopy(_load_iso3166_3_json(self.iso3166_3_path))
+            self._index = _get_iso3166_3_index(self.iso3166_3_path)
         except json.JSONDecodeError:
             raise ValueError("Error: The ISO 3166-3 data file contains invalid JSON.")
+        self.all = self._index.entries
 
         self.alpha4_code = alpha4_code
         if self.alpha4_code:
@@ -1734,6 +5236,164 @@ class Iso31663:
             raise ValueError(f"Unknown ISO 3166-3 alpha-4 code: {key!r}.")
         return Map(self.all[key])
 
+    def current_code(self, current_codes: str|list, raw: bool=False) -> dict:
+        """
+        Return the ISO 3166-3 entries of the formerly used codes that were replaced by, or merged or
+        divided into, one or more current ISO 3166-1 alpha-2 codes, via a reverse index of the
+        entries' Current_Codes.
+
+        Parameters
+        ==========
+        :current_codes: str|list
+            one or more current alpha-2 codes, comma-separated or as a list, e.g. ``"DJ"``
+            or ``["CZ", "SK"]``.
+        :raw: bool (default=False)
+            return a plain dict of the shared entries rather than a Map of Map copies. The 
+            entries should be treated as read-only.
+
+        Returns
+        =======
+        :result: Map (dict)
+            entries of the matching alpha-4 codes, keyed by alpha-4 code in dataset order.
+            Codes without any formerly used codes return an empty object.
+
+        Raises
+        ======
+        TypeError:
+            Input is not a string or list of strings.
+        ValueError:
+            Invalid alpha-2 code input.
+
+        Usage
+        =====
+        iso3 = Iso31663()
+        iso3.current_code("DJ")      # French Afars and Issas (AIDJ)
+        iso3.current_code("CZ,SK")   # Czechoslovakia (CSHH)
+        """
+        return self._lookup(self._index.current_codes, current_codes, 2, "alpha-2", raw)
+
+    def former_alpha2(self, alpha2_codes: str|list, raw: bool=False) -> dict:
+        """
+        Return the ISO 3166-3 entries of one or more former ISO 3166-1 alpha-2 codes, via a 
+        reverse index of the entries' Former_Alpha2. A former alpha-2 code may have been 
+        used by more than one withdrawn country, e.g. ``CS``.
+
+        Parameters
+        ==========
+        :alpha2_codes: str|list
+            one or more former alpha-2 codes, comma-separated or as a list, e.g. ``"AI"``.
+        :raw: bool (default=False)
+            return a plain dict of the shared entries rather than a Map of Map copies.
+
+        Returns
+        =======
+        :result: Map (dict)
+            entries of the matching alpha-4 codes, keyed by alpha-4 code in dataset order.
+
+        Raises
+        ======
+        TypeError:
+            Input is not a string or list of strings.
+        ValueError:
+            Invalid alpha-2 code input.
+        """
+        return self._lookup(self._index.former_alpha2, alpha2_codes, 2, "alpha-2", raw)
+
+    def former_alpha3(self, alpha3_codes: str|list, raw: bool=False) -> dict:
+        """
+        Return the ISO 3166-3 entries of one or more former ISO 3166-1 alpha-3 codes, via a 
+        reverse index of the entries' Former_Alpha3.
+
+        Parameters
+        ==========
+        :alpha3_codes: str|list
+            one or more former alpha-3 codes, comma-separated or as a list, e.g. ``"AFI"``.
+        :raw: bool (default=False)
+            return a plain dict of the shared entries rather than a Map of Map copies.
+
+        Returns
+        =======
+        :result: Map (dict)
+            entries of the matching alpha-4 codes, keyed by alpha-4 code in dataset order.
+
+        Raises
+        ======
+        TypeError:
+            Input is not a string or list of strings.
+        ValueError:
+            Invalid alpha-3 code input.
+        """
+        return self._lookup(self._index.former_alpha3, alpha3_codes, 3, "alpha-3", raw)
+
+    def withdrawal_date_range(self, start_date: str="", end_date: str="", raw: bool=False) -> dict:
+        """
+        Return the ISO 3166-3 entries of the codes withdrawn between two dates, inclusive, via a
+        range index of the entries sorted by Withdrawal_Date. Either date can be a year or a 
+        YYYY-MM-DD date, an empty start or end date is unbounded. An end year includes the whole
+        year; withdrawal dates recorded as a year only are compared as the start of their year.
+
+        Parameters
+        ==========
+        :start_date: str (default="")
+            earliest withdrawal date, e.g. ``"1990"`` or ``"1990-05-22"``.
+        :end_date: str (default="")
+            latest withdrawal date, e.g. ``"2000"`` or ``"2000-12-31"``.
+        :raw: bool (default=False)
+            return a plain dict of the shared entries rather than a Map of Map copies.
+
+        Returns
+        =======
+        :result: Map (dict)
+            entries of the withdrawn alpha-4 codes, keyed by alpha-4 code in order of withdrawal
+            date.
+
+        Raises
+        ======
+        TypeError:
+            Input dates are not strings.
+        ValueError:
+            Invalid date format, or start date after end date.
+
+        Usage
+        =====
+        iso3 = Iso31663()
+        iso3.withdrawal_date_range("1990", "2000")   # e.g. DDDE, SUHH, CSHH, YUCS ...
+        iso3.withdrawal_date_range("2002-01-01")     # withdrawn since 2002
+        """
+        for date in (start_date, end_date):
+            if not isinstance(date, str):
+                raise TypeError(f"Expected withdrawal date to be a string, got {type(date)}.")
+            if date.strip() and not re.match(r"^\d{4}(-\d{2}-\d{2})?$", date.strip()):
+                raise ValueError(f"Invalid withdrawal date format, expected YYYY or YYYY-MM-DD, got: {date!r}.")
+        start_date, end_date = start_date.strip(), end_date.strip()
+        if (start_date and end_date and start_date[:len(end_date)] > end_date):
+            raise ValueError(f"Start date {start_date!r} is after end date {end_date!r}.")
+
+        return self._format_entries([alpha4_code for alpha4_code in self._index.withdrawn_between(start_date, end_date) 
+                                     if alpha4_code in self.all], raw)
+
+    def _lookup(self, index: dict, codes: str|list, length: int, code_type: str, raw: bool=False) -> dict:
+        """ Get the entries of the alpha-4 codes of one or more input codes in a reverse index, in dataset order. """
+        if isinstance(codes, str):
+            codes = codes.split(",")
+        elif not (isinstance(codes, (list, tuple)) and all(isinstance(code, str) for code in codes)):
+            raise TypeError(f"Expected {code_type} codes to be a string or list of strings, got {type(codes)}.")
+
+        alpha4_codes = set()
+        for code in codes:
+            code = code.strip().upper()
+            if not re.match(rf"^[A-Z]{{{length}}}$", code):
+                raise ValueError(f"Invalid {code_type} code, expected {length} letters, got: {code!r}.")
+            alpha4_codes.update(index.get(code, ()))
+
+        return self._format_entries([alpha4_code for alpha4_code in self.all if alpha4_code in alpha4_codes], raw)
+
+    def _format_entries(self, alpha4_codes: list, raw: bool=False) -> dict:
+        """ Get the entries of the alpha-4 codes, as a plain dict of the shared entries or a Map of Map copies. """
+        if (raw):
+            return {alpha4_code: self.all[alpha4_code] for alpha4_code in alpha4_codes}
+        return Map({alpha4_code: Map(self.all[alpha4_code]) for alpha4_code in alpha4_codes})
+
     def __len__(self) -> int:
         return len(self.all)
 
@@ -0,0 +1,528 @@
+"""
+Standalone HTTP API server for the ISO 3166 updates data, serving the /api/all, /api/alpha,
+/api/year, /api/country_name, /api/search and /api/date_range endpoints of the iso3166-updates
+API from a single preloaded Updates instance, using only the standard library.
+
+At startup the dataset, its pre-serialized JSON fragments and the responses of the /api/all,
+/api/alpha/<code> and /api/year/<year> endpoints are built, before the listening socket is
+shared by a number of pre-forked worker processes, each serving requests on a pool of threads.
+Responses are cached, keyed by their ETag, which is combined from the Updates.etag() content
+hash of the data the request reads and the request's normalised path and query string, so
+conditional requests are answered with a 304 without building the response. Each cached
+response is stored alongside its precompressed gzip body, served to clients accepting gzip,
+which for the /api/all, /api/alpha and /api/year endpoints is joined into a single gzip member
+from the precompressed deflate fragments of Updates.to_json_gzip(), rather than compressing the 
+response body.
+
+Usage
+=====
+python -m iso3166_updates.serve --host 127.0.0.1 --port 8000 --workers 4
+
+curl http://127.0.0.1:8000/api/alpha/FR,DE
+curl http://127.0.0.1:8000/api/year/2023
+curl http://127.0.0.1:8000/api/date_range/2019-01-01,2023-12-31?sortBy=dateDesc
+"""
+from __future__ import annotations
+import os
+import json
+import gzip
+import signal
+import hashlib
+import argparse
+import threading
+from functools import partial
+from collections import OrderedDict
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qsl, unquote
+from .iso3166_updates import Updates, _get_country_name_index, _deflate, _gzip_join
+
+#(data, deflated) fragment opening the data envelope of a response, joined with the data's precompressed deflate fragments
+_DEFLATE_DATA_PREFIX = (b'{"data": ', _deflate(b'{"data": '))
+
+class _Response:
+    """ Cached API response, with its precompressed gzip body. """
+    __slots__ = ("status", "content_type", "body", "gzip_body", "etag")
+
+    def __init__(self, status: int, content_type: str, body: bytes, gzip_body: bytes=None, etag: str=None) -> None:
+        self.status = status
+        self.content_type = content_type
+        self.body = body
+        self.gzip_body = gzip_body
+        self.etag = etag
+
+class _APIError(Exception):
+    """ Error raised whilst routing or building a response, returned as a JSON error response. """
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+class UpdatesAPI:
+    """
+    Request handling logic of the iso3166-updates API, independent of the HTTP server. Each
+    request is routed to an endpoint that computes the request's ETag, from the content hash
+    of the updates data it reads, and a builder for its response body. Built responses are kept
+    in an LRU cache keyed by their ETag, alongside their precompressed gzip body, so repeated
+    requests for unchanged data are served without re-running the query or re-encoding it.
+
+    The data of successful responses is returned in a {"data": ..., "metadata": ...} envelope,
+    where the metadata contains the count of updates returned and the time the dataset was
+    loaded. Errors are returned as {"message": ..., "path": ..., "status": ...} objects.
+
+    Parameters
+    ==========
+    :updates: Updates (default=None)
+        Updates instance to serve, by default an instance of the package's updates data with
+        its response cache enabled.
+    :cache_size: int (default=4096)
+        maximum number of responses kept in the response cache.
+    :gzip_level: int (default=6)
+        compression level of the precompressed gzip response bodies.
+    :gzip_min_size: int (default=512)
+        minimum size in bytes of a response body for it to be gzip compressed.
+
+    Methods
+    =======
+    warm():
+        load the dataset and build the responses of the /api/all, /api/alpha/<code> and
+        /api/year/<year> endpoints.
+    get(target, if_none_match="", accept_gzip=False, base_url=""):
+        get the response for a request target, returning its status, headers and body.
+    """
+    def __init__(self, updates: Updates=None, cache_size: int=4096, gzip_level: int=6, gzip_min_size: int=512) -> None:
+        self.updates = updates if updates is not None else Updates(response_cache=True)
+        self.cache_size = cache_size
+        self.gzip_level = gzip_level
+        self.gzip_min_size = gzip_min_size
+
+        #time the dataset was loaded, returned in the metadata of each response
+        self.generated = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def warm(self) -> None:
+        """
+        Load the dataset, its JSON fragments, content hashes and country name index, and build the responses of the
+        /api/all, /api/alpha/<code> and /api/year/<year> endpoints into the response cache.
+        """
+        all_updates = self.updates.all
+        self.updates.etag()
+        _get_country_name_index()
+
+        targets = ["/api/all"] + [f"/api/alpha/{alpha_code}" for alpha_code in all_updates]
+        years = {Updates._parse_date_issued(update["Date Issued"]) for updates in all_updates.values() for update in updates}
+        targets.extend(f"/api/year/{year.year}" for year in sorted({year for year in years if year is not None}))
+        for target in targets:
+            self.get(target)
+
+    def get(self, target: str, if_none_match: str="", accept_gzip: bool=False, base_url: str="") -> tuple:
+        """
+        Get the response for an API request target, i.e. its path and query string.
+
+        Parameters
+        ==========
+        :target: str
+            request target, e.g. "/api/alpha/FR?fields=Change".
+        :if_none_match: str (default="")
+            value of the request's If-None-Match header.
+        :accept_gzip: bool (default=False)
+            whether the client accepts a gzip encoded response body.
+        :base_url: str (default="")
+            scheme and host of the request, used in the path of error responses.
+
+        Returns
+        =======
+        :response: tuple
+            status code, dict of response headers and response body.
+        """
+        split_target = urlsplit(target)
+        segments = [unquote(segment) for segment in split_target.path.strip("/").split("/")]
+        query = {key.lower(): value for key, value in parse_qsl(split_target.query, keep_blank_values=True)}
+
+        try:
+            #route request to endpoint, raising a 404 error if no endpoint found
+            if not (segments and segments[0] == "api"):
+                raise _APIError(404, f"No endpoint found for path: {split_target.path}.")
+            #the ETag and response body are both derived from a single snapshot of the dataset, so a custom update or reload 
+            #published whilst handling the request can't cache a response under the ETag of a different generation
+            etag_func, build_func = self._route(segments[1:], query, self.updates._pinned())
+
+            #cached responses are keyed by the content hash of their data and their normalised request target
+            etag_hash = hashlib.blake2b(digest_size=16)
+            for part in (etag_func(), split_target.path.rstrip("/"), *sorted(query.items())):
+                etag_hash.update(repr(part).encode("utf-8") + b"\0")
+            etag = '"' + etag_hash.hexdigest() + '"'
+
+            response = self._get_cached_response(etag)
+            if response is None:
+                response = self._cache_response(etag, *build_func())
+        except _APIError as error:
+            response = self._error_response(error.status, error.message, base_url + target)
+        except (ValueError, TypeError, KeyError) as error:
+            response = self._error_response(400, str(error).strip("'\""), base_url + target)
+
+        headers = {"Content-Type": response.content_type, "Access-Control-Allow-Origin": "*"}
+        if response.etag is not None:
+            headers.update({"ETag": response.etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"})
+            #return not modified if the client's copy of the response is current
+            if response.etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+                return 304, headers, b""
+        if accept_gzip and response.gzip_body is not None:
+            headers["Content-Encoding"] = "gzip"
+            return response.status, headers, response.gzip_body
+
+        return response.status, headers, response.body
+
+    def _get_cached_response(self, etag: str) -> _Response|None:
+        """ Get a response from the LRU response cache. """
+        with self._cache_lock:
+            response = self._cache.get(etag)
+            if response is not None:
+                self._cache.move_to_end(etag)
+            return response
+
+    def _cache_response(self, etag: str, content_type: str, body: bytes, gzip_body: bytes=None) -> _Response:
+        """
+        Add a built response to the LRU response cache, compressing its body unless it was built
+        with a gzip body, joined from precompressed deflate fragments.
+        """
+        if (len(body) < self.gzip_min_size):
+            gzip_body = None
+        elif (gzip_body is None):
+            gzip_body = gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+        response = _Response(200, content_type, body, gzip_body, etag)
+        with self._cache_lock:
+            self._cache[etag] = response
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return response
+
+    @staticmethod
+    def _error_response(status: int, message: str, path: str) -> _Response:
+        """ Build an uncached JSON error response. """
+        body = json.dumps({"message": message, "path": path, "status": status}).encode("utf-8")
+        return _Response(status, "application/json", body)
+
+    def _route(self, route: list, query: dict, updates: Updates) -> tuple:
+        """
+        Route the path segments following /api to their endpoint, returning the functions that
+        get the ETag of the data read by the request and build the response body, both reading
+        the input Updates instance, i.e. the snapshot of the dataset taken for the request.
+        """
+        if route in ([], [""]):
+            return (lambda: updates.__version__), self._index
+        if route == ["version"]:
+            return (lambda: updates.__version__), (lambda: ("text/plain; charset=utf-8", updates.__version__.encode("utf-8")))
+        if route == ["all"]:
+            return updates.etag, (lambda: self._data_response(updates.all, query, updates.to_json_bytes, updates._json_deflate, paginate=True))
+
+        #endpoints with an input, and optionally a year or alpha code filter, e.g. /alpha/<code>/year/<year>
+        endpoint, endpoint_input = route[0], route[1] if len(route) > 1 else ""
+        endpoint_filter = route[2:4] if len(route) == 4 else None
+        if len(route) not in (1, 2, 4):
+            raise _APIError(404, f"No endpoint found for path: /api/{'/'.join(route)}.")
+
+        if endpoint == "alpha" and endpoint_filter is None:
+            return (lambda: updates.etag(endpoint_input)), \
+                (lambda: self._data_response(updates.alpha(endpoint_input, raw=True), query, partial(updates.to_json_bytes, endpoint_input), 
+                                             partial(updates._json_deflate, endpoint_input)))
+        if endpoint == "alpha" and endpoint_filter[0] == "year":
+            return updates.etag, (lambda: self._data_response(self._year_filter(updates, updates.alpha(endpoint_input, raw=True), endpoint_filter[1]), query))
+        if endpoint == "year" and endpoint_filter is None:
+            return (lambda: updates.etag(year=endpoint_input)), \
+                (lambda: self._data_response(updates.year(endpoint_input, raw=True), query, partial(updates.to_json_bytes, year=endpoint_input),
+                                             partial(updates._json_deflate, year=endpoint_input)))
+        if endpoint == "country_name" and (endpoint_filter is None or endpoint_filter[0] == "year"):
+            def build_country_name() -> tuple:
+                country_updates = updates.country_name(endpoint_input, self._get_likeness_score(query), raw=True)
+                if endpoint_filter is not None:
+                    country_updates = self._year_filter(updates, country_updates, endpoint_filter[1])
+                return self._data_response(country_updates, query)
+            return updates.etag, build_country_name
+        if endpoint == "search" and endpoint_filter is None:
+            return updates.etag, (lambda: self._data_response(self._search(updates, endpoint_input, query), query))
+        if endpoint == "date_range" and (endpoint_filter is None or endpoint_filter[0] == "alpha"):
+            def build_date_range() -> tuple:
+                if not (endpoint_input.strip()):
+                    raise _APIError(400, "Input date cannot be empty, expecting at least one date in the format YYYY-MM-DD.")
+                date_range = updates.date_range(endpoint_input, raw=True)
+                if endpoint_filter is not None:
+                    alpha_codes = updates.alpha(endpoint_filter[1], raw=True)
+                    date_range = {code: date_range[code] for code in alpha_codes if code in date_range}
+                return self._data_response(date_range, query)
+            return updates.etag, build_date_range
+
+        raise _APIError(404, f"No endpoint found for path: /api/{'/'.join(route)}.")
+
+    def _index(self) -> tuple:
+        """ Build the response of the /api endpoint, listing the available endpoints. """
+        index = {
+            "name": "iso3166-updates",
+            "version": self.updates.__version__,
+            "endpoints": ["/api/all", "/api/alpha/<alpha_codes>", "/api/alpha/<alpha_codes>/year/<year>", "/api/year/<year>",
+                          "/api/country_name/<country_names>", "/api/country_name/<country_names>/year/<year>", "/api/search/<search_terms>",
+                          "/api/date_range/<dates>", "/api/date_range/<dates>/alpha/<alpha_codes>", "/api/version"],
+            "query_parameters": ["fields", "sortBy", "limit", "offset", "likeness", "excludeMatchScore"],
+        }
+        return "application/json", json.dumps(index).encode("utf-8")
+
+    def _data_response(self, data: dict|list, query: dict, to_json_bytes=None, json_deflate=None, paginate: bool=False) -> tuple:
+        """
+        Build a JSON response body of the data and its metadata, applying the sortBy, fields and,
+        if applicable, limit and offset query parameters. If none of the parameters apply, the
+        data's pre-serialized JSON from to_json_bytes is used rather than encoding the data, and 
+        the gzip body is joined into a single gzip member from the data's precompressed deflate 
+        fragment from json_deflate and fragments of the response's envelope, rather than 
+        compressing the response body.
+        """
+        metadata = {}
+        transformed = False
+
+        #sort updates by publication date, flattening them into a list of updates with their country code
+        sort_by_date = query.get("sortby", "").lower()
+        if isinstance(data, dict) and sort_by_date in ("dateasc", "datedesc"):
+            data = self._sort_by_date(data, sort_by_date == "datedesc")
+            transformed = True
+
+        #paginate the countries, or sorted updates, by limit and offset query parameters
+        if (paginate and ("limit" in query or "offset" in query)):
+            try:
+                limit = int(query.get("limit", len(data)))
+                offset = int(query.get("offset", 0))
+            except ValueError:
+                raise _APIError(400, "Limit and offset query string parameter values must be integers.")
+            if (limit < 0 or offset < 0):
+                raise _APIError(400, "Limit and offset query string parameter values must be 0 or greater.")
+            metadata.update({"limit": limit, "offset": offset, "total": len(data)})
+            data = dict(list(data.items())[offset:offset + limit]) if isinstance(data, dict) else data[offset:offset + limit]
+            transformed = True
+
+        #only include the sought attributes of each update
+        if (query.get("fields")):
+            fields = [field.strip() for field in query["fields"].split(",")]
+            if isinstance(data, dict):
+                data = {code: [{field: update[field] for field in fields if field in update} for update in code_updates] for code, code_updates in data.items()}
+            else:
+                data = [{field: update[field] for field in fields if field in update} for update in data]
+            transformed = True
+
+        count = sum(len(code_updates) for code_updates in data.values()) if isinstance(data, dict) else len(data)
+        data_bytes = to_json_bytes() if to_json_bytes is not None and not transformed else json.dumps(data).encode("utf-8")
+        metadata_bytes = b', "metadata": ' + json.dumps({"count": count, "generated": self.generated, **metadata}).encode("utf-8") + b"}"
+
+        gzip_body = None
+        if (json_deflate is not None and not transformed and len(data_bytes) >= self.gzip_min_size):
+            gzip_body = _gzip_join([_DEFLATE_DATA_PREFIX, (data_bytes, json_deflate()), (metadata_bytes, _deflate(metadata_bytes, self.gzip_level))])
+
+        return "application/json", b'{"data": ' + data_bytes + metadata_bytes, gzip_body
+
+    @staticmethod
+    def _sort_by_date(data: dict, descending: bool) -> list:
+        """ Flatten updates by country code into a list of updates with their Country Code, sorted by publication date. """
+        dated_updates = []
+        for code, code_updates in data.items():
+            for update in code_updates:
+                date_issued = Updates._parse_date_issued(update["Date Issued"])
+                dated_updates.append((date_issued or datetime.min, code, update))
+        dated_updates.sort(key=lambda dated_update: dated_update[0], reverse=descending)
+
+        return [{"Country Code": code, **update} for _, code, update in dated_updates]
+
+    @staticmethod
+    def _year_filter(updates: Updates, country_updates: dict, year: str) -> dict:
+        """ Filter the updates of the input countries by the year filter. """
+        year_updates = updates.year(year, raw=True)
+        return {code: year_updates[code] for code in country_updates if code in year_updates}
+
+    @staticmethod
+    def _get_likeness_score(query: dict) -> int:
+        """ Get the likeness query parameter, between 0 and 100, with 0 treated as the minimum likeness score of 1. """
+        try:
+            likeness_score = int(query.get("likeness", 100))
+        except ValueError:
+            raise _APIError(400, "Likeness query string parameter value must be between 0 and 100.")
+        if not (0 <= likeness_score <= 100):
+            raise _APIError(400, "Likeness query string parameter value must be between 0 and 100.")
+        return max(likeness_score, 1)
+
+    def _search(self, updates: Updates, search_term: str, query: dict) -> dict|list:
+        """ Search the updates data with the search term and the likeness and excludeMatchScore query parameters. """
+        if not (search_term.strip()):
+            raise _APIError(400, "The search input parameter cannot be empty.")
+        likeness_score = self._get_likeness_score(query)
+        include_match_score = query.get("excludematchscore", "0").lower() in ("0", "false", "")
+
+        #search without printing a message to stdout if no matching updates are found
+        search_terms = Updates._parse_search_terms(search_term, likeness_score)
+        search_results = updates._search_updates(updates.all.items(), search_terms, likeness_score)
+        if not (search_results):
+            return {} if not include_match_score else []
+        return Updates._format_search_results(search_results, search_terms, include_match_score, raw=False)
+
+class _UpdatesRequestHandler(BaseHTTPRequestHandler):
+    """ HTTP/1.1 request handler serving the responses of an UpdatesAPI instance. """
+    protocol_version = "HTTP/1.1"
+    server_version = "iso3166-updates"
+    disable_nagle_algorithm = True
+    api = None
+    access_log = False
+
+    def do_GET(self) -> None:
+        self._respond(send_body=True)
+
+    def do_HEAD(self) -> None:
+        self._respond(send_body=False)
+
+    def _respond(self, send_body: bool) -> None:
+        accept_gzip = "gzip" in self.headers.get("Accept-Encoding", "")
+        base_url = f"http://{self.headers.get('Host', '%s:%s' % self.server.server_address[:2])}"
+        status, headers, body = self.api.get(self.path, self.headers.get("If-None-Match", ""), accept_gzip, base_url)
+
+        self.send_response(status)
+        for header, value in headers.items():
+            self.send_header(header, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if (send_body and body):
+            self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        if (self.access_log):
+            super().log_message(format, *args)
+
+def make_server(host: str="127.0.0.1", port: int=8000, api: UpdatesAPI=None, access_log: bool=False) -> ThreadingHTTPServer:
+    """
+    Create a threaded HTTP server, bound to the host and port, serving the responses of the API.
+
+    Parameters
+    ==========
+    :host: str (default="127.0.0.1")
+        host address to bind the server to.
+    :port: int (default=8000)
+        port to bind the server to, 0 to bind to a free port.
+    :api: UpdatesAPI (default=None)
+        API instance to serve, by default an instance serving the package's updates data.
+    :access_log: bool (default=False)
+        whether to log each request to stderr.
+
+    Returns
+    =======
+    :server: ThreadingHTTPServer
+        HTTP server, call serve_forever() to start serving requests.
+    """
+    api = api if api is not None else UpdatesAPI()
+    handler = type("UpdatesRequestHandler", (_UpdatesRequestHandler,), {"api": api, "access_log": access_log})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+
+    return server
+
+def serve(host: str="127.0.0.1", port: int=8000, workers: int=1, updates: Updates=None, access_log: bool=False, watch_interval: float=0) -> None:
+    """
+    Load and warm the API and serve it until interrupted. With more than one worker, the bound
+    listening socket is shared by pre-forked worker processes, which inherit the warmed dataset
+    and response cache from the parent process. Workers that exit are restarted by the parent
+    process, which shuts the workers down when it receives SIGINT or SIGTERM. Pre-forking is
+    only supported on POSIX platforms, elsewhere a single process is used.
+
+    Parameters
+    ==========
+    :host: str (default="127.0.0.1")
+        host address to bind the server to.
+    :port: int (default=8000)
+        port to bind the server to.
+    :workers: int (default=1)
+        number of worker processes.
+    :updates: Updates (default=None)
+        Updates instance to serve, by default an instance of the package's updates data.
+    :access_log: bool (default=False)
+        whether to log each request to stderr.
+    :watch_interval: float (default=0)
+        if set, seconds between polls of the updates file for changes, which are reloaded by each
+        process in the background; cached responses are keyed by the content hash of their data, 
+        so the responses of changed countries are rebuilt on their next request.
+    """
+    api = UpdatesAPI(updates)
+    api.warm()
+    server = make_server(host, port, api, access_log)
+    print(f"Serving iso3166-updates API on http://{server.server_address[0]}:{server.server_address[1]}/api with {workers} worker(s).", flush=True)
+
+    if (workers <= 1 or not hasattr(os, "fork")):
+        if (watch_interval):
+            api.updates.watch(watch_interval)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        return
+
+    def start_worker() -> int:
+        pid = os.fork()
+        if pid == 0:
+            #worker process, exit on SIGTERM from the parent process
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            signal.signal(signal.SIGTERM, lambda signum, frame: os._exit(0))
+            #threads aren't inherited by forked processes, so each worker watches the updates file itself
+            if (watch_interval):
+                api.updates.watch(watch_interval)
+            try:
+                server.serve_forever()
+            finally:
+                os._exit(0)
+        return pid
+
+    worker_pids = {start_worker() for _ in range(workers)}
+    stopping = False
+
+    def stop(signum, frame) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in worker_pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    #restart any worker that exits until stopped
+    while worker_pids:
+        try:
+            pid, _ = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        worker_pids.discard(pid)
+        if not (stopping):
+            worker_pids.add(start_worker())
+    server.server_close()
+
+def main(argv: list=None) -> None:
+    """ Command-line entry point of the API server. """
+    parser = argparse.ArgumentParser(description='Serve the iso3166-updates API.')
+    parser.add_argument('-host', '--host', type=str, required=False, default="127.0.0.1",
+        help='Host address to bind the server to.')
+    parser.add_argument('-port', '--port', type=int, required=False, default=8000,
+        help='Port to bind the server to.')
+    parser.add_argument('-workers', '--workers', type=int, required=False, default=os.cpu_count() or 1,
+        help='Number of pre-forked worker processes.')
+    parser.add_argument('-custom_updates_filepath', '--custom_updates_filepath', type=str, required=False, default="",
+        help='Filepath to a custom updates object to serve.')
+    parser.add_argument('-access_log', '--access_log', required=False, action=argparse.BooleanOptionalAction, default=False,
+        help='Log each request to stderr.')
+    parser.add_argument('-watch_interval', '--watch_interval', type=float, required=False, default=0,
+        help='Seconds between polls of the updates file for changes to reload, disabled by default.')
+
+    #parse input args
+    args = parser.parse_args(argv)
+
+    serve(args.host, args.port, args.workers, Updates(custom_updates_filepath=args.custom_updates_filepath, response_cache=True), args.access_log, args.watch_interval)
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,7 @@
 import os
+import time
+import threading
+from contextlib import contextmanager
 from fake_useragent import UserAgent
 from selenium import webdriver
 
@@ -134,4 +137,193 @@ def create_driver(proxy: str=None) -> webdriver.Chrome:
                 pass
         raise RuntimeError(f"Failed to initialize WebDriver: {e}")
 
-    return driver
\ No newline at end of file
+    return driver
+
+#the Cloud Run scraper (iso3166_check_for_updates/get_all_iso3166_updates.py) has its own copy of the pool, as it is
+#deployed standalone without the export package, any changes to the pool must be kept in sync with that copy
+class DriverPool:
+    """
+    Thread-safe pool of Selenium Chromedriver instances, created via create_driver, so multiple
+    workers can load the countries' ISO pages concurrently, each on its own driver, rather than
+    sharing a single driver behind a lock. Drivers are started lazily, up to the pool's size, 
+    when a worker first needs one. Each driver is checked to be alive before it's handed out and
+    after any error, with crashed or unresponsive drivers quit and replaced by a new driver. 
+    Drivers are also recycled after loading a maximum number of pages or when the browser's 
+    memory usage grows too large, as long-running Chrome sessions leak memory.
+
+    Parameters
+    ==========
+    :size: int (default=1)
+        maximum number of drivers running concurrently.
+    :proxy: str (default=None)
+        proxy IP to use when creating the drivers.
+    :max_pages: int (default=50)
+        number of pages a driver loads before it's recycled, 0 to not recycle by number of pages.
+    :max_memory_mb: int (default=1024)
+        used JS heap size in megabytes of a driver's page above which it's recycled, 0 to not 
+        recycle by memory usage.
+    :driver_factory: callable (default=None)
+        function called with the proxy to create each driver, by default create_driver.
+
+    Usage
+    =====
+    with DriverPool(size=4) as pool:
+        with pool.driver() as driver:
+            get_updates_df_selenium("AD", driver)
+
+    Raises
+    ======
+    ValueError:
+        Invalid pool size or recycling thresholds.
+    """
+    def __init__(self, size: int=1, proxy: str=None, max_pages: int=50, max_memory_mb: int=1024, driver_factory=None) -> None:
+        #raise error if invalid pool size or recycling thresholds input
+        if (size < 1):
+            raise ValueError(f"Expected a driver pool size of at least 1, got {size}.")
+        if (max_pages < 0 or max_memory_mb < 0):
+            raise ValueError(f"Expected non-negative recycling thresholds, got {max_pages} pages and {max_memory_mb} MB.")
+        self.size = size
+        self.proxy = proxy
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self.driver_factory = driver_factory or create_driver
+
+        #idle drivers and their number of loaded pages, number of drivers running or being started 
+        self._idle = []
+        self._pages = {}
+        self._running = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+        #number of drivers created, recycled and replaced after crashing
+        self.created = 0
+        self.recycled = 0
+        self.replaced = 0
+
+    def acquire(self, timeout: float=None) -> webdriver.Chrome:
+        """
+        Get an idle, live driver from the pool, starting a new driver if none are idle and the
+        pool isn't full, otherwise waiting for a driver to be released. Raises a RuntimeError if
+        the pool is closed and a TimeoutError if no driver is available within the timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._condition:
+                while not (self._closed or self._idle or self._running < self.size):
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if (remaining is not None and remaining <= 0):
+                        raise TimeoutError(f"No driver available in the pool within {timeout} seconds.")
+                    self._condition.wait(remaining)
+                if (self._closed):
+                    raise RuntimeError("Driver pool is closed.")
+                driver = self._idle.pop() if self._idle else None
+                if (driver is None):
+                    self._running += 1
+
+            #start a new driver outside the lock, releasing its slot if it fails to start
+            if (driver is None):
+                try:
+                    driver = self.driver_factory(self.proxy)
+                except Exception:
+                    with self._condition:
+                        self._running -= 1
+                        self._condition.notify()
+                    raise
+                with self._condition:
+                    self.created += 1
+                    self._pages[driver] = 0
+                return driver
+
+            #replace idle drivers that have crashed since they were released
+            if (self.is_alive(driver)):
+                return driver
+            self._discard(driver)
+            with self._condition:
+                self.replaced += 1
+
+    def start(self, count: int=1) -> None:
+        """ Eagerly start drivers, up to the pool's size, e.g. to check drivers can be created before using the pool. """
+        drivers = [self.acquire() for _ in range(min(count, self.size))]
+        with self._condition:
+            self._idle.extend(drivers)
+            self._condition.notify_all()
+
+    def release(self, driver: webdriver.Chrome, failed: bool=False) -> None:
+        """
+        Return a driver to the pool after loading a page. The driver is quit rather than reused if
+        the pool is closed, if it has crashed after a failed page load, or if it has reached the 
+        maximum number of pages or memory usage, its replacement being started lazily.
+        """
+        with self._condition:
+            self._pages[driver] = self._pages.get(driver, 0) + 1
+            pages = self._pages[driver]
+            closed = self._closed
+
+        if (closed):
+            self._discard(driver)
+        elif (failed and not self.is_alive(driver)):
+            self._discard(driver)
+            with self._condition:
+                self.replaced += 1
+        elif ((self.max_pages and pages >= self.max_pages) or 
+              (self.max_memory_mb and self.memory_usage(driver) > self.max_memory_mb)):
+            self._discard(driver)
+            with self._condition:
+                self.recycled += 1
+        else:
+            with self._condition:
+                self._idle.append(driver)
+                self._condition.notify()
+
+    @contextmanager
+    def driver(self, timeout: float=None):
+        """ Context manager acquiring a driver from the pool and releasing it on exit. """
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        except BaseException:
+            self.release(driver, failed=True)
+            raise
+        self.release(driver)
+
+    @staticmethod
+    def is_alive(driver: webdriver.Chrome) -> bool:
+        """ Liveness check of a driver, whether its browser session responds to a script. """
+        try:
+            return driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    @staticmethod
+    def memory_usage(driver: webdriver.Chrome) -> float:
+        """ Used JS heap size in megabytes of a driver's current page, 0 if unavailable. """
+        try:
+            return float(driver.execute_script("return window.performance.memory ? window.performance.memory.usedJSHeapSize : 0") or 0) / 1048576
+        except Exception:
+            return 0
+
+    def _discard(self, driver: webdriver.Chrome) -> None:
+        """ Quit a driver and free its slot in the pool. """
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        with self._condition:
+            self._pages.pop(driver, None)
+            self._running -= 1
+            self._condition.notify()
+
+    def close(self) -> None:
+        """ Quit all idle drivers, drivers in use are quit when they're released. """
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for driver in idle:
+            self._discard(driver)
+
+    def __enter__(self) -> "DriverPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
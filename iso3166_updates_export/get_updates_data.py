@@ -15,7 +15,7 @@ from iso3166_updates_export.driver import *
 from iso3166_updates_export.parse_updates_data import *
 from iso3166_updates_export.utils import *
 
-def get_updates_df_wiki(alpha_code: str, proxy: str=None, verbose: bool=False) -> pd.DataFrame:
+def get_updates_df_wiki(alpha_code: str, proxy: str=None, verbose: bool=False, rate_limiter: HostRateLimiter=None) -> pd.DataFrame:
     """
     Pull all related ISO 3166 updates/changes for a given input country from the country's
     respective wiki page. Selenium is not a requirement for web scraping wiki pages. Convert
@@ -31,6 +31,9 @@ def get_updates_df_wiki(alpha_code: str, proxy: str=None, verbose: bool=False) -
         help the request stop getting blocked via 429 errors. By default no proxy is used.
     :verbose: bool (default=False)
         if True, display useful progress information throughout the function execution.
+    :rate_limiter: HostRateLimiter (default=None)
+        rate limiter of the requests to Wikipedia shared by concurrent workers. By default 
+        the function sleeps for 2 seconds before the request.
 
     Returns
     =======
@@ -89,7 +92,10 @@ def get_updates_df_wiki(alpha_code: str, proxy: str=None, verbose: bool=False) -
 
     #get html content from wiki of ISO 3166 page, raise exception if status code != 200, add proxies if using one
     try:
-        time.sleep(2)
+        if (rate_limiter is not None):
+            rate_limiter.wait(wiki_base_url + alpha2)
+        else:
+            time.sleep(2)
         if verbose:
             print(f"[Wiki] Fetching content from Wikipedia: {wiki_base_url + alpha2}")
         # response = session.get(wiki_base_url + alpha2, headers={"User-Agent": user_agent_header}, timeout=15)
@@ -178,7 +184,8 @@ def get_updates_df_wiki(alpha_code: str, proxy: str=None, verbose: bool=False) -
 
     return iso3166_df_wiki
 
-def get_updates_df_selenium(alpha_code: str, driver: webdriver=None, include_remarks_data: bool=True, verbose: bool=False) -> tuple:
+def get_updates_df_selenium(alpha_code: str, driver: webdriver=None, include_remarks_data: bool=True, verbose: bool=False, 
+                            rate_limiter: HostRateLimiter=None) -> tuple:
     """
     Parse the ISO table from the official ISO.org website for a given country code.
     
@@ -191,6 +198,9 @@ def get_updates_df_selenium(alpha_code: str, driver: webdriver=None, include_rem
         If provided, the driver will NOT be closed after use (caller is responsible for cleanup).
     :verbose: bool (default=True)
         If True, display progress information during execution.
+    :rate_limiter: HostRateLimiter (default=None)
+        rate limiter of the page loads from the ISO website shared by concurrent workers. 
+        By default pages are loaded without waiting.
     
     Returns
     =======
@@ -245,7 +255,9 @@ def get_updates_df_selenium(alpha_code: str, driver: webdriver=None, include_rem
         if verbose:
             print(f"[ISO] Navigating to: {iso_nav_url}")
 
-        # Navigate to the page (English locale)
+        # Navigate to the page (English locale), waiting for the host's rate limit if shared by concurrent workers
+        if rate_limiter is not None:
+            rate_limiter.wait(iso_nav_url)
         driver_instance.get(iso_nav_url)
 
         # Wait for complete page load
@@ -1,5 +1,6 @@
 import argparse
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Union
 from tqdm import tqdm
 from pycountry import countries
@@ -10,10 +11,13 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from iso3166_updates_export.utils import *
 from iso3166_updates_export.get_updates_data import *
+from iso3166_updates_export.driver import DriverPool
 
 def get_iso3166_updates(alpha_codes: str="", year: str="", export_filename: str="iso3166-updates", export_folder: str="iso3166-updates-output",
         alpha_codes_range: str="", concat_updates: bool=True, export_json: bool=True, export_csv: bool=True, export_xml: bool=False, verbose: bool=True, 
-        use_selenium: bool=True, use_wiki: bool=True, include_remarks_data: bool=True, save_each_iteration=False, use_proxy: bool=True) -> Dict[str, Union[List[Dict], pd.DataFrame]]:
+        use_selenium: bool=True, use_wiki: bool=True, include_remarks_data: bool=True, save_each_iteration=False, use_proxy: bool=True, 
+        export_manifest: bool=False, max_wiki_workers: int=4, max_iso_workers: int=1, request_interval: float=2.0, 
+        max_driver_pages: int=50, max_driver_memory_mb: int=1024) -> Dict[str, Union[List[Dict], pd.DataFrame]]:
     """
     Get all listed changes/updates to a country's ISO 3166-2 subdivision codes/names. The two data
     sources for the updates data are via the "Changes" section on its wiki page as well as any listed
@@ -39,6 +43,13 @@ def get_iso3166_updates(alpha_codes: str="", year: str="", export_filename: str=
     The earliest available changes are from the year 1996 and the latest changes are from the 
     current year.
 
+    The countries' wiki and ISO pages are fetched concurrently, by separate pools of workers with
+    their own concurrency limits, max_wiki_workers and max_iso_workers, each ISO worker using its
+    own Chromedriver instance from a pool of drivers that are health checked and recycled. Requests 
+    to each host are spaced by a shared rate limiter, so the data sources aren't overloaded. The 
+    fetched pages are parsed and merged in the order of the input alpha codes, so the output is 
+    identical to fetching the countries one at a time.
+
     The updates data from the wiki page and ISO website are converted to a DataFrame with the
     columns: Change, Description of Change, Date Issued, and Source. These are concatenated before 
     being exported to a CSV and or JSON for further analysis. You can also get the updates from a 
@@ -103,6 +114,22 @@ def get_iso3166_updates(alpha_codes: str="", year: str="", export_filename: str=
         if set to True then use a proxy IP when creating the Chromedriver via the create_driver
         module/function. This was implemented to help the Chromedriver stop getting blocked via 
         429 errors.
+    :export_manifest: bool (default=False)
+        export the manifest of each country's content digest, number of updates and byte span
+        alongside the exported JSON, used by the iso3166-updates software to only fetch the
+        updates of changed countries when checking for updates.
+    :max_wiki_workers: int (default=4)
+        maximum number of countries' wiki pages fetched concurrently.
+    :max_iso_workers: int (default=1)
+        maximum number of countries' ISO pages loaded concurrently, the size of the pool of 
+        Chromedriver instances used by the ISO workers.
+    :request_interval: float (default=2.0)
+        minimum number of seconds between the starts of consecutive requests to the same host.
+    :max_driver_pages: int (default=50)
+        number of ISO pages a Chromedriver instance loads before it's recycled, 0 to not recycle.
+    :max_driver_memory_mb: int (default=1024)
+        memory usage in megabytes of a Chromedriver instance's page above which it's recycled, 0 to
+        not recycle.
 
     Returns
     =======
@@ -114,6 +141,8 @@ def get_iso3166_updates(alpha_codes: str="", year: str="", export_filename: str=
     ======
     TypeError:
         Invalid data types for input parameters.
+    ValueError:
+        Invalid number of workers, request interval or driver recycling thresholds.
     """
     #print input parameters if verbose is True
     if (verbose):
@@ -135,6 +164,11 @@ def get_iso3166_updates(alpha_codes: str="", year: str="", export_filename: str=
         print(f"include_remarks_data: {include_remarks_data}")
         print(f"save_each_iteration: {save_each_iteration}")
         print(f"use_proxy: {use_proxy}")
+        print(f"max_wiki_workers: {max_wiki_workers}")
+        print(f"max_iso_workers: {max_iso_workers}")
+        print(f"request_interval: {request_interval}")
+        print(f"max_driver_pages: {max_driver_pages}")
+        print(f"max_driver_memory_mb: {max_driver_memory_mb}")
         print("="*80 + "\n")
     
     # Define flag function to generate country flag emoji from ISO 3166-1 alpha-2 code
@@ -154,6 +188,14 @@ def get_iso3166_updates(alpha_codes: str="", year: str="", export_filename: str=
     if not (isinstance(alpha_codes, str)):
       raise TypeError(f"Expected input alpha_codes parameter to be a string, got {type(alpha_codes)}.")
 
+    #raise error if invalid number of workers or request interval input
+    if (max_wiki_workers < 1 or max_iso_workers < 1):
+        raise ValueError(f"Expected at least 1 wiki and ISO worker, got {max_wiki_workers} and {max_iso_workers}.")
+    if (request_interval < 0):
+        raise ValueError(f"Expected a non-negative request interval, got {request_interval}.")
+    if (max_driver_pages < 0 or max_driver_memory_mb < 0):
+        raise ValueError(f"Expected non-negative driver recycling thresholds, got {max_driver_pages} and {max_driver_memory_mb}.")
+
     #keep track of original input alpha codes list 
     input_alpha_codes = alpha_codes
 
@@ -171,8 +213,8 @@ def get_iso3166_updates(alpha_codes: str="", year: str="", export_filename: str=
     #object to store all country updates/changes
     all_iso3166_updates = {}
     
-    #initialize driver to None (will be set if use_selenium is True and driver creation succeeds)
-    driver = None
+    #initialize driver pool to None (will be set if use_selenium is True and driver creation succeeds)
+    driver_pool = None
     
     #by default, set proxy to None
     proxy = None
@@ -186,10 +228,12 @@ def get_iso3166_updates(alpha_codes: str="", year: str="", export_filename: str=
         except Exception:
             proxy = None
 
-    #create webdriver instance if using Selenium, pass in proxy IP, if applicable
+    #create pool of webdriver instances if using Selenium, pass in proxy IP, if applicable, the first driver is started
+    #upfront to check Selenium is available, the rest are started lazily by the ISO workers
     if (use_selenium):
         try:
-            driver = create_driver(proxy)
+            driver_pool = DriverPool(max_iso_workers, proxy, max_driver_pages, max_driver_memory_mb, driver_factory=create_driver)
+            driver_pool.start()
         except Exception as e:
             #If driver creation fails (timeout, browser issue), fall back to wiki-only mode
             if verbose:
@@ -205,112 +249,139 @@ def get_iso3166_updates(alpha_codes: str="", year: str="", export_filename: str=
 
     #start elapsed time counter
     start = time.time()
-    
-    #initalise tqdm progress bar, if less than 5 alpha-2 codes input then don't display progress bar, or print elapsed time
-    progress_bar = tqdm(alpha_codes_list, ncols=80, disable=(len(alpha_codes_list) < 5))
-
-    #iterate over all input ISO 3166-1 country codes
-    for alpha2 in progress_bar:
-        flag_icon = flag(alpha2) if alpha2 != "XK" else "" #get flag icon from emoji-country-flag library
-        progress_bar.set_description(f"{countries.get(alpha_2=alpha2).name.title()} ({alpha2}) {flag_icon}")        
-
-        #initialise object of updates for current alpha-2 code
-        all_iso3166_updates[alpha2] = []
-        
-        #initialize remarks_data to empty dict (will be populated if Selenium is used successfully)
-        remarks_data = {}
-
-        #pull wiki and ISO data depending on respective parameter bools
-        if (use_wiki and use_selenium):
-
-            #web scrape country's wiki data, convert html table/2D array to dataframe
-            iso3166_df_wiki = get_updates_df_wiki(alpha2, verbose=verbose)
-
-            #use Selenium Chromedriver to parse country's updates data from official ISO website
-            if verbose:
-                print(f"[Main] Calling get_updates_df_selenium for {alpha2}...")
-            try:
-                iso_website_df, remarks_data = get_updates_df_selenium(alpha2, driver, include_remarks_data, verbose=verbose)
-                if verbose:
-                    print(f"[Main] get_updates_df_selenium returned DataFrame with shape {iso_website_df.shape}")
-                #concatenate two updates dataframes
-                iso3166_df = pd.concat([iso3166_df_wiki, iso_website_df], ignore_index=True, sort=False)
-            except Exception as e:
-                #Selenium failed (network error, timeout, etc.) - fall back to wiki data only
-                if verbose:
-                    print(f"[Main] Warning: Selenium failed for {alpha2}: {str(e)}")
-                    print(f"[Main] Falling back to wiki-only data for {alpha2}")
-                iso3166_df = iso3166_df_wiki
-
-
-        #pull just wiki data 
-        elif (use_wiki):
-
-            #web scrape country's wiki data, convert html table/2D array to dataframe
-            iso3166_df = get_updates_df_wiki(alpha2, verbose=verbose)
-
-        #pull just ISO page data 
-        elif (use_selenium):
-
-            #use Selenium Chromedriver to parse country's updates data from official ISO website
-            if verbose:
-                print(f"[Main] Calling get_updates_df_selenium for {alpha2}...")
-            try:
-                iso3166_df, remarks_data = get_updates_df_selenium(alpha2, driver, include_remarks_data, verbose=verbose)
-                if verbose:
-                    print(f"[Main] get_updates_df_selenium returned DataFrame with shape {iso3166_df.shape}")
-            except Exception as e:
-                #Selenium failed (network error, timeout, etc.) - use empty dataframe
-                if verbose:
-                    print(f"[Main] Warning: Selenium failed for {alpha2}: {str(e)}")
-                iso3166_df = pd.DataFrame()
-        
-        #raise error if both bools are set to False, no data being exported
-        else:
-            raise ValueError("No data exported as both bools are set to False, use_selenium & use_wiki = False.")
-        
-        #if updates dataframe is empty, skip to next iteration
-        if (iso3166_df.empty):
-            continue
-
-        #if year parameter input, filter in/out the relevant rows depending on year values
-        if (year and year != ['']):
-            iso3166_df = filter_year(iso3166_df, year, year_range, year_greater_than, year_less_than, year_not_equal)
-
-        #if updates dataframe is empty, skip to next iteration
-        if (iso3166_df.empty):
-            continue
-            
-        #drop any duplicate rows in object, e.g rows that have the same publication date and change/description of change attribute values
-        iso3166_df = remove_duplicates(iso3166_df)
 
-        #add remarks data from ISO country summary table, if applicable
-        if (use_selenium and include_remarks_data and remarks_data):
-          iso3166_df = add_remarks_data(iso3166_df, remarks_data)
+    #rate limiter of the requests to each host, shared by the wiki and ISO workers
+    rate_limiter = HostRateLimiter(request_interval)
 
-        #create a mask of rows where the "Change" column is empty
-        empty_change_mask = iso3166_df["Change"] == ""
+    def fetch_wiki(alpha2: str) -> pd.DataFrame:
+        """ Web scrape country's wiki data, convert html table/2D array to dataframe. """
+        return get_updates_df_wiki(alpha2, verbose=verbose, rate_limiter=rate_limiter)
 
-        #swap Change and Description of Change if Change is empty
-        iso3166_df.loc[empty_change_mask, "Change"] = iso3166_df["Description of Change"]
+    def fetch_iso(alpha2: str) -> tuple:
+        """ Use Selenium Chromedriver to parse country's updates data from official ISO website. """
+        if verbose:
+            print(f"[Main] Calling get_updates_df_selenium for {alpha2}...")
+        with driver_pool.driver() as driver:
+            return get_updates_df_selenium(alpha2, driver, include_remarks_data, verbose=verbose, rate_limiter=rate_limiter)
 
-        #for rows that have been swapped, set Description of Change to empty
-        iso3166_df.loc[empty_change_mask, "Description of Change"] = ""
+    #separate bounded pools of workers for each data source, all countries are scheduled upfront and their results 
+    #are consumed in the order of the input alpha codes, so the output is the same as a sequential export
+    wiki_executor = ThreadPoolExecutor(max_workers=max_wiki_workers, thread_name_prefix="wiki") if use_wiki else None
+    iso_executor = ThreadPoolExecutor(max_workers=max_iso_workers, thread_name_prefix="iso") if use_selenium else None
+    wiki_futures = {alpha2: wiki_executor.submit(fetch_wiki, alpha2) for alpha2 in alpha_codes_list} if use_wiki else {}
+    iso_futures = {alpha2: iso_executor.submit(fetch_iso, alpha2) for alpha2 in alpha_codes_list} if use_selenium else {}
 
-        #sort rows by publication date descending
-        iso3166_df = iso3166_df.assign(
-            SortDate=pd.to_datetime(iso3166_df['Date Issued'].str.extract(r'^(\d{4}-\d{2}-\d{2})')[0], errors='coerce')
-        ).sort_values(by='SortDate', ascending=False).drop(columns=['SortDate']).reset_index(drop=True)
+    #initalise tqdm progress bar, if less than 5 alpha-2 codes input then don't display progress bar, or print elapsed time
+    progress_bar = tqdm(alpha_codes_list, ncols=80, disable=(len(alpha_codes_list) < 5))
 
-        #add ISO updates to object of all ISO 3166 updates, convert to json
-        all_iso3166_updates[alpha2] = iso3166_df.to_dict(orient="records")
+    try:
+        #iterate over all input ISO 3166-1 country codes
+        for alpha2 in progress_bar:
+            flag_icon = flag(alpha2) if alpha2 != "XK" else "" #get flag icon from emoji-country-flag library
+            progress_bar.set_description(f"{countries.get(alpha_2=alpha2).name.title()} ({alpha2}) {flag_icon}")        
 
-        #save the updates data export at current iteration, useful in the case where the Selenium session might timeout
-        #only export JSON during iteration, full exports happen at the end
-        if (save_each_iteration):
-            export_updates(all_iso3166_updates, export_folder, export_filename, True, False, False, 
-                           concat_updates, alpha2, alpha_codes_range, year, year_range, year_greater_than, 
-                           year_less_than, year_not_equal)    
+            #initialise object of updates for current alpha-2 code
+            all_iso3166_updates[alpha2] = []
+            
+            #initialize remarks_data to empty dict (will be populated if Selenium is used successfully)
+            remarks_data = {}
+
+            #pull wiki and ISO data depending on respective parameter bools
+            if (use_wiki and use_selenium):
+
+                #country's wiki data dataframe
+                iso3166_df_wiki = wiki_futures[alpha2].result()
+
+                #country's updates data from official ISO website
+                try:
+                    iso_website_df, remarks_data = iso_futures[alpha2].result()
+                    if verbose:
+                        print(f"[Main] get_updates_df_selenium returned DataFrame with shape {iso_website_df.shape}")
+                    #concatenate two updates dataframes
+                    iso3166_df = pd.concat([iso3166_df_wiki, iso_website_df], ignore_index=True, sort=False)
+                except Exception as e:
+                    #Selenium failed (network error, timeout, etc.) - fall back to wiki data only
+                    if verbose:
+                        print(f"[Main] Warning: Selenium failed for {alpha2}: {str(e)}")
+                        print(f"[Main] Falling back to wiki-only data for {alpha2}")
+                    iso3166_df = iso3166_df_wiki
+
+            #pull just wiki data 
+            elif (use_wiki):
+
+                #country's wiki data dataframe
+                iso3166_df = wiki_futures[alpha2].result()
+
+            #pull just ISO page data 
+            elif (use_selenium):
+
+                #country's updates data from official ISO website
+                try:
+                    iso3166_df, remarks_data = iso_futures[alpha2].result()
+                    if verbose:
+                        print(f"[Main] get_updates_df_selenium returned DataFrame with shape {iso3166_df.shape}")
+                except Exception as e:
+                    #Selenium failed (network error, timeout, etc.) - use empty dataframe
+                    if verbose:
+                        print(f"[Main] Warning: Selenium failed for {alpha2}: {str(e)}")
+                    iso3166_df = pd.DataFrame()
+            
+            #raise error if both bools are set to False, no data being exported
+            else:
+                raise ValueError("No data exported as both bools are set to False, use_selenium & use_wiki = False.")
+            
+            #if updates dataframe is empty, skip to next iteration
+            if (iso3166_df.empty):
+                continue
+
+            #if year parameter input, filter in/out the relevant rows depending on year values
+            if (year and year != ['']):
+                iso3166_df = filter_year(iso3166_df, year, year_range, year_greater_than, year_less_than, year_not_equal)
+
+            #if updates dataframe is empty, skip to next iteration
+            if (iso3166_df.empty):
+                continue
+                
+            #drop any duplicate rows in object, e.g rows that have the same publication date and change/description of change attribute values
+            iso3166_df = remove_duplicates(iso3166_df)
+
+            #add remarks data from ISO country summary table, if applicable
+            if (use_selenium and include_remarks_data and remarks_data):
+              iso3166_df = add_remarks_data(iso3166_df, remarks_data)
+
+            #create a mask of rows where the "Change" column is empty
+            empty_change_mask = iso3166_df["Change"] == ""
+
+            #swap Change and Description of Change if Change is empty
+            iso3166_df.loc[empty_change_mask, "Change"] = iso3166_df["Description of Change"]
+
+            #for rows that have been swapped, set Description of Change to empty
+            iso3166_df.loc[empty_change_mask, "Description of Change"] = ""
+
+            #sort rows by publication date descending
+            iso3166_df = iso3166_df.assign(
+                SortDate=pd.to_datetime(iso3166_df['Date Issued'].str.extract(r'^(\d{4}-\d{2}-\d{2})')[0], errors='coerce')
+            ).sort_values(by='SortDate', ascending=False).drop(columns=['SortDate']).reset_index(drop=True)
+
+            #add ISO updates to object of all ISO 3166 updates, convert to json
+            all_iso3166_updates[alpha2] = iso3166_df.to_dict(orient="records")
+
+            #save the updates data export at current iteration, useful in the case where the Selenium session might timeout
+            #only export JSON during iteration, full exports happen at the end
+            if (save_each_iteration):
+                export_updates(all_iso3166_updates, export_folder, export_filename, True, False, False, 
+                               concat_updates, alpha2, alpha_codes_range, year, year_range, year_greater_than, 
+                               year_less_than, year_not_equal)    
+
+    #cancel the fetches of any remaining countries if the export fails, close all created Selenium drivers
+    finally:
+        for executor in (wiki_executor, iso_executor):
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+        if driver_pool is not None:
+            driver_pool.close()
+            if verbose:
+                print(f"[Main] Selenium drivers created: {driver_pool.created}, recycled: {driver_pool.recycled}, replaced: {driver_pool.replaced}")
 
     #end elapsed time counter and calculate
     end = time.time()
@@ -332,21 +403,13 @@ def get_iso3166_updates(alpha_codes: str="", year: str="", export_filename: str=
 
     #export all pulled ISO 3166 updates to JSON/CSV
     export_updates(all_iso3166_updates, export_folder, export_filename, export_json, export_csv, export_xml, concat_updates, alpha_codes_list, 
-        alpha_codes_range, year, year_range, year_greater_than, year_less_than, year_not_equal)
+        alpha_codes_range, year, year_range, year_greater_than, year_less_than, year_not_equal, export_manifest)
     #export_updates(all_iso3166_updates, **export_params)
 
     #print out elapsed time for export
     if (verbose):
         print(f"Total elapsed time for executing script: {round(elapsed/60, 2)} minutes.")
 
-    #close Selenium driver if it was created
-    if (use_selenium and driver is not None):
-        try:
-            driver.quit()
-        except Exception as e:
-            if verbose:
-                print(f"[Main] Warning: Error closing Selenium driver: {str(e)}")
-
     return all_iso3166_updates
 
 if __name__ == "__main__":
@@ -385,6 +448,18 @@ if __name__ == "__main__":
         help="Export the updates data per each individual country iteration, useful for if Selenium might timeout and export progress is lost.")
     parser.add_argument('-use_proxy', '--use_proxy', required=False, action=argparse.BooleanOptionalAction, default=False, 
         help="Use a proxy IP when exporting data from the 2 data sources to avoid requests getting rejected.")
+    parser.add_argument('-export_manifest', '--export_manifest', required=False, action=argparse.BooleanOptionalAction, default=False, 
+        help="Export the manifest of each country's digest, number of updates and byte span alongside the exported JSON.")
+    parser.add_argument('-max_wiki_workers', '--max_wiki_workers', type=int, required=False, default=4, 
+        help="Maximum number of countries' wiki pages fetched concurrently.")
+    parser.add_argument('-max_iso_workers', '--max_iso_workers', type=int, required=False, default=1, 
+        help="Maximum number of countries' ISO pages loaded concurrently, the size of the pool of Chromedriver instances.")
+    parser.add_argument('-request_interval', '--request_interval', type=float, required=False, default=2.0, 
+        help="Minimum number of seconds between the starts of consecutive requests to the same host.")
+    parser.add_argument('-max_driver_pages', '--max_driver_pages', type=int, required=False, default=50, 
+        help="Number of ISO pages a Chromedriver instance loads before it's recycled, 0 to not recycle.")
+    parser.add_argument('-max_driver_memory_mb', '--max_driver_memory_mb', type=int, required=False, default=1024, 
+        help="Memory usage in megabytes of a Chromedriver instance's page above which it's recycled, 0 to not recycle.")
 
     #parse input args
     args = parser.parse_args()
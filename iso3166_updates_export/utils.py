@@ -1,6 +1,10 @@
 import re
 import os 
 import json
+import hashlib
+import time
+import threading
+from urllib.parse import urlparse
 from itertools import product
 from datetime import datetime
 from pycountry import countries
@@ -806,7 +810,7 @@ def remove_extra_spacing(row: str):
 
 def export_updates(iso3166_updates_data: dict, export_folder: str="iso3166-updates-output", export_filename: str="iso3166-updates", 
     export_json: bool=True, export_csv: bool=False, export_xml: bool=False, concat_updates: bool=True, alpha_codes: list=[], alpha_codes_range: str="", year: list=[], 
-    year_range: bool=False, year_greater_than: bool=False, year_less_than: bool=False, year_not_equal: bool=False) -> None:
+    year_range: bool=False, year_greater_than: bool=False, year_less_than: bool=False, year_not_equal: bool=False, export_manifest_json: bool=False) -> None:
     """
     Export the exported ISO 3166 updates data to JSON, CSV or XML files in export folder. The various 
     input parameters are required for the naming of the exported files which differ depending on the 
@@ -859,6 +863,9 @@ def export_updates(iso3166_updates_data: dict, export_folder: str="iso3166-updat
     :year_not_equal: bool (default=False)
         set to True if not equal to  symbol is input into year parameter e.g "<>2020" etc.
         Function will remove all rows in Dataframe that have the input publication year.
+    :export_manifest_json: bool (default=False)
+        export the manifest of the concatenated JSON alongside it, listing the digest, number of
+        updates and byte span of each country's updates, via export_manifest.
 
     Returns
     =======
@@ -974,6 +981,10 @@ def export_updates(iso3166_updates_data: dict, export_folder: str="iso3166-updat
             with open(os.path.join(export_folder, export_filename_concat_updates + ".json"), "w") as write_file:
                 json.dump(iso3166_updates_data, write_file, indent=4, ensure_ascii=False)
             print(f"\nAll ISO 3166 updates exported to JSON: {os.path.join(export_folder, export_filename_concat_updates)}.json.")
+            #export manifest of per-country digests and byte spans alongside the JSON
+            if (export_manifest_json):
+                export_manifest(os.path.join(export_folder, export_filename_concat_updates + ".json"))
+                print(f"\nManifest of ISO 3166 updates exported to JSON: {os.path.join(export_folder, export_filename_concat_updates)}.manifest.json.")
         #export updates into the same CSV 
         if (export_csv and not all_empty):
             csv_iso3166_df.to_csv(os.path.join(export_folder, os.path.splitext(export_filename_concat_updates)[0] + ".csv"), index=False)
@@ -1676,4 +1687,130 @@ def export_to_csv_xml(input_json_path: str="", export_filename: str="") -> None:
 #     anomalies_df.to_csv(output_csv_path, index=False, encoding='utf-8')
 #     print(f"Anomaly detection complete. Results saved to: {output_csv_path}")
 
-#     return anomalies_df
\ No newline at end of file
+#     return anomalies_df
+def export_manifest(input_json_path: str="", manifest_path: str="", version: str="") -> dict:
+    """
+    Export the manifest of an exported updates JSON, published alongside it so the iso3166-updates
+    software can check for updates by fetching the manifest and then only the updates of the 
+    countries that changed. The manifest lists the content digest, number of updates and byte span
+    (offset and length) of each country's array of updates in the JSON, so a country's updates
+    can be fetched via an HTTP Range request. A country's digest is the blake2b-128 hash of its 
+    compact "code": [...] JSON object member, so is independent of the indentation of the JSON.
+
+    Parameters
+    ==========
+    :input_json_path: str (default="")
+        filepath to exported JSON.
+    :manifest_path: str (default="")
+        export filepath of the manifest. If no value input it will be the input JSON filepath 
+        with a .manifest.json extension, e.g. iso3166-updates.manifest.json.
+    :version: str (default="")
+        version of the dataset recorded in the manifest.
+
+    Returns
+    =======
+    :manifest: dict
+        exported manifest.
+
+    Raises
+    ======
+    OSError:
+        Filepath to JSON is invalid.
+    ValueError:
+        Error parsing JSON.
+    """
+    #raise error if invalid JSON object path
+    if not os.path.isfile(input_json_path):
+        raise OSError(f"Invalid filepath to JSON object: {input_json_path}.")
+
+    with open(input_json_path, "rb") as f:
+        raw = f.read()
+    text = raw.decode("utf-8")
+    decoder = json.JSONDecoder()
+    whitespace = re.compile(r"\s*")
+
+    #iterate over each "alpha-2": [...] pair in the top-level object, recording the byte span and digest of each array
+    countries_manifest = {}
+    last_char, last_byte = 0, 0
+    try:
+        pos = whitespace.match(text, 0).end()
+        if text[pos:pos + 1] != "{":
+            raise ValueError("expected an object keyed by country code")
+        pos = whitespace.match(text, pos + 1).end()
+        while text[pos:pos + 1] != "}":
+            alpha_code, pos = decoder.raw_decode(text, pos)
+            pos = whitespace.match(text, pos).end()
+            if text[pos:pos + 1] != ":":
+                raise ValueError(f"expected ':' after country code {alpha_code}")
+            start = whitespace.match(text, pos + 1).end()
+            updates, end = decoder.raw_decode(text, start)
+            offset = last_byte + len(text[last_char:start].encode("utf-8"))
+            length = len(text[start:end].encode("utf-8"))
+            last_char, last_byte = end, offset + length
+            countries_manifest[alpha_code] = {
+                "digest": hashlib.blake2b(json.dumps({alpha_code: updates})[1:-1].encode("utf-8"), digest_size=16).hexdigest(),
+                "count": len(updates),
+                "offset": offset,
+                "length": length,
+            }
+            pos = whitespace.match(text, end).end()
+            if text[pos:pos + 1] == ",":
+                pos = whitespace.match(text, pos + 1).end()
+    except (json.JSONDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid JSON: {e}.") from e
+
+    manifest = {"version": version, "algorithm": "blake2b-128", "filename": os.path.basename(input_json_path), 
+                "size": len(raw), "countries": countries_manifest}
+
+    #write manifest to file
+    if not (manifest_path):
+        manifest_path = os.path.splitext(input_json_path)[0] + ".manifest.json"
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=4)
+
+    return manifest
+
+class HostRateLimiter:
+    """
+    Thread-safe rate limiter of the requests made to each host by concurrent workers, spacing 
+    the start of consecutive requests to the same host by a minimum interval, whilst requests 
+    to different hosts aren't delayed by each other. Used by the export pipeline to fetch the 
+    Wikipedia and ISO OBP pages of multiple countries concurrently without getting rate limited 
+    by either source.
+
+    Parameters
+    ==========
+    :interval: float (default=2.0)
+        minimum number of seconds between the starts of consecutive requests to a host.
+    :host_intervals: dict (default=None)
+        minimum intervals of specific hosts, overriding the default interval, e.g. 
+        {"www.iso.org": 4.0}.
+
+    Usage
+    =====
+    rate_limiter = HostRateLimiter(2.0)
+    rate_limiter.wait("https://en.wikipedia.org/wiki/ISO_3166-2:AD")
+    """
+    def __init__(self, interval: float=2.0, host_intervals: dict=None) -> None:
+        #raise error if invalid interval input
+        if (interval < 0 or any(host_interval < 0 for host_interval in (host_intervals or {}).values())):
+            raise ValueError(f"Rate limiter intervals must be non-negative, got {interval} and {host_intervals}.")
+        self.interval = interval
+        self.host_intervals = dict(host_intervals or {})
+        self._next_request = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str) -> float:
+        """
+        Block until a request can be made to the host of the URL, reserving its slot so concurrent
+        workers are given consecutive slots in the order they called wait(). Returns the number of 
+        seconds waited.
+        """
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            now = time.monotonic()
+            request_time = max(now, self._next_request.get(host, now))
+            self._next_request[host] = request_time + self.host_intervals.get(host, self.interval)
+        if (request_time > now):
+            time.sleep(request_time - now)
+        return request_time - now
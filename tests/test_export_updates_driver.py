@@ -1,6 +1,8 @@
-from iso3166_updates_export.driver import create_driver
+from iso3166_updates_export.driver import create_driver, DriverPool
 from selenium.common.exceptions import WebDriverException
 from unittest.mock import MagicMock, patch
+import threading
+import time
 import unittest
 unittest.TestLoader.sortTestMethodsUsing = None
 
@@ -26,6 +28,8 @@ class ISO3166_Export_Updates_Driver_Tests(unittest.TestCase):
         testing driver session is properly closed.
     test_chrome_options_applied:
         testing chrome options are applied on Chromedriver initialisation. 
+    test_driver_pool:
+        testing pool of drivers, started lazily, health checked, recycled and replaced.
     """
     @patch("os.path.isfile")
     @patch("os.path.exists")
@@ -134,6 +138,77 @@ class ISO3166_Export_Updates_Driver_Tests(unittest.TestCase):
             for option in expected_options:
                 options_instance.add_argument.assert_any_call(option)
 
+    def test_driver_pool(self):
+        """ Testing pool of drivers is started lazily up to its size, recycles drivers and replaces crashed drivers. """
+        test_memory = {"mb": 10}
+        def test_driver(proxy=None):
+            driver = MagicMock()
+            driver.execute_script.side_effect = lambda script: test_memory["mb"] * 1048576 if "memory" in script else 1
+            return driver
+        mock_factory = MagicMock(side_effect=test_driver)
+#1.) drivers started lazily, idle drivers reused
+        test_pool = DriverPool(size=2, proxy="1.2.3.4", max_pages=3, max_memory_mb=100, driver_factory=mock_factory)
+        mock_factory.assert_not_called()
+        with test_pool.driver() as driver_1:
+            mock_factory.assert_called_once_with("1.2.3.4")
+        with test_pool.driver() as driver_2:
+            self.assertIs(driver_2, driver_1, "Expected idle driver to be reused.")
+        self.assertEqual(test_pool.created, 1, "Expected a single driver created.")
+#2.) at most size drivers run concurrently, workers wait for a driver to be released
+        test_active, test_max_active, test_lock = [0], [0], threading.Lock()
+        def test_worker():
+            with test_pool.driver():
+                with test_lock:
+                    test_active[0] += 1
+                    test_max_active[0] = max(test_max_active[0], test_active[0])
+                time.sleep(0.01)
+                with test_lock:
+                    test_active[0] -= 1
+        test_threads = [threading.Thread(target=test_worker) for _ in range(6)]
+        for thread in test_threads:
+            thread.start()
+        for thread in test_threads:
+            thread.join()
+        self.assertEqual(test_max_active[0], 2, "Expected at most 2 drivers in use concurrently.")
+        self.assertLessEqual(test_pool._running, 2, "Expected at most 2 drivers running.")
+        self.assertGreater(test_pool.recycled, 0, "Expected drivers recycled after their maximum number of pages.")
+        driver_1.quit.assert_called_once()
+        with self.assertRaises(TimeoutError):
+            test_held = [test_pool.acquire(), test_pool.acquire()]
+            test_pool.acquire(timeout=0.01)
+        for driver in test_held:
+            test_pool.release(driver)
+#3.) drivers recycled when memory usage exceeds maximum
+        test_recycled = test_pool.recycled
+        test_memory["mb"] = 200
+        with test_pool.driver() as driver_3:
+            pass
+        self.assertEqual(test_pool.recycled, test_recycled + 1, "Expected driver recycled after exceeding maximum memory.")
+        driver_3.quit.assert_called_once()
+        test_memory["mb"] = 10
+#4.) crashed drivers replaced, after failed page loads and when idle
+        with self.assertRaises(RuntimeError):
+            with test_pool.driver() as driver_4:
+                driver_4.execute_script.side_effect = RuntimeError("Chrome crashed.")
+                raise RuntimeError("Page load failed.")
+        self.assertEqual(test_pool.replaced, 1, "Expected crashed driver to be replaced.")
+        with test_pool.driver() as driver_5:
+            self.assertIsNot(driver_5, driver_4, "Expected crashed driver not to be reused.")
+        driver_5.execute_script.side_effect = RuntimeError("Chrome crashed.")
+        with test_pool.driver() as driver_6:
+            self.assertIsNot(driver_6, driver_5, "Expected crashed idle driver not to be reused.")
+        self.assertEqual(test_pool.replaced, 2, "Expected crashed idle driver to be replaced.")
+#5.) drivers quit on close
+        test_pool.close()
+        driver_6.quit.assert_called_once()
+        with self.assertRaises(RuntimeError):
+            test_pool.acquire()
+#6.)
+        with self.assertRaises(ValueError):
+            DriverPool(size=0)
+        with self.assertRaises(ValueError):
+            DriverPool(max_pages=-1)
+
 if __name__ == '__main__':
     #run all unit tests
     unittest.main(verbosity=2)
\ No newline at end of file
@@ -39,6 +39,9 @@ class ISO3166_Export_Updates_Main_Tests(unittest.TestCase):
     test_save_each_iteration:
         testing the main entry function for the full export updates pipeline,
         and the parameter that saves each export's data per iteration.
+    test_concurrent_export:
+        testing the main entry function fetching the countries concurrently, 
+        exporting the same data as a sequential export.
     """
     def setUp(self):
         """ Initialise test variables, import json. """
@@ -686,6 +689,53 @@ class ISO3166_Export_Updates_Main_Tests(unittest.TestCase):
         self.assertTrue(os.path.isfile(os.path.join(self.test_export_folder, self.test_export_filename + "_PG.json")), 
             f"Expected output JSON file to exist in folder: {os.path.join(self.test_export_folder, self.test_export_filename + '_PG.json')}.")
         
+    # @unittest.skip("")
+    @patch('iso3166_updates_export.main.create_driver')
+    @patch('iso3166_updates_export.main.get_updates_df_selenium')
+    @patch('iso3166_updates_export.main.get_updates_df_wiki')
+    def test_concurrent_export(self, mock_get_updates_df_wiki, mock_get_updates_df_selenium, mock_create_driver):
+        """ Testing concurrent export of countries produces the same data as a sequential export, using mocked data sources with random delays. """
+        import random, threading, time
+        test_alpha_codes = "AD,BA,CD,DE,FR,GB,JP,KW,PG,ZW"
+        test_drivers = []
+        def test_create_driver(proxy=None):
+            test_drivers.append(threading.get_ident())
+            return unittest.mock.MagicMock(**{"execute_script.return_value": 1})
+        def test_wiki(alpha2, verbose=False, rate_limiter=None):
+            time.sleep(random.uniform(0, 0.02))
+            return pd.DataFrame([{"Change": "", "Description of Change": f"Wiki change {i} to {alpha2}.", "Date Issued": f"20{10 + i}-01-01", "Source": "Wiki"} 
+                                 for i in range(3)])
+        def test_selenium(alpha2, driver, include_remarks_data=True, verbose=False, rate_limiter=None):
+            time.sleep(random.uniform(0, 0.02))
+            if (alpha2 == "KW"):
+                raise TimeoutError("Selenium timed out.")
+            return pd.DataFrame([{"Change": f"ISO change to {alpha2}.", "Description of Change": "", "Date Issued": "2015-06-01", "Source": "ISO"}]), {}
+        mock_create_driver.side_effect = test_create_driver
+        mock_get_updates_df_wiki.side_effect = test_wiki
+        mock_get_updates_df_selenium.side_effect = test_selenium
+#1.)
+        test_sequential_folder = os.path.join(self.test_export_folder, "sequential")
+        test_sequential_updates = get_iso3166_updates(alpha_codes=test_alpha_codes, export_folder=test_sequential_folder, verbose=0, 
+            save_each_iteration=False, max_wiki_workers=1, max_iso_workers=1, request_interval=0)
+        self.assertEqual(len(test_drivers), 1, "Expected a single driver for a single ISO worker.")
+        test_concurrent_folder = os.path.join(self.test_export_folder, "concurrent")
+        test_concurrent_updates = get_iso3166_updates(alpha_codes=test_alpha_codes, export_folder=test_concurrent_folder, verbose=0, 
+            save_each_iteration=False, max_wiki_workers=4, max_iso_workers=3, request_interval=0)
+        self.assertLessEqual(len(test_drivers), 4, "Expected at most one driver per ISO worker.")
+#2.) output is byte-identical to the sequential export, with the failed ISO fetch falling back to the wiki data
+        self.assertEqual(list(test_concurrent_updates), test_alpha_codes.split(","), "Expected countries in the order of the input alpha codes.")
+        self.assertEqual(test_concurrent_updates, test_sequential_updates, "Expected concurrent export to match sequential export.")
+        self.assertEqual(len(test_concurrent_updates["KW"]), 3, "Expected wiki-only updates for failed ISO fetch.")
+        self.assertEqual(len(test_concurrent_updates["AD"]), 4, "Expected wiki and ISO updates.")
+        with open(os.path.join(test_sequential_folder, f"iso3166-updates_{test_alpha_codes}.json"), "rb") as sequential_json, \
+             open(os.path.join(test_concurrent_folder, f"iso3166-updates_{test_alpha_codes}.json"), "rb") as concurrent_json:
+            self.assertEqual(concurrent_json.read(), sequential_json.read(), "Expected byte-identical JSON exports.")
+#3.)
+        with self.assertRaises(ValueError):
+            get_iso3166_updates(alpha_codes="AD", max_wiki_workers=0)
+        with self.assertRaises(ValueError):
+            get_iso3166_updates(alpha_codes="AD", request_interval=-1)
+
     def tearDown(self):
         """ Delete any exported test files/directories and clean up resources. """
         # Stop the patcher to properly close stdout mock
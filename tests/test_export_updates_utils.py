@@ -1,6 +1,7 @@
 from iso3166_updates_export.utils import *
 import json
 import re
+import hashlib
 from datetime import datetime
 import os 
 import shutil
@@ -50,6 +51,10 @@ class ISO3166_Export_Updates_Utils_Tests(unittest.TestCase):
         testing the functionality that removes duplicate objects from the dataframe export. 
     test_export_to_csv_xml:
         testing the functionality that just exports an input JSON into XML and CSV.
+    test_export_manifest:
+        testing the functionality that exports the manifest of each country's digest and byte span in a JSON.
+    test_host_rate_limiter:
+        testing the rate limiter that spaces the requests to each host across threads.
     """
     def setUp(self):
         """ Initialise test variables, import json. """
@@ -756,6 +761,75 @@ class ISO3166_Export_Updates_Utils_Tests(unittest.TestCase):
         self.assertTrue(os.path.isfile("test-iso3166-updates.csv"), "Expected output CSV file to be exported.")
         self.assertTrue(os.path.isfile("test-iso3166-updates.xml"), "Expected output XML file to be exported.")
 
+    # @unittest.skip("")
+    def test_export_manifest(self):
+        """ Testing export of the manifest of per-country digests, counts and byte spans of a JSON. """
+        test_json_path = os.path.join(self.test_export_folder, "test-iso3166-updates.json")
+        with open(test_json_path, "w", encoding="utf-8") as f:
+            json.dump({**self.iso3166_data, "XX": [{"Change": "Ñame change for testing.", "Description of Change": "", "Date Issued": "2025-01-01", "Source": ""}]}, 
+                      f, indent=4, ensure_ascii=False)
+        with open(test_json_path, "rb") as f:
+            test_json_bytes = f.read()
+#1.)
+        test_manifest = export_manifest(test_json_path, version="1.8.7")
+        self.assertTrue(os.path.isfile(os.path.join(self.test_export_folder, "test-iso3166-updates.manifest.json")), "Expected manifest to be exported alongside JSON.")
+        with open(os.path.join(self.test_export_folder, "test-iso3166-updates.manifest.json"), encoding="utf-8") as f:
+            self.assertEqual(json.load(f), test_manifest, "Expected exported manifest to match returned manifest.")
+        self.assertEqual((test_manifest["version"], test_manifest["algorithm"], test_manifest["filename"], test_manifest["size"]), 
+                         ("1.8.7", "blake2b-128", "test-iso3166-updates.json", len(test_json_bytes)), "Expected manifest version, algorithm, filename and size.")
+        self.assertEqual(list(test_manifest["countries"]), list(self.iso3166_data) + ["XX"], "Expected manifest entry for each country, in order.")
+#2.) byte spans delimit each country's updates, including non-ASCII updates, with digests of their compact JSON
+        for alpha_code, entry in test_manifest["countries"].items():
+            test_country_updates = json.loads(test_json_bytes[entry["offset"]:entry["offset"] + entry["length"]])
+            self.assertEqual(entry["count"], len(test_country_updates), f"Expected count of updates of {alpha_code}.")
+            self.assertEqual(entry["digest"], hashlib.blake2b(json.dumps({alpha_code: test_country_updates})[1:-1].encode("utf-8"), digest_size=16).hexdigest(), 
+                             f"Expected digest of updates of {alpha_code}.")
+#3.) digests are independent of the JSON's indentation
+        test_compact_json_path = os.path.join(self.test_export_folder, "test-iso3166-updates-compact.json")
+        with open(test_compact_json_path, "w", encoding="utf-8") as f:
+            f.write(test_json_bytes.decode("utf-8").replace("\n", "").replace("    ", ""))
+        test_compact_manifest = export_manifest(test_compact_json_path, os.path.join(self.test_export_folder, "compact.manifest.json"))
+        self.assertTrue(os.path.isfile(os.path.join(self.test_export_folder, "compact.manifest.json")), "Expected manifest to be exported to manifest path.")
+        self.assertEqual({code: entry["digest"] for code, entry in test_compact_manifest["countries"].items()}, 
+                         {code: entry["digest"] for code, entry in test_manifest["countries"].items()}, "Expected digests independent of indentation.")
+#4.)
+        with self.assertRaises(OSError):
+            export_manifest(os.path.join(self.test_export_folder, "invalid.json"))
+        with open(os.path.join(self.test_export_folder, "invalid.json"), "w", encoding="utf-8") as f:
+            f.write('["AD", []]')
+        with self.assertRaises(ValueError):
+            export_manifest(os.path.join(self.test_export_folder, "invalid.json"))
+
+    # @unittest.skip("")
+    def test_host_rate_limiter(self):
+        """ Testing rate limiter spacing the starts of the requests to each host, shared across threads. """
+        test_rate_limiter = HostRateLimiter(0.05, {"www.iso.org": 0.1})
+#1.) first request to each host isn't delayed
+        self.assertEqual(test_rate_limiter.wait("https://en.wikipedia.org/wiki/ISO_3166-2:AD"), 0, "Expected first request to host to not be delayed.")
+        self.assertEqual(test_rate_limiter.wait("https://www.iso.org/obp/ui#iso:code:3166:AD"), 0, "Expected first request to host to not be delayed.")
+#2.) concurrent requests to the same host are spaced by the host's interval
+        test_starts = []
+        def test_request(url):
+            test_rate_limiter.wait(url)
+            test_starts.append(time.monotonic())
+        test_threads = [threading.Thread(target=test_request, args=(f"https://www.iso.org/obp/ui#iso:code:3166:A{i}",)) for i in range(4)]
+        for thread in test_threads:
+            thread.start()
+        for thread in test_threads:
+            thread.join()
+        test_starts.sort()
+        for previous, current in zip(test_starts, test_starts[1:]):
+            self.assertGreaterEqual(current - previous, 0.09, "Expected requests to host to be spaced by its interval.")
+#3.) default interval used for other hosts
+        test_rate_limiter.wait("https://en.wikipedia.org/wiki/ISO_3166-2:AE")
+        self.assertGreater(test_rate_limiter.wait("https://en.wikipedia.org/wiki/ISO_3166-2:AF"), 0.04, "Expected consecutive requests to host to be delayed.")
+        self.assertEqual(HostRateLimiter(0).wait("https://en.wikipedia.org"), 0, "Expected no delay with zero interval.")
+#4.)
+        with self.assertRaises(ValueError):
+            HostRateLimiter(-1)
+        with self.assertRaises(ValueError):
+            HostRateLimiter(1, {"www.iso.org": -1})
+
     def tearDown(self):
         """ Delete test directory. """
         shutil.rmtree(self.test_export_folder)
\ No newline at end of file
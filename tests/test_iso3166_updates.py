@@ -5,6 +5,21 @@ from importlib.metadata import metadata
 from jsonschema import validate
 import jsonschema
 import shutil
+import re
+import copy
+import threading
+import hashlib
+import inspect
+import subprocess
+import time
+import sys
+import http.server
+import requests
+import iso3166_updates
+import gzip
+import zlib
+import csv
+import xml.etree.ElementTree as ET
 import json
 import os
 from datetime import date
@@ -58,6 +73,52 @@ class ISO3166_Updates_Tests(unittest.TestCase):
         testing correct functionality for last_updated property in class.
     test_change_type:
         testing correct functionality for change_type() method in class.
+    test_lazy_country_loading:
+        testing country updates data is read individually using the per-country offset index.
+    test_instance_isolation:
+        testing instances' shared updates data is read-only so can't be modified for other instances.
+    test_concurrent_reads_during_custom_updates:
+        testing readers see consistent dataset generations during concurrent custom updates.
+    test_async_updates_queries:
+        testing AsyncUpdates awaitable query methods using thread and process executors.
+    test_updates_search_parallel:
+        testing parallel search() sharded across a process pool in Updates class.
+    test_raw_output:
+        testing raw output mode returns shared references without Map wrapping or copies.
+    test_to_json_bytes:
+        testing to_json_bytes() output joined from pre-serialized fragments matches json.dumps.
+    test_etag:
+        testing etag() of country, year and date range queries from content hashes.
+    test_to_json_gzip:
+        testing to_json_gzip() output from cached compressed payloads decompresses to to_json_bytes().
+    test_country_name:
+        testing country_name() and country_names_to_alpha2() exact, accent-folded, alias and fuzzy matching.
+    test_custom_update_journal:
+        testing custom updates are journaled, replayed on load and compacted via compact().
+    test_custom_updates_batch:
+        testing batches, transactions and bulk imports of custom updates in class.
+    test_custom_update_overlay:
+        testing custom updates are journaled to named overlays over the shared base updates.
+    test_export:
+        testing correct functionality for streaming export() function in class.
+    test_reload_watch:
+        testing correct functionality for reload() and watch() functions in class.
+    test_check_for_updates_cache:
+        testing check_for_updates() caches fetched objects and revalidates them via conditional requests.
+    test_diff:
+        testing correct functionality for diff() function in class.
+    test_check_for_updates_manifest:
+        testing check_for_updates() only fetches the countries whose manifest digests changed.
+    test_delta:
+        testing correct functionality for create_delta() and apply_delta() functions in class.
+    test_from_version:
+        testing correct functionality for from_version() and from_versions() functions in class.
+    test_iso31663_indexes:
+        testing the reverse and range index lookups of the Iso31663 class.
+    test_timeline:
+        testing correct functionality for timeline() and timelines() functions in class.
+    test_async_check_for_updates:
+        testing AsyncUpdates.acheck_for_updates() fetches the remote objects natively via asyncio streams.
     """
     def setUp(self):
         """ Initialise test variables. """                
@@ -782,16 +843,19 @@ class ISO3166_Updates_Tests(unittest.TestCase):
                     self.assertLessEqual(datetime.strptime(corrected_date, "%Y-%m-%d").date(), date.today(), f"Expected no future publication dates, got: {corrected_date}.")
 
     # @unittest.skip("")
-    @patch('iso3166_updates.iso3166_updates.requests.get')
+    @patch('iso3166_updates.iso3166_updates.requests.Session.get')
     @patch('iso3166_updates.sys.stdout', new_callable=io.StringIO)
     def test_check_for_updates(self, mock_stdout, mock_get): 
         """ Testing functionality that pulls the latest object from repo and compares with object in current version of software. """
         #build a minimal fake response that matches the shape expected by check_for_updates()
         fake_json = {code: entries for code, entries in self.all_updates.all.items()}
         mock_response = unittest.mock.MagicMock()
-        mock_response.json.return_value = fake_json
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = json.dumps(fake_json).encode("utf-8")
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
+        self.all_updates.remote_cache_dir = os.path.join(self.test_export_folder, "cache")
 
         result = self.all_updates.check_for_updates()
         
@@ -1027,13 +1091,31 @@ class ISO3166_Updates_Tests(unittest.TestCase):
             "Expected 'US' to be accessible via AsyncUpdates.__contains__.")
         self.assertIsInstance(async_iso.all, dict,
             "Expected AsyncUpdates.all to return a dict.")
-#3.) async check_for_updates() returns the same structured dict
-        result = asyncio.run(async_iso.check_for_updates())
+        self.assertEqual(async_iso.year("2020-2022"), self.all_updates.year("2020-2022"),
+            "Expected synchronous AsyncUpdates.year() to match Updates.year().")
+        self.assertEqual(async_iso.search("canton", likeness_score=80), self.all_updates.search("canton", likeness_score=80),
+            "Expected synchronous AsyncUpdates.search() to match Updates.search().")
+        self.assertEqual(async_iso.date_range("2019-01-01", sort_by_date="dateDesc"), self.all_updates.date_range("2019-01-01", sort_by_date="dateDesc"),
+            "Expected synchronous AsyncUpdates.date_range() to match Updates.date_range().")
+        self.assertEqual(async_iso.change_type("deletion"), self.all_updates.change_type("deletion"),
+            "Expected synchronous AsyncUpdates.change_type() to match Updates.change_type().")
+        self.assertEqual(async_iso.stats(), self.all_updates.stats(),
+            "Expected synchronous AsyncUpdates.stats() to match Updates.stats().")
+        self.assertEqual(async_iso.country_name("Tajikistan"), self.all_updates.country_name("Tajikistan"),
+            "Expected synchronous AsyncUpdates.country_name() to match Updates.country_name().")
+        self.assertEqual(async_iso.to_json_bytes("FR"), self.all_updates.to_json_bytes("FR"),
+            "Expected synchronous AsyncUpdates.to_json_bytes() to match Updates.to_json_bytes().")
+#3.) async acheck_for_updates() returns the same structured dict
+        result = asyncio.run(async_iso.acheck_for_updates())
         self.assertIsInstance(result, dict,
-            f"Expected async check_for_updates() to return a dict, got {type(result)}.")
+            f"Expected async acheck_for_updates() to return a dict, got {type(result)}.")
         for key in ("updates_found", "total_updates", "total_countries", "updates"):
             self.assertIn(key, result,
-                f"Expected key '{key}' in async check_for_updates() result.")
+                f"Expected key '{key}' in async acheck_for_updates() result.")
+#4.) every awaitable method has the 'a' prefix, the unprefixed names are synchronous
+        for name in ("country_name", "country_names_to_alpha2", "to_json_bytes", "to_json_gzip", "export", "check_for_updates"):
+            self.assertFalse(inspect.iscoroutinefunction(getattr(AsyncUpdates, name)), f"Expected AsyncUpdates.{name}() to be synchronous.")
+            self.assertTrue(inspect.iscoroutinefunction(getattr(AsyncUpdates, "a" + name)), f"Expected AsyncUpdates.a{name}() to be awaitable.")
 
     # @unittest.skip("")
     def test_iso31663(self):
@@ -1068,6 +1150,1279 @@ class ISO3166_Updates_Tests(unittest.TestCase):
         with self.assertRaises((ValueError, KeyError)):
             _ = iso3[""]
 
+    # @unittest.skip("")
+    def test_iso31663_indexes(self):
+        """ Testing the reverse and range index lookups of the Iso31663 class. """
+        from iso3166_updates import Iso31663
+        iso3 = Iso31663()
+#1.) dataset is shared by instances without being copied
+        self.assertIs(Iso31663().all, iso3.all, "Expected ISO 3166-3 dataset to be shared by instances.")
+        self.assertIs(Iso31663(alpha4_code="DDDE").all["DDDE"], iso3.all["DDDE"], "Expected filtered entries to be shared.")
+#2.) current codes reverse lookup, in dataset order
+        self.assertEqual(list(iso3.current_code("DJ")), ["AIDJ"], "Expected AIDJ to be the entry of current code DJ.")
+        self.assertEqual(list(iso3.current_code("cz, SK")), ["CSHH"], "Expected CSHH to be the entry of current codes CZ and SK.")
+        self.assertEqual(list(iso3.current_code(["UM"])), ["JTUM", "MIUM", "PUUM", "WKUM"], "Expected the entries of current code UM.")
+        self.assertEqual(iso3.current_code("US"), {}, "Expected empty object for current code without formerly used codes.")
+        self.assertEqual(iso3.current_code("DJ").AIDJ.Name, "French Afars and Issas", "Expected Map output with dot notation.")
+        self.assertIs(iso3.current_code("DJ", raw=True)["AIDJ"], iso3.all["AIDJ"], "Expected raw output to share the entries.")
+#3.) former alpha-2 and alpha-3 reverse lookups
+        self.assertEqual(list(iso3.former_alpha2("AI")), ["AIDJ"], "Expected AIDJ to be the entry of former alpha-2 AI.")
+        self.assertEqual(list(iso3.former_alpha2("CS")), ["CSHH", "CSXX"], "Expected both entries of former alpha-2 CS.")
+        self.assertEqual(list(iso3.former_alpha3("AFI,DDR")), ["AIDJ", "DDDE"], "Expected the entries of former alpha-3 AFI and DDR.")
+        self.assertEqual(list(Iso31663(alpha4_code="CSXX").former_alpha2("CS")), ["CSXX"], "Expected lookups limited to a filtered instance.")
+#4.) withdrawal date range, in order of withdrawal date
+        test_withdrawn = iso3.withdrawal_date_range("1990", "2000")
+        self.assertEqual(list(test_withdrawn), ["YDYE", "DDDE", "BYAA", "SUHH", "NTHH", "CSHH", "FXFR", "ZRCD"], "Expected codes withdrawn between 1990 and 2000.")
+        for alpha4_code, entry in iso3.all.items():
+            self.assertEqual(alpha4_code in test_withdrawn, "1990" <= entry["Withdrawal_Date"][:4] <= "2000", f"Expected {alpha4_code} to be matched by its withdrawal year.")
+        self.assertEqual(list(iso3.withdrawal_date_range("1990-10-03", "1990-10-03")), ["DDDE"], "Expected code withdrawn on a single date.")
+        self.assertEqual(list(iso3.withdrawal_date_range("2006")), ["CSXX", "ANHH"], "Expected codes withdrawn since 2006.")
+        self.assertEqual(len(iso3.withdrawal_date_range()), len(iso3), "Expected all codes for an unbounded range.")
+#5.) invalid inputs raise errors
+        with self.assertRaises(ValueError):
+            iso3.current_code("DJI")
+        with self.assertRaises(ValueError):
+            iso3.former_alpha3("AI")
+        with self.assertRaises(TypeError):
+            iso3.former_alpha2(123)
+        with self.assertRaises(ValueError):
+            iso3.withdrawal_date_range("1990/01/01")
+        with self.assertRaises(ValueError):
+            iso3.withdrawal_date_range("2001", "2000")
+        with self.assertRaises(TypeError):
+            iso3.withdrawal_date_range(1990)
+
+    # @unittest.skip("")
+    def test_timeline(self):
+        """ Testing the joined timeline of a country's ISO 3166-3 predecessors and its updates. """
+#1.) predecessors of Serbia, followed by its updates, in date order
+        test_timeline = self.all_updates.timeline("RS")
+        self.assertEqual([(event.Type, event.Code) for event in test_timeline[:2]], [("Withdrawal", "YUCS"), ("Withdrawal", "CSXX")], 
+                         "Expected YUCS and CSXX to precede the updates of RS.")
+        self.assertEqual(test_timeline[0].Name, Iso31663()["YUCS"].Name, "Expected ISO 3166-3 entry attributes in the event.")
+        self.assertEqual([{key: value for key, value in event.items() if key not in ("Date", "Type", "Code")} for event in test_timeline[2:]], 
+                         sorted(self.all_updates.all["RS"], key=lambda update: update["Date Issued"]), "Expected the updates of RS after its predecessors.")
+        self.assertEqual([event.Date for event in test_timeline], sorted(event.Date for event in test_timeline), "Expected events in date order.")
+#2.) alpha-3, numeric and former codes resolve to the current country
+        for test_code in ("SRB", "688", "rs"):
+            self.assertEqual(self.all_updates.timeline(test_code), test_timeline, f"Expected {test_code} to resolve to RS.")
+        for test_code in ("DDDE", "DD", "DDR"):
+            self.assertEqual(self.all_updates.timeline(test_code), self.all_updates.timeline("DE"), f"Expected former code {test_code} to resolve to DE.")
+        self.assertEqual(self.all_updates.timeline("DE")[0].Code, "DDDE", "Expected DDDE to precede the updates of DE.")
+        self.assertEqual([event.Code for event in self.all_updates.timeline("FR") if event.Type == "Withdrawal"], ["FXFR"], "Expected FXFR to be the only predecessor of FR.")
+#3.) bulk timelines resolve former codes to all their successors, cached per country
+        self.assertEqual(list(self.all_updates.timelines("YUCS")), ["ME", "RS"], "Expected YUCS to resolve to ME and RS.")
+        self.assertEqual(list(self.all_updates.timelines(["CS", "DE"])), ["CZ", "DE", "ME", "RS", "SK"], "Expected CS to resolve to CZ, SK, ME and RS.")
+        self.assertEqual(list(self.all_updates.timelines()), sorted(self.all_updates.all), "Expected the timelines of all countries.")
+        self.assertIs(self.all_updates.timeline("RS", raw=True)[0], self.all_updates.timelines("RS", raw=True)["RS"][0], "Expected timeline events to be cached.")
+#4.) timeline is rebuilt when the country's updates change
+        test_updates_filepath = os.path.join(self.test_export_folder, "timeline-iso3166-updates.json")
+        shutil.copyfile(os.path.join("tests", "test-iso3166-updates.json"), test_updates_filepath)
+        test_updates = Updates(custom_updates_filepath=test_updates_filepath)
+        test_length = len(test_updates.timeline("RS"))
+        test_updates.custom_update("RS", change="New RS change.", date_issued="2099-01-01")
+        self.assertEqual(len(test_updates.timeline("RS")), test_length + 1, "Expected timeline to include the custom update.")
+        self.assertEqual(test_updates.timeline("RS")[-1].Change, "New RS change.", "Expected custom update to be the latest event.")
+#5.) invalid inputs raise errors
+        with self.assertRaises(ValueError):
+            self.all_updates.timeline("YUCS")
+        with self.assertRaises(ValueError):
+            self.all_updates.timeline("XXXX")
+        with self.assertRaises(TypeError):
+            self.all_updates.timeline(123)
+        with self.assertRaises(TypeError):
+            self.all_updates.timelines(123)
+        with self.assertRaises(ValueError):
+            Updates(country_code="FR", custom_updates_filepath=os.path.join("tests", "test-iso3166-updates.json")).timeline("RS")
+
+    # @unittest.skip("")
+    def test_lazy_country_loading(self):
+        """ Testing country updates data is read individually from the updates file using the per-country offset index. """
+        test_updates_filepath = os.path.join(self.test_export_folder, "lazy-iso3166-updates.json")
+        shutil.copyfile(os.path.join("tests", "test-iso3166-updates.json"), test_updates_filepath)
+        with open(test_updates_filepath, encoding="utf-8") as f:
+            test_updates_json = json.load(f)
+#1.) scoped instance only loads the requested countries, sidecar index created alongside updates file
+        iso_ie = Updates(country_code="IE,FRA", custom_updates_filepath=test_updates_filepath)
+        self.assertEqual(list(iso_ie.all), ["IE", "FR"], f"Expected only IE and FR to be loaded, got {list(iso_ie.all)}.")
+        self.assertEqual(iso_ie.all["IE"], test_updates_json["IE"], "Expected IE updates to match those in the updates file.")
+        self.assertEqual(iso_ie.all["FR"], test_updates_json["FR"], "Expected FR updates to match those in the updates file.")
+        self.assertTrue(os.path.isfile(os.path.join(self.test_export_folder, "lazy-iso3166-updates.index.json")), "Expected sidecar index file to be created.")
+#2.) unscoped instance loads countries individually on first access
+        iso_lazy = Updates(custom_updates_filepath=test_updates_filepath)
+        self.assertIsNone(iso_lazy._generation, "Expected full dataset not to be loaded on instantiation.")
+        self.assertEqual(iso_lazy._lazy_updates, {}, "Expected no countries to be loaded on instantiation.")
+        self.assertEqual(iso_lazy["BA"]["BA"], test_updates_json["BA"], "Expected BA updates to match those in the updates file.")
+        self.assertEqual(list(iso_lazy._lazy_updates), ["BA"], f"Expected only BA to be loaded, got {list(iso_lazy._lazy_updates)}.")
+        self.assertIn("ZW", iso_lazy, "Expected ZW to be in updates object without loading it.")
+        self.assertEqual(list(iso_lazy._lazy_updates), ["BA"], f"Expected only BA to be loaded, got {list(iso_lazy._lazy_updates)}.")
+#3.) full dataset loaded in file order on access of all attribute
+        self.assertEqual(iso_lazy.all, test_updates_json, "Expected all attribute to match the updates file.")
+        self.assertEqual(list(iso_lazy.all), list(test_updates_json), "Expected countries to be in the same order as the updates file.")
+#4.) stale sidecar index is rebuilt if the updates file changes
+        test_updates_json["AD"].append({"Change": "New AD change.", "Description of Change": "", "Date Issued": "2025-01-01", "Source": ""})
+        with open(test_updates_filepath, "w", encoding="utf-8") as f:
+            json.dump(test_updates_json, f, ensure_ascii=False, indent=4)
+        iso_stale = Updates(country_code="AD,ZW", custom_updates_filepath=test_updates_filepath)
+        self.assertEqual(iso_stale.all["AD"], test_updates_json["AD"], "Expected AD updates to match the changed updates file.")
+        self.assertEqual(iso_stale.all["ZW"], test_updates_json["ZW"], "Expected ZW updates to match the changed updates file.")
+
+    # @unittest.skip("")
+    def test_instance_isolation(self):
+        """ Testing an instance's shared updates data is read-only, so it can't be modified for other existing or new instances using the same updates file. """
+        test_updates_filepath = os.path.join(self.test_export_folder, "isolation-iso3166-updates.json")
+        shutil.copyfile(os.path.join("tests", "test-iso3166-updates.json"), test_updates_filepath)
+        test_update = {"Change": "New IE change.", "Description of Change": "", "Date Issued": "2025-01-01", "Source": ""}
+        iso_1 = Updates(custom_updates_filepath=test_updates_filepath)
+        iso_2 = Updates(custom_updates_filepath=test_updates_filepath)
+        test_ie_total = len(iso_2.all["IE"])
+#1.) appending to and modifying a fully loaded instance's updates
+        self.assertIs(iso_1.all["IE"], iso_2.all["IE"], "Expected instances to share the cached IE updates.")
+        with self.assertRaises(TypeError):
+            iso_1.all["IE"].append(test_update)
+        with self.assertRaises(TypeError):
+            iso_1.all["IE"] += [test_update]
+        with self.assertRaises(TypeError):
+            iso_1.all["FR"][0]["Change"] = "Modified FR change."
+        with self.assertRaises(TypeError):
+            iso_1.all["FR"].sort(key=lambda update: update["Date Issued"])
+        self.assertEqual(len(iso_2.all["IE"]), test_ie_total, "Expected existing instance's IE updates to be unchanged.")
+        self.assertNotEqual(iso_2.all["FR"][0]["Change"], "Modified FR change.", "Expected existing instance's FR update to be unchanged.")
+        iso_3 = Updates(custom_updates_filepath=test_updates_filepath)
+        self.assertEqual(len(iso_3.all["IE"]), test_ie_total, "Expected new instance's IE updates to be unchanged.")
+        self.assertEqual(len(Updates(country_code="IE", custom_updates_filepath=test_updates_filepath)["IE"]["IE"]), test_ie_total, 
+                         "Expected new scoped instance's IE updates to be unchanged.")
+#2.) modifying journaled custom updates of a lazily loaded instance
+        iso_1.custom_update("IE", change="Journaled IE change.", date_issued="2025-02-01")
+        iso_4 = Updates(custom_updates_filepath=test_updates_filepath)
+        iso_5 = Updates(custom_updates_filepath=test_updates_filepath)
+        iso_4["IE"]["IE"]
+        with self.assertRaises(TypeError):
+            iso_4._lazy_updates["IE"][-1]["Change"] = "Modified journaled IE change."
+        self.assertIn("Journaled IE change.", [update["Change"] for update in iso_5.all["IE"]], "Expected other instance's journaled update to be unchanged.")
+
+    # @unittest.skip("")
+    def test_concurrent_reads_during_custom_updates(self):
+        """ Testing readers always see a complete dataset generation whilst custom updates are concurrently added and deleted. """
+        import threading
+        test_updates_filepath = os.path.join(self.test_export_folder, "concurrent-iso3166-updates.json")
+        shutil.copyfile(os.path.join("tests", "test-iso3166-updates.json"), test_updates_filepath)
+        iso = Updates(custom_updates_filepath=test_updates_filepath)
+        base_jp_updates = list(iso.all["JP"])
+        custom_update_jp = {"Change": "Concurrent change for Japan.", "Description of Change": "", "Date Issued": "2025-01-01", "Source": ""}
+        errors = []
+        writer_done = threading.Event()
+
+        #writer repeatedly adds and deletes a custom update for JP
+        def writer():
+            try:
+                for _ in range(10):
+                    iso.custom_update("JP", custom_update_object=dict(custom_update_jp), save_new=True, save_new_filename=self.custom_updates_filepath)
+                    iso.custom_update("JP", custom_update_object=dict(custom_update_jp), delete=True, save_new=True, save_new_filename=self.custom_updates_filepath)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                writer_done.set()
+
+        #readers check each snapshot has either all or none of the custom update
+        def reader():
+            try:
+                while not writer_done.is_set():
+                    snapshot = iso.all
+                    jp_updates = snapshot["JP"]
+                    if jp_updates != base_jp_updates and jp_updates != base_jp_updates + [custom_update_jp]:
+                        errors.append(AssertionError(f"Inconsistent JP updates observed: {jp_updates}."))
+                    self.assertEqual(sum(1 for _ in snapshot.values()), 250)
+                    iso.year("2025")
+                    iso["JP,FR"]
+                    iso.date_range("2024-12-01,2025-02-01")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=reader) for _ in range(4)] + [threading.Thread(target=writer)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+#1.) no errors raised and no partial writes observed by readers
+        self.assertEqual(errors, [], f"Expected no errors during concurrent reads and writes, got {errors}.")
+#2.) dataset back to its original state, with a new generation published for each write
+        self.assertEqual(iso.all["JP"], base_jp_updates, "Expected JP updates to be back to their original state.")
+        self.assertEqual(iso._generation.number, 20, f"Expected 20 dataset generations to be published, got {iso._generation.number}.")
+
+    # @unittest.skip("")
+    @patch('iso3166_updates.sys.stdout', new_callable=io.StringIO)
+    def test_async_updates_queries(self, mock_stdout):
+        """ Testing AsyncUpdates query methods are awaitable and return the same output as the Updates class, using thread and process executors. """
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+        from iso3166_updates import AsyncUpdates
+        test_updates_filepath = os.path.join("tests", "test-iso3166-updates.json")
+
+        async def run_queries(async_iso):
+            return [await async_iso.asearch("canton, 2014-11-03", likeness_score=70),
+                    await async_iso.asearch("canton", likeness_score=80, include_match_score=False),
+                    await async_iso.asearch("zzzzzzzz"),
+                    await async_iso.ayear("2020-2022"),
+                    await async_iso.adate_range("2019-01-01", sort_by_date="dateDesc"),
+                    await async_iso.achange_type("deletion"),
+                    await async_iso.astats(),
+                    await async_iso.acountry_name("Tajikstan, Irland", likeness_score=80),
+                    await async_iso.acountry_names_to_alpha2(["Viet Nam", "Ivory Coast", "Narnia"]),
+                    await async_iso.ato_json_bytes("FR,DE"),
+                    gzip.decompress(await async_iso.ato_json_gzip(year="2023"))]
+
+        expected_outputs = [self.all_updates.search("canton, 2014-11-03", likeness_score=70),
+                            self.all_updates.search("canton", likeness_score=80, include_match_score=False),
+                            self.all_updates.search("zzzzzzzz"),
+                            self.all_updates.year("2020-2022"),
+                            self.all_updates.date_range("2019-01-01", sort_by_date="dateDesc"),
+                            self.all_updates.change_type("deletion"),
+                            self.all_updates.stats(),
+                            self.all_updates.country_name("Tajikstan, Irland", likeness_score=80),
+                            self.all_updates.country_names_to_alpha2(["Viet Nam", "Ivory Coast", "Narnia"]),
+                            self.all_updates.to_json_bytes("FR,DE"),
+                            self.all_updates.to_json_bytes(year="2023")]
+#1.) thread and process executors, search scanned in small chunks
+        for executor in ("thread", "process"):
+            async_iso = AsyncUpdates(custom_updates_filepath=test_updates_filepath, executor=executor, max_concurrency=2, chunk_size=7)
+            try:
+                self.assertEqual(asyncio.run(run_queries(async_iso)), expected_outputs, 
+                    f"Expected AsyncUpdates query outputs to match Updates outputs using {executor} executor.")
+#2.) queries reflect custom updates, process pool restarted with new dataset generation
+                async_iso.custom_update("JP", change="Async custom change for JP.", date_issued="2025-01-01", save_new=True, save_new_filename=self.custom_updates_filepath)
+                search_results = asyncio.run(async_iso.asearch("Async custom change for JP.", include_match_score=False))
+                self.assertEqual(list(search_results), ["JP"], f"Expected custom update for JP to be found, got {search_results}.")
+            finally:
+                async_iso.close()
+#3.) existing executor instance
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            async_iso = AsyncUpdates(custom_updates_filepath=test_updates_filepath, executor=executor)
+            self.assertEqual(asyncio.run(run_queries(async_iso)), expected_outputs, 
+                "Expected AsyncUpdates query outputs to match Updates outputs using existing executor.")
+#4.) invalid executor, concurrency and chunk size parameters
+        with self.assertRaises(ValueError):
+            AsyncUpdates(executor="invalid_executor")
+        with self.assertRaises(TypeError):
+            AsyncUpdates(executor=123)
+        with self.assertRaises(ValueError):
+            AsyncUpdates(max_concurrency=0)
+        with self.assertRaises(ValueError):
+            AsyncUpdates(chunk_size=0)
+
+    # @unittest.skip("")
+    @patch('iso3166_updates.sys.stdout', new_callable=io.StringIO)
+    def test_updates_search_parallel(self, mock_stdout):
+        """ Testing parallel search sharded across a process pool returns the same output as the single-process search. """
+        test_search_inputs = [("canton, 2014-11-03", 70, True), ("canton", 80, False), ("addition, deletion", 100, True), ("zzzzzzzz", 100, True)]
+        try:
+#1.) parallel search output matches single-process search, using 2 and 3 worker processes
+            for processes in (2, 3):
+                for search_term, likeness_score, include_match_score in test_search_inputs:
+                    self.assertEqual(self.all_updates.search(search_term, likeness_score, include_match_score, parallel=processes),
+                        self.all_updates.search(search_term, likeness_score, include_match_score),
+                        f"Expected parallel search output for {search_term} to match single-process search using {processes} processes.")
+#2.) persistent pool reused between searches, restarted after a custom update
+            executor = self.all_updates._process_pool.get_executor()[0]
+            self.all_updates.search("canton", parallel=3)
+            self.assertIs(self.all_updates._process_pool.get_executor()[0], executor, "Expected process pool to be reused between searches.")
+            self.all_updates.custom_update("JP", change="Parallel custom change for JP.", date_issued="2025-01-01", save_new=True, save_new_filename=self.custom_updates_filepath)
+            search_results = self.all_updates.search("Parallel custom change for JP.", include_match_score=False, parallel=3)
+            self.assertEqual(list(search_results), ["JP"], f"Expected custom update for JP to be found by parallel search, got {search_results}.")
+#3.) invalid number of processes
+            with self.assertRaises(ValueError):
+                self.all_updates.search("canton", parallel=-1)
+        finally:
+            self.all_updates.close()
+        self.assertIsNone(self.all_updates._process_pool, "Expected process pool to be shutdown.")
+#4.) process pool shutdown on exiting the instance's context manager, or as soon as an unclosed instance is released, without waiting for the cyclic garbage collector
+        with Updates(custom_updates_filepath=os.path.join("tests", "test-iso3166-updates.json")) as test_updates:
+            test_updates.search("canton", parallel=2)
+            test_processes = list(test_updates._process_pool.get_executor()[0]._processes.values())
+        self.assertIsNone(test_updates._process_pool, "Expected process pool to be shutdown on exiting context manager.")
+        test_updates = Updates(custom_updates_filepath=os.path.join("tests", "test-iso3166-updates.json"))
+        test_updates.search("canton", parallel=2)
+        test_processes += list(test_updates._process_pool.get_executor()[0]._processes.values())
+        del test_updates
+        for process in test_processes:
+            process.join(timeout=30)
+        self.assertFalse(any(process.is_alive() for process in test_processes), "Expected worker processes to exit once the pool is shutdown.")
+
+    # @unittest.skip("")
+    @patch('iso3166_updates.sys.stdout', new_callable=io.StringIO)
+    def test_raw_output(self, mock_stdout):
+        """ Testing raw output mode returns shared references to the dataset, equal to the default outputs. """
+        all_updates = self.all_updates.all
+#1.) alpha/subscript - raw returns plain dicts of the dataset's own lists
+        test_alpha_raw = self.all_updates.alpha("FR,DEU,356", raw=True)
+        self.assertNotIsInstance(test_alpha_raw, Map, "Expected raw alpha output to not be wrapped in Map.")
+        self.assertEqual(list(test_alpha_raw), ["DE", "FR", "IN"], f"Expected raw alpha output keys to be DE, FR, IN, got {list(test_alpha_raw)}.")
+        for code in test_alpha_raw:
+            self.assertIs(test_alpha_raw[code], all_updates[code], f"Expected raw alpha output for {code} to be the dataset's list of updates.")
+        self.assertEqual(test_alpha_raw, self.all_updates["FR,DEU,356"], "Expected raw alpha output to equal the subscript output.")
+#2.) year and change_type - raw returns plain dicts sharing the dataset's updates
+        for test_raw, test_default in ((self.all_updates.year("2014,2016", raw=True), self.all_updates.year("2014,2016")),
+                                       (self.all_updates.change_type("correction", raw=True), self.all_updates.change_type("correction"))):
+            self.assertNotIsInstance(test_raw, Map, "Expected raw output to not be wrapped in Map.")
+            self.assertEqual(test_raw, test_default, "Expected raw output to equal the default output.")
+            for code, updates in test_raw.items():
+                self.assertTrue(all(any(update is u for u in all_updates[code]) for update in updates), f"Expected raw updates for {code} to be shared references.")
+#3.) date_range sorted - raw returns (code, update) tuples in the same order as the default output
+        for sort_by_date in ("dateAsc", "dateDesc"):
+            test_date_range_raw = self.all_updates.date_range("2016-01-01,2019-12-31", sort_by_date=sort_by_date, raw=True)
+            test_date_range = self.all_updates.date_range("2016-01-01,2019-12-31", sort_by_date=sort_by_date)
+            self.assertEqual([{"Country Code": code, **update} for code, update in test_date_range_raw], test_date_range, 
+                f"Expected raw sorted date range output to match the default output when sorted {sort_by_date}.")
+            self.assertTrue(all(any(update is u for u in all_updates[code]) for code, update in test_date_range_raw), "Expected raw date range updates to be shared references.")
+            self.assertTrue(all("sortable_date" not in update for code, update in test_date_range_raw), "Expected no temporary sort attribute in dataset updates.")
+#4.) search - raw returns (code, update, score) tuples, or a dict of shared references without match scores
+        test_search_raw = self.all_updates.search("canton, 2014-11-03", likeness_score=70, raw=True)
+        self.assertEqual([{"Country Code": code, **update, "Match Score": score} for code, update, score in test_search_raw], 
+            self.all_updates.search("canton, 2014-11-03", likeness_score=70), "Expected raw search output to match the default output.")
+        self.assertTrue(all(any(update is u for u in all_updates[code]) for code, update, _ in test_search_raw), "Expected raw search updates to be shared references.")
+        test_search_raw = self.all_updates.search("canton", likeness_score=80, include_match_score=False, raw=True)
+        self.assertEqual(test_search_raw, self.all_updates.search("canton", likeness_score=80, include_match_score=False), 
+            "Expected raw search output without match score to match the default output.")
+        self.assertTrue(all(any(update is u for u in all_updates[code]) for code, updates in test_search_raw.items() for update in updates), "Expected raw search updates to be shared references.")
+        self.assertEqual(self.all_updates.search("zzzzzzzz", raw=True), [], "Expected no raw search results for an unmatched search term.")
+
+    # @unittest.skip("")
+    def test_to_json_bytes(self):
+        """ Testing JSON bytes output joined from pre-serialized fragments is identical to serializing the lookups. """
+        test_alpha_codes = ["AD", "FR,DEU,356", "BA,DE,FRA,HUN,600"]
+        test_years = ["2023", "2014,2016", "2014,2014", "2005-2010", ">2020", "<2004", "<>2010,2019", ["2016"], "1999"]
+        test_updates_filepath = os.path.join(self.test_export_folder, "json-bytes-iso3166-updates.json")
+        for response_cache in (False, True):
+            shutil.copyfile(os.path.join("tests", "test-iso3166-updates.json"), test_updates_filepath)
+            test_updates = Updates(custom_updates_filepath=test_updates_filepath, response_cache=response_cache)
+#1.) all updates, country and year lookups
+            self.assertEqual(test_updates.to_json_bytes(), json.dumps(test_updates.all).encode("utf-8"), "Expected JSON bytes of all updates to match json.dumps output.")
+            for alpha_code in test_alpha_codes:
+                self.assertEqual(test_updates.to_json_bytes(alpha_code), json.dumps(test_updates[alpha_code]).encode("utf-8"), 
+                    f"Expected JSON bytes for {alpha_code} to match json.dumps output.")
+            for year in test_years:
+                self.assertEqual(test_updates.to_json_bytes(year=year), json.dumps(test_updates.year(year)).encode("utf-8"), 
+                    f"Expected JSON bytes for year {year} to match json.dumps output.")
+#2.) fragments of unchanged countries reused after a custom update, updated country's fragments rebuilt
+            test_fr_fragments, test_de_fragments = test_updates._json_fragments["FR"], test_updates._json_fragments["DE"]
+            test_updates.custom_update("FR", change="Custom change for FR.", date_issued="2023-05-01", save_new=True, save_new_filename=self.custom_updates_filepath)
+            self.assertEqual(test_updates.to_json_bytes(year="2023"), json.dumps(test_updates.year("2023")).encode("utf-8"), "Expected JSON bytes to include custom update.")
+            self.assertEqual(test_updates.to_json_bytes("FR,DE"), json.dumps(test_updates["FR,DE"]).encode("utf-8"), "Expected JSON bytes to include custom update.")
+            self.assertIsNot(test_updates._json_fragments["FR"], test_fr_fragments, "Expected fragments of updated country to be rebuilt.")
+            self.assertIs(test_updates._json_fragments["DE"], test_de_fragments, "Expected fragments of unchanged country to be reused.")
+#3.) scoped instance
+        test_updates = Updates(country_code="FR,DE", custom_updates_filepath=test_updates_filepath, response_cache=True)
+        self.assertEqual(sorted(test_updates._json_fragments), ["DE", "FR"], "Expected fragments to be pre-serialized for the scoped countries only.")
+        self.assertEqual(test_updates.to_json_bytes(year="2014,2016"), json.dumps(test_updates.year("2014,2016")).encode("utf-8"), 
+            "Expected JSON bytes of scoped instance to match json.dumps output.")
+#4.) invalid parameters
+        with self.assertRaises(ValueError):
+            self.all_updates.to_json_bytes("FR", year="2023")
+        with self.assertRaises(ValueError):
+            self.all_updates.to_json_bytes(year="1900")
+        with self.assertRaises(ValueError):
+            self.all_updates.to_json_bytes("ZZ")
+        with self.assertRaises(TypeError):
+            self.all_updates.to_json_bytes(year=2023)
+
+    # @unittest.skip("")
+    def test_etag(self):
+        """ Testing ETags of queries are stable, normalised and only change when the updates data read by the query changes. """
+        test_updates_filepath = os.path.join(self.test_export_folder, "etag-iso3166-updates.json")
+        shutil.copyfile(os.path.join("tests", "test-iso3166-updates.json"), test_updates_filepath)
+        test_updates = Updates(custom_updates_filepath=test_updates_filepath)
+#1.) country ETags don't require the full dataset to be loaded, equivalent country codes give the same ETag
+        test_etag_fr = test_updates.etag("FR")
+        self.assertRegex(test_etag_fr, r'^"[0-9a-f]{32}"$', f"Expected double quoted hex ETag, got {test_etag_fr}.")
+        self.assertIsNone(test_updates._generation, "Expected country ETag to not load the full dataset.")
+        self.assertEqual(test_updates.etag("FRA"), test_etag_fr, "Expected ETag of equivalent alpha-3 code to match.")
+        self.assertEqual(test_updates.etag("DE,FR"), test_updates.etag("FR, DEU"), "Expected ETag of equivalent country codes to match.")
+        self.assertNotEqual(test_updates.etag("FR,DE"), test_etag_fr, "Expected ETags of different countries to differ.")
+#2.) year, date range and all ETags, equivalent inputs give the same ETag
+        test_etag_all, test_etag_year = test_updates.etag(), test_updates.etag(year="2016")
+        test_etag_date_range = test_updates.etag(date_range="2016-01-01,2019-12-31", sort_by_date="dateAsc")
+        self.assertEqual(len({test_etag_fr, test_etag_all, test_etag_year, test_etag_date_range}), 4, "Expected ETags of different queries to differ.")
+        self.assertEqual(test_updates.etag(year=["2016"]), test_etag_year, "Expected ETag of equivalent year input to match.")
+        self.assertEqual(test_updates.etag(date_range=["2019-12-31", "2016-01-01"], sort_by_date="DATEASC"), test_etag_date_range, 
+            "Expected ETag of equivalent date range input to match.")
+        self.assertNotEqual(test_updates.etag(date_range="2016-01-01,2019-12-31"), test_etag_date_range, "Expected ETags of sorted and unsorted date ranges to differ.")
+        self.assertEqual(Updates(custom_updates_filepath=test_updates_filepath).etag(), test_etag_all, "Expected ETag of same updates data to match across instances.")
+#3.) custom update changes the ETags of queries reading the updated country only
+        test_updates.custom_update("DE", change="Custom change for DE.", date_issued="2016-05-01", save_new=True, save_new_filename=self.custom_updates_filepath)
+        self.assertEqual(test_updates.etag("FR"), test_etag_fr, "Expected ETag of unchanged country to be unchanged.")
+        self.assertNotEqual(test_updates.etag(), test_etag_all, "Expected ETag of all updates to change after custom update.")
+        self.assertNotEqual(test_updates.etag(year="2016"), test_etag_year, "Expected ETag of year query to change after custom update.")
+        test_updates.custom_update("DE", change="Custom change for DE.", date_issued="2016-05-01", delete=True, save_new=True, save_new_filename=self.custom_updates_filepath)
+        self.assertEqual(test_updates.etag(), test_etag_all, "Expected ETag of all updates to be restored after deleting custom update.")
+#4.) invalid parameters
+        with self.assertRaises(ValueError):
+            test_updates.etag("FR", year="2016")
+        with self.assertRaises(ValueError):
+            test_updates.etag(year="1900")
+        with self.assertRaises(ValueError):
+            test_updates.etag(date_range="2016-01-01,abc")
+        with self.assertRaises(TypeError):
+            test_updates.etag(date_range=2016)
+
+    # @unittest.skip("")
+    def test_to_json_gzip(self):
+        """ Testing gzip output from cached compressed payloads and deflate fragments decompresses to the JSON bytes output. """
+        test_updates_filepath = os.path.join(self.test_export_folder, "json-gzip-iso3166-updates.json")
+        shutil.copyfile(os.path.join("tests", "test-iso3166-updates.json"), test_updates_filepath)
+        test_updates = Updates(custom_updates_filepath=test_updates_filepath)
+#1.) all updates, country and year lookups, including multi-country lookups joined into a single gzip member
+        self.assertEqual(gzip.decompress(test_updates.to_json_gzip()), test_updates.to_json_bytes(), "Expected gzip of all updates to decompress to JSON bytes output.")
+        for alpha_code in ["AD", "FR,DEU,356", "BA,DE,FRA,HUN,600"]:
+            self.assertEqual(gzip.decompress(test_updates.to_json_gzip(alpha_code)), test_updates.to_json_bytes(alpha_code), 
+                f"Expected gzip for {alpha_code} to decompress to JSON bytes output.")
+            test_decompressor = zlib.decompressobj(31)
+            self.assertEqual(test_decompressor.decompress(test_updates.to_json_gzip(alpha_code)), test_updates.to_json_bytes(alpha_code), 
+                f"Expected single gzip member for {alpha_code} to decode to JSON bytes output.")
+            self.assertTrue(test_decompressor.eof, f"Expected gzip member for {alpha_code} to be complete.")
+            self.assertEqual(test_decompressor.unused_data, b"", f"Expected gzip for {alpha_code} to be a single gzip member.")
+        for year in ["2023", "2014,2016", "2005-2010", ">2020", "<>2010,2019", "1999"]:
+            self.assertEqual(gzip.decompress(test_updates.to_json_gzip(year=year)), test_updates.to_json_bytes(year=year), 
+                f"Expected gzip for year {year} to decompress to JSON bytes output.")
+#2.) compressed payloads are cached on the generation and per country, and recompressed after a custom update
+        test_gzip_all, test_gzip_year = test_updates.to_json_gzip(), test_updates.to_json_gzip(year="2023")
+        self.assertIs(test_updates.to_json_gzip(), test_gzip_all, "Expected gzip of all updates to be cached.")
+        self.assertIs(test_updates.to_json_gzip(year=["2023"]), test_gzip_year, "Expected gzip of equivalent year input to be cached.")
+        test_gzip_de = test_updates._json_fragments["DE"].deflate_head
+        test_updates.custom_update("FR", change="Custom change for FR.", date_issued="2023-05-01", save_new=True, save_new_filename=self.custom_updates_filepath)
+        self.assertEqual(gzip.decompress(test_updates.to_json_gzip()), test_updates.to_json_bytes(), "Expected gzip of all updates to include custom update.")
+        self.assertEqual(gzip.decompress(test_updates.to_json_gzip(year="2023")), test_updates.to_json_bytes(year="2023"), "Expected gzip of year to include custom update.")
+        self.assertEqual(gzip.decompress(test_updates.to_json_gzip("DE,FR")), test_updates.to_json_bytes("DE,FR"), "Expected gzip of countries to include custom update.")
+        self.assertIs(test_updates._json_fragments["DE"].deflate_head, test_gzip_de, "Expected deflate fragment of unchanged country to be reused.")
+#3.) invalid parameters
+        with self.assertRaises(ValueError):
+            test_updates.to_json_gzip("FR", year="2023")
+        with self.assertRaises(ValueError):
+            test_updates.to_json_gzip("ZZ")
+
+    # @unittest.skip("")
+    def test_country_name(self):
+        """ Testing country name lookups matched exactly, accent-folded, via aliases and fuzzy matched, and the batch conversion of names. """
+#1.) exact, accent-folded, qualified and alias names, returning the same output as __getitem__
+        self.assertEqual(self.all_updates.country_name("Tajikistan, Ireland"), self.all_updates["TJ,IE"], "Expected country name output to match __getitem__ output.")
+        for test_name, test_alpha_code in (("Andorra", "AD"), ("côte d'ivoire", "CI"), ("Cote d'Ivoire", "CI"), ("Korea, Republic of", "KR"), ("Republic of Korea", "KR"), 
+                                           ("South Korea", "KR"), ("Iran", "IR"), ("U.K.", "GB"), ("Ivory Coast", "CI"), ("The Netherlands", "NL"), 
+                                           ("Falkland Islands", "FK"), ("Virgin Islands, U.S.", "VI"), ("TRINIDAD & TOBAGO", "TT")):
+            self.assertEqual(list(self.all_updates.country_name(test_name, raw=True)), [test_alpha_code], f"Expected {test_name} to match {test_alpha_code}.")
+        self.assertEqual(sorted(self.all_updates.country_name("Korea, Republic of, Virgin Islands, British, Mali")), ["KR", "ML", "VG"], 
+            "Expected names containing commas to be matched within a list of names.")
+        self.assertIs(self.all_updates.country_name("Andorra", raw=True)["AD"], self.all_updates.alpha("AD", raw=True)["AD"], "Expected raw output to be a shared reference.")
+#2.) fuzzy matched names only match with a lower likeness score
+        with self.assertRaises(ValueError):
+            self.all_updates.country_name("Tajikstan")
+        self.assertEqual(list(self.all_updates.country_name("Tajikstan, Untied Kingdom", likeness_score=80)), ["GB", "TJ"], "Expected misspelt names to be fuzzy matched.")
+        with self.assertRaises(ValueError):
+            self.all_updates.country_name("Narnia", likeness_score=80)
+#3.) batch conversion of names, unmatched names are None
+        self.assertEqual(self.all_updates.country_names_to_alpha2(["Viet Nam", "U.S.A.", "Korea, Republic of", "Narnia", "viet nam", ""]), ["VN", "US", "KR", None, "VN", None],
+            "Expected batch conversion of country names to alpha-2 codes.")
+        self.assertEqual(Updates.country_names_to_alpha2(["Tajikstan", "Irland"], likeness_score=80), ["TJ", "IE"], "Expected batch conversion of misspelt names.")
+#4.) invalid parameters
+        with self.assertRaises(ValueError):
+            self.all_updates.country_name("")
+        with self.assertRaises(ValueError):
+            self.all_updates.country_name("Andorra", likeness_score=0)
+        with self.assertRaises(TypeError):
+            self.all_updates.country_name(123)
+        with self.assertRaises(TypeError):
+            self.all_updates.country_names_to_alpha2("Andorra")
+        with self.assertRaises(TypeError):
+            self.all_updates.country_names_to_alpha2(["Andorra", 123])
+
+    # @unittest.skip("")
+    def test_custom_update_journal(self):
+        """ Testing custom updates are appended to a journal that's replayed on load and compacted into the updates file on demand. """
+        test_updates_filepath = os.path.join(self.test_export_folder, "journal-iso3166-updates.json")
+        test_journal_filepath = os.path.join(self.test_export_folder, "journal-iso3166-updates.journal.ndjson")
+        shutil.copyfile(os.path.join("tests", "test-iso3166-updates.json"), test_updates_filepath)
+        with open(test_updates_filepath, "rb") as f:
+            test_base_bytes = f.read()
+        test_updates = Updates(custom_updates_filepath=test_updates_filepath)
+        test_custom_update_jp = {"Change": "Journaled change for Japan.", "Date Issued": "2025-01-01", "Description of Change": "", "Source": ""}
+        test_custom_update_fr = {"Change": "Journaled change for France.", "Date Issued": "2025-02-01", "Description of Change": "Blah", "Source": "https://example.fr"}
+#1.) custom updates are appended to the journal, one line per operation, without rewriting the updates file
+        test_updates.custom_update("JP", custom_update_object=dict(test_custom_update_jp))
+        test_updates.custom_update("FRA", custom_update_object=dict(test_custom_update_fr))
+        test_updates.custom_update("JP", change="journaled change for japan.", date_issued="2025-01-01", delete=True)
+        with open(test_updates_filepath, "rb") as f:
+            self.assertEqual(f.read(), test_base_bytes, "Expected updates file to not be rewritten by custom updates.")
+        with open(test_journal_filepath, encoding="utf-8") as f:
+            test_journal = [json.loads(line) for line in f]
+        self.assertEqual([(operation["op"], operation["alpha_code"]) for operation in test_journal], [("add", "JP"), ("add", "FR"), ("delete", "JP")],
+            "Expected each custom update operation to be appended to the journal.")
+        self.assertEqual(test_journal[1]["update"], test_custom_update_fr, "Expected journaled update to match custom update.")
+#2.) journal is replayed when the full dataset or an individual country is loaded
+        self.assertEqual(Updates(custom_updates_filepath=test_updates_filepath).all, test_updates.all, "Expected journal to be replayed when loading the dataset.")
+        self.assertIn(test_custom_update_fr, Updates(custom_updates_filepath=test_updates_filepath)["FR"]["FR"], "Expected journal to be replayed when loading a country.")
+        self.assertEqual(Updates("FR,JP", custom_updates_filepath=test_updates_filepath).all, test_updates["FR,JP"], "Expected journal to be replayed for scoped instance.")
+        self.assertNotIn(test_custom_update_jp, Updates(custom_updates_filepath=test_updates_filepath).all["JP"], "Expected deleted update to not be replayed.")
+#3.) a torn final line, from a crash mid-append, is ignored and truncated by the next append
+        with open(test_journal_filepath, "ab") as f:
+            f.write(b'{"op": "add", "alpha_code": "DE", "upd')
+        self.assertEqual(Updates(custom_updates_filepath=test_updates_filepath).all, test_updates.all, "Expected torn final journal line to be ignored.")
+        test_updates.custom_update("JP", custom_update_object=dict(test_custom_update_jp))
+        self.assertEqual(Updates(custom_updates_filepath=test_updates_filepath).all, test_updates.all, "Expected append after torn line to be replayed.")
+#4.) compacting the journal writes a new updates file and removes the journal
+        with open(test_journal_filepath, "rb") as f:
+            test_journal_bytes = f.read()
+        test_updates.compact()
+        self.assertFalse(os.path.isfile(test_journal_filepath), "Expected journal to be removed after compaction.")
+        with open(test_updates_filepath, encoding="utf-8") as f:
+            self.assertEqual(json.load(f), test_updates.all, "Expected compacted updates file to include the journaled updates.")
+        self.assertEqual(Updates("FR", custom_updates_filepath=test_updates_filepath)["FR"], test_updates["FR"], "Expected compacted updates file to be reindexed.")
+#5.) replaying a journal onto a file it's already been compacted into leaves the updates unchanged
+        with open(test_journal_filepath, "wb") as f:
+            f.write(test_journal_bytes)
+        self.assertEqual(Updates(custom_updates_filepath=test_updates_filepath).all, test_updates.all, "Expected replaying compacted journal to leave updates unchanged.")
+#6.) invalid journal operation
+        with open(test_journal_filepath, "a", encoding="utf-8") as f:
+            f.write("not a journal operation\n")
+        with self.assertRaises(ValueError):
+            Updates(custom_updates_filepath=test_updates_filepath).all
+#7.) updates file compacted by another process is reloaded rather than served from a stale cache
+        os.remove(test_journal_filepath)
+        self.assertEqual(Updates(custom_updates_filepath=test_updates_filepath).all, test_updates.all, "Expected compacted updates file to be loaded.")
+        test_custom_update_de = {"Change": "Change for Germany from another process.", "Date Issued": "2025-03-01", "Description of Change": "", "Source": ""}
+        subprocess.run([sys.executable, "-c", "import sys; from iso3166_updates import Updates; test_updates = Updates(custom_updates_filepath=sys.argv[1]); "
+            f"test_updates.custom_update('DE', custom_update_object={test_custom_update_de!r}); test_updates.compact()", test_updates_filepath], check=True)
+        self.assertFalse(os.path.isfile(test_journal_filepath), "Expected journal to be removed by the other process's compaction.")
+        self.assertIn(test_custom_update_de, Updates(custom_updates_filepath=test_updates_filepath).all["DE"], "Expected update compacted by another process to be loaded.")
+#8.) update appended by another process whilst the journal is being compacted isn't lost
+        test_custom_update_jp = {"Change": "Second journaled change for Japan.", "Date Issued": "2025-04-01", "Description of Change": "", "Source": ""}
+        test_updates.custom_update("JP", custom_update_object=dict(test_custom_update_jp))
+        test_custom_update_it = {"Change": "Change for Italy appended whilst compacting.", "Date Issued": "2025-04-01", "Description of Change": "", "Source": ""}
+        os_remove = os.remove
+        test_appends = []
+        def remove_journal(path):
+            #start the other process's append in the window between the journal being reread and removed
+            if (path == test_journal_filepath and not test_appends):
+                test_appends.append(subprocess.Popen([sys.executable, "-c", "import sys; from iso3166_updates import Updates; "
+                    "test_updates = Updates(custom_updates_filepath=sys.argv[1]); test_updates.all; print('ready', flush=True); "
+                    f"test_updates.custom_update('IT', custom_update_object={test_custom_update_it!r})", test_updates_filepath], stdout=subprocess.PIPE, text=True))
+                self.assertEqual(test_appends[0].stdout.readline().strip(), "ready", "Expected other process to load the updates.")
+                time.sleep(0.5)
+            os_remove(path)
+        with patch("os.remove", side_effect=remove_journal):
+            test_updates.compact()
+        self.assertEqual(len(test_appends), 1, "Expected compacted journal to be removed.")
+        self.assertEqual(test_appends[0].wait(timeout=60), 0, "Expected other process's append to succeed.")
+        test_appends[0].stdout.close()
+        self.assertIn(test_custom_update_it, Updates(custom_updates_filepath=test_updates_filepath).all["IT"], "Expected update appended whilst compacting to be kept.")
+        self.assertIn(test_custom_update_jp, Updates(custom_updates_filepath=test_updates_filepath).all["JP"], "Expected compacted update to be kept.")
+
+    # @unittest.skip("")
+    def test_custom_updates_batch(self):
+        """ Testing batches, transactions and bulk imports of custom updates are applied atomically with a single journal append. """
+        test_updates_filepath = os.path.join(self.test_export_folder, "batch-iso3166-updates.json")
+        test_journal_filepath = os.path.join(self.test_export_folder, "batch-iso3166-updates.journal.ndjson")
+        shutil.copyfile(os.path.join("tests", "test-iso3166-updates.json"), test_updates_filepath)
+        test_updates = Updates(custom_updates_filepath=test_updates_filepath)
+        test_batch = [{"alpha_code": "JP", "Change": f"Batched change {i} for Japan.", "Date Issued": "2025-01-01"} for i in range(50)] + \
+            [{"Country Code": "FRA", "Change": "Batched change for France.", "Date Issued": "2025-02-01", "Source": "https://example.fr"}]
+#1.) batch of operations is applied and journaled in a single append
+        self.assertEqual(test_updates.custom_updates_batch(test_batch), 51, "Expected number of applied operations to be returned.")
+        self.assertEqual(len([update for update in test_updates.all["JP"] if update["Change"].startswith("Batched change")]), 50, "Expected batched updates to be added.")
+        self.assertIn({"Change": "Batched change for France.", "Description of Change": "", "Date Issued": "2025-02-01", "Source": "https://example.fr"},
+            test_updates.all["FR"], "Expected batched update to be added by its Country Code.")
+        with open(test_journal_filepath, encoding="utf-8") as f:
+            self.assertEqual(len(f.readlines()), 51, "Expected one journal line per batched operation.")
+        self.assertEqual(Updates(custom_updates_filepath=test_updates_filepath).all, test_updates.all, "Expected batched updates to be replayed from the journal.")
+#2.) batch with an invalid operation is rejected atomically, with the operation's index in the error
+        test_all_updates = test_updates.all
+        with self.assertRaisesRegex(ValueError, "index 1"):
+            test_updates.custom_updates_batch([{"alpha_code": "DE", "Change": "Batched change for Germany.", "Date Issued": "2025-01-01"},
+                {"alpha_code": "JP", "Change": "BATCHED CHANGE 3 FOR JAPAN. ", "Date Issued": "2025-01-01"}])
+        with self.assertRaisesRegex(ValueError, "index 0"):
+            test_updates.custom_updates_batch([{"alpha_code": "DE", "Change": "Missing change for Germany.", "Date Issued": "2025-01-01", "delete": True}])
+        with self.assertRaises(ValueError):
+            test_updates.custom_updates_batch([{"alpha_code": "DE", "Change": "Duplicate change.", "Date Issued": "2025-01-01"},
+                {"alpha_code": "DE", "Change": "duplicate change.", "Date Issued": "2025-01-01"}])
+        with self.assertRaises(TypeError):
+            test_updates.custom_updates_batch(["JP"])
+        self.assertIs(test_updates.all, test_all_updates, "Expected rejected batches to leave the dataset unchanged.")
+#3.) transaction applies buffered custom updates on exit, and discards them on error
+        with test_updates.transaction():
+            test_updates.custom_update("DE", change="Transaction change for Germany.", date_issued="2025-03-01")
+            test_updates.custom_update("JP", change="Batched change 0 for Japan.", date_issued="2025-01-01", delete=True)
+            self.assertIs(test_updates.all, test_all_updates, "Expected buffered updates to not be applied within the transaction.")
+        self.assertIn("Transaction change for Germany.", [update["Change"] for update in test_updates.all["DE"]], "Expected transaction to add update.")
+        self.assertNotIn("Batched change 0 for Japan.", [update["Change"] for update in test_updates.all["JP"]], "Expected transaction to delete update.")
+        test_all_updates = test_updates.all
+        with self.assertRaises(RuntimeError):
+            with test_updates.transaction():
+                test_updates.custom_update("DE", change="Rolled back change for Germany.", date_issued="2025-03-01")
+                raise RuntimeError("rollback")
+        self.assertIs(test_updates.all, test_all_updates, "Expected transaction to be discarded on error.")
+#4.) bulk import custom updates from CSV and NDJSON files
+        test_csv_filepath = os.path.join(self.test_export_folder, "custom-updates.csv")
+        with open(test_csv_filepath, "w", encoding="utf-8", newline="") as f:
+            f.write("Country Code,Change,Description of Change,Date Issued,Source,delete\n")
+            f.write('ES,"Imported change, for Spain.",,2025-04-01,,\n')
+            f.write("DE,Transaction change for Germany.,,2025-03-01,,true\n")
+        self.assertEqual(test_updates.import_custom_updates(test_csv_filepath), 2, "Expected CSV operations to be imported.")
+        self.assertIn("Imported change, for Spain.", [update["Change"] for update in test_updates.all["ES"]], "Expected CSV update to be added.")
+        self.assertNotIn("Transaction change for Germany.", [update["Change"] for update in test_updates.all["DE"]], "Expected CSV update to be deleted.")
+        test_ndjson_filepath = os.path.join(self.test_export_folder, "custom-updates.ndjson")
+        with open(test_ndjson_filepath, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"alpha_code": "IT", "Change": "Imported change for Italy.", "Date Issued": "2025-05-01"}) + "\n\n")
+            f.write(json.dumps({"op": "add", "alpha_code": "IT", "update": {"Change": "Journaled change for Italy.", "Description of Change": "", "Date Issued": "2025-05-02", "Source": ""}}) + "\n")
+        self.assertEqual(test_updates.import_custom_updates(test_ndjson_filepath), 2, "Expected NDJSON operations to be imported.")
+        self.assertTrue({"Imported change for Italy.", "Journaled change for Italy."} <= {update["Change"] for update in test_updates.all["IT"]}, "Expected NDJSON updates to be added.")
+        self.assertEqual(Updates(custom_updates_filepath=test_updates_filepath).all, test_updates.all, "Expected imported updates to be replayed from the journal.")
+#5.) invalid import files
+        with self.assertRaises(OSError):
+            test_updates.import_custom_updates(os.path.join(self.test_export_folder, "missing.csv"))
+        with self.assertRaises(ValueError):
+            test_updates.import_custom_updates(test_updates_filepath)
+
+    # @unittest.skip("")
+    def test_custom_update_overlay(self):
+        """ Testing custom updates made to named overlays are persisted separately over the untouched, shared base updates. """
+        test_updates_filepath = os.path.join(self.test_export_folder, "overlay-iso3166-updates.json")
+        test_overlay_filepath = os.path.join(self.test_export_folder, "overlay-iso3166-updates.tenant_a.overlay.ndjson")
+        shutil.copyfile(os.path.join("tests", "test-iso3166-updates.json"), test_updates_filepath)
+        with open(test_updates_filepath, "rb") as f:
+            test_base_bytes = f.read()
+        test_base = Updates(custom_updates_filepath=test_updates_filepath)
+        test_tenant_a = Updates(custom_updates_filepath=test_updates_filepath, overlay="tenant_a")
+        test_tenant_b = Updates(custom_updates_filepath=test_updates_filepath, overlay="tenant-b")
+        test_deleted_update = test_base.all["DE"][0]
+#1.) custom updates are journaled to the overlay, leaving the base updates and other overlays untouched
+        test_tenant_a.custom_update("FR", change="Overlay change for France.", date_issued="2025-01-01")
+        test_tenant_a.custom_update("FR", change="Temporary overlay change for France.", date_issued="2025-01-02")
+        test_tenant_a.custom_update("FR", change="Temporary overlay change for France.", date_issued="2025-01-02", delete=True)
+        test_tenant_a.custom_update("DE", change=test_deleted_update["Change"], date_issued=test_deleted_update["Date Issued"], delete=True)
+        self.assertTrue(os.path.isfile(test_overlay_filepath), "Expected overlay journal to be created.")
+        self.assertFalse(os.path.isfile(os.path.join(self.test_export_folder, "overlay-iso3166-updates.journal.ndjson")), "Expected base journal to not be created.")
+        with open(test_updates_filepath, "rb") as f:
+            self.assertEqual(f.read(), test_base_bytes, "Expected base updates file to be untouched.")
+        self.assertIn("Overlay change for France.", [update["Change"] for update in test_tenant_a.all["FR"]], "Expected overlay update to be added.")
+        self.assertNotIn(test_deleted_update, test_tenant_a.all["DE"], "Expected overlay to delete base update.")
+        for test_updates in (test_base, test_tenant_b, Updates(custom_updates_filepath=test_updates_filepath)):
+            self.assertNotIn("Overlay change for France.", [update["Change"] for update in test_updates.all["FR"]], "Expected overlay update to not be in base or other overlays.")
+            self.assertIn(test_deleted_update, test_updates.all["DE"], "Expected overlay delete to not affect base or other overlays.")
+#2.) countries not changed by the overlay are shared with the base updates and other overlays, whilst changed countries are copied
+        self.assertTrue(all(test_tenant_a.all[alpha_code] is test_base.all[alpha_code] is test_tenant_b.all[alpha_code]
+            for alpha_code in test_base.all if alpha_code not in ("FR", "DE")), "Expected unchanged countries to be shared with the base updates and other overlays.")
+        self.assertIsNot(test_tenant_a.all["FR"], test_base.all["FR"], "Expected country changed by the overlay to be copied.")
+        self.assertIs(test_tenant_b.all["FR"], test_base.all["FR"], "Expected country changed by another overlay to be shared with the base updates.")
+#3.) overlay is replayed on load, over the base updates and their journal
+        test_base.custom_update("ES", change="Base change for Spain.", date_issued="2025-03-01")
+        test_reloaded_tenant_a = Updates(custom_updates_filepath=test_updates_filepath, overlay="tenant_a")
+        self.assertEqual(test_reloaded_tenant_a["FR,DE"], test_tenant_a["FR,DE"], "Expected overlay to be replayed on load.")
+        self.assertIn("Base change for Spain.", [update["Change"] for update in test_reloaded_tenant_a.all["ES"]], "Expected base journal to be replayed under the overlay.")
+        self.assertEqual(Updates("FR", custom_updates_filepath=test_updates_filepath, overlay="tenant_a").all["FR"], test_tenant_a.all["FR"], 
+            "Expected overlay to be replayed for scoped instance.")
+#4.) compacting an overlay rewrites its journal as the minimal operations, leaving the base updates file untouched
+        test_all_updates = test_reloaded_tenant_a.all
+        test_tenant_a.compact()
+        with open(test_overlay_filepath, encoding="utf-8") as f:
+            self.assertEqual([(operation["op"], operation["alpha_code"]) for operation in map(json.loads, f)], [("add", "FR"), ("delete", "DE")],
+                "Expected overlay journal to be compacted into minimal operations.")
+        with open(test_updates_filepath, "rb") as f:
+            self.assertEqual(f.read(), test_base_bytes, "Expected base updates file to be untouched by overlay compaction.")
+        self.assertEqual(Updates(custom_updates_filepath=test_updates_filepath, overlay="tenant_a").all, test_all_updates, "Expected compacted overlay to be unchanged.")
+#5.) overlay in a separate directory
+        test_overlay_dir = os.path.join(self.test_export_folder, "overlays")
+        os.mkdir(test_overlay_dir)
+        Updates(custom_updates_filepath=test_updates_filepath, overlay="tenant_c", overlay_dir=test_overlay_dir).custom_update("JP", change="Overlay change for Japan.", date_issued="2025-01-01")
+        self.assertTrue(os.path.isfile(os.path.join(test_overlay_dir, "overlay-iso3166-updates.tenant_c.overlay.ndjson")), "Expected overlay journal in overlay directory.")
+#6.) invalid overlay name or directory
+        with self.assertRaises(ValueError):
+            Updates(custom_updates_filepath=test_updates_filepath, overlay="../tenant")
+        with self.assertRaises(OSError):
+            Updates(custom_updates_filepath=test_updates_filepath, overlay="tenant", overlay_dir=os.path.join(self.test_export_folder, "missing"))
+
+    # @unittest.skip("")
+    def test_export(self):
+        """ Testing streaming export of the updates data and query outputs to JSON, NDJSON, CSV and XML files. """
+        test_updates = self.all_updates.year(">2020", raw=True)
+        test_total_updates = sum(len(updates) for updates in test_updates.values())
+        test_sorted_updates = self.all_updates.date_range("2020-01-01", sort_by_date="dateDesc")
+#1.) compact JSON export, optionally gzip compressed, in the format of the updates JSON
+        test_json_filepath = os.path.join(self.test_export_folder, "export.json")
+        self.assertEqual(self.all_updates.export(test_json_filepath), len(self.all_updates), "Expected number of exported updates to be returned.")
+        with open(test_json_filepath, encoding="utf-8") as f:
+            test_json = f.read()
+        self.assertEqual(json.loads(test_json), self.all_updates.all, "Expected JSON export to match updates data.")
+        self.assertNotIn("\n", test_json, "Expected JSON export to be compact.")
+        self.all_updates.export(test_json_filepath + ".gz", test_updates)
+        with gzip.open(test_json_filepath + ".gz", "rt", encoding="utf-8") as f:
+            self.assertEqual(json.load(f), test_updates, "Expected gzip compressed JSON export to match query output.")
+        self.all_updates.export(test_json_filepath, test_sorted_updates)
+        with open(test_json_filepath, encoding="utf-8") as f:
+            self.assertEqual(json.load(f), test_sorted_updates, "Expected JSON export of list of updates to be an array in the same order.")
+#2.) NDJSON export, one update per line with its country code
+        test_ndjson_filepath = os.path.join(self.test_export_folder, "export.ndjson")
+        self.assertEqual(self.all_updates.export(test_ndjson_filepath, test_updates), test_total_updates, "Expected all updates to be exported.")
+        with open(test_ndjson_filepath, encoding="utf-8") as f:
+            test_ndjson = [json.loads(line) for line in f]
+        self.assertEqual(len(test_ndjson), test_total_updates, "Expected one NDJSON line per update.")
+        self.assertEqual(test_ndjson[0], {"Country Code": list(test_updates)[0], **list(test_updates.values())[0][0]}, "Expected NDJSON line to include the country code.")
+        self.all_updates.export(test_ndjson_filepath, self.all_updates.search("addition", likeness_score=100, raw=True))
+        with open(test_ndjson_filepath, encoding="utf-8") as f:
+            self.assertIn("Match Score", json.loads(f.readline()), "Expected raw search output to be exported with its match score.")
+#3.) CSV export, matching the layout of the export_updates CSV
+        test_csv_filepath = os.path.join(self.test_export_folder, "export.csv")
+        self.all_updates.export(test_csv_filepath, {alpha_code: test_updates[alpha_code] for alpha_code in reversed(list(test_updates))})
+        with open(test_csv_filepath, encoding="utf-8", newline="") as f:
+            test_csv = list(csv.DictReader(f))
+        self.assertEqual(list(test_csv[0]), ["Country Code", "Change", "Description of Change", "Date Issued", "Source"], "Expected CSV columns to match export_updates.")
+        self.assertEqual([row["Country Code"] for row in test_csv], sorted(row["Country Code"] for row in test_csv), "Expected CSV rows to be sorted by country code.")
+        self.assertEqual(len(test_csv), test_total_updates, "Expected one CSV row per update.")
+        self.all_updates.export(test_csv_filepath, {"FR": self.all_updates.all["FR"]})
+        with open(test_csv_filepath, encoding="utf-8", newline="") as f:
+            test_csv = list(csv.DictReader(f))
+        self.assertNotIn("Country Code", test_csv[0], "Expected Country Code column to be dropped for a single country.")
+        self.assertEqual([row["Change"] for row in test_csv], [update["Change"] for update in self.all_updates.all["FR"]], "Expected CSV rows to match updates.")
+#4.) XML export, matching the layout of the export_updates XML
+        test_xml_filepath = os.path.join(self.test_export_folder, "export.xml.gz")
+        self.all_updates.export(test_xml_filepath, {"AD": [], "FR": self.all_updates.all["FR"], "GB": self.all_updates.all["GB"]})
+        with gzip.open(test_xml_filepath, "rt", encoding="utf-8") as f:
+            test_xml = f.read()
+        self.assertTrue(test_xml.startswith('<?xml version="1.0" ?>\n<ISO3166Updates>\n  <Country code="AD"/>\n  <Country code="FR">\n    <Update>\n'), "Expected pretty printed XML layout.")
+        test_xml_root = ET.fromstring(test_xml.encode("utf-8"))
+        self.assertEqual([country.get("code") for country in test_xml_root], ["AD", "FR", "GB"], "Expected a Country element per country.")
+        self.assertEqual([update.findtext("Date_Issued") for update in test_xml_root[1]], [update["Date Issued"] for update in self.all_updates.all["FR"]], 
+            "Expected an Update element per update.")
+        self.all_updates.export(test_xml_filepath, test_sorted_updates, compress=False)
+        with open(test_xml_filepath, encoding="utf-8") as f:
+            test_xml_root = ET.fromstring(f.read().encode("utf-8"))
+        self.assertEqual(sum(len(country) for country in test_xml_root), len(test_sorted_updates), "Expected all sorted updates to be exported.")
+#5.) invalid filepath, format or data
+        with self.assertRaises(ValueError):
+            self.all_updates.export(os.path.join(self.test_export_folder, "export.txt"))
+        with self.assertRaises(ValueError):
+            self.all_updates.export(test_json_filepath, format="yaml")
+        with self.assertRaises(TypeError):
+            self.all_updates.export(test_json_filepath, "FR")
+        with self.assertRaises(TypeError):
+            self.all_updates.export(123)
+        with self.assertRaises(OSError):
+            self.all_updates.export(os.path.join(self.test_export_folder, "missing", "export.json"))
+
+    # @unittest.skip("")
+    def test_reload_watch(self):
+        """ Testing the updates file is reloaded, rebuilding only the changed countries, via reload() and a background watcher. """
+        test_updates_filepath = os.path.join(self.test_export_folder, "reload-iso3166-updates.json")
+        shutil.copyfile(os.path.join("tests", "test-iso3166-updates.json"), test_updates_filepath)
+        with open(test_updates_filepath, encoding="utf-8") as f:
+            test_updates_data = json.load(f)
+        test_updates = Updates(custom_updates_filepath=test_updates_filepath)
+        test_lazy_updates = Updates(custom_updates_filepath=test_updates_filepath)
+        test_scoped_updates = Updates("FR,DE", custom_updates_filepath=test_updates_filepath)
+        test_all_updates = test_updates.all
+        test_lazy_updates["FR,DE"]
+
+        def update_file(test_updates_data):
+            temp_filepath = test_updates_filepath + ".tmp"
+            with open(temp_filepath, "w", encoding="utf-8") as f:
+                json.dump(test_updates_data, f, ensure_ascii=False, indent=4)
+            os.replace(temp_filepath, test_updates_filepath)
+#1.) reload publishes only the changed, added or removed countries, keeping the updates of unchanged countries
+        test_updates_data["FR"] = test_updates_data["FR"][1:]
+        test_updates_data["JP"] = test_updates_data["JP"] + [{"Change": "Reloaded change for Japan.", "Description of Change": "", "Date Issued": "2025-01-01", "Source": ""}]
+        del test_updates_data["ZW"]
+        update_file(test_updates_data)
+        self.assertEqual(test_updates.reload(), ["FR", "JP", "ZW"], "Expected changed countries to be returned.")
+        self.assertEqual(test_updates.all, test_updates_data, "Expected reloaded updates to match updates file.")
+        self.assertTrue(all(test_updates.all[alpha_code] is test_all_updates[alpha_code] for alpha_code in test_updates.all if alpha_code not in ("FR", "JP")),
+            "Expected unchanged countries' updates to be kept.")
+        self.assertEqual(test_updates.reload(), [], "Expected no changed countries when reloading an unchanged file.")
+#2.) lazily loaded and scoped instances only reload their countries
+        self.assertEqual(test_lazy_updates.reload(), ["FR"], "Expected only lazily loaded changed countries to be returned.")
+        self.assertEqual(test_lazy_updates["FR"]["FR"], test_updates_data["FR"], "Expected lazily loaded country to be reloaded.")
+        self.assertEqual(test_scoped_updates.reload(), ["FR"], "Expected only scoped changed countries to be returned.")
+        self.assertEqual(list(test_scoped_updates.all), ["FR", "DE"], "Expected scoped instance to keep its countries.")
+#3.) watcher reloads the file in the background when it changes, calling the callback with the changed countries
+        test_changed_countries = []
+        test_reloaded = threading.Event()
+        test_updates.watch(interval=0.02, callback=lambda changed_countries: (test_changed_countries.append(changed_countries), test_reloaded.set()))
+        test_updates_data["DE"] = test_updates_data["DE"][1:]
+        update_file(test_updates_data)
+        self.assertTrue(test_reloaded.wait(10), "Expected watcher to reload the changed updates file.")
+        self.assertEqual(test_changed_countries, [["DE"]], "Expected callback to be called with the changed countries.")
+        self.assertEqual(test_updates.all["DE"], test_updates_data["DE"], "Expected watcher to publish the reloaded updates.")
+#4.) content hash watcher, and watchers are stopped via unwatch() and close()
+        test_reloaded.clear()
+        test_updates.watch(interval=0.02, content_hash=True, callback=lambda changed_countries: test_reloaded.set())
+        test_updates_data["ES"] = test_updates_data["ES"][1:]
+        update_file(test_updates_data)
+        self.assertTrue(test_reloaded.wait(10), "Expected content hash watcher to reload the changed updates file.")
+        test_watcher_thread = test_updates._watcher[0]
+        test_updates.close()
+        self.assertFalse(test_watcher_thread.is_alive(), "Expected watcher to be stopped on close.")
+        with self.assertRaises(ValueError):
+            test_updates.watch(interval=0)
+
+    # @unittest.skip("")
+    @patch('iso3166_updates.sys.stdout', new_callable=io.StringIO)
+    def test_check_for_updates_cache(self, mock_stdout):
+        """ Testing fetched updates JSON objects are cached on disk and revalidated via conditional requests to a local HTTP stand-in. """
+        test_new_update = {"Change": "Remote change for France.", "Description of Change": "", "Date Issued": "2025-01-01", "Source": ""}
+        test_remote_objects = {"/main/iso3166-updates.json": json.dumps(self.all_updates.all).encode("utf-8"),
+                               "/v1.8.0/iso3166-updates.json": json.dumps(self.all_updates.all).encode("utf-8")}
+        test_requests = []
+
+        class TestRemoteHandler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = test_remote_objects.get(self.path)
+                etag = '"' + hashlib.md5(body or b"").hexdigest() + '"'
+                #manifests aren't published, so the full objects are fetched
+                if not self.path.endswith(".manifest.json"):
+                    test_requests.append((self.path, self.headers.get("If-None-Match"), self.headers.get("If-Modified-Since")))
+                if body is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                elif self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                else:
+                    self.send_response(200)
+                    self.send_header("ETag", etag)
+                    self.send_header("Last-Modified", "Wed, 01 Jan 2025 00:00:00 GMT")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+            def log_message(self, format, *args):
+                pass
+
+        test_server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), TestRemoteHandler)
+        threading.Thread(target=test_server.serve_forever, daemon=True).start()
+        self.addCleanup(test_server.server_close)
+        self.addCleanup(test_server.shutdown)
+        test_cache_dir = os.path.join(self.test_export_folder, "remote_cache")
+        self.all_updates.remote_updates_url = f"http://127.0.0.1:{test_server.server_address[1]}/{{ref}}/iso3166-updates.json"
+        self.all_updates.remote_cache_dir = test_cache_dir
+#1.) first fetch is unconditional and cached on disk with its ETag and Last-Modified headers
+        self.assertFalse(self.all_updates.check_for_updates()["updates_found"], "Expected no updates found for unchanged remote object.")
+        self.assertEqual(test_requests, [("/main/iso3166-updates.json", None, None)], "Expected a single unconditional request.")
+        self.assertEqual(len(os.listdir(test_cache_dir)), 2, "Expected remote object and its metadata to be cached.")
+#2.) unchanged remote object is revalidated with a conditional request, returning a 304 that isn't reparsed
+        test_remote_cache = iso3166_updates.iso3166_updates._get_remote_dataset_cache(test_cache_dir)
+        test_remote_object = test_remote_cache.fetch(self.all_updates.remote_updates_url.format(ref="main"))
+        self.all_updates.check_for_updates()
+        self.assertEqual(test_requests[-1][0], "/main/iso3166-updates.json", "Expected request for remote object.")
+        self.assertIsNotNone(test_requests[-1][1], "Expected conditional If-None-Match request.")
+        self.assertEqual(test_requests[-1][2], "Wed, 01 Jan 2025 00:00:00 GMT", "Expected conditional If-Modified-Since request.")
+        self.assertIs(test_remote_cache.fetch(self.all_updates.remote_updates_url.format(ref="main")), test_remote_object, "Expected 304 to return the parsed cached object.")
+#3.) changed remote object is refetched, versioned objects are only fetched once
+        test_remote_objects["/main/iso3166-updates.json"] = json.dumps({**self.all_updates.all, "FR": self.all_updates.all["FR"] + [test_new_update]}).encode("utf-8")
+        test_requests.clear()
+        test_result = self.all_updates.check_for_updates(since_version="1.8.0")
+        self.assertEqual(test_result["updates"], {"FR": [test_new_update]}, "Expected new remote update to be found against the versioned object.")
+        self.assertEqual(sorted(path for path, _, _ in test_requests), ["/main/iso3166-updates.json", "/v1.8.0/iso3166-updates.json"], "Expected both objects to be fetched.")
+        test_requests.clear()
+        self.all_updates.check_for_updates(since_version="1.8.0")
+        self.assertEqual([path for path, _, _ in test_requests], ["/main/iso3166-updates.json"], "Expected cached versioned object to not be refetched.")
+#4.) fetch errors return an empty result, and the cache is optional if its directory isn't writable
+        self.assertFalse(self.all_updates.check_for_updates(since_version="9.9.9")["updates_found"], "Expected empty result for a missing versioned object.")
+        test_file_filepath = os.path.join(self.test_export_folder, "remote_cache_file")
+        with open(test_file_filepath, "w") as f:
+            f.write("")
+        self.all_updates.remote_cache_dir = os.path.join(test_file_filepath, "cache")
+        self.assertEqual(self.all_updates.check_for_updates(since_version="1.8.0")["updates"], {"FR": [test_new_update]}, "Expected unwritable cache to be skipped.")
+
+    # @unittest.skip("")
+    def test_diff(self):
+        """ Testing the fingerprint based diff of the added, removed and modified records between two datasets. """
+        test_new_update = {"Change": "New change for Germany.", "Description of Change": "", "Date Issued": "2025-01-01", "Source": ""}
+        test_current_updates = copy.deepcopy(self.all_updates.all)
+        test_current_updates["FR"][0]["Description of Change"] += " Edited."
+        test_current_updates["FR"][1]["Change"] = "  " + test_current_updates["FR"][1]["Change"].replace(" ", "   ") + "\n"
+        test_current_updates["DE"].append(test_new_update)
+        test_removed_update = test_current_updates["GB"].pop(2)
+        test_current_updates["XX"] = [test_new_update]
+        del test_current_updates["ZW"]
+#1.) added, removed and modified records, ignoring whitespace only changes
+        test_diff = self.all_updates.diff(test_current_updates)
+        self.assertEqual(test_diff["added"], {"DE": [test_new_update], "XX": [test_new_update]}, "Expected added records of existing and new countries.")
+        self.assertEqual(test_diff["removed"], {"GB": [test_removed_update], "ZW": self.all_updates.all["ZW"]}, "Expected removed records of existing and removed countries.")
+        self.assertEqual(test_diff["modified"], {"FR": [{"previous": self.all_updates.all["FR"][0], "current": test_current_updates["FR"][0]}]}, 
+            "Expected modified record paired by its Date Issued, ignoring whitespace only changes.")
+        self.assertEqual((test_diff["total_added"], test_diff["total_removed"], test_diff["total_modified"], test_diff["total_countries"]), 
+            (2, 1 + len(self.all_updates.all["ZW"]), 1, 5), "Expected totals of diff.")
+#2.) diff of an Updates instance, an identical dataset and reversed diff
+        self.assertEqual(self.all_updates.diff(Updates(custom_updates_filepath=os.path.join("tests", "test-iso3166-updates.json")))["total_countries"], 0, 
+            "Expected no differences between identical datasets.")
+        test_reversed_diff = Updates._diff_updates(test_current_updates, self.all_updates.all)
+        self.assertEqual((test_reversed_diff["added"], test_reversed_diff["removed"]), (test_diff["removed"], test_diff["added"]), "Expected reversed diff to swap added and removed records.")
+#3.) since_date only includes records published on or after the date
+        test_since_diff = self.all_updates.diff(test_current_updates, since_date="2024-01-01")
+        self.assertEqual(test_since_diff["added"], test_diff["added"], "Expected records published since date to be included.")
+        self.assertTrue(all(self.all_updates._parse_date_issued(update["Date Issued"][:10]) >= datetime(2024, 1, 1) for update in test_since_diff["removed"].get("ZW", [])), 
+            "Expected records published before date to be excluded.")
+        self.assertEqual(self.all_updates.diff(test_current_updates, since_date="2099-01-01")["total_countries"], 0, "Expected no differences since a future date.")
+#4.) invalid other or since_date
+        with self.assertRaises(TypeError):
+            self.all_updates.diff("FR")
+        with self.assertRaises(ValueError):
+            self.all_updates.diff(test_current_updates, since_date="not-a-date")
+
+    # @unittest.skip("")
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_check_for_updates_manifest(self, mock_stdout):
+        """ Testing only the countries whose manifest digests changed are fetched, via Range requests to a local HTTP stand-in. """
+        test_new_update = {"Change": "Remote change for France.", "Description of Change": "", "Date Issued": "2025-01-01", "Source": ""}
+        test_remote_objects, test_requests, test_range_support = {}, [], [True]
+
+        def publish(path: str, updates: dict, corrupt_digest: bool=False) -> None:
+            """ Publish an updates object and its manifest of per-country digests, counts and byte spans. """
+            body = json.dumps(updates, indent=4, ensure_ascii=False).encode("utf-8")
+            test_filepath = os.path.join(self.test_export_folder, "remote.json")
+            with open(test_filepath, "wb") as f:
+                f.write(body)
+            test_country_index = iso3166_updates.iso3166_updates._build_country_index(test_filepath)["countries"]
+            test_manifest = {"version": "1.8.7", "algorithm": "blake2b-128", "filename": "iso3166-updates.json", "size": len(body), "countries": 
+                {code: {"digest": iso3166_updates.iso3166_updates._country_digest(code, country_updates) if not corrupt_digest else "0" * 32, 
+                        "count": len(country_updates), "offset": test_country_index[code][0], "length": test_country_index[code][1]} 
+                 for code, country_updates in updates.items()}}
+            test_remote_objects[path] = body
+            test_remote_objects[path[:-len(".json")] + ".manifest.json"] = json.dumps(test_manifest).encode("utf-8")
+
+        class TestRemoteHandler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = test_remote_objects.get(self.path)
+                etag = '"' + hashlib.md5(body or b"").hexdigest() + '"'
+                test_requests.append((self.path, self.headers.get("Range")))
+                if body is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                range_match = re.match(r"bytes=(\d+)-(\d+)$", self.headers.get("Range") or "")
+                if range_match and test_range_support[0]:
+                    self.send_response(206)
+                    self.send_header("Content-Range", f"bytes {range_match[1]}-{range_match[2]}/{len(body)}")
+                    body = body[int(range_match[1]):int(range_match[2]) + 1]
+                else:
+                    self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            def log_message(self, format, *args):
+                pass
+
+        test_server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), TestRemoteHandler)
+        threading.Thread(target=test_server.serve_forever, daemon=True).start()
+        self.addCleanup(test_server.server_close)
+        self.addCleanup(test_server.shutdown)
+        self.all_updates.remote_updates_url = f"http://127.0.0.1:{test_server.server_address[1]}/{{ref}}/iso3166-updates.json"
+        self.all_updates.remote_cache_dir = os.path.join(self.test_export_folder, "remote_cache")
+        publish("/main/iso3166-updates.json", self.all_updates.all)
+        publish("/v1.8.0/iso3166-updates.json", self.all_updates.all)
+#1.) unchanged remote object only fetches its manifest, whose digests match the local fragments' digests
+        self.assertFalse(self.all_updates.check_for_updates()["updates_found"], "Expected no updates found for unchanged remote object.")
+        self.assertEqual(test_requests, [("/main/iso3166-updates.manifest.json", None)], "Expected only the manifest to be fetched.")
+        self.assertEqual(iso3166_updates.iso3166_updates._country_digest("FR", self.all_updates["FR"]["FR"]), 
+                         self.all_updates._get_json_fragments("FR", self.all_updates.all["FR"]).digest.hex(), "Expected manifest digest to match fragments digest.")
+#2.) only the changed country is fetched, via a Range request of its span, and cached by its digest
+        publish("/main/iso3166-updates.json", {**self.all_updates.all, "FR": [test_new_update] + self.all_updates.all["FR"]})
+        test_requests.clear()
+        test_result = self.all_updates.check_for_updates()
+        self.assertEqual(test_result["updates"], {"FR": [test_new_update]}, "Expected new remote update of changed country.")
+        self.assertEqual([path for path, _ in test_requests], ["/main/iso3166-updates.manifest.json", "/main/iso3166-updates.json"], 
+                         "Expected manifest and a single request of the changed country.")
+        self.assertRegex(test_requests[-1][1], r"^bytes=\d+-\d+$", "Expected a Range request of the changed country.")
+        test_requests.clear()
+        self.assertEqual(self.all_updates.check_for_updates()["updates"], {"FR": [test_new_update]}, "Expected new remote update of changed country.")
+        self.assertEqual([path for path, _ in test_requests], ["/main/iso3166-updates.manifest.json"], "Expected cached country to not be refetched.")
+#3.) since_version compares the manifest against the stored versioned object, fetched once in full
+        test_requests.clear()
+        self.assertEqual(self.all_updates.check_for_updates(since_version="1.8.0")["updates"], {"FR": [test_new_update]}, 
+                         "Expected new remote update against the versioned object.")
+        self.assertEqual(sorted(test_requests), [("/main/iso3166-updates.manifest.json", None), ("/v1.8.0/iso3166-updates.json", None)], 
+                         "Expected manifest and the full versioned object to be fetched.")
+        test_requests.clear()
+        self.all_updates.check_for_updates(since_version="1.8.0")
+        self.assertEqual(test_requests, [("/main/iso3166-updates.manifest.json", None)], "Expected stored versioned object to not be refetched.")
+#4.) countries are taken from the full object if Range requests aren't supported
+        test_range_support[0] = False
+        publish("/main/iso3166-updates.json", {**self.all_updates.all, "DE": [test_new_update], "GB": []})
+        test_result = self.all_updates.check_for_updates()
+        self.assertEqual(test_result["updates"], {"DE": [test_new_update]}, "Expected new remote update from the full object.")
+        self.assertEqual(test_result["removed"], {"DE": self.all_updates.all["DE"], "GB": self.all_updates.all["GB"]}, "Expected removed updates from the full object.")
+        self.assertEqual((test_result["total_updates"], test_result["total_countries"]), (1, 1), "Expected totals of the new updates, excluding the removal-only country.")
+        self.assertEqual(test_result["diff_total_countries"], 2, "Expected diff's total of countries with any changed records.")
+#5.) full objects are compared if a manifest's digests don't match the fetched countries, or it isn't published
+        test_range_support[0] = True
+        publish("/main/iso3166-updates.json", {**self.all_updates.all, "ES": [test_new_update]}, corrupt_digest=True)
+        self.assertEqual(self.all_updates.check_for_updates()["updates"], {"ES": [test_new_update]}, "Expected invalid manifest digests to fall back to the full object.")
+        del test_remote_objects["/main/iso3166-updates.manifest.json"]
+        test_requests.clear()
+        self.assertEqual(self.all_updates.check_for_updates()["updates"], {"ES": [test_new_update]}, "Expected missing manifest to fall back to the full object.")
+        self.assertEqual([path for path, _ in test_requests], ["/main/iso3166-updates.manifest.json", "/main/iso3166-updates.json"], "Expected full object to be fetched.")
+#6.) instances scoped to specific countries only compare and fetch the manifest entries of those countries
+        test_scoped_updates = Updates(country_code="FR,DE", custom_updates_filepath=os.path.join("tests", "test-iso3166-updates.json"))
+        test_scoped_updates.remote_updates_url, test_scoped_updates.remote_cache_dir = self.all_updates.remote_updates_url, self.all_updates.remote_cache_dir
+        publish("/main/iso3166-updates.json", {**self.all_updates.all, "FR": [test_new_update] + self.all_updates.all["FR"], "ES": [test_new_update], "GB": []})
+        test_requests.clear()
+        test_result = test_scoped_updates.check_for_updates()
+        self.assertEqual(test_result["updates"], {"FR": [test_new_update]}, "Expected only the new remote update of the scoped countries.")
+        self.assertEqual((test_result["removed"], test_result["diff_total_countries"]), ({}, 1), "Expected only the scoped countries to be diffed.")
+        self.assertEqual([path for path, _ in test_requests], ["/main/iso3166-updates.manifest.json"], "Expected cached changed scoped country to not be refetched.")
+        self.assertEqual(test_scoped_updates.check_for_updates(since_version="1.8.0")["updates"], {"FR": [test_new_update]}, 
+                         "Expected only the new remote update of the scoped countries against the versioned object.")
+        del test_remote_objects["/main/iso3166-updates.manifest.json"]
+        self.assertEqual(test_scoped_updates.check_for_updates()["updates"], {"FR": [test_new_update]}, 
+                         "Expected only the new remote update of the scoped countries from the full object.")
+
+    # @unittest.skip("")
+    def test_delta(self):
+        """ Testing the creation of delta patches between datasets and applying them to a dataset with custom updates. """
+        test_updates_filepath = os.path.join(self.test_export_folder, "delta-iso3166-updates.json")
+        shutil.copyfile(os.path.join("tests", "test-iso3166-updates.json"), test_updates_filepath)
+        test_new_update = {"Change": "New change for Germany.", "Description of Change": "", "Date Issued": "2025-01-01", "Source": ""}
+        test_target_updates = copy.deepcopy(self.all_updates.all)
+        test_target_updates["FR"][0]["Description of Change"] += " Edited."
+        test_target_updates["DE"].insert(0, test_new_update)
+        test_removed_update = test_target_updates["GB"].pop(2)
+        test_target_updates["ES"][0]["Change"] = " " + test_target_updates["ES"][0]["Change"] + " "
+#1.) delta lists the add, remove and modify operations of each changed country, keyed by fingerprint, ignoring whitespace only changes
+        test_delta = self.all_updates.create_delta(test_target_updates, "1.8.0", "1.8.7")
+        self.assertEqual((test_delta["format"], test_delta["from_version"], test_delta["to_version"]), ("iso3166-updates-delta", "1.8.0", "1.8.7"), 
+            "Expected delta format and versions.")
+        self.assertEqual(test_delta["countries"], {
+            "DE": {"add": [test_new_update]},
+            "FR": {"modify": [{"fingerprint": iso3166_updates.iso3166_updates._update_fingerprint(self.all_updates.all["FR"][0]).hex(), "update": test_target_updates["FR"][0]}]},
+            "GB": {"remove": [iso3166_updates.iso3166_updates._update_fingerprint(test_removed_update).hex()]}}, "Expected delta operations of changed countries.")
+        self.assertEqual(json.loads(json.dumps(test_delta)), test_delta, "Expected delta to be JSON serializable.")
+#2.) delta is applied to the dataset, keeping its custom updates, and only copies the changed countries
+        test_updates = Updates(custom_updates_filepath=test_updates_filepath)
+        test_updates.custom_update("FR", change="Custom change for France.", date_issued="2025-02-01")
+        test_custom_update = test_updates.all["FR"][-1]
+        test_unchanged_updates = test_updates.all["JP"]
+        self.assertEqual(test_updates.apply_delta(test_delta), 3, "Expected all delta operations to be applied.")
+        test_delta_diff = test_updates.diff(test_target_updates)
+        self.assertEqual((test_delta_diff["added"], test_delta_diff["removed"], test_delta_diff["modified"]), ({}, {"FR": [test_custom_update]}, {}), 
+            "Expected delta applied dataset to only differ from the target by its custom update.")
+        self.assertIs(test_updates.all["JP"], test_unchanged_updates, "Expected unchanged countries to not be copied.")
+#3.) delta operations are persisted in the journal, reapplying a delta skips its applied operations
+        test_reloaded_updates = Updates(custom_updates_filepath=test_updates_filepath)
+        self.assertEqual(test_reloaded_updates.diff(test_updates)["total_countries"], 0, "Expected journaled delta to be replayed on load.")
+        self.assertEqual(test_reloaded_updates.apply_delta(test_delta), 0, "Expected reapplied delta operations to be skipped.")
+#4.) delta applied to an overlay leaves the base updates untouched
+        test_base_updates = Updates(custom_updates_filepath=os.path.join("tests", "test-iso3166-updates.json"))
+        shutil.copyfile(os.path.join("tests", "test-iso3166-updates.json"), test_updates_filepath.replace("delta-", "overlay-delta-"))
+        test_overlay_updates = Updates(custom_updates_filepath=test_updates_filepath.replace("delta-", "overlay-delta-"), overlay="tenant_a")
+        self.assertEqual(test_overlay_updates.apply_delta(test_delta), 3, "Expected all delta operations to be applied to the overlay.")
+        self.assertEqual(test_overlay_updates.diff(test_target_updates)["total_countries"], 0, "Expected overlay to match the target updates.")
+        self.assertEqual(Updates(custom_updates_filepath=test_updates_filepath.replace("delta-", "overlay-delta-")).diff(test_base_updates)["total_countries"], 0, 
+            "Expected base updates to be untouched.")
+#5.) invalid deltas
+        with self.assertRaises(TypeError):
+            test_updates.apply_delta([test_delta])
+        for test_invalid_delta in ({"format": "other", "countries": {}}, {**test_delta, "countries": {"FR": [test_new_update]}}, 
+                                   {**test_delta, "countries": {"FR": {"add": [{"Change": "Missing date."}]}}}, {**test_delta, "countries": {"XX": {"add": [test_new_update]}}}):
+            with self.assertRaises(ValueError):
+                test_updates.apply_delta(test_invalid_delta)
+        self.assertEqual(test_updates.diff(test_reloaded_updates)["total_countries"], 0, "Expected invalid deltas to not be applied.")
+        with self.assertRaises(TypeError):
+            test_updates.create_delta("FR")
+
+    # @unittest.skip("")
+    def test_from_version(self):
+        """ Testing tagged versions' datasets are fetched concurrently into a local content-addressed store, for offline historical queries. """
+        test_new_update = {"Change": "Remote change for France.", "Description of Change": "", "Date Issued": "2025-01-01", "Source": ""}
+        test_remote_objects = {"/v1.8.0/iso3166-updates.json": json.dumps(self.all_updates.all).encode("utf-8"),
+                               "/v1.8.5/iso3166-updates.json": json.dumps(self.all_updates.all).encode("utf-8"),
+                               "/v1.8.7/iso3166-updates.json": json.dumps({**self.all_updates.all, "FR": [test_new_update] + self.all_updates.all["FR"]}).encode("utf-8")}
+        test_requests = []
+
+        class TestRemoteHandler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = test_remote_objects.get(self.path)
+                test_requests.append(self.path)
+                self.send_response(200 if body is not None else 404)
+                self.send_header("Content-Length", str(len(body or b"")))
+                self.end_headers()
+                self.wfile.write(body or b"")
+            def log_message(self, format, *args):
+                pass
+
+        test_server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), TestRemoteHandler)
+        threading.Thread(target=test_server.serve_forever, daemon=True).start()
+        self.addCleanup(test_server.server_close)
+        self.addCleanup(test_server.shutdown)
+        test_url = f"http://127.0.0.1:{test_server.server_address[1]}/{{ref}}/iso3166-updates.json"
+        test_cache_dir = os.path.join(self.test_export_folder, "version_cache")
+#1.) missing versions are fetched and stored gzip compressed, with identical datasets stored once
+        test_versions = Updates.from_versions(["1.8.0", "1.8.5", "1.8.7"], test_cache_dir, test_url)
+        self.assertEqual(sorted(test_requests), ["/v1.8.0/iso3166-updates.json", "/v1.8.5/iso3166-updates.json", "/v1.8.7/iso3166-updates.json"], 
+            "Expected each version to be fetched.")
+        self.assertEqual(sorted(os.path.splitext(filename)[1] for filename in os.listdir(os.path.join(test_cache_dir, "versions", "objects"))), [".gz", ".gz"], 
+            "Expected identical datasets to be stored once, gzip compressed.")
+        with open(os.path.join(test_cache_dir, "versions", "versions.json"), encoding="utf-8") as f:
+            test_index = json.load(f)
+        self.assertEqual(sorted(test_index), ["1.8.0", "1.8.5", "1.8.7"], "Expected index of stored versions.")
+        self.assertEqual(test_index["1.8.0"], test_index["1.8.5"], "Expected identical datasets to have the same digest.")
+#2.) historical queries and comparisons of the stored versions
+        self.assertEqual(test_versions["1.8.0"].all, self.all_updates.all, "Expected dataset of version.")
+        self.assertEqual(test_versions["1.8.7"]["FR"]["FR"][0], test_new_update, "Expected updates of version.")
+        self.assertEqual(test_versions["1.8.0"].diff(test_versions["1.8.7"])["added"], {"FR": [test_new_update]}, "Expected diff of versions.")
+#3.) invalid versions and versions that can't be fetched
+        with self.assertRaises(ValueError):
+            Updates.from_version("latest", test_cache_dir, test_url)
+        with self.assertRaises(requests.exceptions.RequestException):
+            Updates.from_version("9.9.9", test_cache_dir, test_url)
+#4.) versions that can't be stored are written once to a temporary directory shared by the process, rather than one per call
+        test_file_filepath = os.path.join(self.test_export_folder, "version_cache_file")
+        with open(test_file_filepath, "w") as f:
+            f.write("")
+        test_unstored_versions = [Updates.from_version("1.8.7", os.path.join(test_file_filepath, "cache"), test_url) for _ in range(2)]
+        self.assertEqual(test_unstored_versions[0].iso3166_updates_path, test_unstored_versions[1].iso3166_updates_path, "Expected unstored version to be written once.")
+        self.assertEqual(os.path.dirname(test_unstored_versions[0].iso3166_updates_path), iso3166_updates.iso3166_updates._get_versions_temp_dir(), 
+            "Expected unstored version to be written to the process's temporary directory.")
+        self.assertEqual(test_unstored_versions[1]["FR"]["FR"][0], test_new_update, "Expected updates of unstored version.")
+#5.) stored versions need no network, including in later processes with a new store
+        test_server.shutdown()
+        test_requests.clear()
+        iso3166_updates.iso3166_updates._get_version_store.cache_clear()
+        test_version = Updates.from_version("1.8.5", test_cache_dir, test_url, country_code="FR")
+        self.assertEqual(test_version["FR"]["FR"], self.all_updates.all["FR"], "Expected stored version to be read offline.")
+        self.assertEqual(test_requests, [], "Expected stored version to not be refetched.")
+#6.) gzip compressed updates files are loaded in full, and compacted in place
+        test_updates_filepath = os.path.join(self.test_export_folder, "compressed-iso3166-updates.json.gz")
+        with open(os.path.join("tests", "test-iso3166-updates.json"), "rb") as f:
+            with open(test_updates_filepath, "wb") as test_updates_file:
+                test_updates_file.write(gzip.compress(f.read()))
+        test_updates = Updates(custom_updates_filepath=test_updates_filepath)
+        test_updates.custom_update("FR", custom_update_object=test_new_update)
+        test_updates.compact()
+        with gzip.open(test_updates_filepath, "rt", encoding="utf-8") as f:
+            self.assertIn(test_new_update, json.load(f)["FR"], "Expected compacted updates to be written gzip compressed.")
+        self.assertIn(test_new_update, Updates(custom_updates_filepath=test_updates_filepath).all["FR"], "Expected compacted compressed updates to be loaded.")
+
+    # @unittest.skip("")
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_async_check_for_updates(self, mock_stdout):
+        """ Testing the async acheck_for_updates() fetches the remote objects via asyncio streams from a local HTTP stand-in. """
+        import asyncio
+        from iso3166_updates import AsyncUpdates
+        test_new_update = {"Change": "Remote change for France.", "Description of Change": "", "Date Issued": "2025-01-01", "Source": ""}
+        test_remote_objects, test_requests = {}, []
+
+        def publish(path: str, updates: dict) -> None:
+            """ Publish an updates object and its manifest of per-country digests, counts and byte spans. """
+            body = json.dumps(updates, indent=4, ensure_ascii=False).encode("utf-8")
+            test_filepath = os.path.join(self.test_export_folder, "remote.json")
+            with open(test_filepath, "wb") as f:
+                f.write(body)
+            test_country_index = iso3166_updates.iso3166_updates._build_country_index(test_filepath)["countries"]
+            test_manifest = {"version": "1.8.7", "algorithm": "blake2b-128", "filename": "iso3166-updates.json", "size": len(body), "countries": 
+                {code: {"digest": iso3166_updates.iso3166_updates._country_digest(code, country_updates), "count": len(country_updates), 
+                        "offset": test_country_index[code][0], "length": test_country_index[code][1]} for code, country_updates in updates.items()}}
+            test_remote_objects[path] = body
+            test_remote_objects[path[:-len(".json")] + ".manifest.json"] = json.dumps(test_manifest).encode("utf-8")
+
+        class TestRemoteHandler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            def do_GET(self):
+                test_requests.append((self.path, self.headers.get("Range")))
+                if self.path.startswith("/latest/"):
+                    self.send_response(302)
+                    self.send_header("Location", self.path.replace("/latest/", "/main/"))
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                body = test_remote_objects.get(self.path)
+                if body is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                etag = '"' + hashlib.md5(body).hexdigest() + '"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                range_match = re.match(r"bytes=(\d+)-(\d+)$", self.headers.get("Range") or "")
+                if range_match:
+                    self.send_response(206)
+                    self.send_header("Content-Range", f"bytes {range_match[1]}-{range_match[2]}/{len(body)}")
+                    body = body[int(range_match[1]):int(range_match[2]) + 1]
+                else:
+                    self.send_response(200)
+                self.send_header("ETag", etag)
+                #manifests are streamed with chunked transfer encoding, objects with a content length
+                if self.path.endswith(".manifest.json"):
+                    self.send_header("Transfer-Encoding", "chunked")
+                    self.end_headers()
+                    for i in range(0, len(body), 4096):
+                        self.wfile.write(f"{len(body[i:i + 4096]):x}\r\n".encode("latin-1") + body[i:i + 4096] + b"\r\n")
+                    self.wfile.write(b"0\r\n\r\n")
+                    return
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            def log_message(self, format, *args):
+                pass
+
+        test_server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), TestRemoteHandler)
+        threading.Thread(target=test_server.serve_forever, daemon=True).start()
+        self.addCleanup(test_server.server_close)
+        self.addCleanup(test_server.shutdown)
+        test_url = f"http://127.0.0.1:{test_server.server_address[1]}/{{ref}}/iso3166-updates.json"
+        async_iso = AsyncUpdates(custom_updates_filepath=os.path.join("tests", "test-iso3166-updates.json"))
+        self.addCleanup(async_iso.close)
+        async_iso._updates.remote_updates_url = test_url
+        async_iso._updates.remote_cache_dir = os.path.join(self.test_export_folder, "async_remote_cache")
+        self.all_updates.remote_updates_url = test_url
+        self.all_updates.remote_cache_dir = os.path.join(self.test_export_folder, "sync_remote_cache")
+        publish("/main/iso3166-updates.json", self.all_updates.all)
+        publish("/v1.8.0/iso3166-updates.json", self.all_updates.all)
+#1.) unchanged remote object only fetches its chunked manifest, without the requests session
+        with patch.object(requests.Session, "get", side_effect=AssertionError("Expected no requests session to be used.")):
+            self.assertFalse(asyncio.run(async_iso.acheck_for_updates())["updates_found"], "Expected no updates found for unchanged remote object.")
+        self.assertEqual(test_requests, [("/main/iso3166-updates.manifest.json", None)], "Expected only the manifest to be fetched.")
+#2.) concurrent checks return the same result as the sync check, fetching the changed country via a Range request
+        publish("/main/iso3166-updates.json", {**self.all_updates.all, "FR": [test_new_update] + self.all_updates.all["FR"], "GB": []})
+        test_requests.clear()
+
+        async def check_concurrently() -> list:
+            return await asyncio.gather(*(async_iso.acheck_for_updates() for _ in range(5)))
+
+        with patch.object(requests.Session, "get", side_effect=AssertionError("Expected no requests session to be used.")):
+            test_results = asyncio.run(check_concurrently())
+        test_sync_result = self.all_updates.check_for_updates()
+        for test_result in test_results:
+            self.assertEqual(test_result, test_sync_result, "Expected async check to return the same result as the sync check.")
+        self.assertEqual(test_sync_result["updates"], {"FR": [test_new_update]}, "Expected new remote update of changed country.")
+        self.assertEqual(test_sync_result["removed"], {"GB": self.all_updates.all["GB"]}, "Expected removed updates of changed country.")
+        self.assertTrue(all(test_range for path, test_range in test_requests if path == "/main/iso3166-updates.json"), "Expected Range requests of the changed countries.")
+#3.) since_version fetches the versioned object once into the version store
+        test_requests.clear()
+        self.assertEqual(asyncio.run(async_iso.acheck_for_updates(since_version="1.8.0"))["updates"], {"FR": [test_new_update]}, 
+                         "Expected new remote update against the versioned object.")
+        self.assertIn(("/v1.8.0/iso3166-updates.json", None), test_requests, "Expected the versioned object to be fetched.")
+        test_requests.clear()
+        asyncio.run(async_iso.acheck_for_updates(since_version="1.8.0"))
+        self.assertEqual(test_requests, [("/main/iso3166-updates.manifest.json", None)], "Expected stored versioned object to not be refetched.")
+#4.) redirects are followed, and error statuses raised as requests exceptions
+        test_response = asyncio.run(iso3166_updates.iso3166_updates._async_http_get(test_url.format(ref="latest")))
+        self.assertEqual(test_response.content, test_remote_objects["/main/iso3166-updates.json"], "Expected redirect to be followed.")
+        with self.assertRaises(requests.exceptions.HTTPError):
+            asyncio.run(iso3166_updates.iso3166_updates._async_http_get(test_url.format(ref="missing"))).raise_for_status()
+#5.) invalid parameters raise errors, and a missing versioned object returns the empty result
+        with self.assertRaises(ValueError):
+            asyncio.run(async_iso.acheck_for_updates(since_date="not-a-date"))
+        with self.assertRaises(ValueError):
+            asyncio.run(async_iso.acheck_for_updates(since_version="abc"))
+        self.assertFalse(asyncio.run(async_iso.acheck_for_updates(since_version="9.9.9"))["updates_found"], "Expected empty result for a missing versioned object.")
+
     # @unittest.skip("")
     def tearDown(self):
         """ Delete instance of Updates class. """
@@ -0,0 +1,225 @@
+from iso3166_updates import Updates
+from iso3166_updates.serve import UpdatesAPI, make_server
+import os
+import json
+import gzip
+import zlib
+import threading
+import http.client
+import unittest
+from unittest.mock import patch
+unittest.TestLoader.sortTestMethodsUsing = None
+
+# @unittest.skip("Skipping iso3166-updates API server tests.")
+class ISO3166_Updates_Serve_Tests(unittest.TestCase):
+    """
+    Test suite for testing the bundled iso3166-updates API server module, serve.py. The
+    module implements the /api/all, /api/alpha, /api/year, /api/country_name, /api/search
+    and /api/date_range endpoints on a preloaded Updates instance.
+
+    Test Cases
+    ==========
+    test_endpoints:
+        testing the data returned by each endpoint matches the Updates class outputs.
+    test_query_parameters:
+        testing the sortBy, limit, offset, fields, likeness and excludeMatchScore query parameters.
+    test_errors:
+        testing 400 and 404 error responses for invalid inputs and unknown endpoints.
+    test_etag_gzip_response_cache:
+        testing ETag/304 conditional responses, precompressed gzip bodies and the response cache.
+    test_http_server:
+        testing the endpoints served over HTTP by the threaded server.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """ Initialise and warm the API once for all tests. """
+        cls.updates = Updates(custom_updates_filepath=os.path.join("tests", "test-iso3166-updates.json"), response_cache=True)
+        cls.api = UpdatesAPI(cls.updates)
+        cls.api.warm()
+
+    def get_json(self, target: str, **kwargs) -> tuple:
+        """ Get the status and decoded JSON body of the API's response to a request target. """
+        status, headers, body = self.api.get(target, base_url="http://127.0.0.1", **kwargs)
+        return status, json.loads(body)
+
+    # @unittest.skip("")
+    def test_endpoints(self):
+        """ Testing the data returned by each endpoint matches the outputs of the Updates class. """
+#1.) /api/all, /api/alpha and /api/year, with the metadata envelope
+        for target, expected in (("/api/all", self.updates.all), ("/api/alpha/BN,CUB,262", self.updates["BN,CUB,262"]),
+                                 ("/api/year/2016", self.updates.year("2016")), ("/api/year/2010,2015", self.updates.year("2010,2015")),
+                                 ("/api/year/<>2011,2020", self.updates.year("<>2011,2020"))):
+            status, response = self.get_json(target)
+            self.assertEqual(status, 200, f"Expected 200 status code for {target}, got {status}.")
+            self.assertEqual(response["data"], json.loads(json.dumps(expected)), f"Expected data of {target} to match Updates output.")
+            self.assertEqual(response["metadata"]["count"], sum(len(updates) for updates in expected.values()), f"Expected metadata count of {target} to match number of updates.")
+            self.assertRegex(response["metadata"]["generated"], r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$", "Expected generated metadata to be ISO 8601 UTC timestamp.")
+#2.) /api/alpha/<code>/year/<year>
+        status, response = self.get_json("/api/alpha/AD,PW/year/2015")
+        self.assertEqual(response["data"], {"AD": self.updates.year("2015")["AD"]}, f"Expected only AD updates for 2015, got {response['data']}.")
+#3.) /api/country_name, including names with a qualifier and names with a year
+        status, response = self.get_json("/api/country_name/Benin")
+        self.assertEqual(response["data"], json.loads(json.dumps(self.updates["BJ"])), "Expected country name data to match BJ updates.")
+        for country_name, alpha_code in (("Iran", "IR"), ("United Kingdom", "GB"), ("Korea, Republic of", "KR"), ("Mali,Nicaragua", "ML,NI")):
+            status, response = self.get_json("/api/country_name/" + country_name)
+            self.assertEqual(sorted(response["data"]), alpha_code.split(","), f"Expected {country_name} to be resolved to {alpha_code}, got {list(response['data'])}.")
+        status, response = self.get_json("/api/country_name/Tajikstan,Irland?likeness=80")
+        self.assertEqual(sorted(response["data"]), ["IE", "TJ"], f"Expected misspelt names to be fuzzy matched, got {list(response['data'])}.")
+        status, response = self.get_json("/api/country_name/Andorra/year/2015")
+        self.assertEqual(response["data"], {"AD": self.updates.year("2015")["AD"]}, f"Expected only AD updates for 2015, got {response['data']}.")
+#4.) /api/search and /api/date_range
+        status, response = self.get_json("/api/search/parishes")
+        self.assertEqual(response["data"], self.updates.search("parishes"), "Expected search data to match Updates search output.")
+        status, response = self.get_json("/api/date_range/2014-04-07,2016-10-16")
+        self.assertEqual(response["data"], self.updates.date_range("2014-04-07,2016-10-16"), "Expected date range data to match Updates date_range output.")
+        status, response = self.get_json("/api/date_range/2007-01-01,2016-05-07/alpha/PW,QA")
+        expected = self.updates.date_range("2007-01-01,2016-05-07")
+        self.assertEqual(response["data"], {code: expected[code] for code in ("PW", "QA") if code in expected}, "Expected date range data filtered to PW and QA.")
+#5.) /api and /api/version
+        status, headers, body = self.api.get("/api/version")
+        self.assertEqual(body.decode("utf-8"), self.updates.__version__, f"Expected version endpoint to return software version, got {body}.")
+        status, response = self.get_json("/api")
+        self.assertIn("/api/all", response["endpoints"], "Expected /api/all to be listed in endpoints.")
+
+    # @unittest.skip("")
+    def test_query_parameters(self):
+        """ Testing the sortBy, limit, offset, fields, likeness and excludeMatchScore query parameters. """
+#1.) sortBy flattens and sorts the updates by date
+        status, response = self.get_json("/api/all?sortBy=dateDesc")
+        self.assertIsInstance(response["data"], list, "Expected sorted output to be a list.")
+        self.assertEqual(len(response["data"]), sum(len(updates) for updates in self.updates.all.values()), "Expected sorted output to include all updates.")
+        dates = [Updates._parse_date_issued(update["Date Issued"]) for update in response["data"]]
+        self.assertEqual(dates, sorted(dates, reverse=True), "Expected updates to be sorted by date descending.")
+        self.assertTrue(all("Country Code" in update for update in response["data"]), "Expected Country Code attribute in sorted updates.")
+#2.) limit and offset paginate the countries
+        status, response = self.get_json("/api/all?limit=10&offset=5")
+        self.assertEqual(list(response["data"]), list(self.updates.all)[5:15], "Expected 10 countries from offset 5.")
+        self.assertEqual((response["metadata"]["limit"], response["metadata"]["offset"], response["metadata"]["total"]), (10, 5, len(self.updates.all)),
+            f"Expected pagination metadata, got {response['metadata']}.")
+#3.) fields only includes the sought attributes
+        status, response = self.get_json("/api/alpha/FR?fields=Change,Date%20Issued")
+        self.assertTrue(all(list(update) == ["Change", "Date Issued"] for update in response["data"]["FR"]), "Expected only Change and Date Issued attributes.")
+        status, response = self.get_json("/api/search/parishes?fields=Change,Country%20Code")
+        self.assertTrue(all(list(update) == ["Change", "Country Code"] for update in response["data"]), "Expected only Change and Country Code attributes.")
+#4.) likeness and excludeMatchScore
+        status, response = self.get_json("/api/search/cantons?likeness=90&excludeMatchScore=1")
+        self.assertEqual(response["data"], self.updates.search("cantons", likeness_score=90, include_match_score=False),
+            "Expected search data to match Updates search output without match score.")
+        status, response = self.get_json("/api/search/abcdefg")
+        self.assertEqual((status, response["data"]), (200, []), "Expected empty list for search with no matches.")
+
+    # @unittest.skip("")
+    def test_errors(self):
+        """ Testing 400 and 404 error responses for invalid inputs and unknown endpoints. """
+#1.) invalid inputs
+        for target, message in (("/api/alpha/XYZ", "Invalid ISO 3166-1 alpha-3 country code: XYZ."),
+                                ("/api/year/abc", "Invalid year input, must be a valid year >= 1996, got abc."),
+                                ("/api/country_name/ABCDEF", "No matching country name found for input: ABCDEF."),
+                                ("/api/search/", "The search input parameter cannot be empty."),
+                                ("/api/search/parishes?likeness=200", "Likeness query string parameter value must be between 0 and 100."),
+                                ("/api/date_range/", "Input date cannot be empty, expecting at least one date in the format YYYY-MM-DD.")):
+            status, response = self.get_json(target)
+            self.assertEqual(response, {"message": message, "path": "http://127.0.0.1" + target, "status": 400}, f"Expected 400 error response for {target}, got {response}.")
+            self.assertEqual(status, 400, f"Expected 400 status code for {target}, got {status}.")
+        for target in ("/api/all?limit=-1", "/api/all?offset=-5", "/api/all?limit=abc", "/api/date_range/abcdef", "/api/alpha/abc/year/2000"):
+            status, response = self.get_json(target)
+            self.assertEqual((status, response["status"]), (400, 400), f"Expected 400 error response for {target}, got {response}.")
+#2.) unknown endpoints
+        for target in ("/api/nonexistent/path/xyz", "/api/alpha/AD/unknown", "/index.html"):
+            status, response = self.get_json(target)
+            self.assertEqual((status, response["status"]), (404, 404), f"Expected 404 error response for {target}, got {response}.")
+
+    # @unittest.skip("")
+    def test_etag_gzip_response_cache(self):
+        """ Testing ETag/304 conditional responses, precompressed gzip bodies and the response cache. """
+#1.) responses have a stable ETag, a matching If-None-Match header returns a 304 without a body
+        status, headers, body = self.api.get("/api/alpha/FR")
+        self.assertRegex(headers["ETag"], r'^"[0-9a-f]{32}"$', f"Expected quoted ETag header, got {headers.get('ETag')}.")
+        self.assertEqual(self.api.get("/api/alpha/FR")[1]["ETag"], headers["ETag"], "Expected stable ETag for same request.")
+        self.assertNotEqual(self.api.get("/api/alpha/FR?fields=Change")[1]["ETag"], headers["ETag"], "Expected different ETag for different query parameters.")
+        self.assertEqual(self.api.get("/api/alpha/FR", if_none_match=headers["ETag"])[::2], (304, b""), "Expected 304 with no body for matching ETag.")
+        self.assertEqual(self.api.get("/api/alpha/FR", if_none_match='"abc", ' + headers["ETag"])[0], 304, "Expected 304 for ETag in list of ETags.")
+        self.assertEqual(self.api.get("/api/alpha/FR", if_none_match='"abc"')[0], 200, "Expected 200 for non-matching ETag.")
+#2.) precompressed gzip body served when accepted
+        status, headers, body = self.api.get("/api/all", accept_gzip=True)
+        self.assertEqual(headers.get("Content-Encoding"), "gzip", "Expected gzip Content-Encoding header.")
+        self.assertEqual(gzip.decompress(body), self.api.get("/api/all")[2], "Expected decompressed gzip body to match uncompressed body.")
+        for target in ("/api/all", "/api/alpha/FR,DE,JP", "/api/year/2016", "/api/year/2016?fields=Change", "/api/search/parishes"):
+            status, headers, body = self.api.get(target, accept_gzip=True)
+            self.assertEqual(gzip.decompress(body), self.api.get(target)[2], f"Expected decompressed gzip body of {target} to match uncompressed body.")
+            #body is a single gzip member, fully decoded by a single decompressor
+            test_decompressor = zlib.decompressobj(31)
+            self.assertEqual(test_decompressor.decompress(body), self.api.get(target)[2], f"Expected single gzip member of {target} to decode to uncompressed body.")
+            self.assertTrue(test_decompressor.eof, f"Expected gzip member of {target} to be complete.")
+            self.assertEqual(test_decompressor.unused_data, b"", f"Expected gzip body of {target} to be a single gzip member.")
+#3.) warmed responses are cached, the same response object is reused
+        self.assertIs(self.api._get_cached_response(headers["ETag"]).gzip_body, body, "Expected precompressed body to be reused from response cache.")
+        test_api = UpdatesAPI(self.updates, cache_size=2)
+        for target in ("/api/alpha/AD", "/api/alpha/FR", "/api/alpha/DE"):
+            test_api.get(target)
+        self.assertEqual(len(test_api._cache), 2, f"Expected response cache to be bounded to 2 responses, got {len(test_api._cache)}.")
+#4.) ETags change when the updates data changes
+        test_updates = Updates(custom_updates_filepath=os.path.join("tests", "test-iso3166-updates.json"))
+        test_api = UpdatesAPI(test_updates)
+        etag_fr, etag_de = test_api.get("/api/alpha/FR")[1]["ETag"], test_api.get("/api/alpha/DE")[1]["ETag"]
+        test_updates.all = {**test_updates.all, "FR": test_updates.all["FR"][1:]}
+        self.assertNotEqual(test_api.get("/api/alpha/FR")[1]["ETag"], etag_fr, "Expected ETag of changed country to change.")
+        self.assertEqual(test_api.get("/api/alpha/DE")[1]["ETag"], etag_de, "Expected ETag of unchanged country to be unchanged.")
+        self.assertEqual(json.loads(test_api.get("/api/alpha/FR")[2])["data"]["FR"], test_updates.all["FR"], "Expected response to reflect changed data.")
+#5.) ETag and body of a response are from the same dataset generation, even if a new generation is published in between
+        test_api = UpdatesAPI(test_updates)
+        test_fr_updates, test_de_updates = list(test_updates.all["FR"]), list(test_updates.all["DE"])
+        updates_etag = Updates.etag
+        def etag_then_publish(updates: Updates, *args, **kwargs) -> str:
+            etag = updates_etag(updates, *args, **kwargs)
+            test_updates.all = {**test_updates.all, "DE": test_de_updates[1:]}
+            return etag
+        with patch.object(Updates, "etag", autospec=True, side_effect=etag_then_publish):
+            status, headers, body = test_api.get("/api/alpha/DE")
+        self.assertEqual(headers["ETag"], etag_de, "Expected ETag of the generation before the new generation was published.")
+        self.assertEqual(json.loads(body)["data"]["DE"], test_de_updates, "Expected body of the same generation as the ETag.")
+        status, headers, body = test_api.get("/api/alpha/DE")
+        self.assertNotEqual(headers["ETag"], etag_de, "Expected ETag of the new generation.")
+        self.assertEqual(json.loads(body)["data"]["DE"], test_de_updates[1:], "Expected body of the new generation.")
+        self.assertEqual(json.loads(test_api.get("/api/alpha/FR")[2])["data"]["FR"], test_fr_updates, "Expected unchanged country's body.")
+
+    # @unittest.skip("")
+    def test_http_server(self):
+        """ Testing the endpoints served over HTTP by the threaded server. """
+        server = make_server("127.0.0.1", 0, self.api)
+        server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+        server_thread.start()
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=10)
+#1.) successful response with headers, reusing the persistent connection
+            connection.request("GET", "/api/alpha/AD")
+            response = connection.getresponse()
+            body = response.read()
+            self.assertEqual(response.status, 200, f"Expected 200 status code, got {response.status}.")
+            self.assertEqual(response.getheader("Content-Type"), "application/json", "Expected application/json content type.")
+            self.assertEqual(response.getheader("Access-Control-Allow-Origin"), "*", "Expected CORS header.")
+            self.assertEqual(json.loads(body)["data"], json.loads(json.dumps(self.updates["AD"])), "Expected AD updates data.")
+#2.) conditional and gzip requests
+            connection.request("GET", "/api/alpha/AD", headers={"If-None-Match": response.getheader("ETag")})
+            response = connection.getresponse()
+            self.assertEqual((response.status, response.read()), (304, b""), "Expected 304 with no body.")
+            connection.request("GET", "/api/all", headers={"Accept-Encoding": "gzip"})
+            response = connection.getresponse()
+            self.assertEqual(response.getheader("Content-Encoding"), "gzip", "Expected gzip encoded response.")
+            self.assertEqual(len(json.loads(gzip.decompress(response.read()))["data"]), len(self.updates.all), "Expected all countries in gzip response.")
+#3.) HEAD request and 404 response
+            connection.request("HEAD", "/api/all")
+            response = connection.getresponse()
+            self.assertEqual((response.status, response.read()), (200, b""), "Expected 200 with no body for HEAD request.")
+            connection.request("GET", "/api/nonexistent")
+            response = connection.getresponse()
+            self.assertEqual(response.status, 404, f"Expected 404 status code, got {response.status}.")
+            response.read()
+            connection.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+if __name__ == '__main__':
+    #run all unit tests
+    unittest.main(verbosity=2)